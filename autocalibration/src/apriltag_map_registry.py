@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import os
+import tempfile
+
+from scene_common import log
+from scene_common.timestamp import get_iso_time
+
+# Bump when the stored entry format or the tag sweep changes
+REGISTRY_FORMAT_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+# The datasets directory is persistent storage of the autocalibration service
+REGISTRY_DIR = os.getenv("APRILTAG_MAP_REGISTRY_DIR",
+                         os.path.join(os.getcwd(), "datasets", ".apriltag_maps"))
+
+def computeMapKey(map_file, scale, sweep_settings):
+  """! Hash the inputs that determine the apriltags found in a scene map.
+  @param   map_file         Path of the map (GLB, PLY or image file).
+  @param   scale            Scale of the scene map in pixels per meter.
+  @param   sweep_settings   JSON serializable tag sweep and detector settings.
+
+  @return  key              Hex digest identifying the map registration.
+  """
+  digest = hashlib.sha256()
+  header = {"version": REGISTRY_FORMAT_VERSION, "scale": scale, "sweep": sweep_settings}
+  digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+  with open(map_file, "rb") as f:
+    while True:
+      chunk = f.read(HASH_CHUNK_SIZE)
+      if not chunk:
+        break
+      digest.update(chunk)
+  return digest.hexdigest()
+
+class ApriltagMapRegistry:
+  """
+  On-disk registry of the apriltags found in scene maps, keyed by computeMapKey.
+  Every entry is a JSON file with the 3D center and corners of each tag and the
+  sweep and detector settings used, so registering an unchanged map again
+  does not need another tile sweep.
+  """
+
+  def __init__(self, registry_dir=REGISTRY_DIR):
+    """! Initializes the registry.
+    @param   registry_dir   Directory holding the registry entries.
+
+    @return  None
+    """
+    self.registry_dir = registry_dir
+    return
+
+  def entryPath(self, key):
+    """! Path of the entry file of a map key. """
+    return os.path.join(self.registry_dir, f"{key}.json")
+
+  def get(self, key):
+    """! Look up the apriltags of a map.
+    @param   key     Map key from computeMapKey.
+
+    @return  entry   Registry entry, None if the map is not registered.
+    """
+    try:
+      with open(self.entryPath(key), "r") as f:
+        entry = json.load(f)
+    except FileNotFoundError:
+      return None
+    except (OSError, ValueError) as e:
+      log.warning(f"Dropping unreadable apriltag map registry entry {key}: {e}")
+      self.remove(key)
+      return None
+
+    if entry.get("version") != REGISTRY_FORMAT_VERSION or not isinstance(entry.get("tags"), dict):
+      self.remove(key)
+      return None
+    return entry
+
+  def put(self, key, tags, sweep_settings, map_file=None):
+    """! Store the apriltags of a map, replacing an existing entry.
+    @param   key              Map key from computeMapKey.
+    @param   tags             Tags as {"apriltag_id": {"center": [x, y, z], "corners": [[x, y, z], ...]}}.
+    @param   sweep_settings   Tag sweep and detector settings used.
+    @param   map_file         Path of the map, for reference only.
+
+    @return  None
+    """
+    entry = {
+      "version": REGISTRY_FORMAT_VERSION,
+      "map_file": os.path.basename(map_file) if map_file else None,
+      "registered": get_iso_time(),
+      "sweep": sweep_settings,
+      "tags": tags,
+    }
+    try:
+      os.makedirs(self.registry_dir, exist_ok=True)
+      # Write to a temporary file and rename, so readers never see partial entries
+      fd, staging_path = tempfile.mkstemp(prefix=".staging_", suffix=".json", dir=self.registry_dir)
+      try:
+        with os.fdopen(fd, "w") as f:
+          json.dump(entry, f)
+        os.replace(staging_path, self.entryPath(key))
+      except (OSError, TypeError, ValueError):
+        os.unlink(staging_path)
+        raise
+    except (OSError, TypeError, ValueError) as e:
+      log.warning(f"Failed to store apriltag map registry entry {key}: {e}")
+    return
+
+  def remove(self, key):
+    """! Remove the entry of a map if present.
+    @param   key     Map key from computeMapKey.
+
+    @return  None
+    """
+    try:
+      os.unlink(self.entryPath(key))
+    except FileNotFoundError:
+      pass
+    return
@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import math
-from threading import Lock
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from threading import Lock, RLock
 
 import cv2
 import numpy as np
@@ -26,6 +30,140 @@ SUNLIGHT_INTENSITY = 100000
 SUNLIGHT_DIRECTION = [0.0, 0.0, -1.0]
 SUNLIGHT_COLOR = [1.0, 1.0, 1.0]
 DEFAULT_FOV = 70
+DETECTOR_PARAMS = {
+  "families": "tag36h11",
+  "nthreads": 1,
+  "quad_decimate": 1.0,
+  "quad_sigma": 0.0,
+  "refine_edges": 1,
+  "decode_sharpening": 0.25,
+}
+
+# Worker processes rendering map tiles; 0 uses one per CPU
+SWEEP_WORKERS = int(os.getenv("APRILTAG_SWEEP_WORKERS", "0"))
+# Rays per side cast to check whether a tile sees any part of the map
+TILE_PROBE_RESOLUTION = 32
+# Tile renderer of the map sweep: "offscreen" renders with OpenGL (EGL or
+# OSMesa), "raycast" samples the map texture along camera rays on the CPU
+TILE_RENDERERS = ("offscreen", "raycast")
+TILE_RENDERER = os.getenv("APRILTAG_TILE_RENDERER", "offscreen")
+RAYCAST_BACKGROUND_COLOR = (255, 255, 255)
+RAYCAST_UNTEXTURED_COLOR = (128, 128, 128)
+
+# Per process calibration object of the tile sweep workers
+_tile_worker = None
+# Open3D offscreen renderers share one rendering engine per process and must not
+# be used from several threads at once, e.g. by registrations of different scenes
+_offscreen_render_lock = RLock()
+
+def _initTileWorker(init_args, res_x, res_y):
+  """! Load the map and renderer once in a tile sweep worker process.
+  @param   init_args   Arguments of the CameraCalibrationApriltag constructor.
+  @param   res_x       Image resolution in x-axis.
+  @param   res_y       Image resolution in y-axis.
+
+  @return  None
+  """
+  global _tile_worker
+  _tile_worker = CameraCalibrationApriltag(*init_args)
+  _tile_worker.prepareTileSweep(res_x, res_y)
+  return
+
+def _detectApriltagsInTile(tile):
+  """! Tile sweep worker task, see CameraCalibrationApriltag.detectApriltagsInTile. """
+  return _tile_worker.detectApriltagsInTile(*tile)
+
+class RaycastRenderer:
+  """
+  CPU tile renderer with the camera interface of the Open3D offscreen renderer.
+  Casts one ray per pixel against the map and samples the unlit albedo at the
+  hit points, so no OpenGL context is needed and images are deterministic.
+  """
+
+  def __init__(self, mesh, tensor_mesh, raycasting_scene=None):
+    """! Extract the texture and its coordinates of the map mesh.
+    @param   mesh                Triangular mesh (tensor geometry).
+    @param   tensor_mesh         Tensor meshes with materials of a GLB map, None for image maps.
+    @param   raycasting_scene    Raycasting scene of the mesh, created if None.
+
+    @return  None
+    """
+    if raycasting_scene is None:
+      raycasting_scene = o3d.t.geometry.RaycastingScene()
+      raycasting_scene.add_triangles(mesh)
+    self.raycasting_scene = raycasting_scene
+    self.rays = None
+    self.res_x = self.res_y = 0
+
+    material = mesh.material if tensor_mesh is None else tensor_mesh[0].material
+    self.texture = None
+    self.texture_uvs = None
+    self.vertex_colors = None
+    self.triangles = None
+    if "albedo" in material.texture_maps and "texture_uvs" in mesh.triangle:
+      texture = material.texture_maps["albedo"].as_tensor().numpy()
+      if texture.ndim == 2 or texture.shape[2] == 1:
+        texture = np.repeat(texture.reshape(texture.shape[0], texture.shape[1], 1), 3, axis=2)
+      self.texture = np.ascontiguousarray(texture[:, :, :3])
+      self.texture_uvs = mesh.triangle.texture_uvs.numpy()
+    elif "colors" in mesh.vertex:
+      self.vertex_colors = mesh.vertex.colors.numpy()
+      self.triangles = mesh.triangle.indices.numpy()
+    return
+
+  def setup_camera(self, intrinsic_matrix, extrinsic_matrix, res_x, res_y):
+    """! Create the rays of a pinhole camera.
+    @param   intrinsic_matrix    Camera intrinsic matrix.
+    @param   extrinsic_matrix    Extrinsic matrix in 4x4 format.
+    @param   res_x               Image resolution in x-axis.
+    @param   res_y               Image resolution in y-axis.
+
+    @return  None
+    """
+    self.rays = o3d.t.geometry.RaycastingScene.create_rays_pinhole(
+      intrinsic_matrix=o3d.core.Tensor(np.asarray(intrinsic_matrix, dtype=np.float64)),
+      extrinsic_matrix=o3d.core.Tensor(np.asarray(extrinsic_matrix, dtype=np.float64)),
+      width_px=res_x,
+      height_px=res_y)
+    self.res_x, self.res_y = res_x, res_y
+    return
+
+  def render_to_image(self):
+    """! Cast the camera rays and color every pixel by the map at its hit point.
+
+    @return  img                 RGB image in numpy format.
+    """
+    cast_results = self.raycasting_scene.cast_rays(self.rays)
+    primitive_ids = cast_results['primitive_ids'].numpy()
+    hit = primitive_ids != o3d.t.geometry.RaycastingScene.INVALID_ID
+    triangles = np.where(hit, primitive_ids, 0)
+    # Barycentric weights of the second and third triangle vertex
+    weights = cast_results['primitive_uvs'].numpy()
+    w1 = weights[..., 0:1]
+    w2 = weights[..., 1:2]
+    w0 = 1.0 - w1 - w2
+
+    if self.texture is not None:
+      uvs = self.texture_uvs[triangles]
+      uv = w0 * uvs[..., 0, :] + w1 * uvs[..., 1, :] + w2 * uvs[..., 2, :]
+      # Texture coordinates start at the bottom left, image rows at the top
+      map_x = (uv[..., 0] * self.texture.shape[1] - 0.5).astype(np.float32)
+      map_y = ((1.0 - uv[..., 1]) * self.texture.shape[0] - 0.5).astype(np.float32)
+      map_x[~hit] = -1.0
+      map_y[~hit] = -1.0
+      return cv2.remap(self.texture, map_x, map_y, cv2.INTER_LINEAR,
+                       borderMode=cv2.BORDER_CONSTANT,
+                       borderValue=RAYCAST_BACKGROUND_COLOR)
+
+    img = np.empty((self.res_y, self.res_x, 3), dtype=np.uint8)
+    img[...] = RAYCAST_BACKGROUND_COLOR
+    if self.vertex_colors is not None:
+      colors = self.vertex_colors[self.triangles[triangles[hit]]]
+      colors = w0[hit] * colors[:, 0] + w1[hit] * colors[:, 1] + w2[hit] * colors[:, 2]
+      img[hit] = np.clip(colors * 255.0, 0, 255).astype(np.uint8)
+    else:
+      img[hit] = RAYCAST_UNTEXTURED_COLOR
+    return img
 
 class CameraCalibrationApriltag:
   """
@@ -42,20 +180,34 @@ class CameraCalibrationApriltag:
   intrinsic_matrix_2d = None
   extrinsic_matrix = None
 
-  def __init__(self, map_filename, scale, scene_name, intrinsic_matrix=None, tag_size=TAG_SIZE):
+  def __init__(self, map_filename, scale, scene_name, intrinsic_matrix=None, tag_size=TAG_SIZE,
+               tile_renderer=None):
     """! Initializes the class with various data necessary for preprocessing.
     @param   map_filename        Filename of map object (image/object file).
     @param   scale               Scale size in float(as in database).
     @param   scene_name          Name of the scene as in database.
     @param   intrinsic_matrix    Camera intrinsic matrix.
+    @param   tile_renderer       Renderer of the map sweep tiles, one of TILE_RENDERERS,
+                                 defaults to TILE_RENDERER.
 
     @return  None
     """
     o3d.utility.set_verbosity_level(o3d.utility.VerbosityLevel.Error)
     if not map_filename or not scale:
       raise ValueError("No map available for scene")
+    tile_renderer = tile_renderer or TILE_RENDERER
+    if tile_renderer not in TILE_RENDERERS:
+      raise ValueError(f"Unknown tile renderer {tile_renderer}, expected one of {TILE_RENDERERS}")
 
     self.scene_name = scene_name
+    self.scale = scale
+    self.intrinsic_matrix_2d = intrinsic_matrix
+    self.tile_renderer = tile_renderer
+    # The map file as uploaded; map_info is updated when a point cloud is converted
+    self.map_file = map_filename
+    self.result_corners_3d = None
+    self.renderer = None
+    self.raycasting_scene = None
     self.map_info = []
     self.tag_size = tag_size
     self.fixed_step_size = 4 * self.tag_size
@@ -69,45 +221,68 @@ class CameraCalibrationApriltag:
       self.map_info.append(map_filename)
 
     # Get the detector object.
-    self.atag_detector = Detector(searchpath=['apriltags'],
-                                  families='tag36h11',
-                                  nthreads=1,
-                                  quad_decimate=1.0,
-                                  quad_sigma=0.0,
-                                  refine_edges=1,
-                                  decode_sharpening=0.25,
-                                  debug=0)
-    self.intrinsic_matrix_2d = intrinsic_matrix
+    self.atag_detector = Detector(searchpath=['apriltags'], debug=0, **DETECTOR_PARAMS)
 
     return
 
 
-  def renderCamView(self, mesh, tensor_mesh, intrinsic_matrix, extrinsic_matrix, res_x, res_y):
+  def createRenderer(self, mesh, tensor_mesh, res_x, res_y):
+    """! Create an offscreen renderer showing the mesh, reusable for many camera views.
+    @param   mesh                Triangular mesh.
+    @param   tensor_mesh         Tensor meshes with materials of a GLB map, None for image maps.
+    @param   res_x               Image resolution in x-axis.
+    @param   res_y               Image resolution in y-axis
+
+    @return  renderer            Open3D offscreen renderer, or RaycastRenderer
+                                 for the "raycast" tile renderer.
+    """
+    if self.tile_renderer == "raycast":
+      # The raycasting scene of the tile sweep is shared when it holds this mesh
+      raycasting_scene = self.raycasting_scene if mesh is self.triangle_mesh else None
+      return RaycastRenderer(mesh, tensor_mesh, raycasting_scene)
+    with _offscreen_render_lock:
+      renderer = rendering.OffscreenRenderer(res_x, res_y)
+      if tensor_mesh is None:
+        material = o3d.visualization.rendering.MaterialRecord()
+        material.shader = mesh.material.material_name
+        material.albedo_img = mesh.material.texture_maps["albedo"].to_legacy()
+      else:
+        material = materialToMaterialRecord(tensor_mesh[0].material)
+      renderer.scene.add_geometry("mesh", mesh, material)
+      renderer.scene.scene.set_sun_light(SUNLIGHT_DIRECTION,
+                                         SUNLIGHT_COLOR,
+                                         SUNLIGHT_INTENSITY)
+      renderer.scene.scene.enable_sun_light(True)
+      renderer.scene.show_axes(False)
+    return renderer
+
+  def _renderLock(self):
+    """! Lock to hold while this object renders in the current process.
+
+    @return  lock                The offscreen render lock, or a no-op context for the
+                                 thread safe "raycast" tile renderer.
+    """
+    return _offscreen_render_lock if self.tile_renderer == "offscreen" else nullcontext()
+
+  def renderCamView(self, mesh, tensor_mesh, intrinsic_matrix, extrinsic_matrix, res_x, res_y, renderer=None):
     """! Render an image on camera plane with given intrinsic and extrinsic matrices
     @param   mesh                Triangular mesh.
     @param   intrinsic_matrix    Camera intrinsic matrix.
     @param   extrinsic_matrix    Extrinsix matrix in 4x4 format.
     @param   res_x               Image resolution in x-axis.
     @param   res_y               Image resolution in y-axis
+    @param   renderer            Renderer from createRenderer, a new one is created if None.
 
     @return  img                 Image in numpy format.
     """
-    renderer = rendering.OffscreenRenderer(res_x, res_y)
-    if tensor_mesh is None:
-      material = o3d.visualization.rendering.MaterialRecord()
-      material.shader = mesh.material.material_name
-      material.albedo_img = mesh.material.texture_maps["albedo"].to_legacy()
-    else:
-      material = materialToMaterialRecord(tensor_mesh[0].material)
-    renderer.scene.add_geometry("mesh", mesh, material)
-    renderer.scene.scene.set_sun_light(SUNLIGHT_DIRECTION,
-                                       SUNLIGHT_COLOR,
-                                       SUNLIGHT_INTENSITY)
-    renderer.scene.scene.enable_sun_light(True)
-    renderer.scene.show_axes(False)
-    renderer.setup_camera(intrinsic_matrix, extrinsic_matrix, res_x, res_y)
-    img = renderer.render_to_image()
-    return np.array(img)
+    with self._renderLock():
+      if renderer is None:
+        renderer = self.createRenderer(mesh, tensor_mesh, res_x, res_y)
+      renderer.setup_camera(intrinsic_matrix, extrinsic_matrix, res_x, res_y)
+      img = np.array(renderer.render_to_image())
+      # A renderer created here is released before the lock
+      renderer = None
+    return img
 
   def findApriltagsInFrame(self, source_image, store=False, intrinsics=None):
     """! Detects the apriltags in the source image using the apriltag class detector.
@@ -117,119 +292,258 @@ class CameraCalibrationApriltag:
 
     @return  dict            Return data format {"apriltag_id":"apriltag_id_centers"}.
     """
+    tags = self.detectApriltags(source_image, intrinsics)
+    apriltag_2d_centers = {str(tag.tag_id): tag.center for tag in tags}
+    if store:
+      self.apriltags_2d_data = apriltag_2d_centers
+    return apriltag_2d_centers
+
+  def detectApriltags(self, source_image, intrinsics=None):
+    """! Run the apriltag detector on an image.
+    @param   source_image    Image in which apriltags are to be detected.
+    @param   intrinsics      Source Camera Intrinsics.
+
+    @return  list            Detected tags with id, center and corners in pixels.
+    """
     intrinsics_matrix = intrinsics if intrinsics is not None else self.intrinsic_matrix_2d
     grayed_image = cv2.cvtColor(source_image, cv2.COLOR_BGR2GRAY)
-    tags = self.atag_detector.detect(grayed_image,
+    return self.atag_detector.detect(grayed_image,
                                      estimate_tag_pose=True,
                                      camera_params=(intrinsics_matrix[0][0],
                                                     intrinsics_matrix[1][1],
                                                     intrinsics_matrix[0][2],
                                                     intrinsics_matrix[1][2]),
                                      tag_size=self.tag_size)
-    apriltag_2d_centers = {str(tag.tag_id): tag.center for tag in tags}
-    if store:
-      self.apriltags_2d_data = apriltag_2d_centers
-    return apriltag_2d_centers
 
-  def identifyApriltagsInScene(self, res_x, res_y, rotational_matrix):
+  def sweepSettings(self):
+    """! Settings of the tile sweep and the detector that determine the apriltags found in a map.
+
+    @return  dict            JSON serializable settings.
+    """
+    return {
+      "tag_size": self.tag_size,
+      "tile_size": TILE_SIZE,
+      "fov": DEFAULT_FOV,
+      "rotation": DEFAULT_ROTATION_MATRIX,
+      "mesh_rotation": DEFAULT_MESH_ROTATION.tolist(),
+      "tile_renderer": self.tile_renderer,
+      "detector": DETECTOR_PARAMS,
+    }
+
+  def identifyApriltagsInScene(self, res_x, res_y, rotational_matrix, workers=None):
     """! Identify apriltags in a scene map, based on a bounding box approach.
+         The virtual camera tiles that see the map are spread over a pool of
+         worker processes, each rendering with a single reused renderer.
     @param   res_x               Image resolution in x-axis.
     @param   res_y               Image resolution in y-axis.
     @param   rotational_matrix   Rotational matrix in 3x3 format.
+    @param   workers             Number of worker processes, defaults to SWEEP_WORKERS.
 
     @return  None
     """
+    self.prepareTileSweep(res_x, res_y)
+    all_tiles = self.sweepTiles(rotational_matrix)
+    tiles = [tile for tile in all_tiles if self.tileSeesMesh(self.tileCameraPose(*tile))]
+
+    workers = min(workers or SWEEP_WORKERS or os.cpu_count() or 1, len(tiles))
+    if workers <= 1:
+      # The reused renderer is created, used and released under the render lock
+      with self._renderLock():
+        tile_results = [self.detectApriltagsInTile(*tile) for tile in tiles]
+        self.renderer = None
+    else:
+      # Spawned workers load the (already converted) map themselves; the GL
+      # context of a renderer must not be shared with forked processes
+      init_args = (self.map_info[0], self.scale, self.scene_name, self.intrinsic_matrix_2d, self.tag_size,
+                   self.tile_renderer)
+      with ProcessPoolExecutor(max_workers=workers,
+                               mp_context=multiprocessing.get_context("spawn"),
+                               initializer=_initTileWorker,
+                               initargs=(init_args, res_x, res_y)) as pool:
+        tile_results = list(pool.map(_detectApriltagsInTile, tiles,
+                                     chunksize=max(1, len(tiles) // (4 * workers))))
+
+    # Merge in sweep order, so later tiles take precedence as in a sequential sweep
     apriltag_3d_data = {}
-    new_intrinsic_matrix = CameraIntrinsics(intrinsics=DEFAULT_FOV,
-                                            resolution=[TILE_SIZE, TILE_SIZE])
+    apriltag_corners_3d = {}
+    for current_apriltags, current_corners in tile_results:
+      apriltag_3d_data |= current_apriltags
+      apriltag_corners_3d |= current_corners
+
+    self.renderer = None
+    self.result_data_3d = apriltag_3d_data
+    self.result_corners_3d = apriltag_corners_3d
+    return
+
+  def prepareTileSweep(self, res_x, res_y):
+    """! Load the map mesh and its raycasting scene for the tile sweep.
+    @param   res_x               Image resolution in x-axis.
+    @param   res_y               Image resolution in y-axis.
+
+    @return  None
+    """
     self.triangle_mesh, self.tensor_tmesh = extractTriangleMesh(self.map_info, DEFAULT_MESH_ROTATION)
-    scene = o3d.t.geometry.RaycastingScene()
-    scene.add_triangles(self.triangle_mesh)
+    self.raycasting_scene = o3d.t.geometry.RaycastingScene()
+    self.raycasting_scene.add_triangles(self.triangle_mesh)
+    self.tile_intrinsics = CameraIntrinsics(intrinsics=DEFAULT_FOV,
+                                            resolution=[TILE_SIZE, TILE_SIZE])
+    self.tile_resolution = (res_x, res_y)
+    # Created on the first rendered tile and reused for all further tiles
+    self.renderer = None
+    return
+
+  def sweepTiles(self, rotational_matrix):
+    """! Positions of the virtual camera covering the map bounding box.
+    @param   rotational_matrix   Rotational matrix in 3x3 format.
+
+    @return  tiles               List of (x, y, rotational_matrix) in sweep order.
+    """
     max_bounding_box = self.triangle_mesh.get_max_bound()
     min_bounding_box = self.triangle_mesh.get_min_bound()
-
-    # Move virtual camera within bounding box, detect apriltags and
-    # use raycasting to get 3D coordinates of apriltag center points.
+    tiles = []
     bby = min_bounding_box[1].item()
     while bby < max_bounding_box[1].item():
       bbx = min_bounding_box[0].item()
       while bbx < max_bounding_box[0].item():
-        pose_dict = {
-          'rotation': rotational_matrix,
-          'translation': [bbx, bby, self.zval],
-          'scale': [1.0, 1.0, 1.0]
-        }
-        camera_pose = CameraPose(pose=pose_dict,
-                                 intrinsics=new_intrinsic_matrix)
-        extrinsic_matrix = np.linalg.inv(camera_pose.pose_mat)
-        rendered_img = self.renderCamView(self.triangle_mesh,
-                                          self.tensor_tmesh,
-                                          new_intrinsic_matrix.intrinsics,
-                                          extrinsic_matrix,
-                                          res_x, res_y)
-        imgpts = self.findApriltagsInFrame(rendered_img, intrinsics=new_intrinsic_matrix.intrinsics)
-        if len(imgpts) != 0:
-          current_apriltags = self.getCorresponding3DPoints(imgpts,
-                                                            new_intrinsic_matrix.intrinsics,
-                                                            camera_pose.pose_mat,
-                                                            scene)
-          apriltag_3d_data |= current_apriltags
+        tiles.append((bbx, bby, rotational_matrix))
         bbx = bbx + self.fixed_step_size
       bby = bby + self.fixed_step_size
+    return tiles
 
-    self.result_data_3d = apriltag_3d_data
-    return
+  def tileCameraPose(self, bbx, bby, rotational_matrix):
+    """! Pose of the virtual camera above a tile.
+    @param   bbx                 Camera position in x-axis.
+    @param   bby                 Camera position in y-axis.
+    @param   rotational_matrix   Rotational matrix in 3x3 format.
 
-  def createRaysForCasting(self, img_pts, pose_mat, intrinsic_matrix):
-    """! Generate Rays for casting.
-    @param    img_pts           Apriltag Points in 2d plane.
+    @return  camera_pose         CameraPose of the virtual camera.
+    """
+    pose_dict = {
+      'rotation': rotational_matrix,
+      'translation': [bbx, bby, self.zval],
+      'scale': [1.0, 1.0, 1.0]
+    }
+    return CameraPose(pose=pose_dict, intrinsics=self.tile_intrinsics)
+
+  def tileSeesMesh(self, camera_pose):
+    """! Check with a coarse grid of rays whether any part of the map is in view.
+    @param   camera_pose         CameraPose of the virtual camera.
+
+    @return  True/False
+    """
+    probe_scale = TILE_PROBE_RESOLUTION / TILE_SIZE
+    probe_intrinsics = np.array(self.tile_intrinsics.intrinsics, dtype=np.float64)
+    probe_intrinsics[:2] *= probe_scale
+    rays = o3d.t.geometry.RaycastingScene.create_rays_pinhole(
+      intrinsic_matrix=o3d.core.Tensor(probe_intrinsics),
+      extrinsic_matrix=o3d.core.Tensor(np.linalg.inv(camera_pose.pose_mat)),
+      width_px=TILE_PROBE_RESOLUTION,
+      height_px=TILE_PROBE_RESOLUTION)
+    t_hit = self.raycasting_scene.cast_rays(rays)['t_hit'].numpy()
+    return bool(np.isfinite(t_hit).any())
+
+  def detectApriltagsInTile(self, bbx, bby, rotational_matrix):
+    """! Render the map from the virtual camera above a tile, detect apriltags
+         and use raycasting to get 3D coordinates of apriltag centers and corners.
+    @param   bbx                 Camera position in x-axis.
+    @param   bby                 Camera position in y-axis.
+    @param   rotational_matrix   Rotational matrix in 3x3 format.
+
+    @return  dict, dict          Apriltag centers in 3D {"apriltag_id": [x, y, z]} and
+                                 corners in 3D {"apriltag_id": [[x, y, z], ...]}.
+    """
+    res_x, res_y = self.tile_resolution
+    camera_pose = self.tileCameraPose(bbx, bby, rotational_matrix)
+    if self.renderer is None:
+      self.renderer = self.createRenderer(self.triangle_mesh, self.tensor_tmesh, res_x, res_y)
+    extrinsic_matrix = np.linalg.inv(camera_pose.pose_mat)
+    rendered_img = self.renderCamView(self.triangle_mesh,
+                                      self.tensor_tmesh,
+                                      self.tile_intrinsics.intrinsics,
+                                      extrinsic_matrix,
+                                      res_x, res_y,
+                                      renderer=self.renderer)
+    tags = self.detectApriltags(rendered_img, intrinsics=self.tile_intrinsics.intrinsics)
+    if len(tags) == 0:
+      return {}, {}
+    # Centers and corners of all tags are cast in one batch, one row per tag
+    points_2d = np.array([np.vstack((tag.center, tag.corners)) for tag in tags])
+    points_3d, hits = self.castImagePoints(points_2d.reshape(-1, 2),
+                                           self.tile_intrinsics.intrinsics,
+                                           camera_pose.pose_mat,
+                                           self.raycasting_scene)
+    points_3d = points_3d.reshape(len(tags), -1, 3)
+    hits = hits.reshape(len(tags), -1)
+    centers, corners = {}, {}
+    for tag, tag_points, tag_hits in zip(tags, points_3d, hits):
+      if not tag_hits[0]:
+        continue
+      tag_id = str(tag.tag_id)
+      centers[tag_id] = tag_points[0].tolist()
+      if tag_hits[1:].all():
+        corners[tag_id] = tag_points[1:].tolist()
+    return centers, corners
+
+  def createRayTensor(self, points_2d, pose_mat, intrinsic_matrix):
+    """! Generate the rays through image points for casting, all points at once.
+    @param    points_2d         Image points as an N x 2 array.
     @param    pose_mat          Camera Pose Matrix.
     @param    intrinsic_matrix  Intrinsic Matrix.
 
-    @return   rays              List of rays.
+    @return   rays              N x 6 tensor of ray origins and unit directions.
     """
-    homogeneous_pose_mat = np.matmul(pose_mat,
-                                     np.array([0.0, 0.0, 0.0, 1]))[:3]
-    rays = []
-    for id in img_pts:
-      undistort_points = cv2.undistortPoints(np.float64(img_pts[id]),
-                                             intrinsic_matrix, None)[0][0]
-      undistorted_pose_mat = np.matmul(pose_mat,
-                                         np.append(undistort_points, [1., 1, ]))[0:3]
-      ray = [homogeneous_pose_mat, undistorted_pose_mat]
-      rays.append(ray)
-    rays = [[ray[0], ray[1] - ray[0]] for ray in rays]
-    rays = [np.append(ray[0], ray[1] / np.linalg.norm(ray[1])) for ray in rays]
-    rays = o3d.core.Tensor(rays, dtype=o3d.core.Dtype.Float32)
-    return rays
-
-  def getImagePointsFromRayCasting(self, rays, img_pts, cast_results):
-    """! Based on ray casting(Open3d), get matching 2d image points in 3d plane.
-    @param    rays              Rays from ray casting.
-    @param    img_pts           Image points in 2d image space.
+    points_2d = np.asarray(points_2d, dtype=np.float64).reshape(-1, 1, 2)
+    pose_mat = np.asarray(pose_mat, dtype=np.float64)
+    rays = np.empty((len(points_2d), 6), dtype=np.float32)
+    if len(points_2d):
+      normalized = cv2.undistortPoints(points_2d, np.asarray(intrinsic_matrix, dtype=np.float64),
+                                       None).reshape(-1, 2)
+      # Direction from the camera center to the point on the z = 1 image plane
+      directions = normalized @ pose_mat[:3, :2].T + pose_mat[:3, 2]
+      rays[:, :3] = pose_mat[:3, 3]
+      rays[:, 3:] = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+    return o3d.core.Tensor(rays)
+
+  def getHitPoints(self, rays, cast_results):
+    """! Points where the rays hit the mesh.
+    @param    rays              Ray tensor from createRayTensor.
     @param    cast_results      Ray casting results.
 
-    @return   result_array_3d   Corresponding points in 2d and 3d plane.
+    @return   points, hits      N x 3 array of hit points and N boolean array,
+                                False for rays that miss the mesh.
     """
-    result_array_3d = {}
-    for i, id in enumerate(img_pts.keys()):
-      # Results of succesful hit of rays from image to mesh.
-      # http://www.open3d.org/docs/release/python_api/open3d.t.geometry.RaycastingScene.html
-      pt = rays[i][:3] + rays[i][-3:] * cast_results['t_hit'][i]
-      point = pt.numpy().tolist()
-      if float('inf') not in point or float('-inf') not in point:
-        result_array_3d[id] = point
+    # http://www.open3d.org/docs/release/python_api/open3d.t.geometry.RaycastingScene.html
+    rays = rays.numpy()
+    t_hit = cast_results['t_hit'].numpy()
+    hits = np.isfinite(t_hit)
+    points = rays[:, :3] + rays[:, 3:] * np.where(hits, t_hit, 0)[:, None]
+    return points, hits
+
+  def castImagePoints(self, points_2d, intrinsics, pose_mat, scene):
+    """! Cast rays through image points and get the 3D points they hit.
+    @param    points_2d         Image points as an N x 2 array.
+    @param    intrinsics        Intrinsic Matrix.
+    @param    pose_mat          Camera Pose Matrix.
+    @param    scene             Open3d RaycastingScene of the map.
 
-    return result_array_3d
+    @return   points, hits      N x 3 array of hit points and N boolean array.
+    """
+    rays = self.createRayTensor(points_2d, pose_mat, intrinsics)
+    return self.getHitPoints(rays, scene.cast_rays(rays))
 
   def getCorresponding3DPoints(self, points_2d, intrinsics, pose_mat, scene):
-    rays = self.createRaysForCasting(points_2d,
-                                     pose_mat,
-                                     intrinsics)
-    cast_results = scene.cast_rays(rays)
-    return self.getImagePointsFromRayCasting(rays,
-                                             points_2d,
-                                             cast_results)
+    """! Get the 3D points matching image points, skipping points off the mesh.
+    @param    points_2d         Image points {"id": [x, y]}.
+    @param    intrinsics        Intrinsic Matrix.
+    @param    pose_mat          Camera Pose Matrix.
+    @param    scene             Open3d RaycastingScene of the map.
+
+    @return   result_array_3d   3D points {"id": [x, y, z]}.
+    """
+    if not points_2d:
+      return {}
+    points_3d, hits = self.castImagePoints(list(points_2d.values()), intrinsics, pose_mat, scene)
+    return {id: point.tolist() for id, point, hit in zip(points_2d, points_3d, hits) if hit}
 
   def getPointCorrespondences(self):
     """! Returns correspondences between points in 2D and 3D.
@@ -239,7 +553,7 @@ class CameraCalibrationApriltag:
     points_3d, points_2d = [], []
     for point in self.apriltags_2d_data:
       if point in self.result_data_3d:
-        points_2d.append(self.apriltags_2d_data[point].tolist())
+        points_2d.append(np.asarray(self.apriltags_2d_data[point]).tolist())
         points_3d.append(self.result_data_3d[point])
     return points_3d, points_2d
 
@@ -253,11 +567,7 @@ class CameraCalibrationApriltag:
     if len(self.apriltags_2d_data) < MIN_APRILTAG_COUNT or \
        len(self.result_data_3d) < MIN_APRILTAG_COUNT:
       return None
-    points_3d, points_2d = [], []
-    for key in self.apriltags_2d_data:
-      if key in self.result_data_3d:
-        points_3d.append(self.result_data_3d[key])
-        points_2d.append(self.apriltags_2d_data[key])
+    points_3d, points_2d = self.getPointCorrespondences()
     if len(points_2d) < MIN_APRILTAG_COUNT:
       raise TypeError(f"{len(points_2d)} apriltags found in camera feed, at least {MIN_APRILTAG_COUNT} expected")
     computed_pose_data = {"camera points": np.array(points_2d, dtype="float32"),
@@ -273,12 +583,10 @@ class CameraCalibrationApriltag:
     @return  points   Five points on image, when connected by a line looks like a frustum.
     """
     res_x, res_y = TILE_SIZE, TILE_SIZE
-    bottom_right_corner = cv2.undistortPoints(np.float64([res_x, res_y]),
-                                              self.intrinsic_matrix_2d,
-                                              None)[0][0].tolist()
-    top_left_corner = cv2.undistortPoints(np.float64([0, 0]),
-                                          self.intrinsic_matrix_2d,
-                                          None)[0][0].tolist()
+    bottom_right_corner, top_left_corner = cv2.undistortPoints(
+      np.float64([[[res_x, res_y]], [[0, 0]]]),
+      np.asarray(self.intrinsic_matrix_2d, dtype=np.float64),
+      None).reshape(-1, 2).tolist()
     return [
       [0, 0, 0],
       [bottom_right_corner[0], bottom_right_corner[1], 1],
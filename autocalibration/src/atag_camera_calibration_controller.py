@@ -13,6 +13,7 @@ from scene_common import log
 from scene_common.transform import CameraPose, convertToTransformMatrix, getPoseMatrix, CameraIntrinsics
 from scene_common.timestamp import get_iso_time
 
+from apriltag_map_registry import ApriltagMapRegistry, computeMapKey
 from atag_camera_calibration import CameraCalibrationApriltag, \
     TILE_SIZE, DEFAULT_ROTATION_MATRIX, DEFAULT_MESH_ROTATION, MIN_APRILTAG_COUNT
 from auto_camera_calibration_controller import CameraCalibrationController
@@ -26,12 +27,18 @@ class ApriltagCameraCalibrationController(CameraCalibrationController):
   camera calibration processes occuring in the container.
   """
 
+  def __init__(self, calibration_data_interface, map_registry=None):
+    super().__init__(calibration_data_interface)
+    self.map_registry = map_registry or ApriltagMapRegistry()
+    return
+
   def processSceneForCalibration(self, sceneobj, map_update=False):
     """! The following tasks are done in this function:
          1) Create AutoCalibration Object.
          2) If Scene is not updated, use data stored in database.
-            If Scene is updated, identify all the apriltags in the scene
-            and store data to database.
+            If Scene is updated, take the apriltags of the map from the map
+            registry, or identify all the apriltags in the scene and add
+            them to the registry, and store data to database.
          3) Publish ready message to UI, allowing it to enable the calibration button.
     @param   sceneobj     Scene object
     @param   map_update   Flag is set when there is a map update in scene object.
@@ -58,9 +65,12 @@ class ApriltagCameraCalibrationController(CameraCalibrationController):
     if sceneobj.map_processed is None or map_update:
       try:
         with self.cam_calib_objs[sceneobj.id].cam_calib_lock:
-          self.cam_calib_objs[sceneobj.id].identifyApriltagsInScene(TILE_SIZE,
-                                                                    TILE_SIZE,
-                                                                    DEFAULT_ROTATION_MATRIX)
+          map_key = self.mapRegistryKey(self.cam_calib_objs[sceneobj.id])
+          if not self.loadFromMapRegistry(self.cam_calib_objs[sceneobj.id], map_key):
+            self.cam_calib_objs[sceneobj.id].identifyApriltagsInScene(TILE_SIZE,
+                                                                      TILE_SIZE,
+                                                                      DEFAULT_ROTATION_MATRIX)
+            self.storeInMapRegistry(self.cam_calib_objs[sceneobj.id], map_key)
           if self.cam_calib_objs[sceneobj.id].result_data_3d is not None:
             self.saveToDatabase(sceneobj, self.cam_calib_objs[sceneobj.id].result_data_3d)
           log.info("Apriltag center points in 3D identified and saved to database.")
@@ -99,6 +109,46 @@ class ApriltagCameraCalibrationController(CameraCalibrationController):
     else:
       return (sceneobj.map_processed is None)
 
+  def mapRegistryKey(self, cam_calib_obj):
+    """! Key of the scene map in the map registry.
+    @param   cam_calib_obj   CameraCalibrationApriltag object of the scene.
+
+    @return  key             Hash of the map contents, scale and sweep settings.
+    """
+    return computeMapKey(cam_calib_obj.map_file, cam_calib_obj.scale, cam_calib_obj.sweepSettings())
+
+  def loadFromMapRegistry(self, cam_calib_obj, map_key):
+    """! Restore the apriltags of a map that was registered before.
+    @param   cam_calib_obj   CameraCalibrationApriltag object of the scene.
+    @param   map_key         Key from mapRegistryKey.
+
+    @return  True/False      True if the map was found in the registry.
+    """
+    entry = self.map_registry.get(map_key)
+    if entry is None:
+      return False
+    tags = entry['tags']
+    cam_calib_obj.result_data_3d = {tag_id: tag['center'] for tag_id, tag in tags.items()}
+    cam_calib_obj.result_corners_3d = {tag_id: tag['corners'] for tag_id, tag in tags.items()
+                                       if tag.get('corners') is not None}
+    log.info(f"Apriltags of map {cam_calib_obj.map_file} taken from map registry {map_key[:12]}.")
+    return True
+
+  def storeInMapRegistry(self, cam_calib_obj, map_key):
+    """! Add the apriltags identified in a map to the map registry.
+    @param   cam_calib_obj   CameraCalibrationApriltag object of the scene.
+    @param   map_key         Key from mapRegistryKey.
+
+    @return  None
+    """
+    if cam_calib_obj.result_data_3d is None:
+      return
+    corners_3d = cam_calib_obj.result_corners_3d or {}
+    tags = {tag_id: {'center': center, 'corners': corners_3d.get(tag_id)}
+            for tag_id, center in cam_calib_obj.result_data_3d.items()}
+    self.map_registry.put(map_key, tags, cam_calib_obj.sweepSettings(), cam_calib_obj.map_file)
+    return
+
   def saveToDatabase(self, scene, atag_points_3d):
     """! Function stores baseapriltag data into db.
     @param   scene             Scene database object.
@@ -138,7 +188,7 @@ class ApriltagCameraCalibrationController(CameraCalibrationController):
     rotation = None
     if os.path.splitext(sceneobj.map)[1].lower() == '.glb':
       rotation = DEFAULT_MESH_ROTATION
-    self.scene_pose_mat = getPoseMatrix(sceneobj, rotation)
+    scene_pose_mat = getPoseMatrix(sceneobj, rotation)
     cam_calib_data = {}
     cam_calib_data['error'] = "True"
     try:
@@ -171,14 +221,14 @@ class ApriltagCameraCalibrationController(CameraCalibrationController):
         points_3d, points_2d = cur_cam_calib_obj.getPointCorrespondences()
         log.info(f"Point correspondences calculated for calibration UI for camera {cam_frame_data['id']}")
 
-        cam_to_world_y_down = convertToTransformMatrix(self.scene_pose_mat,
+        cam_to_world_y_down = convertToTransformMatrix(scene_pose_mat,
                                                        cam_pose.quaternion_rotation.tolist(),
                                                        camera_pose[0:3, 3:].flatten().tolist())
         quat = Rotation.from_matrix(cam_to_world_y_down[0:3, 0:3]).as_quat()
         trans = np.ravel(cam_to_world_y_down[0:3, 3:4].flatten())
 
         # Apply scene pose to 3d calibration points.
-        points_3d = [np.dot(self.scene_pose_mat, np.append(point, 1))[:3].tolist()
+        points_3d = [np.dot(scene_pose_mat, np.append(point, 1))[:3].tolist()
                      for point in points_3d]
 
         cam_calib_data['scene_name'] = sceneobj.name
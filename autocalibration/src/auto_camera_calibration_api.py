@@ -9,6 +9,8 @@ from flask import Flask, jsonify, request
 from flask_socketio import SocketIO
 from werkzeug.exceptions import BadRequest, NotFound, InternalServerError, RequestEntityTooLarge
 
+from calibration_job_queue import QUEUED, QueueFullError
+
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("autocalibration-rest")
 
@@ -106,6 +108,7 @@ class CameraCalibrationApi:
     CAMERA_ID = "cameraId"
     IMAGE = "image"
     INTRINSICS = "intrinsics"
+    QUEUE_POSITION = "queuePosition"
 
     class Status:
       BUSY = "busy"
@@ -285,6 +288,14 @@ class CameraCalibrationApi:
       raise SceneNotFoundError(scene_id)
     return scene
 
+  def _addQueuePosition(self, response, job_key, operation):
+    """Add the queue position to a status response while the job is waiting."""
+    state, position = self.calibrationContext.jobStatus(job_key)
+    if state == QUEUED and position is not None:
+      response[self.OpenApi.QUEUE_POSITION] = position
+      response[self.OpenApi.MESSAGE] = f"{operation} queued at position {position}"
+    return
+
   def _validateSceneForOperation(self, scene, operation):
     """Validate scene can be used for the specified operation."""
     if scene.camera_calibration == "Manual":
@@ -395,21 +406,24 @@ class CameraCalibrationApi:
 
       if strategy.isMapUpdated(scene):
         log.info(f"Scene map updated for {sceneId}")
-        if self.calibrationContext.register_thread_lock.locked():
-          log.info(f"Registration busy for {sceneId}")
-          register_response = {
-              self.OpenApi.STATUS: self.OpenApi.Status.BUSY,
-              self.OpenApi.SCENE_ID: sceneId,
-              self.OpenApi.MESSAGE: "Registration is currently busy"
-          }
-        else:
+        try:
+          self.calibrationContext.sceneUpdateThreadWrapper(scene, map_update=True)
           log.info(f"Registration triggered for {sceneId}")
           register_response = {
               self.OpenApi.STATUS: self.OpenApi.Status.REGISTERING,
               self.OpenApi.SCENE_ID: sceneId,
               self.OpenApi.MESSAGE: "Registration started"
           }
-          self.calibrationContext.sceneUpdateThreadWrapper(scene, map_update=True)
+          self._addQueuePosition(register_response,
+                                 self.calibrationContext.registrationJobKey(sceneId),
+                                 "Registration")
+        except QueueFullError:
+          log.info(f"Registration busy for {sceneId}")
+          register_response = {
+              self.OpenApi.STATUS: self.OpenApi.Status.BUSY,
+              self.OpenApi.SCENE_ID: sceneId,
+              self.OpenApi.MESSAGE: "Registration is currently busy"
+          }
       else:
         log.info(f"Processing scene for calibration: {sceneId}")
         result = strategy.processSceneForCalibration(scene)
@@ -440,12 +454,8 @@ class CameraCalibrationApi:
       strategy = self._getCalibrationStrategy(scene)
 
       if strategy.isMapUpdated(scene):
-        if self.calibrationContext.register_thread_lock.locked():
-          status = self.OpenApi.Status.BUSY
-          message = "Registration is currently busy"
-        else:
-          status = self.OpenApi.Status.REGISTERING
-          message = "Registration is in progress"
+        status = self.OpenApi.Status.REGISTERING
+        message = "Registration is in progress"
       else:
         status = self.OpenApi.Status.SUCCESS
         message = "Registration is complete"
@@ -455,6 +465,10 @@ class CameraCalibrationApi:
           self.OpenApi.SCENE_ID: sceneId,
           self.OpenApi.MESSAGE: message
       }
+      if status == self.OpenApi.Status.REGISTERING:
+        self._addQueuePosition(response,
+                               self.calibrationContext.registrationJobKey(sceneId),
+                               "Registration")
 
       log.info(f"Returning registration status for {sceneId}: {response}")
       return jsonify(response), 200
@@ -470,7 +484,15 @@ class CameraCalibrationApi:
 
       if strategy.isMapUpdated(scene):
         strategy.resetScene(scene)
-        self.calibrationContext.sceneUpdateThreadWrapper(scene, map_update=True)
+        try:
+          self.calibrationContext.sceneUpdateThreadWrapper(scene, map_update=True)
+        except QueueFullError:
+          log.info(f"Registration busy for {sceneId}")
+          return jsonify({
+              self.OpenApi.STATUS: self.OpenApi.Status.BUSY,
+              self.OpenApi.SCENE_ID: sceneId,
+              self.OpenApi.MESSAGE: "Registration is currently busy"
+          }), 200
         log.info(f"Scene update triggered for {sceneId}")
         return jsonify({self.OpenApi.MESSAGE: "Scene update triggered"}), 202
       else:
@@ -516,11 +538,22 @@ class CameraCalibrationApi:
         self.calibrationContext.calibrateCameraThreadWrapper(
             scene, cameraId, intrinsics, cam_frame_data
         )
-        return jsonify({
+        response = {
             self.OpenApi.STATUS: self.OpenApi.Status.CALIBRATING,
             self.OpenApi.CAMERA_ID: cameraId,
             self.OpenApi.MESSAGE: "Calibration started"
-        }), 202
+        }
+        self._addQueuePosition(response,
+                               self.calibrationContext.calibrationJobKey(cameraId),
+                               "Calibration")
+        return jsonify(response), 202
+      except QueueFullError:
+        log.info(f"Calibration busy for camera {cameraId}")
+        return jsonify({
+            self.OpenApi.STATUS: self.OpenApi.Status.BUSY,
+            self.OpenApi.CAMERA_ID: cameraId,
+            self.OpenApi.MESSAGE: "Too many calibrations are waiting"
+        }), 200
       except Exception as e:
         log.error(f"Calibration failed for camera {cameraId}: {e}")
         raise CameraCalibrationError(f"Calibration failed: {str(e)}")
@@ -533,15 +566,6 @@ class CameraCalibrationApi:
       scene = self._getCamera(cameraId)
       self._validateSceneForOperation(scene, "queried")
 
-      if self.calibrationContext.calibration_thread_lock.locked():
-        response = {
-            self.OpenApi.CAMERA_ID: cameraId,
-            self.OpenApi.SCENE_ID: getattr(scene, "id", None),
-            self.OpenApi.STATUS: self.OpenApi.Status.BUSY,
-            self.OpenApi.MESSAGE: "Calibration is currently in progress"
-        }
-        return jsonify(response), 200
-
       result = self.calibrationContext.calibration_results.get(cameraId)
       if result is None:
         response = {
@@ -558,6 +582,9 @@ class CameraCalibrationApi:
             self.OpenApi.STATUS: self.OpenApi.Status.CALIBRATING,
             self.OpenApi.MESSAGE: "Calibration in progress"
         }
+        self._addQueuePosition(response,
+                               self.calibrationContext.calibrationJobKey(cameraId),
+                               "Calibration")
         return jsonify(response), 200
 
       response = {
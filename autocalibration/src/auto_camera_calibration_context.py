@@ -2,10 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
-import threading
 
 from atag_camera_calibration_controller import ApriltagCameraCalibrationController
 from auto_camera_calibration_model import CameraCalibrationModel
+from calibration_job_queue import CalibrationJobQueue, QueueFullError
 from markerless_camera_calibration_controller import MarkerlessCameraCalibrationController
 
 from scene_common import log
@@ -25,9 +25,7 @@ class CameraCalibrationContext:
     self.socket_scene_clients = {}
     self.socketio = None
 
-    self.register_thread_lock = threading.Lock()
-    self.calibration_thread_lock = threading.Lock()
-    self.current_processing_scene = None
+    self.job_queue = CalibrationJobQueue()
 
     return
 
@@ -39,23 +37,23 @@ class CameraCalibrationContext:
     all_scene_objects = self.calibration_data_interface.allScenes()
     for scene_object in all_scene_objects:
       if scene_object.camera_calibration != "Manual":
-        self.sceneUpdateThreadWrapper(scene_object, map_update=False)
+        # Every scene is validated on start, however many there are
+        self.sceneUpdateThreadWrapper(scene_object, map_update=False, bounded=False)
         log.info(f"Validating Scene = {scene_object.name} on start.")
     return
 
-  def sceneUpdateThreadWrapper(self, sceneobj, map_update=False):
-    """! function checks if lock is not acquired and processes the
-    scene with updated metadata.
-    status.
+  def sceneUpdateThreadWrapper(self, sceneobj, map_update=False, bounded=True):
+    """! Queues the processing of the scene with updated metadata.
+    A registration already waiting for the scene is merged with this one.
     @param   sceneobj      scene object.
     @param   map_update    boolean for re-registering the scene.
+    @param   bounded       raise QueueFullError when the queue is full.
 
-    @return  None
+    @return  job           Queued or running registration job.
     """
-    if not self.register_thread_lock.locked():
-      thread = threading.Thread(target=self.processScene, args=(sceneobj, map_update))
-      thread.start()
-    return
+    return self.job_queue.submit(self.registrationJobKey(sceneobj.id), sceneobj.id,
+                                 self.processScene, (sceneobj, map_update), rerun=map_update,
+                                 bounded=bounded)
 
   def processScene(self, sceneobj, map_update):
     """! function processes the uploaded scene(image/glb) and publish back the
@@ -65,60 +63,77 @@ class CameraCalibrationContext:
 
     @return  None
     """
-    with self.register_thread_lock:
-      try:
-        response_dict = self.scene_strategies[sceneobj.camera_calibration].processSceneForCalibration(sceneobj, map_update)
-      except (FileNotFoundError, KeyError) as e:
-        log.error(f"Error in register dataset : {e}")
-    self.current_processing_scene = {}
+    try:
+      response_dict = self.scene_strategies[sceneobj.camera_calibration].processSceneForCalibration(sceneobj, map_update)
+    except (FileNotFoundError, KeyError) as e:
+      log.error(f"Error in register dataset : {e}")
     return
 
   def calibrateCameraThreadWrapper(self, sceneobj, cameraId, intrinsics, cam_frame_data):
     """
-    Starts a background thread to process camera calibration for REST API.
+    Queues the camera calibration for REST API. A calibration already waiting
+    for the camera is updated with the latest frame and one already running is
+    reused. Raises QueueFullError if no more calibrations can be queued.
     """
-    if not self.calibration_thread_lock.locked():
-      self.socketio.start_background_task(
-          self.processCameraCalibration,
-          sceneobj, cameraId, intrinsics, cam_frame_data
-      )
-      self.calibration_results[cameraId] = {
-          "status": "calibrating",
-          "message": "Calibration started"
-      }
-    else:
+    try:
+      job = self.job_queue.submit(self.calibrationJobKey(cameraId), sceneobj.id,
+                                  self.processCameraCalibration,
+                                  (sceneobj, cameraId, intrinsics, cam_frame_data))
+    except QueueFullError:
       self.calibration_results[cameraId] = {
           "status": "busy",
-          "message": "Another calibration is already in progress"
+          "message": "Too many calibrations are waiting"
       }
+      raise
+    self.calibration_results[cameraId] = {
+        "status": "calibrating",
+        "message": "Calibration started"
+    }
+    return job
+
+  def registrationJobKey(self, sceneId):
+    """! Job queue key of the registration of a scene. """
+    return f"scene:{sceneId}"
+
+  def calibrationJobKey(self, cameraId):
+    """! Job queue key of the calibration of a camera. """
+    return f"camera:{cameraId}"
+
+  def jobStatus(self, key):
+    """! Queue state of a registration or calibration.
+    @param   key           Job queue key.
+
+    @return  (state, position)  State of the job, None if there is no job, and
+                                its queue position, None if it is not waiting.
+    """
+    return self.job_queue.state(key), self.job_queue.position(key)
 
   def processCameraCalibration(self, sceneobj, cameraId, intrinsics, cam_frame_data):
     """
     Processes camera calibration in a background thread for REST API.
     Stores or updates calibration status/result in a suitable place.
     """
-    log.info(f"[processCameraCalibration] Thread started for camera {cameraId}")
-    with self.calibration_thread_lock:
-      try:
-        log.info(f"[processCameraCalibration] About to get strategy for {sceneobj.camera_calibration}")
-        strategy = self.scene_strategies.get(sceneobj.camera_calibration)
-        if not strategy:
-          result = {
-              "status": "error",
-              "message": "Calibration strategy not found"
-          }
-        else:
-          result = strategy.generateCalibration(sceneobj, intrinsics, cam_frame_data)
-      except Exception as e:
+    log.info(f"[processCameraCalibration] Job started for camera {cameraId}")
+    try:
+      log.info(f"[processCameraCalibration] About to get strategy for {sceneobj.camera_calibration}")
+      strategy = self.scene_strategies.get(sceneobj.camera_calibration)
+      if not strategy:
         result = {
             "status": "error",
-            "message": f"Calibration failed: {str(e)}"
+            "message": "Calibration strategy not found"
         }
-      # Store result for later retrieval
-      self.calibration_results[cameraId] = result
-      socket_id = self.socket_clients.get(cameraId)
-      if socket_id:
-        self.socketio.emit("calibration_result", {"camera_id": cameraId, "result": result}, to=socket_id)
-        log.info(f"Sent WebSocket result to {socket_id} for {cameraId}")
       else:
-        log.info(f"No socket_id found for {cameraId}, can't send result via WebSocket")
+        result = strategy.generateCalibration(sceneobj, intrinsics, cam_frame_data)
+    except Exception as e:
+      result = {
+          "status": "error",
+          "message": f"Calibration failed: {str(e)}"
+      }
+    # Store result for later retrieval
+    self.calibration_results[cameraId] = result
+    socket_id = self.socket_clients.get(cameraId)
+    if socket_id:
+      self.socketio.emit("calibration_result", {"camera_id": cameraId, "result": result}, to=socket_id)
+      log.info(f"Sent WebSocket result to {socket_id} for {cameraId}")
+    else:
+      log.info(f"No socket_id found for {cameraId}, can't send result via WebSocket")
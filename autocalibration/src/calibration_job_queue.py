@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import threading
+
+from scene_common import log
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+
+CALIBRATION_WORKERS = int(os.getenv("CALIBRATION_WORKERS", min(4, os.cpu_count() or 1)))
+CALIBRATION_QUEUE_SIZE = int(os.getenv("CALIBRATION_QUEUE_SIZE", 32))
+
+class QueueFullError(RuntimeError):
+  """! Raised when a job is submitted while the queue is at capacity. """
+
+class CalibrationJob:
+  """! Scene registration or camera calibration waiting for or running on a worker. """
+
+  def __init__(self, key, group, target, args):
+    self.key = key
+    self.group = group
+    self.target = target
+    self.args = args
+    self.state = QUEUED
+    return
+
+class CalibrationJobQueue:
+  """
+  Bounded queue of scene registrations and camera calibrations executed by a
+  pool of worker threads.
+
+  Jobs with the same key are deduplicated: submitting a job whose key is
+  already queued replaces its arguments, so only the latest request runs.
+  Jobs of the same group (scene) run one at a time because they share the
+  calibration object of the scene; jobs of different scenes run concurrently.
+  The worker threads are started lazily by the first submitted job.
+  """
+
+  def __init__(self, workers=CALIBRATION_WORKERS, max_queued=CALIBRATION_QUEUE_SIZE):
+    """! Initializes the queue.
+    @param   workers       Number of worker threads.
+    @param   max_queued    Maximum number of jobs waiting to run.
+
+    @return  None
+    """
+    self.workers = max(1, workers)
+    self.max_queued = max_queued
+    self.pending = []
+    self.running = {}
+    self.running_groups = set()
+    self.cond = threading.Condition()
+    self.threads = []
+    return
+
+  def submit(self, key, group, target, args=(), rerun=False, bounded=True):
+    """! Queue a job, or merge it with a queued or running job of the same key.
+    @param   key       Deduplication key of the job.
+    @param   group     Jobs of the same group never run concurrently.
+    @param   target    Callable executing the job.
+    @param   args      Arguments passed to target.
+    @param   rerun     Queue the job even if a job of the same key is running,
+                       so changes made while it runs are picked up.
+    @param   bounded   Refuse the job when max_queued jobs are waiting.
+
+    @return  job       The queued or running job handling the request.
+    """
+    with self.cond:
+      for job in self.pending:
+        if job.key == key:
+          job.args = args
+          return job
+      job = self.running.get(key)
+      if job is not None and not rerun:
+        return job
+      if bounded and len(self.pending) >= self.max_queued:
+        raise QueueFullError(f"Calibration queue is full ({self.max_queued} jobs waiting)")
+
+      job = CalibrationJob(key, group, target, args)
+      self.pending.append(job)
+      self.startWorkers()
+      self.cond.notify()
+    return job
+
+  def state(self, key):
+    """! State of the job of a key.
+    @param   key       Deduplication key of the job.
+
+    @return  state     QUEUED, RUNNING or None if there is no such job.
+    """
+    with self.cond:
+      if any(job.key == key for job in self.pending):
+        return QUEUED
+      if key in self.running:
+        return RUNNING
+    return None
+
+  def position(self, key):
+    """! Position of a queued job, 1 being the next job to run.
+    @param   key       Deduplication key of the job.
+
+    @return  position  Position in the queue, None if the job is not queued.
+    """
+    with self.cond:
+      for index, job in enumerate(self.pending):
+        if job.key == key:
+          return index + 1
+    return None
+
+  def startWorkers(self):
+    """! Start the worker threads not started yet; called with the lock held. """
+    while len(self.threads) < self.workers:
+      thread = threading.Thread(target=self.runWorker, daemon=True,
+                                name=f"calibration-worker-{len(self.threads)}")
+      self.threads.append(thread)
+      thread.start()
+    return
+
+  def nextJob(self):
+    """! Oldest pending job whose group is idle; called with the lock held. """
+    for index, job in enumerate(self.pending):
+      if job.group not in self.running_groups:
+        return self.pending.pop(index)
+    return None
+
+  def runWorker(self):
+    """! Worker loop running jobs until the process exits. """
+    while True:
+      with self.cond:
+        job = self.nextJob()
+        while job is None:
+          self.cond.wait()
+          job = self.nextJob()
+        job.state = RUNNING
+        self.running[job.key] = job
+        self.running_groups.add(job.group)
+
+      try:
+        job.target(*job.args)
+      except Exception as e:
+        log.error(f"Calibration job {job.key} failed: {e}")
+      finally:
+        with self.cond:
+          if self.running.get(job.key) is job:
+            del self.running[job.key]
+          self.running_groups.discard(job.group)
+          # Jobs held back by the finished group may be runnable now
+          self.cond.notify_all()
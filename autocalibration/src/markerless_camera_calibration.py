@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import base64
+import hashlib
+import json
+import os
 import shutil
 import tempfile
 from datetime import datetime
@@ -9,11 +12,15 @@ from pathlib import Path
 from threading import Lock
 
 import cv2
+import h5py
 import numpy as np
+import torch
 from addict import Dict
-from hloc import (extract_features, match_dense, match_features,
-                  pairs_from_retrieval)
+from hloc import (extract_features, extractors, match_dense, match_features,
+                  matchers)
 from hloc.pipelines.SceneScape import localize_scenescape
+from hloc.utils.base_model import cached_load
+from hloc.utils.io import list_h5_names
 from scipy.spatial.transform import Rotation
 
 from scene_common import log
@@ -23,6 +30,62 @@ DEPTH_SCALE = 6553.5
 DEPTH_MAX = 10
 CAMERA_MODEL = 'SIMPLE_PINHOLE'
 CAMERA_SCALE = [1.0, 1.0, 1.0]
+# Query features and matches are written to a memory backed directory
+QUERY_WORK_DIR = os.getenv("MARKERLESS_QUERY_DIR",
+                           "/dev/shm" if os.path.isdir("/dev/shm") else None)
+HASH_CHUNK_SIZE = 1024 * 1024
+# Content hashes of the images in a feature file are kept next to it
+IMAGE_HASHES_SUFFIX = ".hashes.json"
+
+def hashFile(path):
+  """! Hash the contents of a file.
+  @param   path     Path of the file.
+
+  @return  digest   Hex digest of the file contents.
+  """
+  digest = hashlib.sha256()
+  with open(path, "rb") as f:
+    while True:
+      chunk = f.read(HASH_CHUNK_SIZE)
+      if not chunk:
+        break
+      digest.update(chunk)
+  return digest.hexdigest()
+
+def readImageHashes(hashes_path):
+  """! Read the image content hashes stored for a feature file.
+  @param   hashes_path   Path of the hashes file.
+
+  @return  hashes        {"image name": digest}, None if missing or unreadable.
+  """
+  try:
+    with open(hashes_path, "r") as f:
+      hashes = json.load(f)
+  except FileNotFoundError:
+    return None
+  except (OSError, ValueError) as e:
+    log.warning(f"Ignoring unreadable image hashes {hashes_path}: {e}")
+    return None
+  return hashes if isinstance(hashes, dict) else None
+
+def writeImageHashes(hashes_path, hashes):
+  """! Store the image content hashes of a feature file.
+  @param   hashes_path   Path of the hashes file.
+  @param   hashes        {"image name": digest}.
+
+  @return  None
+  """
+  # Write to a temporary file and rename, so a crash never leaves partial hashes
+  fd, staging_path = tempfile.mkstemp(prefix=".staging_", suffix=".json",
+                                      dir=os.path.dirname(hashes_path))
+  try:
+    with os.fdopen(fd, "w") as f:
+      json.dump(hashes, f)
+    os.replace(staging_path, hashes_path)
+  except OSError:
+    os.unlink(staging_path)
+    raise
+  return
 
 class CameraCalibrationMonocularPoseEstimate:
   """! Class peforms the Camera Calibration without any markers based on
@@ -47,6 +110,8 @@ class CameraCalibrationMonocularPoseEstimate:
     self.config = Dict(self.generateMarkerlessConfig(sceneobj))
     self.scene_pose_mat = scene_pose_mat
     self.hloc_config = self.config['hloc']
+    self.db_image_names = []
+    self.db_global_descriptors = None
 
   def decodeImage(self, img_data):
     """! Converts image from string format to numpy format.
@@ -86,6 +151,7 @@ class CameraCalibrationMonocularPoseEstimate:
   def featureExtract(self, dataset_dir, output_dir, image_list):
     """! Create a list of file Paths of all the extracted features
          performed by the models and stored in different files.
+         Only images added or changed since the last registration are extracted.
     @param dataset_dir     Path of the dataset with rbg and depth images.
     @param output_dir      Path of the directory containing extracted features.
     @param image_list      List of images along with their rotation and
@@ -94,23 +160,58 @@ class CameraCalibrationMonocularPoseEstimate:
     @return feature_paths  List of files paths of .h5 files which contain
                            the extracted features from feature matching models.
     """
-    self.hloc_config.global_descriptor_file = str(extract_features.main(
-      self.hloc_config.retrieval_conf, dataset_dir, output_dir,
-      image_list=image_list))
+    image_hashes = {Path(name).as_posix(): hashFile(Path(dataset_dir) / name)
+                    for name in image_list}
+    self.hloc_config.global_descriptor_file = str(self.extractChangedFeatures(
+      self.hloc_config.retrieval_conf, dataset_dir, output_dir, image_hashes))
 
     feature_paths = []
     for dense_matching, local_feature in zip(self.hloc_config.is_match_dense,
                                              self.hloc_config.local_feature):
       if not dense_matching:
         feature_config = extract_features.confs[local_feature]
-        feature_paths.append(str(extract_features.main(feature_config,
-                                                       dataset_dir,
-                                                       output_dir)))
+        feature_paths.append(str(self.extractChangedFeatures(feature_config,
+                                                             dataset_dir,
+                                                             output_dir,
+                                                             image_hashes)))
       else:
         feature_paths.append(".")
 
     return feature_paths
 
+  def extractChangedFeatures(self, feature_config, dataset_dir, output_dir, image_hashes):
+    """! Bring a feature file up to date with the dataset images. Features of
+         removed or changed images are dropped from the file and hloc only
+         extracts the images missing from it, i.e. the added and changed ones.
+    @param feature_config  hloc feature extraction configuration.
+    @param dataset_dir     Path of the dataset with rbg and depth images.
+    @param output_dir      Path of the directory containing extracted features.
+    @param image_hashes    Content hash of each dataset image {"image name": digest}.
+
+    @return feature_path   Path of the .h5 feature file.
+    """
+    feature_path = Path(output_dir) / (feature_config['output'] + ".h5")
+    hashes_path = Path(str(feature_path) + IMAGE_HASHES_SUFFIX)
+    stored_hashes = readImageHashes(hashes_path)
+    if feature_path.exists():
+      if stored_hashes is None:
+        # The images the features were extracted from are unknown
+        log.info(f"Extracting all features of {feature_path.name} again")
+        feature_path.unlink()
+      else:
+        stale = [name for name in list_h5_names(feature_path)
+                 if stored_hashes.get(name) != image_hashes.get(name)]
+        if stale:
+          with h5py.File(str(feature_path), 'a', libver='latest') as fd:
+            for name in stale:
+              del fd[name]
+          log.info(f"Dropped {len(stale)} outdated images from {feature_path.name}")
+
+    extract_features.main(feature_config, Path(dataset_dir), Path(output_dir),
+                          image_list=list(image_hashes), feature_path=feature_path)
+    writeImageHashes(hashes_path, image_hashes)
+    return feature_path
+
   def featureExtractLocalize(self, workdir, query_dir, output_dir, loc_pairs, query):
     """! Creates a list of file Paths for the features that have been matched by
          the query image to be localized.
@@ -176,6 +277,8 @@ class CameraCalibrationMonocularPoseEstimate:
     ]
     feature_paths = self.featureExtract(dataset_dir, output_dir, image_list)
     self.hloc_config.feature_paths = feature_paths
+    self.loadGlobalDescriptors(self.hloc_config.global_descriptor_file)
+    self.loadModels()
     if sceneobj:
       sceneobj.output = self.config['hloc']['output']
       sceneobj.retrieval_conf = self.config['hloc']['retrieval_conf']
@@ -183,6 +286,67 @@ class CameraCalibrationMonocularPoseEstimate:
 
     return sceneobj
 
+  def loadGlobalDescriptors(self, descriptor_file):
+    """!Keep the global descriptors of the dataset images in memory for
+        retrieval of the images closest to a query frame.
+    @param  descriptor_file   Path of the .h5 file with the global descriptors.
+
+    @return None
+    """
+    names = sorted(list_h5_names(descriptor_file))
+    with h5py.File(str(descriptor_file), 'r', libver='latest') as fd:
+      descriptors = [fd[name]['global_descriptor'].__array__() for name in names]
+    self.db_image_names = names
+    self.db_global_descriptors = np.stack(descriptors).astype(np.float32)
+    return
+
+  def loadModels(self):
+    """!Load the configured retrieval, local feature and matching networks.
+        hloc keeps loaded networks resident, so localizing a query frame
+        does not load them again.
+
+    @return None
+    """
+    cached_load(extractors, self.hloc_config.retrieval_conf['model'])
+    for dense_matching, local_feature, matcher in zip(self.hloc_config.is_match_dense,
+                                                      self.hloc_config.local_feature,
+                                                      self.hloc_config.matcher):
+      if dense_matching:
+        matcher_config = match_dense.confs[matcher] | self.hloc_config.matcher[matcher]
+        cached_load(matchers, matcher_config['model'])
+      else:
+        feature_config = (extract_features.confs[local_feature] |
+                          self.hloc_config.local_feature[local_feature])
+        cached_load(extractors, feature_config['model'])
+        matcher_config = match_features.confs[matcher] | self.hloc_config.matcher[matcher]
+        match_features.MF.get_optimized_model(matcher_config['model'])
+    return
+
+  def extractGlobalDescriptor(self, query):
+    """!Compute the global descriptor of a query frame in memory.
+    @param  query        Query with the base64 encoded frame.
+
+    @return descriptor   Global descriptor of the frame.
+    """
+    retrieval_conf = self.hloc_config.retrieval_conf
+    data = extract_features.ImageDataset(self.query_dir, retrieval_conf['preprocessing'], query)[0]
+    model = cached_load(extractors, retrieval_conf['model'])
+    with torch.no_grad():
+      pred = model({'image': torch.from_numpy(data['image'])[None].to(cached_load.device)})
+    descriptor = pred['global_descriptor'][0].cpu().numpy()
+    # Round like the half precision descriptors of the dataset images
+    return descriptor.astype(np.float16).astype(np.float32)
+
+  def retrieveDatabaseImages(self, descriptor):
+    """!Select the dataset images most similar to a query frame.
+    @param  descriptor   Global descriptor of the query frame.
+
+    @return names        Names of at most num_loc dataset images, most similar first.
+    """
+    scores = self.db_global_descriptors @ descriptor
+    order = np.argsort(-scores, kind='stable')[:self.hloc_config.num_loc]
+    return [self.db_image_names[index] for index in order if scores[index] >= 0]
+
   def generateQueryForLocalization(self, cam_frame_data, camera_intrinsics):
     """!Generate the query format necessary for localization.
 
@@ -207,9 +371,8 @@ class CameraCalibrationMonocularPoseEstimate:
     query = Dict(query)
     if "name" not in query:
       query.name = f"{query.camera_id}-{query.timestamp}"
-    self.workdir = Path(tempfile.mkdtemp(prefix=f"{query.name}-"))
+    self.workdir = Path(tempfile.mkdtemp(prefix=f"{query.name}-", dir=QUERY_WORK_DIR))
     self.loc_pairs = self.workdir / "pairs.txt"
-    self.global_feature_path = self.workdir / "global_features.h5"
     self.query_dir = self.dataset_dir + "/rgb"
     if self.query_dir is not None:
       self.query_dir = Path(self.query_dir)
@@ -226,27 +389,22 @@ class CameraCalibrationMonocularPoseEstimate:
     """
     self.scene_pose_mat = getPoseMatrix(sceneobj)
     query, camera_intrinsics = self.generateQueryForLocalization(cam_frame_data, camera_intrinsics)
-    extract_features.main(
-      self.hloc_config.retrieval_conf, self.query_dir, self.output_dir, image_list=query,
-      feature_path=self.global_feature_path
-    )
-    pairs_from_retrieval.main(
-      self.global_feature_path, self.loc_pairs, self.hloc_config.num_loc,
-      query_list=(query.name,),
-      db_descriptors=self.hloc_config.global_descriptor_file
-    )
-    feature_paths, match_paths = self.featureExtractLocalize(
-      self.workdir, self.query_dir, self.output_dir, self.loc_pairs, query
-    )
-    results_path = f"{self.workdir}/results.txt"
-    results = localize_scenescape.main(
-      Path(self.config.dataset_dir), self.hloc_config.feature_paths,
-      self.loc_pairs, camera_intrinsics, feature_paths, match_paths,
-      results_path, skip_matches=self.hloc_config.min_matches,
-      match_dense=self.hloc_config.is_match_dense, data_config=self.config.data
-    )
-    shutil.rmtree(self.workdir)
-    self.workdir = None
+    try:
+      retrieved = self.retrieveDatabaseImages(self.extractGlobalDescriptor(query))
+      self.loc_pairs.write_text("\n".join(f"{query.name} {name}" for name in retrieved))
+      feature_paths, match_paths = self.featureExtractLocalize(
+        self.workdir, self.query_dir, self.output_dir, self.loc_pairs, query
+      )
+      results_path = f"{self.workdir}/results.txt"
+      results = localize_scenescape.main(
+        Path(self.config.dataset_dir), self.hloc_config.feature_paths,
+        self.loc_pairs, camera_intrinsics, feature_paths, match_paths,
+        results_path, skip_matches=self.hloc_config.min_matches,
+        match_dense=self.hloc_config.is_match_dense, data_config=self.config.data
+      )
+    finally:
+      shutil.rmtree(self.workdir)
+      self.workdir = None
 
     if not self.evaluateMatchQuality(results):
       return {
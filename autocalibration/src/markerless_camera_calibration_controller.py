@@ -10,7 +10,7 @@ from pathlib import Path
 
 from auto_camera_calibration_controller import CameraCalibrationController
 from markerless_camera_calibration import \
-    CameraCalibrationMonocularPoseEstimate
+    CameraCalibrationMonocularPoseEstimate, hashFile
 from polycam_to_images import transformDataset
 from pytz import timezone
 
@@ -18,6 +18,8 @@ from scene_common import log
 from scene_common.timestamp import get_iso_time
 
 TIMEZONE = "UTC"
+# Hash of the last extracted Polycam archive, kept in the output directory
+POLYCAM_HASH_FILE = "polycam_archive.sha256"
 
 
 class MarkerlessCameraCalibrationController(CameraCalibrationController):
@@ -183,23 +185,36 @@ class MarkerlessCameraCalibrationController(CameraCalibrationController):
     if not scene_obj.polycam_data:
       raise FileNotFoundError("Polycam zip file not found")
     base_dataset_path = Path(os.getcwd()) / "datasets" / scene_obj.name
+    output_dir = base_dataset_path / "output_dir"
+    archive_hash = hashFile(scene_obj.polycam_data)
     with zipfile.ZipFile(scene_obj.polycam_data) as zf:
-      zf.extractall(base_dataset_path)
       extracted_files = zf.namelist()
     file_name = self._find_dataset_dir(extracted_files)
-    if not file_name:
-      file_name = self.restructure_dataset_dir(extracted_files, base_dataset_path, scene_obj.polycam_data)
-    dataset_dir = base_dataset_path / file_name
-    if dataset_dir.is_file():
-      dataset_dir = dataset_dir.parent
-    output_dir = base_dataset_path / "output_dir"
-    transformDataset(str(dataset_dir), str(output_dir))
+    dataset_dir = base_dataset_path / (file_name or Path(scene_obj.polycam_data).stem)
+    if dataset_dir.is_dir() and self._readPolycamHash(output_dir) == archive_hash:
+      log.info("Polycam dataset unchanged, skipping extraction")
+    else:
+      with zipfile.ZipFile(scene_obj.polycam_data) as zf:
+        zf.extractall(base_dataset_path)
+      if not file_name:
+        file_name = self.restructure_dataset_dir(extracted_files, base_dataset_path, scene_obj.polycam_data)
+      dataset_dir = base_dataset_path / file_name
+      if dataset_dir.is_file():
+        dataset_dir = dataset_dir.parent
+      transformDataset(str(dataset_dir), str(output_dir))
+      (output_dir / POLYCAM_HASH_FILE).write_text(archive_hash)
     response_dict["dataset_dir"] = str(dataset_dir)
     response_dict["output_dir"] = str(output_dir)
     log.info("Polycam dataset preprocessing complete", response_dict)
 
     return response_dict
 
+  def _readPolycamHash(self, output_dir):
+    try:
+      return (Path(output_dir) / POLYCAM_HASH_FILE).read_text().strip()
+    except OSError:
+      return None
+
   def _find_dataset_dir(self, extracted_files):
     for file_path in extracted_files:
       parts = file_path.split('/')
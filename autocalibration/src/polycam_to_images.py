@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: (C) 2023 - 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import filecmp
 import json
 import os
 import shutil
@@ -116,6 +117,32 @@ def obtainImagesDataFromJson(mesh_data, camera_json_files):
 
   return camera_intrinsics, images_rw_data
 
+def syncDirectory(src_dir, dst_dir):
+  """! Move the files of src_dir into dst_dir, removing the files of dst_dir
+       that are not in src_dir. Files with unchanged contents are left untouched.
+  @param   src_dir   Directory with the new files.
+  @param   dst_dir   Directory to update.
+
+  @return  None
+  """
+  if not os.path.exists(dst_dir):
+    shutil.move(src_dir, dst_dir)
+    return
+
+  src_files = {path.relative_to(src_dir) for path in Path(src_dir).rglob("*") if path.is_file()}
+  for path in Path(dst_dir).rglob("*"):
+    if path.is_file() and path.relative_to(dst_dir) not in src_files:
+      path.unlink()
+  for name in src_files:
+    src_path = Path(src_dir) / name
+    dst_path = Path(dst_dir) / name
+    if dst_path.is_file() and filecmp.cmp(src_path, dst_path, shallow=False):
+      continue
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(src_path, dst_path)
+  shutil.rmtree(src_dir)
+  return
+
 def transformDataset(polycam_dir, output_dir=None):
   """! Transforms the polycam raw output into required input format for reloc
   @param   polycam_dir  polycam raw output directory
@@ -124,15 +151,15 @@ def transformDataset(polycam_dir, output_dir=None):
   @return  None
   """
   key_frames_folder = Path(polycam_dir) / "keyframes"
-  if not os.path.exists(Path(polycam_dir) / "depth"):
-    shutil.move(Path(key_frames_folder) / "depth",
-                Path(polycam_dir))
-  if not os.path.exists(Path(polycam_dir) / "rgb"):
-    if not os.path.exists(Path(polycam_dir) / "images"):
-      shutil.move(Path(key_frames_folder) / "images",
+  # A re-extracted archive updates the images of an earlier extraction
+  if os.path.exists(Path(key_frames_folder) / "depth"):
+    syncDirectory(Path(key_frames_folder) / "depth",
+                  Path(polycam_dir) / "depth")
+  if os.path.exists(Path(polycam_dir) / "images"):
+    syncDirectory(Path(polycam_dir) / "images",
                   Path(polycam_dir) / "rgb")
-    elif os.path.exists(Path(polycam_dir) / "images"):
-      shutil.move(Path(polycam_dir) / "images",
+  elif os.path.exists(Path(key_frames_folder) / "images"):
+    syncDirectory(Path(key_frames_folder) / "images",
                   Path(polycam_dir) / "rgb")
 
   if not os.path.exists(Path(output_dir)):
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark for the AprilTag map sweep of CameraCalibrationApriltag.
+Compares the former sweep, which created an offscreen renderer for every tile
+and rendered every tile of the bounding box, with identifyApriltagsInScene,
+which skips tiles without map content, reuses one renderer per process and
+spreads the tiles over worker processes. The sweep is measured with each of
+the given tile renderers: the OpenGL offscreen renderer and the CPU raycast
+renderer.
+
+Without --map a synthetic map of the given size with a grid of tag36h11
+AprilTags is generated, as image map or, with --l-shape, as an L-shaped GLB
+whose bounding box contains a quarter without map content. Headless
+offscreen rendering needs EGL, e.g. Mesa with EGL_PLATFORM=surfaceless;
+use --renderers raycast --skip-legacy without it.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import trimesh
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from atag_camera_calibration import (CameraCalibrationApriltag, DEFAULT_ROTATION_MATRIX,
+                                     TAG_SIZE, TILE_RENDERERS, TILE_SIZE)
+
+def createTagMap(path, width_m, height_m, scale, spacing_m):
+  """Write a white image map with AprilTags every spacing_m meters"""
+  dictionary = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_APRILTAG_36h11)
+  image = np.full((int(height_m * scale), int(width_m * scale)), 255, dtype=np.uint8)
+  tag_px = int(TAG_SIZE * scale)
+  # tag36h11 has a one cell white border inside the 10 cell outer square
+  marker_px = tag_px * 10 // 8
+  tag_id = 0
+  for y in np.arange(spacing_m / 2, height_m - spacing_m / 2, spacing_m):
+    for x in np.arange(spacing_m / 2, width_m - spacing_m / 2, spacing_m):
+      marker = cv2.aruco.generateImageMarker(dictionary, tag_id, marker_px, borderBits=1)
+      row, col = int(y * scale), int(x * scale)
+      image[row:row + marker_px, col:col + marker_px] = marker
+      tag_id += 1
+  cv2.imwrite(path, cv2.cvtColor(image, cv2.COLOR_GRAY2BGR))
+  return tag_id
+
+def createLShapedGlb(path, image_path, width_m, height_m):
+  """Write the image map as a textured floor GLB without its top right quarter"""
+  cells = 16
+  xs, ys = np.meshgrid(np.linspace(0, width_m, cells + 1), np.linspace(0, height_m, cells + 1))
+  # glTF is y-up; the calibration rotates the map by 90 degrees about x to z-up
+  vertices = np.column_stack([xs.ravel(), np.zeros(xs.size), -ys.ravel()])
+  uv = np.column_stack([xs.ravel() / width_m, ys.ravel() / height_m])
+  faces = []
+  for row in range(cells):
+    for col in range(cells):
+      if row >= cells // 2 and col >= cells // 2:
+        continue
+      v0 = row * (cells + 1) + col
+      faces += [[v0, v0 + 1, v0 + cells + 2], [v0, v0 + cells + 2, v0 + cells + 1]]
+  image = Image.open(image_path)
+  mesh = trimesh.Trimesh(vertices=vertices, faces=faces,
+                         visual=trimesh.visual.TextureVisuals(uv=uv, image=image), process=False)
+  mesh.export(path)
+  return
+
+def legacySweep(calibration, res_x, res_y):
+  """Former sweep: a new renderer for every tile of the bounding box, one process"""
+  calibration.prepareTileSweep(res_x, res_y)
+  apriltag_3d_data = {}
+  tiles = calibration.sweepTiles(DEFAULT_ROTATION_MATRIX)
+  for tile in tiles:
+    camera_pose = calibration.tileCameraPose(*tile)
+    rendered_img = calibration.renderCamView(calibration.triangle_mesh,
+                                             calibration.tensor_tmesh,
+                                             calibration.tile_intrinsics.intrinsics,
+                                             np.linalg.inv(camera_pose.pose_mat),
+                                             res_x, res_y)
+    imgpts = calibration.findApriltagsInFrame(rendered_img, intrinsics=calibration.tile_intrinsics.intrinsics)
+    if imgpts:
+      apriltag_3d_data |= calibration.getCorresponding3DPoints(imgpts,
+                                                               calibration.tile_intrinsics.intrinsics,
+                                                               camera_pose.pose_mat,
+                                                               calibration.raycasting_scene)
+  return apriltag_3d_data, len(tiles)
+
+def main():
+  parser = argparse.ArgumentParser(description="Benchmark the AprilTag map sweep")
+  parser.add_argument("--map", help="GLB or image map, default is a synthetic image map")
+  parser.add_argument("--scale", type=float, default=200.0, help="Pixels per meter of an image map")
+  parser.add_argument("--width", type=float, default=6.0, help="Synthetic map width in meters")
+  parser.add_argument("--height", type=float, default=4.0, help="Synthetic map height in meters")
+  parser.add_argument("--tag-spacing", type=float, default=1.0, help="Synthetic map tag spacing in meters")
+  parser.add_argument("--l-shape", action="store_true", help="Synthetic map as L-shaped GLB")
+  parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1],
+                      help="Worker process counts to measure")
+  parser.add_argument("--renderers", nargs="+", choices=TILE_RENDERERS, default=list(TILE_RENDERERS),
+                      help="Tile renderers to measure")
+  parser.add_argument("--skip-legacy", action="store_true", help="Only measure identifyApriltagsInScene")
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory(prefix="atag_bench_") as tmpdir:
+    map_file = args.map
+    if map_file is None:
+      map_file = os.path.join(tmpdir, "map.png")
+      tags = createTagMap(map_file, args.width, args.height, args.scale, args.tag_spacing)
+      if args.l_shape:
+        glb_file = os.path.join(tmpdir, "map.glb")
+        createLShapedGlb(glb_file, map_file, args.width, args.height)
+        map_file = glb_file
+      print(f"Synthetic {'L-shaped GLB' if args.l_shape else 'image'} map {args.width} x {args.height} m, "
+            f"{tags} tags")
+
+    reference = None
+    if not args.skip_legacy:
+      calibration = CameraCalibrationApriltag(map_file, args.scale, "benchmark", tile_renderer="offscreen")
+      start = time.perf_counter()
+      reference, tile_count = legacySweep(calibration, TILE_SIZE, TILE_SIZE)
+      elapsed = time.perf_counter() - start
+      print(f"  legacy sweep        : {elapsed:7.2f} s, {tile_count} tiles rendered, {len(reference)} tags")
+
+    for renderer in args.renderers:
+      for workers in args.workers:
+        calibration = CameraCalibrationApriltag(map_file, args.scale, "benchmark", tile_renderer=renderer)
+        start = time.perf_counter()
+        calibration.identifyApriltagsInScene(TILE_SIZE, TILE_SIZE, DEFAULT_ROTATION_MATRIX, workers=workers)
+        elapsed = time.perf_counter() - start
+        tiles = calibration.sweepTiles(DEFAULT_ROTATION_MATRIX)
+        rendered = sum(calibration.tileSeesMesh(calibration.tileCameraPose(*tile)) for tile in tiles)
+        result = calibration.result_data_3d
+        same = ""
+        if reference is not None:
+          common = result.keys() & reference.keys()
+          deviation = max((np.abs(np.subtract(result[k], reference[k])).max() for k in common), default=0.0)
+          same = f", {len(common)} same tags as legacy, max deviation {deviation * 1000:.2f} mm"
+        print(f"  {renderer:9s} sweep, {workers:2d} worker(s): {elapsed:7.2f} s, "
+              f"{rendered}/{len(tiles)} tiles rendered, {len(result)} tags{same}")
+
+if __name__ == "__main__":
+  main()
@@ -6,12 +6,14 @@ import os
 import threading
 import time
 import numpy as np
+import orjson
 from collections import Counter, defaultdict
-from sklearn.cluster import DBSCAN
 
 from scene_common import log
 from scene_common.mqtt import PubSub
 from cluster_analytics_tracker import ClusterTracker, HungarianMatcher
+from grid_clustering import NOISE, GridClusterEngine
+from scene_workers import SceneWorkerPool
 
 class ClusterAnalyticsConfig:
   """Configuration settings for cluster analytics loaded from config.json"""
@@ -83,9 +85,19 @@ class ClusterAnalyticsContext:
 
     # Initialize cluster tracker for tracking clusters across frames
     self.cluster_tracker = ClusterTracker(matcher=HungarianMatcher(), config=self.config)
+    # Cluster memory is shared by all scenes, which are processed by their own worker threads
+    self.tracker_lock = threading.RLock()
 
     self.user_dbscan_params_by_scene = {}
 
+    # Incremental DBSCAN state per (scene_id, category)
+    self.cluster_engines = {}
+    # Serializes clustering of a scene between its worker and WebUI re-clustering
+    self.scene_locks = {}
+
+    # Scene messages are processed by one keep-latest worker per scene
+    self.scene_workers = SceneWorkerPool(self.processSceneAnalytics)
+
     # Initialize WebUI if enabled
     self.webUi = None
     if enable_webui:
@@ -185,7 +197,8 @@ class ClusterAnalyticsContext:
 
       # If parameters changed significantly, force-clear existing clusters
       if eps_change_ratio > 0.5 or min_samples_changed:
-        cleared_count = self.cluster_tracker.forceClearClustersByCategory(scene_id, category_lower)
+        with self.tracker_lock:
+          cleared_count = self.cluster_tracker.forceClearClustersByCategory(scene_id, category_lower)
         if cleared_count > 0:
           log.debug(f"Cleared {cleared_count} existing clusters for '{category}' in scene '{scene_id}' due to significant parameter change")
 
@@ -230,7 +243,8 @@ class ClusterAnalyticsContext:
       scene_params = self.user_dbscan_params_by_scene[scene_id]
       if category_lower in scene_params:
         # Force-clear existing clusters since parameters are changing back to defaults
-        cleared_count = self.cluster_tracker.forceClearClustersByCategory(scene_id, category_lower)
+        with self.tracker_lock:
+          cleared_count = self.cluster_tracker.forceClearClustersByCategory(scene_id, category_lower)
         if cleared_count > 0:
           log.debug(f"Cleared {cleared_count} existing clusters for '{category}' in scene '{scene_id}' due to parameter reset")
 
@@ -255,24 +269,21 @@ class ClusterAnalyticsContext:
     @return  None
     """
     data_regulated_topic = PubSub.formatTopic(PubSub.DATA_REGULATED, scene_id="+")
-    self.client.addCallback(data_regulated_topic, self.processSceneAnalytics)
+    self.client.addCallback(data_regulated_topic, self.scene_workers.put)
     log.info("Subscribed to " + data_regulated_topic)
     return
 
-  def processSceneAnalytics(self, client, userdata, message):
-    """! MQTT callback function used to process analytics data from scenes and object detections.
-    This function handles incoming data about scenes and detected objects for analytics processing.
-    @param   client      MQTT client.
-    @param   userdata    Private user data as set in Client.
+  def processSceneAnalytics(self, scene_id, message):
+    """! Process analytics data from scenes and object detections.
+    Runs on the worker thread of the scene with the newest message received for it.
+    @param   scene_id    Scene identifier parsed from the message topic.
     @param   message     Message on MQTT bus.
 
     @return  None
     """
     try:
-      # Parse the detection data directly from MQTT message
-      detection_data = json.loads(message.payload.decode("utf-8"))
-      topic = PubSub.parseTopic(message.topic)
-      scene_id = topic.get('scene_id', 'unknown')
+      # Parse the detection data directly from the undecoded MQTT payload
+      detection_data = orjson.loads(message.payload)
 
       # Reduced logging - only log at debug level
       log.debug(f"Received detection data for scene {scene_id}: {len(detection_data.get('objects', []))} objects")
@@ -280,7 +291,7 @@ class ClusterAnalyticsContext:
       all_clusters = self.analyzeObjectClusters(scene_id, detection_data)
       self.publishAllClusters(scene_id, detection_data, all_clusters)
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
       log.error(f"Failed to parse detection data from scene (invalid JSON)")
       log.debug(f"JSON parse error details: {e}")
     except Exception as e:
@@ -308,12 +319,52 @@ class ClusterAnalyticsContext:
         coordinates.append([x, y])
     return coordinates
 
+  def extractVelocitiesFromObjects(self, objects):
+    """! Extract velocities from object detection data for cluster velocity analysis
+    @param   objects  List of object detection data
+    @return  Tuple of (N x 3 velocity array, boolean array of objects with usable velocity and translation)
+    """
+    velocities = np.zeros((len(objects), 3))
+    valid = np.zeros(len(objects), dtype=bool)
+    for index, obj in enumerate(objects):
+      velocity = obj.get('velocity', [0, 0, 0])
+      translation = obj.get('translation', [0, 0, 0])
+      if len(velocity) >= 3 and len(translation) >= 2:
+        velocities[index] = velocity[:3]
+        valid[index] = True
+    return velocities, valid
+
+  def getProcessingStatistics(self):
+    """! Get per-scene processing latency and dropped frame counts
+    @return  Dictionary {scene_id: {'processed', 'dropped', 'last_latency', 'max_latency', 'mean_latency'}},
+             latencies in seconds from message arrival to the end of publishing
+    """
+    return self.scene_workers.statistics()
+
+  def getClusterEngine(self, scene_id, category, dbscan_params):
+    """! Get the incremental clustering engine for a category in a scene
+    @param   scene_id       Scene identifier
+    @param   category       Object category
+    @param   dbscan_params  Dictionary with 'eps' and 'min_samples' parameters
+    @return  GridClusterEngine, recreated when the parameters changed
+    """
+    key = (scene_id, category)
+    engine = self.cluster_engines.get(key)
+    if engine is None or not engine.matchesParams(dbscan_params['eps'], dbscan_params['min_samples']):
+      engine = GridClusterEngine(dbscan_params['eps'], dbscan_params['min_samples'])
+      self.cluster_engines[key] = engine
+    return engine
+
   def analyzeObjectClusters(self, scene_id, detection_data):
     """! Analyze object clusters using DBSCAN algorithm and publish results to MQTT
     @param   scene_id        Scene identifier
     @param   detection_data  Detection data containing objects with coordinates
     @return  None
     """
+    with self.scene_locks.setdefault(scene_id, threading.Lock()):
+      return self._analyzeObjectClusters(scene_id, detection_data)
+
+  def _analyzeObjectClusters(self, scene_id, detection_data):
     # Extract scene metadata for logging
     scene_name = detection_data.get('name', 'Unknown')
     objects = detection_data.get('objects', [])
@@ -358,7 +409,8 @@ class ClusterAnalyticsContext:
     if len(objects) < min_required_objects:
       log.debug(f"Scene {scene_id}: Insufficient objects ({len(objects)}) for clustering")
       # Still process through tracker to mark existing clusters as missed
-      self.cluster_tracker.processNewDetections(scene_id, [], timestamp)
+      with self.tracker_lock:
+        self.cluster_tracker.processNewDetections(scene_id, [], timestamp)
       return []
 
     # Analyze clusters for each category with multiple objects
@@ -369,40 +421,29 @@ class ClusterAnalyticsContext:
       if len(category_objects) < dbscan_params['min_samples']:
         continue  # Skip categories with too few objects
 
-      # Extract x,y coordinates for clustering
+      # Extract x,y coordinates and velocities for clustering and cluster analysis
       coordinates = self.extractCoordinatesFromObjects(category_objects)
-      coordinates_array = np.array(coordinates)
+      coordinates_array = np.array(coordinates, dtype=float)
+      velocities, velocity_valid = self.extractVelocitiesFromObjects(category_objects)
 
-      # Apply DBSCAN clustering
-      clustering = DBSCAN(
-              eps=dbscan_params['eps'],
-              min_samples=dbscan_params['min_samples']
-      ).fit(coordinates_array)
+      # Apply DBSCAN clustering, incrementally from the previous frame of this scene and category
+      engine = self.getClusterEngine(scene_id, category, dbscan_params)
+      labels = engine.update([obj.get('id') for obj in category_objects], coordinates_array)
 
-      labels = clustering.labels_
-      n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
-      n_noise = np.sum(labels == -1)
+      n_clusters = int(labels.max()) + 1 if len(labels) else 0
+      n_noise = np.sum(labels == NOISE)
 
       if n_clusters > 0:
         log.debug(f"Scene {scene_id}: Found {n_clusters} clusters for category '{category}' "
                         f"({len(category_objects)} objects, {n_noise} noise points)")
 
+        # Analyze shape and velocity of all clusters at once
+        cluster_features = self.analyzeClusterFeatures(coordinates_array, velocities, velocity_valid, labels)
+
         # Create detection metadata for each cluster
-        for cluster_id in set(labels) - {-1}:
-          # Get objects belonging to this cluster
-          cluster_objects = []
-          cluster_coordinates = []
-          for i, label in enumerate(labels):
-            if label == cluster_id:
-              cluster_objects.append(category_objects[i])
-              cluster_coordinates.append(coordinates[i])
-
-          # Calculate cluster center
-          cluster_center = np.mean(cluster_coordinates, axis=0)
-
-          # Analyze shape and velocity
-          shape_analysis = self.detectShapeMl(cluster_coordinates)
-          velocity_analysis = self.analyzeClusterVelocity(cluster_objects, cluster_center)
+        for features in cluster_features:
+          cluster_objects = [category_objects[i] for i in features['members']]
+          cluster_center = features['center']
 
           # Create detection dictionary
           cluster_detection = {
@@ -412,8 +453,8 @@ class ClusterAnalyticsContext:
                           'x': float(cluster_center[0]),
                           'y': float(cluster_center[1])
                   },
-                  'shape_analysis': shape_analysis,
-                  'velocity_analysis': velocity_analysis,
+                  'shape_analysis': features['shape_analysis'],
+                  'velocity_analysis': features['velocity_analysis'],
                   'object_ids': [obj.get('id', 'unknown') for obj in cluster_objects],
                   'dbscan_params': {
                           'eps': dbscan_params['eps'],
@@ -424,15 +465,16 @@ class ClusterAnalyticsContext:
 
           raw_cluster_detections.append(cluster_detection)
 
-    self.cluster_tracker.processNewDetections(scene_id, raw_cluster_detections, timestamp)
+    with self.tracker_lock:
+      self.cluster_tracker.processNewDetections(scene_id, raw_cluster_detections, timestamp)
+
+      # Clean up old/lost clusters to prevent stale data
+      self.cluster_tracker.memory.cleanupOldClusters(timestamp)
 
     # Log when no clusters are detected by DBSCAN
     if len(raw_cluster_detections) == 0:
       log.debug(f"Scene {scene_id}: No clusters detected by DBSCAN")
 
-    # Clean up old/lost clusters to prevent stale data
-    self.cluster_tracker.memory.cleanupOldClusters(timestamp)
-
     # Don't publish here - let publishAllClusters handle it to avoid duplicates
     return raw_cluster_detections
 
@@ -447,14 +489,13 @@ class ClusterAnalyticsContext:
       log.debug(f"Scene ID: {scene_id}")
       return
 
-    # Get active/stable clusters for this scene
-    tracked_clusters = self.cluster_tracker.getActiveClusters(
-            scene_id=scene_id,
-            publishable_only=True
-    )
-
-    # Convert to dictionaries
-    cluster_dicts = [c.toDict() for c in tracked_clusters]
+    # Get active/stable clusters for this scene and convert them to dictionaries
+    with self.tracker_lock:
+      tracked_clusters = self.cluster_tracker.getActiveClusters(
+              scene_id=scene_id,
+              publishable_only=True
+      )
+      cluster_dicts = [c.toDict() for c in tracked_clusters]
 
     try:
       # Create aggregated cluster data structure
@@ -470,7 +511,7 @@ class ClusterAnalyticsContext:
       }
 
       topic = PubSub.formatTopic(PubSub.ANALYTICS_CLUSTERS, scene_id=scene_id)
-      payload = json.dumps(cluster_batch_data)
+      payload = orjson.dumps(cluster_batch_data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
 
       result = self.client.publish(topic, payload, qos=1)
       if result.rc == 0:
@@ -517,26 +558,6 @@ class ClusterAnalyticsContext:
 
     return np.array(features), centroid
 
-  def detectShapeMl(self, points):
-    """! Detect the geometric shape formed by a cluster of points using ML techniques
-    @param   points  Array of coordinate points in the cluster
-
-    @return  Tuple of (features array, centroid array)
-    """
-    features = []
-    centroid = np.mean(points, axis=0)
-
-    for point in points:
-      # Distance to centroid
-      dist_to_center = np.linalg.norm(point - centroid)
-
-      # Angle from centroid
-      angle = np.arctan2(point[1] - centroid[1], point[0] - centroid[0])
-
-      features.append([dist_to_center, angle])
-
-    return np.array(features), centroid
-
   def _getCircleShape(self, radius):
     """! Create circle shape metadata
     @param   radius  Circle radius
@@ -554,24 +575,22 @@ class ClusterAnalyticsContext:
         }
     }
 
-  def _getRectangleShape(self, points_array):
+  def _getRectangleShape(self, min_xy, max_xy):
     """! Create rectangle shape metadata
-    @param   points_array  Array of coordinate points
+    @param   min_xy  Minimum x, y of the cluster points
+    @param   max_xy  Maximum x, y of the cluster points
     @return  Dictionary with rectangle shape and size data
     """
-    x_coords = points_array[:, 0]
-    y_coords = points_array[:, 1]
-
-    width = np.max(x_coords) - np.min(x_coords)
-    height = np.max(y_coords) - np.min(y_coords)
+    width = max_xy[0] - min_xy[0]
+    height = max_xy[1] - min_xy[1]
     area = width * height
     perimeter = 2 * (width + height)
 
     corners = [
-        [np.min(x_coords), np.min(y_coords)],
-        [np.max(x_coords), np.min(y_coords)],
-        [np.max(x_coords), np.max(y_coords)],
-        [np.min(x_coords), np.max(y_coords)]
+        [min_xy[0], min_xy[1]],
+        [max_xy[0], min_xy[1]],
+        [max_xy[0], max_xy[1]],
+        [min_xy[0], max_xy[1]]
     ]
 
     return {
@@ -585,17 +604,15 @@ class ClusterAnalyticsContext:
         }
     }
 
-  def _getIrregularShape(self, points_array, distances):
+  def _getIrregularShape(self, min_xy, max_xy, point_spread):
     """! Create irregular shape metadata
-    @param   points_array  Array of coordinate points
-    @param   distances     Array of distances from centroid
+    @param   min_xy        Minimum x, y of the cluster points
+    @param   max_xy        Maximum x, y of the cluster points
+    @param   point_spread  Standard deviation of the point distances from the centroid
     @return  Dictionary with irregular shape and size data
     """
-    x_coords = points_array[:, 0]
-    y_coords = points_array[:, 1]
-
-    width = np.max(x_coords) - np.min(x_coords)
-    height = np.max(y_coords) - np.min(y_coords)
+    width = max_xy[0] - min_xy[0]
+    height = max_xy[1] - min_xy[1]
     bounding_area = width * height
 
     return {
@@ -604,7 +621,7 @@ class ClusterAnalyticsContext:
             "bounding_width": float(width),
             "bounding_height": float(height),
             "bounding_area": float(bounding_area),
-            "point_spread": float(np.std(distances))
+            "point_spread": float(point_spread)
         }
     }
 
@@ -662,14 +679,14 @@ class ClusterAnalyticsContext:
     elif len(points_array) == 4:
       angle_groups = len(np.unique(np.round(features[:, 1] / self.config.QUADRANT_ANGLE)))
       if angle_groups >= 3:
-        return self._getRectangleShape(points_array)
+        return self._getRectangleShape(points_array.min(axis=0), points_array.max(axis=0))
 
     elif len(points_array) >= 5:
       angle_diffs = np.diff(np.sort(angles))
       if np.std(angle_diffs) < self.config.ANGLE_DISTRIBUTION_THRESHOLD:
         return self._getCircleShape(np.mean(distances))
       else:
-        return self._getIrregularShape(points_array, distances)
+        return self._getIrregularShape(points_array.min(axis=0), points_array.max(axis=0), np.std(distances))
 
     if len(points_array) >= 3:
       areas = []
@@ -681,7 +698,7 @@ class ClusterAnalyticsContext:
       if np.mean(areas) < self.config.LINEAR_FORMATION_AREA_THRESHOLD:
         return self._getLineShape(points_array)
 
-    return self._getIrregularShape(points_array, distances)
+    return self._getIrregularShape(points_array.min(axis=0), points_array.max(axis=0), np.std(distances))
 
   def analyzeClusterVelocity(self, cluster_objects, cluster_center):
     """! Analyze velocity patterns and movement characteristics of a cluster
@@ -785,6 +802,169 @@ class ClusterAnalyticsContext:
     else:
       return "chaotic"
 
+  def analyzeClusterFeatures(self, positions, velocities, velocity_valid, labels):
+    """! Compute shape and velocity analysis of all clusters of a frame in one vectorized pass
+    Produces the same fields as detectShapeMl and analyzeClusterVelocity per cluster, plus the
+    PCA orientation of the cluster points, using segment reductions over the label-sorted frame.
+    @param   positions       Array (N, 2) of object x, y coordinates
+    @param   velocities      Array (N, 3) of object velocities
+    @param   velocity_valid  Boolean array (N,) of objects with usable velocity and translation
+    @param   labels          Array (N,) of DBSCAN labels, clusters numbered 0..K-1 and -1 for noise
+
+    @return  List of K dictionaries with 'center', 'members', 'shape_analysis' and 'velocity_analysis'
+    """
+    labels = np.asarray(labels)
+    n_clusters = int(labels.max()) + 1 if len(labels) else 0
+    if n_clusters == 0:
+      return []
+
+    # Cluster members are contiguous after a stable sort by label, noise comes first
+    order = np.argsort(labels, kind='stable')
+    members = order[labels[order] >= 0]
+    segment = labels[members]
+    points = np.asarray(positions, dtype=float)[members]
+    point_velocities = np.asarray(velocities, dtype=float)[members]
+    valid = np.asarray(velocity_valid, dtype=bool)[members]
+
+    counts = np.bincount(segment, minlength=n_clusters)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    local_index = np.arange(len(members)) - starts[segment]
+
+    def segmentMean(values, mask=None, count=counts):
+      if mask is not None:
+        return np.bincount(segment[mask], weights=values[mask], minlength=n_clusters) / np.maximum(count, 1)
+      return np.bincount(segment, weights=values, minlength=n_clusters) / np.maximum(count, 1)
+
+    # Centroid, extent and PCA orientation
+    centers = np.stack([segmentMean(points[:, 0]), segmentMean(points[:, 1])], axis=1)
+    offsets = points - centers[segment]
+    min_xy = np.minimum.reduceat(points, starts, axis=0)
+    max_xy = np.maximum.reduceat(points, starts, axis=0)
+    cov_xx = segmentMean(offsets[:, 0] * offsets[:, 0])
+    cov_yy = segmentMean(offsets[:, 1] * offsets[:, 1])
+    cov_xy = segmentMean(offsets[:, 0] * offsets[:, 1])
+    orientation = np.degrees(0.5 * np.arctan2(2 * cov_xy, cov_xx - cov_yy))
+
+    # Distance and angle features relative to the centroid
+    distances = np.sqrt(np.sum(offsets * offsets, axis=1))
+    angles = np.arctan2(offsets[:, 1], offsets[:, 0])
+    mean_distance = segmentMean(distances)
+    distance_deviation = distances - mean_distance[segment]
+    distance_variance = segmentMean(distance_deviation * distance_deviation)
+
+    # Spread of the sorted angle gaps, used for clusters of five or more points
+    by_angle = np.lexsort((angles, segment))
+    sorted_segment = segment[by_angle]
+    same_segment = sorted_segment[1:] == sorted_segment[:-1]
+    gap_segment = sorted_segment[1:][same_segment]
+    gaps = np.diff(angles[by_angle])[same_segment]
+    gap_counts = np.maximum(counts - 1, 1)
+    gap_mean = np.bincount(gap_segment, weights=gaps, minlength=n_clusters) / gap_counts
+    gap_deviation = gaps - gap_mean[gap_segment]
+    gap_std = np.sqrt(np.bincount(gap_segment, weights=gap_deviation * gap_deviation,
+                                  minlength=n_clusters) / gap_counts)
+
+    # Mean area of consecutive point triples, used for clusters of three or four points
+    triple = np.flatnonzero(local_index <= counts[segment] - 3)
+    p1, p2, p3 = points[triple], points[triple + 1], points[triple + 2]
+    triple_areas = np.abs((p2[:, 0] - p1[:, 0]) * (p3[:, 1] - p1[:, 1])
+                          - (p3[:, 0] - p1[:, 0]) * (p2[:, 1] - p1[:, 1])) / 2
+    mean_triple_area = np.bincount(segment[triple], weights=triple_areas,
+                                   minlength=n_clusters) / np.maximum(counts - 2, 1)
+
+    # Velocity statistics over objects with usable velocity data
+    valid_counts = np.bincount(segment[valid], minlength=n_clusters)
+    average_velocity = np.stack([segmentMean(point_velocities[:, axis], valid, valid_counts)
+                                 for axis in range(3)], axis=1)
+    velocity_deviation = point_velocities - average_velocity[segment]
+    velocity_std = np.sqrt(np.stack([segmentMean(velocity_deviation[:, axis] ** 2, valid, valid_counts)
+                                     for axis in range(3)], axis=1))
+    average_speed = np.sqrt(np.sum(average_velocity * average_velocity, axis=1))
+    movement_direction = np.arctan2(average_velocity[:, 1], average_velocity[:, 0]) * 180 / np.pi
+    velocity_coherence = np.clip(1.0 - np.sqrt(np.sum(velocity_std * velocity_std, axis=1)) / (average_speed + 1e-6),
+                                 0, 1)
+
+    # Alignment of each object's heading with the direction to its cluster center
+    to_center = -offsets
+    to_center_norm = to_center / (np.sqrt(np.sum(to_center * to_center, axis=1)) + 1e-6)[:, None]
+    heading = point_velocities[:, :2]
+    heading_norm = heading / (np.sqrt(np.sum(heading * heading, axis=1)) + 1e-6)[:, None]
+    alignment = np.sum(heading_norm * to_center_norm, axis=1)
+    convergence_ratio = np.bincount(segment[valid & (alignment > self.config.ALIGNMENT_THRESHOLD)],
+                                    minlength=n_clusters) / np.maximum(valid_counts, 1)
+    divergence_ratio = np.bincount(segment[valid & (alignment < -self.config.ALIGNMENT_THRESHOLD)],
+                                   minlength=n_clusters) / np.maximum(valid_counts, 1)
+
+    results = []
+    for cluster_id in range(n_clusters):
+      count = counts[cluster_id]
+      start = starts[cluster_id]
+
+      if count < 3:
+        shape_analysis = {"shape": "insufficient_points", "size": {}}
+      elif distance_variance[cluster_id] < self.config.SHAPE_VARIANCE_THRESHOLD:
+        shape_analysis = self._getCircleShape(mean_distance[cluster_id])
+      elif count >= 5:
+        if gap_std[cluster_id] < self.config.ANGLE_DISTRIBUTION_THRESHOLD:
+          shape_analysis = self._getCircleShape(mean_distance[cluster_id])
+        else:
+          shape_analysis = self._getIrregularShape(min_xy[cluster_id], max_xy[cluster_id],
+                                                   np.sqrt(distance_variance[cluster_id]))
+      else:
+        shape_analysis = None
+        if count == 4:
+          quadrants = np.unique(np.round(angles[start:start + count] / self.config.QUADRANT_ANGLE))
+          if len(quadrants) >= 3:
+            shape_analysis = self._getRectangleShape(min_xy[cluster_id], max_xy[cluster_id])
+        if shape_analysis is None:
+          if mean_triple_area[cluster_id] < self.config.LINEAR_FORMATION_AREA_THRESHOLD:
+            shape_analysis = self._getLineShape(points[start:start + count])
+          else:
+            shape_analysis = self._getIrregularShape(min_xy[cluster_id], max_xy[cluster_id],
+                                                     np.sqrt(distance_variance[cluster_id]))
+      if count >= 3:
+        shape_analysis["orientation_degrees"] = float(orientation[cluster_id])
+
+      if valid_counts[cluster_id] < 2:
+        velocity_analysis = {
+            "movement_type": "insufficient_data",
+            "average_velocity": [0, 0, 0],
+            "velocity_magnitude": 0,
+            "movement_direction_degrees": 0,
+            "velocity_coherence": 0
+        }
+      else:
+        speed = average_speed[cluster_id]
+        coherence = velocity_coherence[cluster_id]
+        if speed < self.config.STATIONARY_THRESHOLD:
+          movement_type = "stationary"
+        elif coherence > self.config.VELOCITY_COHERENCE_THRESHOLD:
+          movement_type = "coordinated_parallel"
+        elif convergence_ratio[cluster_id] > self.config.CONVERGENCE_DIVERGENCE_RATIO_THRESHOLD:
+          movement_type = "converging"
+        elif divergence_ratio[cluster_id] > self.config.CONVERGENCE_DIVERGENCE_RATIO_THRESHOLD:
+          movement_type = "diverging"
+        elif coherence > 0.2:
+          movement_type = "loosely_coordinated"
+        else:
+          movement_type = "chaotic"
+        velocity_analysis = {
+            "movement_type": movement_type,
+            "average_velocity": [float(value) for value in average_velocity[cluster_id]],
+            "velocity_magnitude": float(speed),
+            "movement_direction_degrees": float(movement_direction[cluster_id]),
+            "velocity_coherence": float(coherence)
+        }
+
+      results.append({
+          'center': centers[cluster_id],
+          'members': members[start:start + count],
+          'shape_analysis': shape_analysis,
+          'velocity_analysis': velocity_analysis
+      })
+
+    return results
+
   def loopForever(self):
     # Start WebUI server in a separate thread if available
     if self.webUi:
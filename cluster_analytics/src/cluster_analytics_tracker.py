@@ -522,14 +522,43 @@ class HungarianMatcher(ClusterMatcher):
 
   def _buildCostMatrix(self, existing_clusters: List[TrackedCluster],
                                           new_detections: List[Dict]) -> np.ndarray:
-    """Build cost matrix for Hungarian algorithm"""
-    cost_matrix = np.zeros((len(existing_clusters), len(new_detections)))
-
-    for i, tracked in enumerate(existing_clusters):
-      for j, detection in enumerate(new_detections):
-        cost = self._calculateMatchingCost(tracked, detection)
-        cost_matrix[i, j] = cost
+    """Build cost matrix for Hungarian algorithm from stacked cluster and detection features"""
+    # Position (use prediction if available), velocity, size, shape and category per row
+    tracked_positions = np.array([
+            tracked.predicted_position or (tracked.centroid['x'], tracked.centroid['y'])
+            for tracked in existing_clusters
+    ], dtype=float)
+    tracked_velocities = np.array([tracked.velocity_analysis['average_velocity'][:2]
+                                   for tracked in existing_clusters], dtype=float)
+    tracked_sizes = np.array([tracked.object_count for tracked in existing_clusters], dtype=float)
+    tracked_shapes = np.array([tracked.shape_analysis['shape'] for tracked in existing_clusters], dtype=object)
+    tracked_categories = np.array([tracked.category for tracked in existing_clusters], dtype=object)
+
+    # Same features per column
+    detection_positions = np.array([(detection['center_of_mass']['x'], detection['center_of_mass']['y'])
+                                    for detection in new_detections], dtype=float)
+    detection_velocities = np.array([detection['velocity_analysis']['average_velocity'][:2]
+                                     for detection in new_detections], dtype=float)
+    detection_sizes = np.array([detection['objects_count'] for detection in new_detections], dtype=float)
+    detection_shapes = np.array([detection['shape_analysis']['shape'] for detection in new_detections], dtype=object)
+    detection_categories = np.array([detection.get('category') for detection in new_detections], dtype=object)
+
+    position_delta = tracked_positions[:, None, :] - detection_positions[None, :, :]
+    position_cost = np.sqrt(np.sum(position_delta * position_delta, axis=2)) * self.POSITION_WEIGHT
+
+    velocity_delta = tracked_velocities[:, None, :] - detection_velocities[None, :, :]
+    velocity_cost = np.sqrt(np.sum(velocity_delta * velocity_delta, axis=2)) * self.VELOCITY_WEIGHT
+
+    size_cost = np.abs(tracked_sizes[:, None] - detection_sizes[None, :]) * self.SIZE_WEIGHT
+
+    shape_match = tracked_shapes[:, None] == detection_shapes[None, :]
+    shape_cost = np.where(shape_match, 1.0, 2.0) * self.SHAPE_WEIGHT
+
+    cost_matrix = position_cost + velocity_cost + size_cost + shape_cost
 
+    # Hard constraint: must be same category
+    same_category = tracked_categories[:, None] == detection_categories[None, :]
+    cost_matrix[~same_category] = np.inf
     return cost_matrix
 
   def _calculateMatchingCost(self, tracked: TrackedCluster, detection: Dict) -> float:
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Incremental grid-based DBSCAN for cluster analytics.
+
+OVERVIEW:
+Scene messages arrive at the full scene publish rate and usually differ from the previous
+frame in only part of the scene. Instead of running DBSCAN from scratch for every message,
+GridClusterEngine keeps a uniform spatial hash of the object positions of one scene and
+category across frames, together with the eps-neighbor pairs found so far, and only
+searches the neighborhood of objects that moved, appeared or disappeared.
+
+IMPLEMENTATION:
+- Every object id owns a slot; positions, the spatial hash and the neighbor pairs are kept
+  in slot space, so they stay valid when objects are reordered between frames
+- The spatial hash is a sorted array of eps-sized cell codes; changed objects are deleted
+  from it and inserted again, and all eps-neighbors of a point lie in its 3x3 cell block
+- Neighbor pairs between two unchanged objects are reused, only pairs of changed objects
+  are searched again
+- Core points and clusters follow from the pairs through a sparse connected components
+  pass; border points join the cluster of one of their core neighbors
+- When most objects changed, the whole hash and pair list are rebuilt in one pass
+- Labels are numbered by the first core point in input order, as sklearn DBSCAN does.
+  Core points and noise match sklearn exactly; a border point within eps of several
+  clusters may be assigned to any of them, which DBSCAN leaves unspecified as well
+"""
+
+from typing import Hashable, List, Optional, Sequence
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+NOISE = -1
+
+# Above this share of changed objects rebuilding the hash is cheaper than updating it
+REBUILD_FRACTION = 0.5
+
+INITIAL_CAPACITY = 64
+
+# Cell codes are x << 32 | y, so the three cells of a column of the 3x3 block are one code range
+CELL_Y_BIAS = 1 << 31
+
+class GridClusterEngine:
+  """DBSCAN over object positions, updated incrementally from frame to frame"""
+
+  def __init__(self, eps: float, min_samples: int) -> None:
+    self.eps = float(eps)
+    self.min_samples = int(min_samples)
+    self._eps_squared = self.eps * self.eps
+
+    self._slot_of = {}  # Structure: {object key: slot}
+    self._free_slots = []
+    self._positions = np.zeros((INITIAL_CAPACITY, 2))
+    self._alive = np.zeros(INITIAL_CAPACITY, dtype=bool)
+
+    # Spatial hash: cell codes in ascending order and the slot stored in each entry
+    self._grid_codes = np.empty(0, dtype=np.int64)
+    self._grid_slots = np.empty(0, dtype=np.int64)
+
+    # Unordered eps-neighbor pairs of distinct slots, each pair stored once
+    self._pairs = np.empty((0, 2), dtype=np.int64)
+    return
+
+  def matchesParams(self, eps: float, min_samples: int) -> bool:
+    return self.eps == float(eps) and self.min_samples == int(min_samples)
+
+  def update(self, ids: Sequence[Optional[Hashable]], positions) -> np.ndarray:
+    """! Update the engine with the objects of a new frame and cluster them
+    @param   ids        Object ids, used to recognize objects across frames
+    @param   positions  Array-like of shape (N, 2) with x, y positions in ids order
+    @return  Array of N DBSCAN labels, NOISE for unclustered objects
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    slots, new_indices = self._assignSlots(self._makeKeys(ids))
+
+    present = np.zeros(len(self._alive), dtype=bool)
+    present[slots] = True
+    removed = np.flatnonzero(self._alive & ~present)
+    self._free_slots.extend(removed.tolist())
+
+    changed_mask = np.any(self._positions[slots] != positions, axis=1)
+    changed_mask[new_indices] = True
+    changed = slots[changed_mask]
+    self._positions[slots] = positions
+    self._alive = present
+
+    if len(removed) + len(changed) > REBUILD_FRACTION * max(len(slots), 1):
+      self._rebuild(slots)
+    elif len(removed) or len(changed):
+      self._applyChanges(np.concatenate([removed, changed]), changed)
+
+    return self._labels(slots)
+
+  @staticmethod
+  def _makeKeys(ids: Sequence[Optional[Hashable]]) -> List[Hashable]:
+    """Object ids are expected to be unique; repeated or missing ids get distinct keys"""
+    unique = set(ids)
+    if len(unique) == len(ids) and None not in unique:
+      return list(ids)
+
+    keys = []
+    seen = {}
+    for index, object_id in enumerate(ids):
+      if object_id is None:
+        keys.append(('__index__', index))
+        continue
+      occurrence = seen.get(object_id, 0)
+      seen[object_id] = occurrence + 1
+      keys.append(object_id if occurrence == 0 else (object_id, occurrence))
+    return keys
+
+  def _assignSlots(self, keys: List[Hashable]):
+    """Map keys to slots, allocating slots for keys that are new"""
+    current = set(keys)
+    for key in [key for key in self._slot_of if key not in current]:
+      del self._slot_of[key]
+
+    slots = np.empty(len(keys), dtype=np.int64)
+    new_indices = []
+    for index, key in enumerate(keys):
+      slot = self._slot_of.get(key)
+      if slot is None:
+        new_indices.append(index)
+      else:
+        slots[index] = slot
+
+    # Slots freed in the previous frame are already gone from the hash and the pair list
+    for index in new_indices:
+      if not self._free_slots:
+        self._grow()
+      slot = self._free_slots.pop()
+      self._slot_of[keys[index]] = slot
+      slots[index] = slot
+    return slots, np.array(new_indices, dtype=np.int64)
+
+  def _grow(self) -> None:
+    capacity = len(self._alive)
+    self._positions = np.concatenate([self._positions, np.zeros((capacity, 2))])
+    self._alive = np.concatenate([self._alive, np.zeros(capacity, dtype=bool)])
+    self._free_slots.extend(range(2 * capacity - 1, capacity - 1, -1))
+    return
+
+  def _cellCodes(self, cells: np.ndarray) -> np.ndarray:
+    # Colliding codes only add candidates, which are filtered by distance afterwards
+    return (cells[:, 0] << 32) + (cells[:, 1] + CELL_Y_BIAS)
+
+  def _cells(self, slots: np.ndarray) -> np.ndarray:
+    return np.floor(self._positions[slots] / self.eps).astype(np.int64)
+
+  def _neighborPairs(self, slots: np.ndarray) -> np.ndarray:
+    """Pairs (slot, neighbor) of every slot in slots with each other slot within eps"""
+    codes = self._cellCodes(self._cells(slots))
+    # Sorted queries keep the binary searches cache friendly
+    order = np.argsort(codes, kind='stable')
+    slots = slots[order]
+    codes = codes[order]
+
+    found = []
+    for dx in (-1, 0, 1):
+      column = codes + (dx << 32)
+      starts = np.searchsorted(self._grid_codes, column - 1, side='left')
+      counts = np.searchsorted(self._grid_codes, column + 1, side='right') - starts
+      total = int(counts.sum())
+      if total == 0:
+        continue
+      query = np.repeat(slots, counts)
+      entry_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+      candidates = self._grid_slots[np.repeat(starts, counts) + entry_offsets]
+      delta = self._positions[candidates] - self._positions[query]
+      within = (np.einsum('ij,ij->i', delta, delta) <= self._eps_squared) & (candidates != query)
+      found.append(np.stack([query[within], candidates[within]], axis=1))
+    return np.concatenate(found) if found else np.empty((0, 2), dtype=np.int64)
+
+  def _rebuild(self, slots: np.ndarray) -> None:
+    codes = self._cellCodes(self._cells(slots))
+    order = np.argsort(codes, kind='stable')
+    self._grid_codes = codes[order]
+    self._grid_slots = slots[order]
+
+    pairs = self._neighborPairs(slots)
+    self._pairs = pairs[pairs[:, 0] < pairs[:, 1]]
+    return
+
+  def _applyChanges(self, dirty: np.ndarray, changed: np.ndarray) -> None:
+    is_dirty = np.zeros(len(self._alive), dtype=bool)
+    is_dirty[dirty] = True
+
+    keep = ~is_dirty[self._grid_slots]
+    self._grid_codes = self._grid_codes[keep]
+    self._grid_slots = self._grid_slots[keep]
+    self._pairs = self._pairs[~(is_dirty[self._pairs[:, 0]] | is_dirty[self._pairs[:, 1]])]
+
+    if len(changed) == 0:
+      return
+
+    codes = self._cellCodes(self._cells(changed))
+    order = np.argsort(codes, kind='stable')
+    positions = np.searchsorted(self._grid_codes, codes[order])
+    self._grid_codes = np.insert(self._grid_codes, positions, codes[order])
+    self._grid_slots = np.insert(self._grid_slots, positions, changed[order])
+
+    # Pairs of two changed objects are found from both sides, keep one of them
+    pairs = self._neighborPairs(changed)
+    self._pairs = np.concatenate([self._pairs,
+                                  pairs[~is_dirty[pairs[:, 1]] | (pairs[:, 0] < pairs[:, 1])]])
+    return
+
+  def _labels(self, slots: np.ndarray) -> np.ndarray:
+    """Cluster from the neighbor pairs and number clusters by their first core point in input order"""
+    if len(slots) == 0:
+      return np.empty(0, dtype=int)
+
+    capacity = len(self._alive)
+    pairs = self._pairs
+    neighbor_counts = 1 + np.bincount(pairs.ravel(), minlength=capacity)
+    core = self._alive & (neighbor_counts >= self.min_samples)
+
+    core_pairs = pairs[core[pairs[:, 0]] & core[pairs[:, 1]]]
+    graph = coo_matrix((np.ones(len(core_pairs), dtype=np.int8), (core_pairs[:, 0], core_pairs[:, 1])),
+                       shape=(capacity, capacity))
+    _, components = connected_components(graph, directed=False)
+    components = np.where(core, components, NOISE)
+
+    # Border points join the cluster of their first core neighbor
+    border_pairs = np.concatenate([pairs[core[pairs[:, 0]] & ~core[pairs[:, 1]]],
+                                   pairs[core[pairs[:, 1]] & ~core[pairs[:, 0]]][:, ::-1]])
+    if len(border_pairs):
+      border_slots, first = np.unique(border_pairs[:, 1], return_index=True)
+      components[border_slots] = components[border_pairs[first, 0]]
+
+    frame_components = components[slots]
+    frame_core = core[slots]
+    core_components = frame_components[frame_core]
+    clusters, first_index = np.unique(core_components, return_index=True)
+    numbering = np.full(capacity, NOISE, dtype=int)
+    numbering[clusters[np.argsort(first_index)]] = np.arange(len(clusters))
+
+    labels = np.full(len(slots), NOISE, dtype=int)
+    clustered = frame_components != NOISE
+    labels[clustered] = numbering[frame_components[clustered]]
+    return labels
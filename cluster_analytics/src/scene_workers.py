@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-scene worker pool for cluster analytics.
+
+OVERVIEW:
+Decoding, clustering, cluster tracking and publishing used to run for every scene on
+the single paho callback thread, so one busy scene delayed the analytics of all other
+scenes and the MQTT backlog grew without limit. The pool gives every scene its own
+worker thread. The MQTT callback only stores the raw, undecoded message in the worker
+of its scene, overwriting any message that has not been picked up yet, so a worker
+that falls behind skips straight to the newest frame of its scene.
+
+IMPLEMENTATION:
+- SceneWorkerPool: MQTT callback that routes messages to workers by scene id; workers
+  are started on the first message of a scene
+- SceneWorker: thread with a single pending slot that hands the newest message to the handler
+- Every worker counts superseded (dropped) frames and measures the latency from message
+  arrival to the end of processing; a summary per scene is logged every report interval
+  and available through SceneWorkerPool.statistics()
+"""
+
+import threading
+import time
+
+from scene_common import log
+from scene_common.mqtt import PubSub
+
+# Seconds between the per-scene latency and dropped frame reports in the log
+REPORT_INTERVAL = 60.0
+
+class SceneStatistics:
+  """Processing counters of one scene"""
+
+  def __init__(self):
+    self.processed = 0
+    self.dropped = 0
+    self.last_latency = 0.0
+    self.max_latency = 0.0
+    self.total_latency = 0.0
+
+    # Counters since the last report
+    self.window_processed = 0
+    self.window_dropped = 0
+    self.window_latency = 0.0
+    self.window_max_latency = 0.0
+    return
+
+  def recordLatency(self, latency):
+    self.processed += 1
+    self.last_latency = latency
+    self.max_latency = max(self.max_latency, latency)
+    self.total_latency += latency
+    self.window_processed += 1
+    self.window_latency += latency
+    self.window_max_latency = max(self.window_max_latency, latency)
+    return
+
+  def recordDropped(self):
+    self.dropped += 1
+    self.window_dropped += 1
+    return
+
+  def takeWindow(self):
+    """! Return the counters since the last report and start a new window
+    @return  Tuple of (processed frames, dropped frames, mean latency, max latency)
+    """
+    mean_latency = self.window_latency / self.window_processed if self.window_processed else 0.0
+    window = (self.window_processed, self.window_dropped, mean_latency, self.window_max_latency)
+    self.window_processed = 0
+    self.window_dropped = 0
+    self.window_latency = 0.0
+    self.window_max_latency = 0.0
+    return window
+
+  def toDict(self):
+    return {
+        'processed': self.processed,
+        'dropped': self.dropped,
+        'last_latency': self.last_latency,
+        'max_latency': self.max_latency,
+        'mean_latency': self.total_latency / self.processed if self.processed else 0.0
+    }
+
+class SceneWorker(threading.Thread):
+  """Holds only the newest undecoded message of one scene and passes it to a handler"""
+
+  def __init__(self, scene_id, handler, report_interval=REPORT_INTERVAL):
+    super().__init__(name=f"SceneWorker-{scene_id}", daemon=True)
+    self.scene_id = scene_id
+    self.handler = handler
+    self.report_interval = report_interval
+    self.stats = SceneStatistics()
+    self._pending = None  # Structure: (client, userdata, message, arrival time)
+    self._cond = threading.Condition()
+    self._stop_event = threading.Event()
+    self._last_report = time.monotonic()
+    return
+
+  def put(self, client, userdata, message):
+    """! Store a message, replacing the one still waiting for processing
+    @param   client    MQTT client.
+    @param   userdata  Private user data as set in Client.
+    @param   message   Message on MQTT bus.
+    @return  True if an unprocessed message was dropped
+    """
+    with self._cond:
+      superseded = self._pending is not None
+      self._pending = (client, userdata, message, time.monotonic())
+      if superseded:
+        self.stats.recordDropped()
+      self._cond.notify()
+    return superseded
+
+  def statistics(self):
+    with self._cond:
+      return self.stats.toDict()
+
+  def shutdown(self):
+    """Stop the worker; a message still pending is discarded"""
+    self._stop_event.set()
+    with self._cond:
+      self._cond.notify()
+    return
+
+  def _take(self):
+    with self._cond:
+      while self._pending is None and not self._stop_event.is_set():
+        self._cond.wait()
+      if self._stop_event.is_set():
+        return None
+      item = self._pending
+      self._pending = None
+      return item
+
+  def _report(self, now):
+    with self._cond:
+      processed, dropped, mean_latency, max_latency = self.stats.takeWindow()
+    self._last_report = now
+    log.info(f"Scene {self.scene_id}: processed {processed} frames, dropped {dropped} superseded frames, "
+             f"latency mean {mean_latency * 1000:.1f} ms, max {max_latency * 1000:.1f} ms")
+    return
+
+  def run(self):
+    while True:
+      item = self._take()
+      if item is None:
+        break
+
+      client, userdata, message, arrival = item
+      try:
+        self.handler(self.scene_id, message)
+      except Exception as e:
+        log.error(f"Failed to process frame of scene {self.scene_id}: {e}")
+
+      now = time.monotonic()
+      with self._cond:
+        self.stats.recordLatency(now - arrival)
+      if now - self._last_report >= self.report_interval:
+        self._report(now)
+
+    log.info(f"SceneWorker for scene {self.scene_id} exiting")
+    return
+
+class SceneWorkerPool:
+  """Routes scene messages to one keep-latest worker per scene"""
+
+  def __init__(self, handler, report_interval=REPORT_INTERVAL):
+    """! Create the pool
+    @param   handler          Callable(scene_id, message) run on the worker of the scene
+    @param   report_interval  Seconds between per-scene statistics reports in the log
+    """
+    self.handler = handler
+    self.report_interval = report_interval
+    self.workers = {}  # Structure: {scene_id: SceneWorker}
+    self._lock = threading.Lock()
+    return
+
+  def put(self, client, userdata, message):
+    """! MQTT callback: hand the message to the worker of its scene
+    @param   client    MQTT client.
+    @param   userdata  Private user data as set in Client.
+    @param   message   Message on MQTT bus.
+    @return  None
+    """
+    scene_id = PubSub.parseTopic(message.topic).get('scene_id', 'unknown')
+    self.getWorker(scene_id).put(client, userdata, message)
+    return
+
+  def getWorker(self, scene_id):
+    with self._lock:
+      worker = self.workers.get(scene_id)
+      if worker is None:
+        worker = SceneWorker(scene_id, self.handler, self.report_interval)
+        self.workers[scene_id] = worker
+        worker.start()
+        log.debug(f"Started worker for scene {scene_id}")
+    return worker
+
+  def statistics(self):
+    """! Processing statistics of every scene
+    @return  Dictionary {scene_id: {'processed', 'dropped', 'last_latency', 'max_latency', 'mean_latency'}}
+    """
+    with self._lock:
+      workers = list(self.workers.values())
+    return {worker.scene_id: worker.statistics() for worker in workers}
+
+  def shutdown(self):
+    """Stop all workers and wait for them to finish the frame in progress"""
+    with self._lock:
+      workers = list(self.workers.values())
+      self.workers = {}
+    for worker in workers:
+      worker.shutdown()
+    for worker in workers:
+      worker.join()
+    return
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Pytest Configuration
+Makes the cluster analytics sources importable from the test modules.
+"""
+
+import sys
+from pathlib import Path
+
+# In the container the sources live in /app, in the repository in ../src
+for source_dir in (Path('/app'), Path(__file__).parent.parent / 'src'):
+  if (source_dir / 'grid_clustering.py').exists():
+    sys.path.insert(0, str(source_dir))
+    break
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for vectorized cluster feature extraction
+The per-cluster detectShapeMl and analyzeClusterVelocity are the reference.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from cluster_analytics_context import ClusterAnalyticsConfig, ClusterAnalyticsContext
+
+CONFIG_PATH = Path(__file__).parent.parent / 'config' / 'config.json'
+if not CONFIG_PATH.exists():
+  CONFIG_PATH = Path('/app/config/config.json')
+
+@pytest.fixture
+def context():
+  # Only the analysis methods are exercised, so no MQTT connection or WebUI is set up
+  analytics = ClusterAnalyticsContext.__new__(ClusterAnalyticsContext)
+  analytics.config = ClusterAnalyticsConfig(str(CONFIG_PATH))
+  return analytics
+
+def assertApproxEqual(actual, expected, path="result"):
+  if isinstance(expected, dict):
+    assert set(actual) - {"orientation_degrees"} == set(expected), path
+    for key in expected:
+      assertApproxEqual(actual[key], expected[key], f"{path}.{key}")
+  elif isinstance(expected, (list, tuple)):
+    assert len(actual) == len(expected), path
+    for index, (actual_item, expected_item) in enumerate(zip(actual, expected)):
+      assertApproxEqual(actual_item, expected_item, f"{path}[{index}]")
+  elif isinstance(expected, str):
+    assert actual == expected, path
+  else:
+    assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9), path
+  return
+
+def clusterPoints(rng, count):
+  """Points of one cluster in one of the formations the shape detection distinguishes"""
+  center = rng.uniform(-30, 30, size=2)
+  formation = rng.integers(4)
+  if formation == 0:
+    angles = np.sort(rng.uniform(0, 2 * np.pi, size=count))
+    return center + 0.5 * np.stack([np.cos(angles), np.sin(angles)], axis=1)
+  if formation == 1:
+    return center + np.outer(np.linspace(0, 3, count), rng.normal(size=2)) + rng.normal(0, 0.01, size=(count, 2))
+  if formation == 2 and count == 4:
+    return center + np.array([[-2.0, -2.0], [2.0, -2.0], [2.0, 2.0], [-2.0, 2.0]])
+  return center + rng.normal(0, 1.5, size=(count, 2))
+
+def clusterVelocities(rng, points):
+  """Velocities that are stationary, parallel, converging, diverging or random"""
+  pattern = rng.integers(5)
+  count = len(points)
+  if pattern == 0:
+    return rng.normal(0, 0.01, size=(count, 3))
+  if pattern == 1:
+    return np.tile(rng.normal(0, 2, size=3), (count, 1)) + rng.normal(0, 0.05, size=(count, 3))
+  direction = points.mean(axis=0) - points
+  if pattern in (2, 3):
+    planar = direction if pattern == 2 else -direction
+    return np.column_stack([planar, np.zeros(count)]) + rng.normal(0, 0.05, size=(count, 3))
+  return rng.normal(0, 1, size=(count, 3))
+
+def makeFrame(rng, sizes, noise=5):
+  positions = []
+  velocities = []
+  labels = []
+  for label, count in enumerate(sizes):
+    points = clusterPoints(rng, count)
+    positions.append(points)
+    velocities.append(clusterVelocities(rng, points))
+    labels.extend([label] * count)
+  positions.append(rng.uniform(-50, 50, size=(noise, 2)))
+  velocities.append(rng.normal(0, 1, size=(noise, 3)))
+  labels.extend([-1] * noise)
+
+  order = rng.permutation(len(labels))
+  return np.vstack(positions)[order], np.vstack(velocities)[order], np.array(labels)[order]
+
+class TestAnalyzeClusterFeatures:
+  """Test cases for ClusterAnalyticsContext.analyzeClusterFeatures"""
+
+  @pytest.mark.parametrize("seed", range(12))
+  def test_matches_per_cluster_analysis(self, context, seed):
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(1, 9, size=10)
+    positions, velocities, labels = makeFrame(rng, sizes)
+    velocity_valid = rng.random(len(labels)) > 0.1
+
+    results = context.analyzeClusterFeatures(positions, velocities, velocity_valid, labels)
+    assert len(results) == len(sizes)
+
+    for cluster_id, features in enumerate(results):
+      members = np.flatnonzero(labels == cluster_id)
+      np.testing.assert_array_equal(features['members'], members)
+
+      center = np.mean(positions[members], axis=0)
+      np.testing.assert_allclose(features['center'], center, rtol=1e-12, atol=1e-12)
+
+      assertApproxEqual(features['shape_analysis'], context.detectShapeMl(positions[members]))
+
+      cluster_objects = [{'translation': list(positions[index]) + [0.0], 'velocity': list(velocities[index])}
+                         if velocity_valid[index] else {'translation': list(positions[index]) + [0.0],
+                                                        'velocity': []}
+                         for index in members]
+      assertApproxEqual(features['velocity_analysis'], context.analyzeClusterVelocity(cluster_objects, center))
+
+  def test_orientation_follows_principal_axis(self, context):
+    positions = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.1], [4.0, 3.9]])
+    results = context.analyzeClusterFeatures(positions, np.zeros((5, 3)), np.ones(5, dtype=bool), np.zeros(5, dtype=int))
+    assert results[0]['shape_analysis']['orientation_degrees'] == pytest.approx(45.0, abs=1.0)
+
+  def test_no_clusters(self, context):
+    positions = np.zeros((3, 2))
+    assert context.analyzeClusterFeatures(positions, np.zeros((3, 3)), np.ones(3, dtype=bool),
+                                          np.full(3, -1)) == []
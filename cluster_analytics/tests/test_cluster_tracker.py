@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for cluster tracking
+"""
+
+import numpy as np
+import pytest
+
+from cluster_analytics_tracker import HungarianMatcher, TrackedCluster
+
+CATEGORIES = ['person', 'vehicle']
+SHAPES = ['circle', 'line', 'rectangle', 'irregular']
+
+def randomDetection(rng, category=None):
+  return {
+      'category': category or CATEGORIES[rng.integers(len(CATEGORIES))],
+      'objects_count': int(rng.integers(2, 20)),
+      'center_of_mass': {'x': float(rng.uniform(-20, 20)), 'y': float(rng.uniform(-20, 20))},
+      'shape_analysis': {'shape': SHAPES[rng.integers(len(SHAPES))], 'size': {}},
+      'velocity_analysis': {'average_velocity': [float(v) for v in rng.normal(0, 1, size=3)]},
+      'object_ids': [],
+      'dbscan_params': {},
+  }
+
+def randomCluster(rng, with_prediction):
+  detection = randomDetection(rng)
+  cluster = TrackedCluster(scene_id='scene', category=detection['category'],
+                           centroid=detection['center_of_mass'],
+                           shape_analysis=detection['shape_analysis'],
+                           velocity_analysis=detection['velocity_analysis'],
+                           object_ids=[f'object-{index}' for index in range(detection['objects_count'])],
+                           dbscan_params={}, detection_timestamp=0.0)
+  cluster.predicted_position = (float(rng.uniform(-20, 20)), float(rng.uniform(-20, 20))) \
+    if with_prediction else None
+  return cluster
+
+class TestHungarianMatcher:
+  """Test cases for HungarianMatcher"""
+
+  @pytest.mark.parametrize("clusters,detections", [(1, 1), (3, 7), (12, 5), (40, 40)])
+  def test_cost_matrix_matches_scalar_cost(self, clusters, detections):
+    rng = np.random.default_rng(clusters * 100 + detections)
+    matcher = HungarianMatcher()
+    existing = [randomCluster(rng, with_prediction=index % 2 == 0) for index in range(clusters)]
+    new = [randomDetection(rng) for _ in range(detections)]
+
+    expected = np.array([[matcher._calculateMatchingCost(tracked, detection) for detection in new]
+                         for tracked in existing])
+    cost_matrix = matcher._buildCostMatrix(existing, new)
+
+    assert cost_matrix.shape == (clusters, detections)
+    np.testing.assert_array_equal(np.isinf(cost_matrix), np.isinf(expected))
+    np.testing.assert_allclose(cost_matrix[np.isfinite(expected)], expected[np.isfinite(expected)],
+                               rtol=1e-12, atol=1e-12)
+
+  def test_match_uses_nearest_cluster(self):
+    rng = np.random.default_rng(7)
+    matcher = HungarianMatcher()
+    existing = [randomCluster(rng, with_prediction=False) for _ in range(3)]
+    for cluster in existing:
+      cluster.category = 'person'
+    new = []
+    for cluster in reversed(existing):
+      detection = randomDetection(rng, category='person')
+      detection['center_of_mass'] = dict(cluster.centroid)
+      detection['objects_count'] = cluster.object_count
+      detection['shape_analysis'] = cluster.shape_analysis
+      detection['velocity_analysis'] = cluster.velocity_analysis
+      new.append(detection)
+
+    matches = matcher.match(existing, new)
+    assert sorted((uuid, index) for uuid, index, _ in matches) == \
+      sorted((cluster.uuid, len(existing) - 1 - position) for position, cluster in enumerate(existing))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for the incremental grid clustering engine
+sklearn DBSCAN is the reference implementation.
+"""
+
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+
+from grid_clustering import NOISE, GridClusterEngine
+
+EPS = 1.0
+MIN_SAMPLES = 3
+
+def assertDbscanEquivalent(positions, labels, eps=EPS, min_samples=MIN_SAMPLES):
+  """Core points and noise must match sklearn exactly, border points must join a neighboring cluster"""
+  reference = DBSCAN(eps=eps, min_samples=min_samples).fit(positions)
+  core = np.zeros(len(positions), dtype=bool)
+  core[reference.core_sample_indices_] = True
+
+  np.testing.assert_array_equal(labels[core], reference.labels_[core])
+  np.testing.assert_array_equal(labels == NOISE, reference.labels_ == NOISE)
+
+  distances = np.linalg.norm(positions[:, None, :] - positions[None, :, :], axis=2)
+  for index in np.flatnonzero(~core & (labels != NOISE)):
+    neighbor_labels = labels[(distances[index] <= eps) & core]
+    assert labels[index] in neighbor_labels
+  return
+
+def crowd(rng, count, groups=8, extent=40.0):
+  """Gaussian groups of people plus uniformly scattered individuals"""
+  centers = rng.uniform(-extent / 2, extent / 2, size=(groups, 2))
+  grouped = centers[rng.integers(0, groups, size=count * 3 // 4)] + rng.normal(0, 0.8, size=(count * 3 // 4, 2))
+  scattered = rng.uniform(-extent / 2, extent / 2, size=(count - len(grouped), 2))
+  return np.vstack([grouped, scattered])
+
+class TestGridClusterEngine:
+  """Test cases for GridClusterEngine"""
+
+  def test_first_frame_matches_dbscan(self):
+    rng = np.random.default_rng(1)
+    positions = crowd(rng, 400)
+    labels = GridClusterEngine(EPS, MIN_SAMPLES).update(list(range(len(positions))), positions)
+    assertDbscanEquivalent(positions, labels)
+
+  @pytest.mark.parametrize("moving_fraction", [0.02, 0.1, 0.5])
+  def test_incremental_frames_match_dbscan(self, moving_fraction):
+    rng = np.random.default_rng(2)
+    positions = crowd(rng, 300)
+    ids = list(range(len(positions)))
+    engine = GridClusterEngine(EPS, MIN_SAMPLES)
+    engine.update(ids, positions)
+
+    for _ in range(30):
+      moving = rng.random(len(positions)) < moving_fraction
+      positions = positions.copy()
+      positions[moving] += rng.normal(0, 0.5, size=(moving.sum(), 2))
+      labels = engine.update(ids, positions)
+      assertDbscanEquivalent(positions, labels)
+
+  def test_objects_added_and_removed(self):
+    rng = np.random.default_rng(3)
+    positions = crowd(rng, 200)
+    ids = list(range(len(positions)))
+    next_id = len(ids)
+    engine = GridClusterEngine(EPS, MIN_SAMPLES)
+    engine.update(ids, positions)
+
+    for _ in range(30):
+      keep = rng.random(len(ids)) > 0.03
+      arriving = rng.integers(0, 6)
+      positions = np.vstack([positions[keep], crowd(rng, arriving, groups=1, extent=10.0)]) \
+        if arriving else positions[keep]
+      ids = [object_id for object_id, kept in zip(ids, keep) if kept] + list(range(next_id, next_id + arriving))
+      next_id += arriving
+      labels = engine.update(ids, positions)
+      assertDbscanEquivalent(positions, labels)
+
+  def test_bridge_merges_and_splits_clusters(self):
+    left = [[0.0, 0.0], [0.5, 0.0], [0.0, 0.5]]
+    right = [[3.0, 0.0], [3.5, 0.0], [3.0, 0.5]]
+    bridge = [[1.2, 0.0], [1.9, 0.0], [2.6, 0.0]]
+    ids = list(range(9))
+    engine = GridClusterEngine(EPS, MIN_SAMPLES)
+
+    far_bridge = np.array(left + right + [[20.0, 20.0], [22.0, 20.0], [24.0, 20.0]])
+    labels = engine.update(ids, far_bridge)
+    assert labels[0] != labels[3]
+
+    # Moving a few objects in between connects both groups into one cluster
+    positions = np.array(left + right + bridge)
+    labels = engine.update(ids, positions)
+    assertDbscanEquivalent(positions, labels)
+    assert len(set(labels)) == 1
+
+    labels = engine.update(ids, far_bridge)
+    assertDbscanEquivalent(far_bridge, labels)
+    assert labels[0] != labels[3]
+
+  def test_unchanged_frame_keeps_labels(self):
+    rng = np.random.default_rng(4)
+    positions = crowd(rng, 100)
+    ids = [f"object-{index}" for index in range(len(positions))]
+    engine = GridClusterEngine(EPS, MIN_SAMPLES)
+    first = engine.update(ids, positions)
+    np.testing.assert_array_equal(engine.update(ids, positions), first)
+
+  def test_reordered_and_duplicate_ids(self):
+    rng = np.random.default_rng(5)
+    positions = crowd(rng, 120)
+    ids = [index // 2 for index in range(len(positions))]
+    engine = GridClusterEngine(EPS, MIN_SAMPLES)
+    assertDbscanEquivalent(positions, engine.update(ids, positions))
+
+    order = rng.permutation(len(positions))
+    assertDbscanEquivalent(positions[order], engine.update([None] * len(order), positions[order]))
+
+  def test_empty_frame(self):
+    engine = GridClusterEngine(EPS, MIN_SAMPLES)
+    assert len(engine.update([], np.empty((0, 2)))) == 0
+    assert engine.update([1], [[0.0, 0.0]]).tolist() == [NOISE]
+
+  def test_matches_params(self):
+    engine = GridClusterEngine(1.5, 4)
+    assert engine.matchesParams(1.5, 4)
+    assert not engine.matchesParams(1.0, 4)
+    assert not engine.matchesParams(1.5, 3)
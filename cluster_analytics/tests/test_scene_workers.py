@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for the per-scene worker pool
+Covers routing by scene, keep-latest coalescing and the dropped frame and latency counters.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from scene_common.mqtt import PubSub
+from scene_workers import SceneWorkerPool
+
+TIMEOUT = 5.0
+
+def sceneMessage(scene_id, payload):
+  topic = PubSub.formatTopic(PubSub.DATA_REGULATED, scene_id=scene_id)
+  return SimpleNamespace(topic=topic, payload=payload)
+
+class BlockingHandler:
+  """Records processed payloads; processing of a scene blocks until it is released"""
+
+  def __init__(self):
+    self.processed = []
+    self.started = threading.Event()
+    self.release = threading.Event()
+    self.done = threading.Condition()
+
+  def __call__(self, scene_id, message):
+    self.started.set()
+    self.release.wait(TIMEOUT)
+    with self.done:
+      self.processed.append((scene_id, message.payload))
+      self.done.notify_all()
+
+  def waitFor(self, count):
+    with self.done:
+      return self.done.wait_for(lambda: len(self.processed) >= count, TIMEOUT)
+
+@pytest.fixture
+def handler():
+  return BlockingHandler()
+
+@pytest.fixture
+def pool(handler):
+  workers = SceneWorkerPool(handler)
+  yield workers
+  handler.release.set()
+  workers.shutdown()
+
+def test_superseded_frames_are_dropped(pool, handler):
+  pool.put(None, None, sceneMessage("scene-a", b"1"))
+  assert handler.started.wait(TIMEOUT)
+
+  # Frames 2 and 3 arrive while frame 1 is processed, only frame 4 is kept
+  for payload in (b"2", b"3", b"4"):
+    pool.put(None, None, sceneMessage("scene-a", payload))
+  handler.release.set()
+
+  assert handler.waitFor(2)
+  assert handler.processed == [("scene-a", b"1"), ("scene-a", b"4")]
+
+  stats = pool.statistics()["scene-a"]
+  assert stats["dropped"] == 2
+  assert stats["processed"] == 2
+  assert stats["max_latency"] >= stats["last_latency"] > 0
+
+def test_busy_scene_does_not_block_other_scenes(pool, handler):
+  pool.put(None, None, sceneMessage("scene-a", b"a1"))
+  assert handler.started.wait(TIMEOUT)
+
+  # Scene b is processed by its own worker while scene a is still blocked
+  processed_b = threading.Event()
+  pool.getWorker("scene-b").handler = lambda scene_id, message: processed_b.set()
+  pool.put(None, None, sceneMessage("scene-b", b"b1"))
+  assert processed_b.wait(TIMEOUT)
+  assert handler.processed == []
+
+  handler.release.set()
+  assert handler.waitFor(1)
+  assert set(pool.statistics()) == {"scene-a", "scene-b"}
+  assert pool.statistics()["scene-b"]["dropped"] == 0
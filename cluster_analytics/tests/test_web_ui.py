@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for the WebUI scene snapshots and update scheduler
+Covers versioned deltas, snapshot resends and the per-room fan-out.
+"""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from tools.webui.web_ui import SceneSnapshot, WebUI
+
+TIMEOUT = 5.0
+
+def cluster(clusterId, x, sinceLastSeen=0.0):
+  return {
+    'id': clusterId,
+    'center': [x, 0.0],
+    'tracking': {'state': "stable", 'time_since_last_seen': sinceLastSeen}
+  }
+
+def detections(name, count):
+  return {'name': name, 'objects': [{'id': f"obj{idx}", 'category': "person"} for idx in range(count)]}
+
+def received(client, event):
+  return [packet['args'][0] for packet in client.get_received() if packet['name'] == event]
+
+@pytest.fixture
+def webui():
+  context = mock.Mock()
+  context.user_dbscan_params_by_scene = {}
+  context.getDbscanParamsForCategory.return_value = {'eps': 1.0, 'min_samples': 3}
+  context.getDefaultDbscanParamsForCategory.return_value = {'eps': 1.0, 'min_samples': 3}
+  # The tests drive SocketIO directly, eventlet must not patch the test process
+  with mock.patch('eventlet.monkey_patch'):
+    ui = WebUI(context)
+  scheduler = threading.Thread(target=ui.runScheduler, daemon=True)
+  scheduler.start()
+  return ui
+
+def waitForIdle(webui):
+  """Wait until the scheduler has taken all pending updates"""
+  deadline = time.monotonic() + TIMEOUT
+  while webui.hasPendingUpdates() and time.monotonic() < deadline:
+    time.sleep(0.01)
+  assert not webui.hasPendingUpdates()
+
+def sceneClient(webui, sceneId):
+  client = webui.socketio.test_client(webui.app)
+  client.emit('select_scene', {'scene_id': sceneId})
+  client.get_received()
+  return client
+
+def waitForDelta(client, count=1):
+  deltas = []
+  deadline = time.monotonic() + TIMEOUT
+  while len(deltas) < count and time.monotonic() < deadline:
+    deltas += received(client, 'scene_delta')
+    time.sleep(0.01)
+  return deltas
+
+def test_first_delta_is_full_state():
+  snapshot = SceneSnapshot("Lobby")
+  snapshot.setObjects([{'id': "obj1"}], {'object_count': 1})
+  snapshot.setClusters([cluster("c1", 1.0), cluster("c2", 2.0)])
+
+  delta = snapshot.takeDelta("scene-a")
+  assert delta['base_version'] == 0
+  assert delta['version'] == 1
+  assert [c['id'] for c in delta['clusters']['added']] == ["c1", "c2"]
+  assert delta['clusters']['changed'] == [] and delta['clusters']['removed'] == []
+  assert delta['objects'] == [{'id': "obj1"}]
+  assert snapshot.toDict()['clusters'] == [cluster("c1", 1.0), cluster("c2", 2.0)]
+  assert not snapshot.isDirty()
+  assert snapshot.takeDelta("scene-a") is None
+
+def test_delta_contains_only_changes():
+  snapshot = SceneSnapshot("Lobby")
+  snapshot.setObjects([], {})
+  snapshot.setClusters([cluster("c1", 1.0), cluster("c2", 2.0)])
+  snapshot.takeDelta("scene-a")
+
+  # Only the volatile tracking field differs, so nothing is sent
+  snapshot.setClusters([cluster("c1", 1.0, 0.5), cluster("c2", 2.0, 0.5)])
+  assert snapshot.takeDelta("scene-a") is None
+  assert snapshot.version == 1
+
+  snapshot.setClusters([cluster("c1", 1.5), cluster("c2", 2.0)])
+  delta = snapshot.takeDelta("scene-a")
+  assert (delta['base_version'], delta['version']) == (1, 2)
+  assert delta['clusters'] == {'added': [], 'changed': [cluster("c1", 1.5)], 'removed': []}
+  assert 'objects' not in delta
+
+def test_removed_clusters():
+  snapshot = SceneSnapshot("Lobby")
+  snapshot.setClusters([cluster("c1", 1.0), cluster("c2", 2.0)])
+  snapshot.takeDelta("scene-a")
+
+  snapshot.setClusters([cluster("c2", 2.0), cluster("c3", 3.0)])
+  delta = snapshot.takeDelta("scene-a")
+  assert delta['clusters'] == {'added': [cluster("c3", 3.0)], 'changed': [], 'removed': ["c1"]}
+  assert [c['id'] for c in snapshot.toDict()['clusters']] == ["c2", "c3"]
+
+  snapshot.setClusters([])
+  delta = snapshot.takeDelta("scene-a")
+  assert sorted(delta['clusters']['removed']) == ["c2", "c3"]
+  assert snapshot.toDict()['clusters'] == []
+
+def test_deltas_fan_out_per_room(webui):
+  webui.updateSceneObjects("scene-a", detections("Lobby", 2))
+  webui.updateSceneObjects("scene-b", detections("Garage", 1))
+  waitForIdle(webui)
+  lobbyClients = [sceneClient(webui, "scene-a") for _ in range(2)]
+  garageClient = sceneClient(webui, "scene-b")
+
+  webui.updateSceneClusters("scene-a", [cluster("c1", 1.0)])
+  lobbyDeltas = [waitForDelta(client) for client in lobbyClients]
+  assert lobbyDeltas[0] == lobbyDeltas[1]
+  assert lobbyDeltas[0][0]['scene_id'] == "scene-a"
+  assert lobbyDeltas[0][0]['clusters']['added'] == [cluster("c1", 1.0)]
+  assert received(garageClient, 'scene_delta') == []
+
+  webui.updateSceneClusters("scene-b", [cluster("c9", 9.0)])
+  garageDelta = waitForDelta(garageClient)
+  assert garageDelta[0]['scene_id'] == "scene-b"
+  assert all(received(client, 'scene_delta') == [] for client in lobbyClients)
+
+def test_unwatched_scene_advances(webui):
+  webui.updateSceneObjects("scene-a", detections("Lobby", 1))
+  client = sceneClient(webui, "scene-b")
+  webui.updateSceneClusters("scene-a", [cluster("c1", 1.0)])
+
+  waitForIdle(webui)
+  assert webui.scenes["scene-a"].version >= 1
+  assert received(client, 'scene_delta') == []
+
+  # A client joining later starts from the current full state
+  client.emit('select_scene', {'scene_id': "scene-a"})
+  snapshot = received(client, 'scene_data')
+  assert snapshot[0]['version'] == webui.scenes["scene-a"].version
+  assert snapshot[0]['data']['clusters'] == [cluster("c1", 1.0)]
+
+def test_version_gap_requests_full_snapshot(webui):
+  webui.updateSceneObjects("scene-a", detections("Lobby", 1))
+  waitForIdle(webui)
+  client = sceneClient(webui, "scene-a")
+  webui.updateSceneClusters("scene-a", [cluster("c1", 1.0)])
+  first = waitForDelta(client)[0]
+
+  # The client drops the next delta and detects the gap on the one after
+  webui.updateSceneClusters("scene-a", [cluster("c1", 1.0), cluster("c2", 2.0)], immediate=True)
+  waitForDelta(client)
+  webui.updateSceneClusters("scene-a", [cluster("c2", 2.0)], immediate=True)
+  gap = waitForDelta(client)[0]
+  assert gap['base_version'] == first['version'] + 1
+
+  client.emit('request_snapshot', {'scene_id': "scene-a"})
+  snapshot = received(client, 'scene_data')
+  assert snapshot[0]['version'] == gap['version']
+  assert snapshot[0]['data']['clusters'] == [cluster("c2", 2.0)]
+  assert len(snapshot[0]['data']['objects']) == 1
+
+  # Snapshots are only resent for the scene the client watches
+  client.emit('request_snapshot', {'scene_id': "scene-b"})
+  assert received(client, 'scene_data') == []
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark of GridClusterEngine against sklearn DBSCAN on simulated scene frames.
+
+Each frame moves a share of the objects by one step of walking, the way consecutive
+scene messages differ. sklearn clusters every frame from scratch, the engine updates
+the previous frame's state.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from sklearn.cluster import DBSCAN
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from grid_clustering import GridClusterEngine
+
+def simulate(rng, count, frames, moving_fraction, extent):
+  """Generate frames of grouped and scattered objects with a share of them walking"""
+  centers = rng.uniform(-extent / 2, extent / 2, size=(count // 10, 2))
+  positions = centers[rng.integers(0, len(centers), size=count)] + rng.normal(0, 1.0, size=(count, 2))
+  velocities = rng.normal(0, 1.0, size=(count, 2))
+  result = []
+  for _ in range(frames):
+    moving = rng.random(count) < moving_fraction
+    positions = positions.copy()
+    positions[moving] += velocities[moving] * 0.1
+    result.append(positions)
+  return result
+
+def timeFrames(cluster, frames):
+  start = time.perf_counter()
+  for positions in frames:
+    cluster(positions)
+  return (time.perf_counter() - start) / len(frames)
+
+def build_argparser():
+  parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--counts", type=int, nargs='+', default=[1000, 10000], help="Objects per scene")
+  parser.add_argument("--moving", type=float, nargs='+', default=[0.05, 0.2, 1.0],
+                      help="Share of objects that move between frames")
+  parser.add_argument("--frames", type=int, default=50, help="Frames per measurement")
+  parser.add_argument("--eps", type=float, default=1.0, help="DBSCAN eps")
+  parser.add_argument("--min_samples", type=int, default=3, help="DBSCAN min_samples")
+  return parser
+
+def main():
+  args = build_argparser().parse_args()
+  print(f"{'objects':>8} {'moving':>7} {'sklearn ms':>11} {'engine ms':>10} {'speedup':>8}")
+  for count in args.counts:
+    for moving_fraction in args.moving:
+      rng = np.random.default_rng(42)
+      # Keep the object density of a 1000 object scene over 100m x 100m
+      frames = simulate(rng, count, args.frames, moving_fraction, 100.0 * np.sqrt(count / 1000))
+      ids = list(range(count))
+
+      reference = timeFrames(lambda positions: DBSCAN(eps=args.eps, min_samples=args.min_samples).fit(positions),
+                             frames)
+      engine = GridClusterEngine(args.eps, args.min_samples)
+      engine.update(ids, frames[0])
+      incremental = timeFrames(lambda positions: engine.update(ids, positions), frames)
+
+      print(f"{count:>8} {moving_fraction:>7.0%} {reference * 1000:>11.2f} {incremental * 1000:>10.2f} "
+            f"{reference / incremental:>8.2f}")
+  return
+
+if __name__ == '__main__':
+  exit(main() or 0)
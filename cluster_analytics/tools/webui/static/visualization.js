@@ -18,6 +18,8 @@ let sceneData = {
   clusters: [],
   metadata: {},
 };
+let sceneVersion = null; // Version of the scene snapshot the deltas apply to
+let snapshotRequested = false; // Track if a full snapshot was requested after a missed delta
 let lastClusterUpdateTime = null; // Track when clusters were last updated
 let hasAutoFittedScene = false; // Track if we've auto-fitted the current scene
 let isResettingClusters = false; // Track if a cluster reset is in progress
@@ -283,8 +285,8 @@ function initWebSocket() {
     updateSceneData(data);
   });
 
-  socket.on("clusters_update", function (data) {
-    updateClusters(data);
+  socket.on("scene_delta", function (data) {
+    applySceneDelta(data);
   });
 
   socket.on("refresh_rate_updated", function (data) {
@@ -370,6 +372,8 @@ function selectScene(sceneId) {
   hasAutoFittedScene = false; // Reset auto-fit flag for new scene
   isResettingClusters = false; // Clear reset flag when switching scenes
   lastClusterUpdateTime = null; // Clear cluster timestamp for new scene
+  sceneVersion = null; // Deltas are applied once the snapshot of the new scene arrives
+  snapshotRequested = false;
   socket.emit("select_scene", { scene_id: sceneId });
 
   // Explicitly clear ALL current data (objects and clusters) to prevent historic data display
@@ -388,6 +392,8 @@ function updateSceneData(data) {
 
     // Replace all scene data with current data (no accumulation of historic data)
     sceneData = data.data || { objects: [], clusters: [], metadata: {} };
+    sceneVersion = data.version;
+    snapshotRequested = false;
 
     console.log(
       `Scene data updated - now have ${sceneData.objects?.length || 0} objects and ${sceneData.clusters?.length || 0} clusters`,
@@ -402,48 +408,60 @@ function updateSceneData(data) {
   }
 }
 
-function updateClusters(data) {
-  if (data.scene_id === currentScene) {
-    const now = Date.now();
+function requestSnapshot() {
+  if (!snapshotRequested) {
+    snapshotRequested = true;
+    socket.emit("request_snapshot", { scene_id: currentScene });
+  }
+}
 
-    // Explicitly replace all clusters with current data (no accumulation)
-    console.log(
-      `Updating clusters for scene ${data.scene_id}: ${data.clusters?.length || 0} clusters (replacing any previous clusters)`,
-    );
-    console.log(
-      `Previous cluster update: ${lastClusterUpdateTime ? new Date(lastClusterUpdateTime).toISOString() : "never"}, Current update: ${new Date(now).toISOString()}`,
-    );
+function applySceneDelta(data) {
+  if (data.scene_id !== currentScene) {
+    return;
+  }
 
-    sceneData.clusters = data.clusters || []; // Ensure we always have an array
-    lastClusterUpdateTime = now; // Track when current clusters were received
+  // Deltas up to the snapshot version are already part of the snapshot
+  if (sceneVersion !== null && data.version <= sceneVersion) {
+    return;
+  }
 
-    // DEBUG: Log cluster data structure to see if id exists
-    console.log(
-      "DEBUG: Cluster data structure:",
-      JSON.stringify(data.clusters, null, 2),
-    );
-    if (data.clusters && data.clusters.length > 0) {
-      console.log("DEBUG: First cluster structure:", data.clusters[0]);
-      console.log("DEBUG: First cluster id:", data.clusters[0].id);
-      console.log(
-        "DEBUG: First cluster object_ids:",
-        data.clusters[0].object_ids,
-      );
-    }
-    lastClusterUpdateTime = now; // Track when this current data was received
+  // A delta from another version cannot be applied, resynchronize with a full snapshot
+  if (data.base_version !== sceneVersion) {
+    requestSnapshot();
+    return;
+  }
 
-    // Clear reset flag when new clusters arrive
-    if (isResettingClusters) {
-      isResettingClusters = false;
-      console.log("Reset complete - new clusters received");
-    }
+  if (data.objects) {
+    sceneData.objects = data.objects;
+    sceneData.metadata = data.metadata || {};
+  }
+  if (data.clusters) {
+    updateClusters(data.clusters);
+  }
+  sceneVersion = data.version;
 
-    updateUI();
-    draw();
-  } else {
-    console.log(
-      `Ignoring cluster update for scene ${data.scene_id} - current scene is ${currentScene}`,
-    );
+  updateUI();
+  draw();
+}
+
+function updateClusters(delta) {
+  // Apply added, changed and removed clusters, keeping the order of the remaining ones
+  const clusters = new Map(
+    (sceneData.clusters || []).map((cluster) => [cluster.id, cluster]),
+  );
+  delta.removed.forEach((clusterId) => clusters.delete(clusterId));
+  delta.added.forEach((cluster) => clusters.set(cluster.id, cluster));
+  delta.changed.forEach((cluster) => clusters.set(cluster.id, cluster));
+  sceneData.clusters = Array.from(clusters.values());
+
+  if (delta.added.length || delta.changed.length || delta.removed.length) {
+    lastClusterUpdateTime = Date.now(); // Track when clusters last changed
+  }
+
+  // Clear reset flag when new clusters arrive
+  if (isResettingClusters && sceneData.clusters.length > 0) {
+    isResettingClusters = false;
+    console.log("Reset complete - new clusters received");
   }
 }
 
@@ -727,6 +745,8 @@ function resetClusteringConfig(category) {
   if (sceneData.clusters) {
     console.log("Clearing existing clusters before reset");
     sceneData.clusters = [];
+    // The cleared view no longer matches the snapshot, resynchronize on the next delta
+    sceneVersion = null;
     updateUI();
     draw();
   }
@@ -8,17 +8,141 @@ WebUI module for cluster analytics visualization.
 
 This module provides a Flask-based web interface for real-time visualization
 of cluster analytics data including object detection and clustering results.
+
+Every scene has a versioned snapshot. Clients watching a scene join its SocketIO
+room; a single scheduler task sends each room only the changes since the previous
+version (added, changed and removed clusters), so every update is serialized once
+however many clients are connected. A client that misses a version asks for the
+full snapshot again.
 """
 
 import json
 import os
 import threading
 import time
-from collections import defaultdict
-from flask import Flask, render_template
-from flask_socketio import SocketIO, emit
+
+import orjson
+from flask import Flask, render_template, request
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from scene_common import log
 
+# Cluster fields that change on every publication without the cluster changing
+VOLATILE_TRACKING_FIELDS = ('time_since_last_seen',)
+
+class OrjsonPacketCodec:
+  """Drop-in for the json module used by SocketIO to encode and decode packets"""
+
+  @staticmethod
+  def dumps(obj, *args, **kwargs):
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+  @staticmethod
+  def loads(data, *args, **kwargs):
+    return orjson.loads(data)
+
+def sceneRoom(sceneId):
+  return f"scene/{sceneId}"
+
+def comparableCluster(cluster):
+  """Cluster without the fields that change on every publication, used to detect changed clusters"""
+  tracking = cluster.get('tracking')
+  if not tracking:
+    return cluster
+  return dict(cluster, tracking={key: value for key, value in tracking.items()
+                                 if key not in VOLATILE_TRACKING_FIELDS})
+
+class SceneSnapshot:
+  """
+  Latest WebUI state of one scene.
+
+  Keeps the state that was last sent to the scene room as version `version`, and the
+  newest state received from the analytics, which is sent as the next delta.
+  """
+
+  def __init__(self, name):
+    self.name = name
+    self.version = 0
+
+    # Newest state from the analytics
+    self.objects = []
+    self.metadata = {}
+    self.clusters = {}  # cluster id -> cluster dictionary
+    self.objectsChanged = False
+    self.clustersChanged = False
+
+    # State sent to the scene room as self.version
+    self.sentObjects = []
+    self.sentMetadata = {}
+    self.sentClusters = {}  # cluster id -> (cluster dictionary, comparable cluster)
+
+  def isDirty(self):
+    return self.objectsChanged or self.clustersChanged
+
+  def setObjects(self, objects, metadata):
+    self.objects = objects
+    self.metadata = metadata
+    self.objectsChanged = True
+
+  def setClusters(self, clusters):
+    self.clusters = {cluster['id']: cluster for cluster in clusters}
+    self.clustersChanged = True
+
+  def categories(self):
+    return {obj.get('category', 'unknown') for obj in self.objects}
+
+  def takeDelta(self, sceneId):
+    """
+    Advance to the next version.
+
+    @param sceneId: Scene identifier
+    @return: Delta message from the previous version, or None if nothing changed
+    """
+    added = []
+    changed = []
+    sentClusters = {}
+    for clusterId, cluster in self.clusters.items():
+      comparable = comparableCluster(cluster)
+      previous = self.sentClusters.get(clusterId)
+      if previous is None:
+        added.append(cluster)
+      elif previous[1] != comparable:
+        changed.append(cluster)
+      sentClusters[clusterId] = (cluster, comparable)
+    removed = [clusterId for clusterId in self.sentClusters if clusterId not in self.clusters]
+
+    objectsChanged = self.objectsChanged
+    self.objectsChanged = False
+    self.clustersChanged = False
+    if not (objectsChanged or added or changed or removed):
+      return None
+
+    self.sentClusters = sentClusters
+    delta = {
+      'scene_id': sceneId,
+      'base_version': self.version,
+      'version': self.version + 1,
+      'clusters': {
+        'added': added,
+        'changed': changed,
+        'removed': removed
+      }
+    }
+    if objectsChanged:
+      self.sentObjects = self.objects
+      self.sentMetadata = self.metadata
+      delta['objects'] = self.sentObjects
+      delta['metadata'] = self.sentMetadata
+    self.version += 1
+    return delta
+
+  def toDict(self):
+    """Full state as of the current version"""
+    return {
+      'objects': self.sentObjects,
+      'clusters': [cluster for cluster, _ in self.sentClusters.values()],
+      'metadata': self.sentMetadata
+    }
+
 class WebUI:
   """
   WebUI class for cluster analytics visualization.
@@ -50,27 +174,21 @@ class WebUI:
       template_folder=os.path.join(webuiDir, 'templates'),
       static_folder=os.path.join(webuiDir, 'static')
     )
-    self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode='eventlet')
-
-    # Store scene data and clusters for the WebUI
-    # scene_id -> {objects: [], clusters: [], metadata: {}}
-    self.sceneData = defaultdict(dict)
-    self.availableScenes = {}  # scene_id -> scene_name mapping
-    self.currentSelectedScene = None
+    self.socketio = SocketIO(self.app, cors_allowed_origins="*", async_mode='eventlet',
+                             json=OrjsonPacketCodec)
 
-    # Track current scene categories for clustering configuration
-    self.currentSceneCategories = set()
+    # Versioned state per scene: scene_id -> SceneSnapshot
+    self.scenes = {}
+    self.clientScenes = {}  # SocketIO session id -> selected scene_id
 
     # Throttling mechanism for updates (Real-time by default)
     self.updateInterval = 0.0  # seconds - 0.0 means real-time
-    self.lastUpdateTime = 0
-    self.pendingUpdates = {
-      'scene_data': False,
-      'clusters': False,
-      'scenes_list': False
-    }
-    self.updateLock = threading.Lock()
-    self.delayedUpdateScheduled = False
+    self.lastUpdateTime = 0.0
+    self.scenesListChanged = False
+    self.flushImmediately = False
+    # Guards the snapshots and wakes the scheduler when there is something to send
+    self.updateCondition = threading.Condition()
+    self.schedulerStarted = False
 
     # Set up Flask routes
     self.setRoutes()
@@ -81,6 +199,18 @@ class WebUI:
     # Hook into the cluster analytics context to get data updates
     self.hookIntoAnalytics()
 
+  def scenesInfo(self):
+    """List of available scenes with names."""
+    with self.updateCondition:
+      return [
+        {"id": sceneId, "name": snapshot.name}
+        for sceneId, snapshot in self.scenes.items()
+      ]
+
+  def clientScene(self):
+    """Scene selected by the client of the current SocketIO event."""
+    return self.clientScenes.get(request.sid)
+
   def setRoutes(self):
     """Set up Flask routes for the web interface."""
 
@@ -92,19 +222,68 @@ class WebUI:
     @self.app.route('/api/scenes')
     def get_scenes():
       """API endpoint to get available scenes with names."""
-      scenesInfo = [
-        {"id": sceneId, "name": sceneName}
-        for sceneId, sceneName in self.availableScenes.items()
-      ]
-      return json.dumps(scenesInfo)
+      return json.dumps(self.scenesInfo())
 
     @self.app.route('/api/scene/<scene_id>')
     def get_scene_data(scene_id):
       """API endpoint to get data for a specific scene."""
-      if scene_id in self.sceneData:
-        return json.dumps(self.sceneData[scene_id])
+      with self.updateCondition:
+        snapshot = self.scenes.get(scene_id)
+        if snapshot is not None:
+          return orjson.dumps(dict(snapshot.toDict(), version=snapshot.version)).decode()
       return json.dumps({"error": "Scene not found"}), 404
 
+  def clusteringConfig(self, sceneId):
+    """
+    Current clustering parameters of the categories in a scene.
+
+    @param sceneId: Scene identifier
+    @return: Dictionary with the scene id, categories and per-category configuration
+    """
+    with self.updateCondition:
+      snapshot = self.scenes.get(sceneId)
+      categories = snapshot.categories() if snapshot is not None else set()
+
+    # Get current DBSCAN parameters for each category in this scene
+    config = {}
+    for category in categories:
+      # Get current active parameters (user-configured or defaults) for this scene
+      params = self.clusterContext.getDbscanParamsForCategory(category, sceneId)
+      # Get default parameters to show what the recommended values are
+      defaults = self.clusterContext.getDefaultDbscanParamsForCategory(category)
+
+      # Check if this category has scene-specific customization
+      hasCustomParams = (sceneId in self.clusterContext.user_dbscan_params_by_scene and
+                                    category.lower() in self.clusterContext.user_dbscan_params_by_scene[sceneId])
+
+      config[category] = {
+        'eps': params['eps'],
+        'min_samples': params['min_samples'],
+        'default_eps': defaults['eps'],
+        'default_min_samples': defaults['min_samples'],
+        'is_default': not hasCustomParams
+      }
+
+    return {
+      'scene_id': sceneId,
+      'categories': list(categories),
+      'config': config
+    }
+
+  def emitSnapshot(self, sceneId):
+    """Send the full state of a scene to the client of the current SocketIO event."""
+    with self.updateCondition:
+      snapshot = self.scenes.get(sceneId)
+      if snapshot is None:
+        return False
+      message = {
+        'scene_id': sceneId,
+        'version': snapshot.version,
+        'data': snapshot.toDict()
+      }
+    emit('scene_data', message)
+    return True
+
   def setSocketioHandlers(self):
     """Set up SocketIO event handlers for real-time communication."""
 
@@ -112,60 +291,37 @@ class WebUI:
     def handleConnect():
       log.debug("WebUI client connected")
       # Send current available scenes with names to the newly connected client
-      scenesInfo = [
-        {"id": sceneId, "name": sceneName}
-        for sceneId, sceneName in self.availableScenes.items()
-      ]
-      emit('available_scenes', scenesInfo)
+      emit('available_scenes', self.scenesInfo())
 
     @self.socketio.on('disconnect')
     def handleDisconnect():
       log.debug("WebUI client disconnected")
+      self.clientScenes.pop(request.sid, None)
 
     @self.socketio.on('select_scene')
     def handleSceneSelection(data):
       sceneId = data.get('scene_id')
       log.debug(f"WebUI client selected scene: {sceneId}")
-      self.currentSelectedScene = sceneId
 
-      # Send current scene data if available
-      if sceneId in self.sceneData:
-        emit('scene_data', {
-          'scene_id': sceneId,
-          'data': self.sceneData[sceneId]
-        })
+      previousScene = self.clientScenes.get(request.sid)
+      if previousScene is not None and previousScene != sceneId:
+        leave_room(sceneRoom(previousScene))
+      self.clientScenes[request.sid] = sceneId
+      if not sceneId:
+        return
+      join_room(sceneRoom(sceneId))
 
+      # Send current scene data if available, later changes arrive as deltas
+      if self.emitSnapshot(sceneId):
         # Send clustering configuration for this scene
-        sceneObjects = self.sceneData[sceneId].get('objects', [])
-        categories = set()
-        for obj in sceneObjects:
-          categories.add(obj.get('category', 'unknown'))
-
-        # Get current DBSCAN parameters for each category in this scene
-        config = {}
-        for category in categories:
-          # Get current active parameters (user-configured or defaults) for this scene
-          params = self.clusterContext.getDbscanParamsForCategory(category, sceneId)
-          # Get default parameters to show what the recommended values are
-          defaults = self.clusterContext.getDefaultDbscanParamsForCategory(category)
-
-          # Check if this category has scene-specific customization
-          hasCustomParams = (sceneId in self.clusterContext.user_dbscan_params_by_scene and
-                                        category.lower() in self.clusterContext.user_dbscan_params_by_scene[sceneId])
-
-          config[category] = {
-            'eps': params['eps'],
-            'min_samples': params['min_samples'],
-            'default_eps': defaults['eps'],
-            'default_min_samples': defaults['min_samples'],
-            'is_default': not hasCustomParams
-          }
+        emit('clustering_config', self.clusteringConfig(sceneId))
 
-        emit('clustering_config', {
-          'scene_id': sceneId,
-          'categories': list(categories),
-          'config': config
-        })
+    @self.socketio.on('request_snapshot')
+    def handleSnapshotRequest(data):
+      """Resend the full scene state to a client that missed a delta."""
+      sceneId = data.get('scene_id')
+      if sceneId and sceneId == self.clientScene():
+        self.emitSnapshot(sceneId)
 
     @self.socketio.on('set_refresh_rate')
     def handleRefreshRateChange(data):
@@ -173,12 +329,14 @@ class WebUI:
       log.debug(f"WebUI client changed refresh rate to: {refreshRate}")
 
       # Handle "real-time" mode (0 seconds) and normal throttling
-      if refreshRate == 0:
-        self.updateInterval = 0.0  # Real-time updates
-        log.info("WebUI refresh rate set to real-time mode")
-      else:
-        self.updateInterval = float(refreshRate)
-        log.info(f"WebUI refresh rate set to {refreshRate} seconds")
+      with self.updateCondition:
+        if refreshRate == 0:
+          self.updateInterval = 0.0  # Real-time updates
+          log.info("WebUI refresh rate set to real-time mode")
+        else:
+          self.updateInterval = float(refreshRate)
+          log.info(f"WebUI refresh rate set to {refreshRate} seconds")
+        self.updateCondition.notify()
 
       # Emit confirmation back to client
       emit('refresh_rate_updated', {'refresh_rate': self.updateInterval})
@@ -186,38 +344,9 @@ class WebUI:
     @self.socketio.on('get_clustering_config')
     def handleGetClusteringConfig():
       """Send current clustering parameters for scene categories."""
-      if self.currentSelectedScene and self.currentSelectedScene in self.sceneData:
-        # Get categories present in current scene
-        sceneObjects = self.sceneData[self.currentSelectedScene].get('objects', [])
-        categories = set()
-        for obj in sceneObjects:
-          categories.add(obj.get('category', 'unknown'))
-
-        # Get current DBSCAN parameters for each category in current scene
-        config = {}
-        for category in categories:
-          # Get current active parameters (user-configured or defaults) for this scene
-          params = self.clusterContext.getDbscanParamsForCategory(category, self.currentSelectedScene)
-          # Get default parameters to show what the recommended values are
-          defaults = self.clusterContext.getDefaultDbscanParamsForCategory(category)
-
-          # Check if this category has scene-specific customization
-          hasCustomParams = (self.currentSelectedScene in self.clusterContext.user_dbscan_params_by_scene and
-                                        category.lower() in self.clusterContext.user_dbscan_params_by_scene[self.currentSelectedScene])
-
-          config[category] = {
-            'eps': params['eps'],
-            'min_samples': params['min_samples'],
-            'default_eps': defaults['eps'],
-            'default_min_samples': defaults['min_samples'],
-            'is_default': not hasCustomParams
-          }
-
-        emit('clustering_config', {
-          'scene_id': self.currentSelectedScene,
-          'categories': list(categories),
-          'config': config
-        })
+      sceneId = self.clientScene()
+      if sceneId and sceneId in self.scenes:
+        emit('clustering_config', self.clusteringConfig(sceneId))
       else:
         emit('clustering_config', {
           'scene_id': None,
@@ -231,48 +360,21 @@ class WebUI:
       category = data.get('category')
       eps = data.get('eps')
       minSamples = data.get('min_samples')
+      sceneId = self.clientScene()
 
       if category and eps is not None and minSamples is not None:
-        # Update the parameters using the proper method for the current scene
-        if self.currentSelectedScene:
-          self.clusterContext.setUserDbscanParamsForCategory(category, eps, minSamples, self.currentSelectedScene)
+        # Update the parameters using the proper method for the client's scene
+        if sceneId:
+          self.clusterContext.setUserDbscanParamsForCategory(category, eps, minSamples, sceneId)
 
-          log.info(f"Updated DBSCAN parameters for '{category}' in scene '{self.currentSelectedScene}': eps={eps}, min_samples={minSamples}")
+          log.info(f"Updated DBSCAN parameters for '{category}' in scene '{sceneId}': eps={eps}, min_samples={minSamples}")
         else:
           log.warning(f"Cannot update DBSCAN parameters for '{category}': no scene selected")
+          return
 
-        # If this is the current scene, trigger re-clustering
-        if (self.currentSelectedScene and
-          self.currentSelectedScene in self.sceneData):
-          sceneData = self.sceneData[self.currentSelectedScene]
-          if 'objects' in sceneData:
-            # Trigger immediate re-clustering with updated parameters
-            log.info(f"Triggering immediate re-clustering for scene {self.currentSelectedScene} with updated parameters")
-
-            # Create detection data structure for re-clustering
-            detectionData = {
-              'name': sceneData.get('scene_name', 'Unknown'),
-              'timestamp': sceneData.get('timestamp'),
-              'objects': sceneData['objects']
-            }
-
-            # Perform re-clustering with new parameters
-            self.clusterContext.analyzeObjectClusters(self.currentSelectedScene, detectionData)
-
-            # Immediately send updated cluster data to frontend
-            if 'clusters' in self.sceneData[self.currentSelectedScene]:
-              emit('clusters_update', {
-                'scene_id': self.currentSelectedScene,
-                'clusters': self.sceneData[self.currentSelectedScene]['clusters']
-              })
-              log.info(f"Sent updated cluster data to frontend for scene {self.currentSelectedScene}")
-            else:
-              # If no clusters were formed (not enough objects), send empty clusters
-              emit('clusters_update', {
-                'scene_id': self.currentSelectedScene,
-                'clusters': []
-              })
-              log.info(f"Sent empty cluster data to frontend for scene {self.currentSelectedScene} (insufficient objects)")
+        # Trigger immediate re-clustering with updated parameters
+        log.info(f"Triggering immediate re-clustering for scene {sceneId} with updated parameters")
+        self.reclusterScene(sceneId)
 
     @self.socketio.on('reset_clustering_config')
     def handleResetClusteringConfig(data):
@@ -280,8 +382,8 @@ class WebUI:
       category = data.get('category')
       sceneId = data.get('scene_id')  # Use scene_id from request if provided
 
-      # Use provided scene_id or fall back to current selected scene
-      targetScene = sceneId if sceneId else self.currentSelectedScene
+      # Use provided scene_id or fall back to the client's selected scene
+      targetScene = sceneId if sceneId else self.clientScene()
 
       if category and targetScene:
         # Reset the parameters back to defaults for the target scene
@@ -290,7 +392,7 @@ class WebUI:
         log.info(f"Reset DBSCAN parameters for '{category}' in scene '{targetScene}' back to defaults")
 
         # Send updated configuration to client
-        if targetScene in self.sceneData:
+        if targetScene in self.scenes:
 
           # Get the default parameters that are now active for this scene
           params = self.clusterContext.getDbscanParamsForCategory(category, targetScene)
@@ -306,115 +408,105 @@ class WebUI:
           })
 
           # Trigger immediate re-clustering with reset parameters
-          sceneData = self.sceneData[targetScene]
-          if 'objects' in sceneData:
-            log.info(f"Triggering immediate re-clustering for scene {targetScene} after parameter reset")
-
-            # Create detection data structure for re-clustering
-            detectionData = {
-              'name': sceneData.get('scene_name', 'Unknown'),
-              'timestamp': sceneData.get('timestamp'),
-              'objects': sceneData['objects']
-            }
-
-            # Perform re-clustering with reset parameters
-            self.clusterContext.analyzeObjectClusters(targetScene, detectionData)
-
-            # Immediately send updated cluster data to frontend
-            if 'clusters' in self.sceneData[targetScene]:
-              emit('clusters_update', {
-                'scene_id': targetScene,
-                'clusters': self.sceneData[targetScene]['clusters']
-              })
-              log.info(f"Sent updated cluster data to frontend for scene {targetScene} after reset")
-            else:
-              # If no clusters were formed (not enough objects), send empty clusters
-              emit('clusters_update', {
-                'scene_id': targetScene,
-                'clusters': []
-              })
-              log.info(f"Sent empty cluster data to frontend for scene {targetScene} after reset (insufficient objects)")
+          log.info(f"Triggering immediate re-clustering for scene {targetScene} after parameter reset")
+          self.reclusterScene(targetScene)
       else:
         log.warning(f"Cannot reset DBSCAN parameters for '{category}': no scene specified")
 
-  def scheduleThrottledUpdate(self):
-    """Schedule a throttled update to avoid flooding the WebUI with too many updates."""
-    with self.updateLock:
-      currentTime = time.time()
-
-      # Handle real-time mode (no throttling)
-      if self.updateInterval == 0.0:
-        self.sendPendingUpdates()
-        self.lastUpdateTime = currentTime
-        # Clear pending update flags
-        self.pendingUpdates = {
-          'scene_data': False,
-          'clusters': False,
-          'scenes_list': False
-        }
+  def reclusterScene(self, sceneId):
+    """
+    Cluster the latest objects of a scene again and push the result without throttling.
+
+    @param sceneId: Scene identifier
+    """
+    with self.updateCondition:
+      snapshot = self.scenes.get(sceneId)
+      if snapshot is None:
         return
+      # Create detection data structure for re-clustering
+      detectionData = {
+        'name': snapshot.name,
+        'timestamp': snapshot.metadata.get('timestamp'),
+        'objects': snapshot.objects
+      }
+
+    # Perform re-clustering with the current parameters
+    self.clusterContext.analyzeObjectClusters(sceneId, detectionData)
+    self.updateSceneClusters(sceneId, self.publishedClusters(sceneId), immediate=True)
+
+  def publishedClusters(self, sceneId):
+    """
+    Tracked clusters of a scene as published on MQTT.
 
-      # Check if enough time has passed since the last update
-      if currentTime - self.lastUpdateTime >= self.updateInterval:
-        self.sendPendingUpdates()
-        self.lastUpdateTime = currentTime
-        # Clear pending update flags
-        self.pendingUpdates = {
-          'scene_data': False,
-          'clusters': False,
-          'scenes_list': False
-        }
-      else:
-        # Schedule an update for later if not already scheduled
-        if (any(self.pendingUpdates.values()) and
-            not self.delayedUpdateScheduled):
-          self.delayedUpdateScheduled = True
-
-          def delayedUpdate():
-            time.sleep(
-              self.updateInterval -
-              (currentTime - self.lastUpdateTime)
-            )
-            with self.updateLock:
-              if any(self.pendingUpdates.values()):
-                self.sendPendingUpdates()
-                self.lastUpdateTime = time.time()
-                self.pendingUpdates = {
-                  'scene_data': False,
-                  'clusters': False,
-                  'scenes_list': False
-                }
-              self.delayedUpdateScheduled = False
-
-          # Start delayed update in a separate thread
-          threading.Thread(target=delayedUpdate, daemon=True).start()
-
-  def sendPendingUpdates(self):
-    """Send pending updates to WebUI clients."""
-    if self.pendingUpdates['scenes_list']:
-      scenesInfo = [
-        {"id": sid, "name": sname}
-        for sid, sname in self.availableScenes.items()
-      ]
-      self.socketio.emit('available_scenes', scenesInfo)
-
-    if (
-      self.currentSelectedScene and
-      (self.pendingUpdates['scene_data'] or
-            self.pendingUpdates['clusters'])
-    ):
-      if self.pendingUpdates['scene_data']:
-        self.socketio.emit('scene_data', {
-          'scene_id': self.currentSelectedScene,
-          'data': self.sceneData[self.currentSelectedScene]
-        })
+    @param sceneId: Scene identifier
+    @return: List of cluster dictionaries
+    """
+    with self.clusterContext.tracker_lock:
+      trackedClusters = self.clusterContext.cluster_tracker.getActiveClusters(
+          scene_id=sceneId,
+          publishable_only=True
+      )
+      return [c.toDict() for c in trackedClusters]
 
-      if (self.pendingUpdates['clusters'] and
-          'clusters' in self.sceneData[self.currentSelectedScene]):
-        self.socketio.emit('clusters_update', {
-          'scene_id': self.currentSelectedScene,
-          'clusters': self.sceneData[self.currentSelectedScene]['clusters']
-        })
+  def startScheduler(self):
+    """Start the single background task that pushes scene updates to the clients."""
+    with self.updateCondition:
+      if self.schedulerStarted:
+        return
+      self.schedulerStarted = True
+    self.socketio.start_background_task(self.runScheduler)
+
+  def takePendingUpdates(self):
+    """
+    Collect the messages for all scenes that changed since the last update.
+
+    @return: List of (event, payload, room) tuples, room None for all clients
+    """
+    messages = []
+    if self.scenesListChanged:
+      self.scenesListChanged = False
+      messages.append(('available_scenes', [
+        {"id": sceneId, "name": snapshot.name}
+        for sceneId, snapshot in self.scenes.items()
+      ], None))
+
+    watchedScenes = set(self.clientScenes.values())
+    for sceneId, snapshot in self.scenes.items():
+      if snapshot.isDirty():
+        # Unwatched scenes still advance, so that a client joining later gets their current state
+        delta = snapshot.takeDelta(sceneId)
+        if delta is not None and sceneId in watchedScenes:
+          messages.append(('scene_delta', delta, sceneRoom(sceneId)))
+    return messages
+
+  def hasPendingUpdates(self):
+    return self.scenesListChanged or any(snapshot.isDirty() for snapshot in self.scenes.values())
+
+  def runScheduler(self):
+    """Push pending updates to the scene rooms, at most once per refresh interval."""
+    while True:
+      with self.updateCondition:
+        while not self.hasPendingUpdates():
+          self.updateCondition.wait()
+
+        if not self.flushImmediately:
+          delay = self.lastUpdateTime + self.updateInterval - time.monotonic()
+          if delay > 0:
+            # Further updates for the same scenes are merged into one delta meanwhile
+            self.updateCondition.wait(delay)
+            continue
+
+        self.flushImmediately = False
+        self.lastUpdateTime = time.monotonic()
+        messages = self.takePendingUpdates()
+
+      # Emitting to a room encodes the payload once for all clients in the room
+      for event, payload, room in messages:
+        try:
+          self.socketio.emit(event, payload, to=room)
+        except Exception as e:
+          log.error("Failed to send WebUI update")
+          log.debug(f"WebUI update error: {e}")
 
   def hookIntoAnalytics(self):
     """Hook into the cluster analytics context to receive data updates."""
@@ -438,17 +530,8 @@ class WebUI:
       # Call original method
       result = originalPublishClusters(sceneId, detectionData, allClusters)
 
-      # Get the actual tracked clusters that were published
-      tracked_clusters = self.clusterContext.cluster_tracker.getActiveClusters(
-          scene_id=sceneId,
-          publishable_only=True
-      )
-
-      # Convert to dictionaries (same format as MQTT publication)
-      cluster_dicts = [c.toDict() for c in tracked_clusters]
-
       # Update WebUI clusters with the actual published data
-      self.updateSceneClusters(sceneId, cluster_dicts)
+      self.updateSceneClusters(sceneId, self.publishedClusters(sceneId))
 
       return result
 
@@ -463,49 +546,52 @@ class WebUI:
     # Get scene name from DATA_REGULATED topic data
     sceneName = detectionData.get('name', f"Scene {sceneId[:8]}" if len(sceneId) >= 8 else sceneId)
 
-    # Add scene to available scenes with name from DATA_REGULATED topic
-    self.availableScenes[sceneId] = sceneName
-
-    # Update scene data
-    self.sceneData[sceneId]['objects'] = objects
-    self.sceneData[sceneId]['metadata'] = {
-      'name': sceneName,
-      'timestamp': time.time(),
-      'object_count': len(objects)
-    }
+    with self.updateCondition:
+      snapshot = self.scenes.get(sceneId)
+      if snapshot is None:
+        snapshot = self.scenes[sceneId] = SceneSnapshot(sceneName)
+        self.scenesListChanged = True
+      elif snapshot.name != sceneName:
+        snapshot.name = sceneName
+        self.scenesListChanged = True
+
+      snapshot.setObjects(objects, {
+        'name': sceneName,
+        'timestamp': time.time(),
+        'object_count': len(objects)
+      })
+      self.updateCondition.notify()
 
     log.debug(
       f"WebUI: Updated scene '{sceneName}' ({sceneId}) "
       f"with {len(objects)} objects"
     )
 
-    # Mark updates as pending for throttled delivery
-    self.pendingUpdates['scenes_list'] = True
-    if sceneId == self.currentSelectedScene:
-      self.pendingUpdates['scene_data'] = True
-
-    # Schedule throttled update
-    self.scheduleThrottledUpdate()
+  def updateSceneClusters(self, sceneId, clusters, immediate=False):
+    """
+    Update scene clusters data for WebUI.
 
-  def updateSceneClusters(self, sceneId, clusters):
-    """Update scene clusters data for WebUI."""
-    self.sceneData[sceneId]['clusters'] = clusters
+    @param sceneId: Scene identifier
+    @param clusters: List of published cluster dictionaries
+    @param immediate: Push the update without waiting for the refresh interval
+    """
+    with self.updateCondition:
+      snapshot = self.scenes.get(sceneId)
+      if snapshot is None:
+        return
+      snapshot.setClusters(clusters or [])
+      self.flushImmediately = self.flushImmediately or immediate
+      self.updateCondition.notify()
 
     log.debug(f"WebUI: Updated scene {sceneId} with {len(clusters) if clusters else 0} clusters")
 
-    # Mark cluster update as pending for throttled delivery
-    if sceneId == self.currentSelectedScene:
-      self.pendingUpdates['clusters'] = True
-
-    # Schedule throttled update
-    self.scheduleThrottledUpdate()
-
   def run(self, host='0.0.0.0', port=9443, debug=False, certfile=None, keyfile=None):
     """Run the Flask-SocketIO server with HTTPS."""
     if not certfile or not keyfile:
       raise ValueError("SSL certificate and key files are required for HTTPS")
 
     log.debug(f"Starting WebUI server on https://{host}:{port}")
+    self.startScheduler()
     self.socketio.run(
       self.app,
       host=host,
@@ -535,6 +621,7 @@ class WebUI:
         keyfile=keyfile
       )
 
+    self.startScheduler()
     serverThread = threading.Thread(target=runServer, daemon=True)
     serverThread.start()
     log.info(f"WebUI server thread started on {host}:{port}")
@@ -55,7 +55,11 @@ class CacheManager:
                                       self.tracker_config_data["effective_object_update_rate"],
                                       self.tracker_config_data["time_chunking_enabled"],
                                       self.tracker_config_data["time_chunking_rate_fps"],
-                                      self.tracker_config_data["suspended_track_timeout_secs"]]
+                                      self.tracker_config_data["suspended_track_timeout_secs"],
+                                      self.tracker_config_data["time_chunking_adaptive"],
+                                      self.tracker_config_data["time_chunking_min_rate_fps"],
+                                      self.tracker_config_data["time_chunking_max_rate_fps"],
+                                      self.tracker_config_data["time_chunking_early_dispatch"]]
         scene_data["persist_attributes"] = self.tracker_config_data.get("persist_attributes", {})
 
       uid = scene_data['uid']
@@ -50,7 +50,7 @@ class ChildSceneController():
     log.info("Subscribed to", self.child_event_topic)
 
     self.client.addCallback(self.child_scene_topic,
-                            self.parent_controller.handleMovingObjectMessage)
+                            self.parent_controller.ingress.put)
     log.info("Subscribed to", self.child_scene_topic)
 
     return
@@ -185,6 +185,9 @@ class IntelLabsTracking(Tracking):
 
   def trackCategoryBatched(self, objects_per_camera, when, already_tracked_objects):
     """Create reliable tracks for objects from multiple cameras using batched tracking"""
+    if self.requested_frame_rate is not None and self.requested_frame_rate != self.ref_camera_frame_rate:
+      self.ref_camera_frame_rate = self.requested_frame_rate
+      self.tracker.update_tracker_params(self.ref_camera_frame_rate)
     when = datetime.fromtimestamp(when)
     self.update_tracks_batched(objects_per_camera, when)
     tracked_objects = self.tracker.get_reliable_tracks()
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Keep-latest ingress mailbox for camera and child scene messages.
+
+OVERVIEW:
+When the controller falls behind, MQTT messages used to queue up in the paho socket
+buffer and were only discarded by the max_lag check after being decoded, validated
+and timestamp-parsed. The mailbox moves load shedding in front of all of that work:
+the MQTT callback only stores the raw, undecoded message, overwriting any message
+for the same topic that has not been picked up yet. A single dispatcher thread hands
+the newest message per topic to the real handler.
+
+IMPLEMENTATION:
+- IngressMailbox: thread that owns the pending slots and dispatches to the handler
+- Superseded messages are counted per topic and reported through the
+  controller.observability.metrics shed counter
+- Topics are served in order of first arrival, so a busy camera cannot starve others
+"""
+
+import threading
+from collections import defaultdict
+
+from scene_common import log
+from controller.observability import metrics
+
+class IngressMailbox(threading.Thread):
+  """Holds only the newest undecoded message per topic and dispatches it to a handler"""
+
+  def __init__(self, handler, lock=None):
+    super().__init__(daemon=True)
+    self.handler = handler
+    self.lock = lock if lock is not None else threading.RLock()
+    self.shed_counts = defaultdict(int)
+    self._pending = {}  # Structure: {topic: (client, userdata, message)}
+    self._cond = threading.Condition()
+    self._stop_event = threading.Event()
+
+  def put(self, client, userdata, message):
+    """MQTT callback: store message, replacing any undispatched one for the same topic"""
+    with self._cond:
+      # Overwriting keeps the topic's original position in the dispatch order
+      superseded = message.topic in self._pending
+      self._pending[message.topic] = (client, userdata, message)
+      if superseded:
+        self.shed_counts[message.topic] += 1
+      self._cond.notify()
+
+    if superseded:
+      metrics.inc_shed({"topic": message.topic, "reason": "superseded"})
+    return
+
+  def pending(self):
+    """Number of topics with a message waiting for dispatch"""
+    with self._cond:
+      return len(self._pending)
+
+  def shedCount(self, topic=None):
+    """Number of messages dropped because a newer one arrived, for one topic or in total"""
+    with self._cond:
+      if topic is not None:
+        return self.shed_counts.get(topic, 0)
+      return sum(self.shed_counts.values())
+
+  def shutdown(self):
+    """Stop the dispatcher thread; messages still pending are discarded"""
+    self._stop_event.set()
+    with self._cond:
+      self._cond.notify()
+
+  def _take(self):
+    with self._cond:
+      while not self._pending and not self._stop_event.is_set():
+        self._cond.wait()
+      if self._stop_event.is_set():
+        return None
+      topic = next(iter(self._pending))
+      return self._pending.pop(topic)
+
+  def run(self):
+    while True:
+      item = self._take()
+      if item is None:
+        break
+
+      client, userdata, message = item
+      try:
+        with self.lock:
+          self.handler(client, userdata, message)
+      except Exception as e:
+        log.error(f"Failed to handle message on {message.topic}: {e}")
+
+    log.info("IngressMailbox thread exiting")
+    return
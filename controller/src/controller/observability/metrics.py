@@ -25,14 +25,18 @@ from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from scene_common import log
 
 # Export simplified public API functions only
-__all__ = ['init', 'inc_messages', 'inc_dropped', 'record_object_count', 'time_mqtt_handler', 'time_tracking']
+__all__ = ['init', 'inc_messages', 'inc_dropped', 'inc_shed', 'record_object_count',
+           'inc_chunk_dispatch', 'record_chunk_interval', 'time_mqtt_handler', 'time_tracking']
 
 # OpenTelemetry metric name constants
 METRIC_MQTT_MESSAGES_COUNT = "scenescape_controller_mqtt_messages"
 METRIC_MQTT_MESSAGES_DROPPED = "scenescape_controller_mqtt_messages_dropped"
+METRIC_MQTT_MESSAGES_SHED = "scenescape_controller_mqtt_messages_shed"
 METRIC_MQTT_HANDLER_DURATION = "scenescape_controller_mqtt_handler_duration"
 METRIC_TRACKING_DURATION = "scenescape_controller_tracking_duration"
 METRIC_MQTT_MESSAGES_OBJECT_COUNT = "scenescape_controller_objects_in_mqtt_message"
+METRIC_TIME_CHUNK_DISPATCHES = "scenescape_controller_time_chunk_dispatches"
+METRIC_TIME_CHUNK_INTERVAL = "scenescape_controller_time_chunk_interval"
 
 METRIC_INSTRUMENTS = [
     {
@@ -47,6 +51,12 @@ METRIC_INSTRUMENTS = [
         "unit": "1",
         "kind": "counter"
     },
+    {
+        "name": METRIC_MQTT_MESSAGES_SHED,
+        "description": "MQTT messages superseded in the ingress mailbox before decoding",
+        "unit": "1",
+        "kind": "counter"
+    },
     {
         "name": METRIC_MQTT_HANDLER_DURATION,
         "description": "MQTT handler processing time",
@@ -64,6 +74,18 @@ METRIC_INSTRUMENTS = [
         "description": "Object count per MQTT message",
         "unit": "1",
         "kind": "histogram"
+    },
+    {
+        "name": METRIC_TIME_CHUNK_DISPATCHES,
+        "description": "Time chunk batches dispatched to trackers, by reason",
+        "unit": "1",
+        "kind": "counter"
+    },
+    {
+        "name": METRIC_TIME_CHUNK_INTERVAL,
+        "description": "Time chunking interval in effect at dispatch",
+        "unit": "ms",
+        "kind": "histogram"
     }
 ]
 
@@ -111,12 +133,30 @@ def inc_dropped(attributes=None):
   if instance:
     instance.counter_add(METRIC_MQTT_MESSAGES_DROPPED, 1, attributes)
 
+def inc_shed(attributes=None):
+  """Increment shed (superseded before decoding) messages counter."""
+  instance = _metrics_instance
+  if instance:
+    instance.counter_add(METRIC_MQTT_MESSAGES_SHED, 1, attributes)
+
 def record_object_count(count, attributes=None):
   """Record object count in message."""
   instance = _metrics_instance
   if instance:
     instance.histogram_record(METRIC_MQTT_MESSAGES_OBJECT_COUNT, count, attributes)
 
+def inc_chunk_dispatch(attributes=None):
+  """Increment time chunk dispatch counter."""
+  instance = _metrics_instance
+  if instance:
+    instance.counter_add(METRIC_TIME_CHUNK_DISPATCHES, 1, attributes)
+
+def record_chunk_interval(interval_ms, attributes=None):
+  """Record time chunking interval in effect at dispatch."""
+  instance = _metrics_instance
+  if instance:
+    instance.histogram_record(METRIC_TIME_CHUNK_INTERVAL, interval_ms, attributes)
+
 @contextmanager
 def time_mqtt_handler(attributes=None):
   """Time MQTT handler processing duration."""
@@ -17,7 +17,10 @@ from scene_common.transform import CameraPose
 from scene_common.mesh_util import getMeshAxisAlignedProjectionToXY, createRegionMesh, createObjectMesh
 
 from controller.ilabs_tracking import IntelLabsTracking
-from controller.time_chunking import TimeChunkedIntelLabsTracking, DEFAULT_CHUNKING_RATE_FPS
+from controller.time_chunking import (TimeChunkedIntelLabsTracking,
+                                      DEFAULT_CHUNKING_RATE_FPS,
+                                      MINIMAL_CHUNKING_RATE_FPS,
+                                      MAXIMAL_CHUNKING_RATE_FPS)
 from controller.tracking import (MAX_UNRELIABLE_TIME,
                                  NON_MEASUREMENT_TIME_DYNAMIC,
                                  NON_MEASUREMENT_TIME_STATIC,
@@ -46,7 +49,11 @@ class Scene(SceneModel):
                effective_object_update_rate = EFFECTIVE_OBJECT_UPDATE_RATE,
                time_chunking_enabled = False,
                time_chunking_rate_fps = DEFAULT_CHUNKING_RATE_FPS,
-               suspended_track_timeout_secs = DEFAULT_SUSPENDED_TRACK_TIMEOUT_SECS):
+               suspended_track_timeout_secs = DEFAULT_SUSPENDED_TRACK_TIMEOUT_SECS,
+               time_chunking_adaptive = False,
+               time_chunking_min_rate_fps = MINIMAL_CHUNKING_RATE_FPS,
+               time_chunking_max_rate_fps = MAXIMAL_CHUNKING_RATE_FPS,
+               time_chunking_early_dispatch = False):
     log.info("NEW SCENE", name, map_file, scale, max_unreliable_time,
              non_measurement_time_dynamic, non_measurement_time_static,
              "analytics_only=" + str(ControllerMode.isAnalyticsOnly()))
@@ -60,6 +67,10 @@ class Scene(SceneModel):
     self.trackerType = None
     self.persist_attributes = {}
     self.time_chunking_rate_fps = time_chunking_rate_fps
+    self.time_chunking_adaptive = time_chunking_adaptive
+    self.time_chunking_min_rate_fps = time_chunking_min_rate_fps
+    self.time_chunking_max_rate_fps = time_chunking_max_rate_fps
+    self.time_chunking_early_dispatch = time_chunking_early_dispatch
 
     if not ControllerMode.isAnalyticsOnly():
       self._setTracker("time_chunked_intel_labs" if time_chunking_enabled else self.DEFAULT_TRACKER)
@@ -93,7 +104,9 @@ class Scene(SceneModel):
     if trackerType == "intel_labs":
       args += (self.ref_camera_frame_rate, self.suspended_track_timeout_secs)
     elif trackerType == "time_chunked_intel_labs":
-      args += (self.time_chunking_rate_fps, self.suspended_track_timeout_secs)
+      args += (self.time_chunking_rate_fps, self.suspended_track_timeout_secs,
+               self.time_chunking_adaptive, self.time_chunking_min_rate_fps,
+               self.time_chunking_max_rate_fps, self.time_chunking_early_dispatch)
     self.tracker = self.available_trackers[self.trackerType](*args)
     return
 
@@ -3,6 +3,7 @@
 
 import orjson
 import os
+import threading
 from collections import defaultdict
 
 import ntplib
@@ -13,6 +14,7 @@ from controller.controller_mode import ControllerMode
 from controller.detections_builder import (buildDetectionsDict,
                                            buildDetectionsList,
                                            computeCameraBounds)
+from controller.ingress_mailbox import IngressMailbox
 from controller.scene import Scene
 from scene_common import log
 from scene_common.geometry import Point, Region, Tripwire
@@ -55,6 +57,12 @@ class SceneController:
 
     self.schema_val = SchemaValidation(schema_file)
 
+    # Camera and child scene messages are shed in the mailbox before decoding;
+    # the lock serializes their handling with database and sensor updates
+    self.dispatch_lock = threading.RLock()
+    self.ingress = IngressMailbox(self.handleMovingObjectMessage, self.dispatch_lock)
+    self.ingress.start()
+
     self.pubsub = PubSub(mqtt_auth, client_cert, root_cert, mqtt_broker, keepalive=60)
     self.pubsub.onConnect = self.onConnect
     self.pubsub.connect()
@@ -77,6 +85,7 @@ class SceneController:
       self.tracker_config_data["effective_object_update_rate"] = self._extractTrackerRate(tracker_config, "effective_object_update_rate", EFFECTIVE_OBJECT_UPDATE_RATE)
       self._extractTimeChunkingEnabled(tracker_config)
       self.tracker_config_data["time_chunking_rate_fps"] = self._extractTrackerRate(tracker_config, "time_chunking_rate_fps", DEFAULT_CHUNKING_RATE_FPS, MINIMAL_CHUNKING_RATE_FPS, MAXIMAL_CHUNKING_RATE_FPS)
+      self._extractAdaptiveTimeChunking(tracker_config)
       self.tracker_config_data["suspended_track_timeout_secs"] = tracker_config.get("suspended_track_timeout_secs", DEFAULT_SUSPENDED_TRACK_TIMEOUT_SECS)
 
       if "persist_attributes" in tracker_config:
@@ -121,6 +130,23 @@ class SceneController:
       raise ValueError("Invalid value for time_chunking_enabled in tracker config file.")
     return
 
+  def _extractAdaptiveTimeChunking(self, tracker_config):
+    """Extract and validate adaptive time chunking and early dispatch settings"""
+    self.tracker_config_data["time_chunking_adaptive"] = bool(tracker_config.get("time_chunking_adaptive", False))
+    self.tracker_config_data["time_chunking_early_dispatch"] = bool(tracker_config.get("time_chunking_early_dispatch", False))
+    self.tracker_config_data["time_chunking_min_rate_fps"] = MINIMAL_CHUNKING_RATE_FPS
+    self.tracker_config_data["time_chunking_max_rate_fps"] = MAXIMAL_CHUNKING_RATE_FPS
+
+    if self.tracker_config_data["time_chunking_adaptive"]:
+      min_rate = self._extractTrackerRate(tracker_config, "time_chunking_min_rate_fps", MINIMAL_CHUNKING_RATE_FPS, MINIMAL_CHUNKING_RATE_FPS, MAXIMAL_CHUNKING_RATE_FPS)
+      max_rate = self._extractTrackerRate(tracker_config, "time_chunking_max_rate_fps", MAXIMAL_CHUNKING_RATE_FPS, MINIMAL_CHUNKING_RATE_FPS, MAXIMAL_CHUNKING_RATE_FPS)
+      if min_rate > max_rate:
+        raise ValueError("time_chunking_min_rate_fps must not exceed time_chunking_max_rate_fps in tracker configuration")
+      self.tracker_config_data["time_chunking_min_rate_fps"] = min_rate
+      self.tracker_config_data["time_chunking_max_rate_fps"] = max_rate
+    log.info(f"Time chunking adaptive: {self.tracker_config_data['time_chunking_adaptive']}, early dispatch: {self.tracker_config_data['time_chunking_early_dispatch']}")
+    return
+
   def loopForever(self):
     return self.pubsub.loopForever()
 
@@ -351,6 +377,11 @@ class SceneController:
          "status": "green" }
     """
 
+    with self.dispatch_lock:
+      self._handleSensorMessage(message)
+    return
+
+  def _handleSensorMessage(self, message):
     message = message.payload.decode('utf-8')
     jdata = orjson.loads(message)
 
@@ -531,14 +562,15 @@ class SceneController:
   def handleDatabaseMessage(self, client, userdata, message):
     command = str(message.payload.decode("utf-8"))
     if command == "update":
-      try:
-        self.updateSubscriptions()
-        self.updateObjectClasses()
-        self.updateCameras()
-        self.updateRegulateCache()
-        self.updateTRSMatrix()
-      except Exception as e:
-        log.warning("Failed to update database: %s", e)
+      with self.dispatch_lock:
+        try:
+          self.updateSubscriptions()
+          self.updateObjectClasses()
+          self.updateCameras()
+          self.updateRegulateCache()
+          self.updateTRSMatrix()
+        except Exception as e:
+          log.warning("Failed to update database: %s", e)
     return
 
   def calculateRate(self):
@@ -559,9 +591,10 @@ class SceneController:
     if rc != 0:
       exit(1)
     self.subscribed = set()
-    self.updateSubscriptions()
-    self.updateObjectClasses()
-    self.updateTRSMatrix()
+    with self.dispatch_lock:
+      self.updateSubscriptions()
+      self.updateObjectClasses()
+      self.updateTRSMatrix()
     topic = PubSub.formatTopic(PubSub.CMD_DATABASE)
     self.pubsub.addCallback(topic, self.handleDatabaseMessage)
     log.info("Subscribed to", topic)
@@ -654,7 +687,7 @@ class SceneController:
       if not ControllerMode.isAnalyticsOnly():
         for camera in scene.cameras:
           need_subscribe.add((PubSub.formatTopic(PubSub.DATA_CAMERA, camera_id=camera),
-                              self.handleMovingObjectMessage))
+                              self.ingress.put))
       else:
         need_subscribe.add((PubSub.formatTopic(PubSub.DATA_SCENE, scene_id=scene.uid, thing_type="+"),
                             self.handleSceneDataMessage))
@@ -673,7 +706,7 @@ class SceneController:
 
               need_subscribe.add((PubSub.formatTopic(PubSub.DATA_EXTERNAL,
                                                      scene_id=info['child'], thing_type="+"),
-                                  self.handleMovingObjectMessage))
+                                  self.ingress.put))
 
               need_subscribe.add((PubSub.formatTopic(PubSub.EVENT, region_type="+",
                                                     event_type="+",
@@ -17,11 +17,17 @@ IMPLEMENTATION:
 
 FEATURES:
 - Object Batching: batches objects from all cameras per category into a single tracker call for improved performance
+- Adaptive Rate (optional): tunes the chunk interval from measured per-category tracking latency and
+  camera arrival spread, within configured min and max rate bounds
+- Early Dispatch (optional): dispatches a category as soon as all of its active cameras have reported
 
 USAGE:
 TimeChunkedIntelLabsTracking is configurable via tracker-config.json:
 - Set "time_chunking_enabled": true to enable time-chunked tracking
 - Set "time_chunking_rate_fps": 15 to set processing rate in frames per second (optional, valid range: [MINIMAL_CHUNKING_RATE_FPS, MAXIMAL_CHUNKING_RATE_FPS], defaults to DEFAULT_CHUNKING_RATE_FPS if not present)
+- Set "time_chunking_adaptive": true to let the interval adapt between "time_chunking_min_rate_fps" and
+  "time_chunking_max_rate_fps" (optional, default to MINIMAL_CHUNKING_RATE_FPS and MAXIMAL_CHUNKING_RATE_FPS)
+- Set "time_chunking_early_dispatch": true to dispatch a category once all its active cameras have reported
 The Scene class will automatically select TimeChunkedIntelLabsTracking when enabled, otherwise uses standard IntelLabsTracking.
 """
 
@@ -38,12 +44,19 @@ DEFAULT_CHUNKING_RATE_FPS = 15
 MINIMAL_CHUNKING_RATE_FPS = 1
 MAXIMAL_CHUNKING_RATE_FPS = 100
 
+ADAPTIVE_LATENCY_HEADROOM = 1.25  # Interval is kept this much above the slowest category's tracking latency
+ADAPTIVE_SMOOTHING = 0.2          # Weight of a new sample in the moving averages driving the interval
+ACTIVE_CAMERA_TIMEOUT_S = 1.0     # Cameras silent for longer are not waited for by early dispatch
+
+DISPATCH_REASON_TIMER = "timer"
+DISPATCH_REASON_ALL_CAMERAS = "all_cameras_reported"
+
 
 class TimeChunkBuffer:
   """Buffer organized by category, then by camera for efficient grouping"""
 
   def __init__(self):
-    self._data = {}  # Structure: {category: {camera_id: (objects, when, already_tracked)}}
+    self._data = {}  # Structure: {category: {camera_id: (objects, when, already_tracked, arrival)}}
     self._lock = threading.Lock()
 
   def add(self, camera_id: str, category: str, objects: Any, when: float, already_tracked: List[Any]):
@@ -53,43 +66,135 @@ class TimeChunkBuffer:
       if category not in self._data:
         self._data[category] = {}
 
-      # Store latest frame for this camera in this category
-      self._data[category][camera_id] = (objects, when, already_tracked)
+      # Store latest frame for this camera in this category, with its local arrival time
+      self._data[category][camera_id] = (objects, when, already_tracked, time.monotonic())
+
+  def cameras(self, category: str):
+    """Get the set of cameras with a buffered frame for the category"""
+    with self._lock:
+      return set(self._data.get(category, {}))
 
   def pop_all(self):
     """Get all data organized by category->camera and clear buffer"""
+    return self.pop()
+
+  def pop(self, categories=None):
+    """Get data for the given categories (all if None) and remove it from the buffer"""
     with self._lock:
-      result = self._data.copy()  # {category: {camera_id: (objects, when, already_tracked)}}
-      self._data.clear()
-      return result
+      if categories is None:
+        result = self._data.copy()  # {category: {camera_id: (objects, when, already_tracked, arrival)}}
+        self._data.clear()
+        return result
+      return {category: self._data.pop(category) for category in categories if category in self._data}
 
 
 class TimeChunkProcessor(threading.Thread):
   """Timer thread that processes buffered messages at configurable intervals"""
 
-  def __init__(self, tracker_manager, rate_fps=DEFAULT_CHUNKING_RATE_FPS):
+  def __init__(self, tracker_manager, rate_fps=DEFAULT_CHUNKING_RATE_FPS, adaptive=False,
+               min_rate_fps=MINIMAL_CHUNKING_RATE_FPS, max_rate_fps=MAXIMAL_CHUNKING_RATE_FPS,
+               early_dispatch=False):
     super().__init__(daemon=True)
     self.buffer = TimeChunkBuffer()
     self.tracker_manager = tracker_manager
     self.interval = float(1.0 / rate_fps)  # Convert FPS to interval in seconds
+    self.adaptive = adaptive
+    self.min_interval = float(1.0 / max_rate_fps)
+    self.max_interval = float(1.0 / min_rate_fps)
+    self.early_dispatch = early_dispatch
+    self.arrival_spread = 0.0  # Moving average of camera arrival spread within a chunk
+    self._camera_last_seen = {}  # Structure: {category: {camera_id: monotonic time}}
+    self._last_dispatch = {}  # Structure: {category: monotonic time}
+    self._complete = set()  # Categories for which all active cameras have reported
+    self._lock = threading.Lock()
+    self._wakeup = threading.Event()
     self._stop_event = threading.Event()  # Use Event instead of boolean flag
 
   def add_message(self, camera_id: str, category: str, objects: Any, when: float, already_tracked: List[Any]):
     """Buffer latest frame only - overwrites previous frames per camera+category for performance"""
     self.buffer.add(camera_id, category, objects, when, already_tracked)
+    if self.early_dispatch and self._allCamerasReported(camera_id, category):
+      self._wakeup.set()
+
+  def _allCamerasReported(self, camera_id, category):
+    """Record camera activity and check whether every active camera of the category is buffered"""
+    now = time.monotonic()
+    with self._lock:
+      last_seen = self._camera_last_seen.setdefault(category, {})
+      last_seen[camera_id] = now
+      for cam in [cam for cam, seen in last_seen.items() if now - seen > ACTIVE_CAMERA_TIMEOUT_S]:
+        del last_seen[cam]
+      if not set(last_seen).issubset(self.buffer.cameras(category)):
+        return False
+      self._complete.add(category)
+      return True
+
+  def _readyCategories(self):
+    """Take complete categories whose last dispatch is at least the minimal interval ago"""
+    now = time.monotonic()
+    with self._lock:
+      ready = [category for category in self._complete
+               if now - self._last_dispatch.get(category, 0.0) >= self.min_interval]
+      self._complete.difference_update(ready)
+    return ready
 
   def shutdown(self):
     """Gracefully shutdown the processor thread"""
     self._stop_event.set()
+    self._wakeup.set()
+
+  def _updateInterval(self, category_data):
+    """Move the chunk interval towards the measured tracking latency and camera arrival spread"""
+    for camera_dict in category_data.values():
+      arrivals = [item[3] for item in camera_dict.values()]
+      spread = max(arrivals) - min(arrivals)
+      self.arrival_spread += ADAPTIVE_SMOOTHING * (spread - self.arrival_spread)
+
+    latency = 0.0
+    for category in category_data:
+      tracker = self.tracker_manager.trackers.get(category)
+      if tracker is not None:
+        latency = max(latency, tracker.tracking_latency)
+
+    target = max(latency * ADAPTIVE_LATENCY_HEADROOM, self.arrival_spread)
+    target = min(max(target, self.min_interval), self.max_interval)
+    self.interval += ADAPTIVE_SMOOTHING * (target - self.interval)
+
+    # Keep the frame-based tracker parameters in line with the effective processing rate
+    rate_fps = int(round(1.0 / self.interval))
+    for tracker in self.tracker_manager.trackers.values():
+      tracker.requested_frame_rate = rate_fps
+    return
 
   def run(self):
     """Process buffer at configured interval - organized by category with camera data"""
+    deadline = time.monotonic() + self.interval
     while not self._stop_event.is_set():
-      if self._stop_event.wait(timeout=self.interval):
+      woken = self._wakeup.wait(timeout=max(0.0, deadline - time.monotonic()))
+      if self._stop_event.is_set():
         break  # Stop event was set, exit loop
 
-      # {category: {camera_id: (objects, when, already_tracked)}}
-      category_data = self.buffer.pop_all()
+      categories = None
+      reason = DISPATCH_REASON_TIMER
+      if woken:
+        self._wakeup.clear()
+        categories = self._readyCategories()
+        reason = DISPATCH_REASON_ALL_CAMERAS
+        if not categories:
+          continue
+      else:
+        deadline = time.monotonic() + self.interval
+
+      # {category: {camera_id: (objects, when, already_tracked, arrival)}}
+      category_data = self.buffer.pop(categories)
+      now = time.monotonic()
+      with self._lock:
+        for category in category_data:
+          self._last_dispatch[category] = now
+        self._complete.difference_update(category_data)
+
+      if self.adaptive and category_data:
+        self._updateInterval(category_data)
 
       # Iterate per category and process each camera separately
       for category, camera_dict in category_data.items():
@@ -107,6 +212,13 @@ class TimeChunkProcessor(threading.Thread):
             metrics.inc_dropped(metrics_attributes)
             continue
 
+          metrics_attributes = {
+              "category": category,
+              "reason": reason
+          }
+          metrics.inc_chunk_dispatch(metrics_attributes)
+          metrics.record_chunk_interval(self.interval * 1000, metrics_attributes)
+
           # Create aggregated lists: list of lists where each inner list contains objects from one camera
           objects_per_camera = []
           latest_when = 0
@@ -115,7 +227,7 @@ class TimeChunkProcessor(threading.Thread):
           # Sort camera data by timestamp (when) to ensure earliest detections come first
           sorted_camera_items = sorted(camera_dict.items(), key=lambda x: x[1][1])  # Sort by 'when' (index 1 in tuple)
 
-          for camera_id, (objects, when, already_tracked) in sorted_camera_items:
+          for camera_id, (objects, when, already_tracked, _) in sorted_camera_items:
             objects_per_camera.append(objects)  # Keep objects from each camera in separate list
             latest_when = max(latest_when, when)
             all_already_tracked.extend(already_tracked)
@@ -130,12 +242,19 @@ class TimeChunkProcessor(threading.Thread):
 class TimeChunkedIntelLabsTracking(IntelLabsTracking):
   """Time-chunked version of IntelLabsTracking."""
 
-  def __init__(self, max_unreliable_time, non_measurement_time_dynamic, non_measurement_time_static, time_chunking_rate_fps, suspended_track_timeout_secs=DEFAULT_SUSPENDED_TRACK_TIMEOUT_SECS):
+  def __init__(self, max_unreliable_time, non_measurement_time_dynamic, non_measurement_time_static, time_chunking_rate_fps, suspended_track_timeout_secs=DEFAULT_SUSPENDED_TRACK_TIMEOUT_SECS,
+               time_chunking_adaptive=False, time_chunking_min_rate_fps=MINIMAL_CHUNKING_RATE_FPS,
+               time_chunking_max_rate_fps=MAXIMAL_CHUNKING_RATE_FPS, time_chunking_early_dispatch=False):
     # Call parent constructor to initialize IntelLabsTracking
     super().__init__(max_unreliable_time, non_measurement_time_dynamic, non_measurement_time_static, time_chunking_rate_fps, suspended_track_timeout_secs)
     self.time_chunking_rate_fps = time_chunking_rate_fps
     self.suspended_track_timeout_secs = suspended_track_timeout_secs
-    log.info(f"Initialized TimeChunkedIntelLabsTracking {self.__str__()} with chunking rate: {self.time_chunking_rate_fps} fps")
+    self.time_chunking_adaptive = time_chunking_adaptive
+    self.time_chunking_min_rate_fps = time_chunking_min_rate_fps
+    self.time_chunking_max_rate_fps = time_chunking_max_rate_fps
+    self.time_chunking_early_dispatch = time_chunking_early_dispatch
+    log.info(f"Initialized TimeChunkedIntelLabsTracking {self.__str__()} with chunking rate: {self.time_chunking_rate_fps} fps"
+             f" (adaptive: {self.time_chunking_adaptive}, early dispatch: {self.time_chunking_early_dispatch})")
 
   def trackObjects(self, objects, already_tracked_objects, when, categories,
                    ref_camera_frame_rate, max_unreliable_time,
@@ -173,7 +292,11 @@ class TimeChunkedIntelLabsTracking(IntelLabsTracking):
 
     # create time chunk processor for frames buffering
     if not hasattr(self, 'time_chunk_processor'):
-      self.time_chunk_processor = TimeChunkProcessor(self, self.time_chunking_rate_fps)
+      self.time_chunk_processor = TimeChunkProcessor(self, self.time_chunking_rate_fps,
+                                                     self.time_chunking_adaptive,
+                                                     self.time_chunking_min_rate_fps,
+                                                     self.time_chunking_max_rate_fps,
+                                                     self.time_chunking_early_dispatch)
       self.time_chunk_processor.start()
 
     # delegate tracking to IntelLabsTracking
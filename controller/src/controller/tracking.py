@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: (C) 2022 - 2026 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import time
 from queue import Queue
 from threading import Thread
 
@@ -23,6 +24,7 @@ NON_MEASUREMENT_TIME_DYNAMIC = 0.2666
 NON_MEASUREMENT_TIME_STATIC = 0.5333
 EFFECTIVE_OBJECT_UPDATE_RATE = 15
 DEFAULT_SUSPENDED_TRACK_TIMEOUT_SECS = 60.0
+TRACKING_LATENCY_SMOOTHING = 0.2  # Weight of the newest sample in the tracking latency moving average
 
 # Queue mode constants for tracking operation
 STREAMING_MODE = False  # (DEFAULT) Objects from one source (camera) at a time are put into the queue
@@ -36,6 +38,10 @@ class Tracking(Thread):
     self.already_tracked_objects = []
     self.queue = Queue()
     self.uuid_manager = UUIDManager()
+    # Moving average of queue item processing time in seconds, used by adaptive time chunking
+    self.tracking_latency = 0.0
+    # Frame rate to apply to frame-based tracker parameters on the tracker thread, if set
+    self.requested_frame_rate = None
     return
 
   def getUniqueIDCount(self, category):
@@ -170,6 +176,7 @@ class Tracking(Thread):
       metrics_attributes = {
         "category": category,
       }
+      start_time = time.monotonic()
       with metrics.time_tracking(metrics_attributes):
         if mode == BATCHED_MODE:
           self.trackCategoryBatched(objects, when, already_tracked_objects)
@@ -178,6 +185,8 @@ class Tracking(Thread):
         # curObjects are the results while all_tracker_objects
         # is used as a working collection inside the thread
         self.curObjects = (self.all_tracker_objects).copy()
+        duration = time.monotonic() - start_time
+        self.tracking_latency += TRACKING_LATENCY_SMOOTHING * (duration - self.tracking_latency)
         self.queue.task_done()
 
     log.debug(f"Tracker thread {self.__str__()} exiting. Queue size: {self.queue.qsize()}")
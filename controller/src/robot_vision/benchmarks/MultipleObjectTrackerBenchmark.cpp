@@ -175,6 +175,96 @@ static void BM_Tracking50MovingPeople(::benchmark::State& state) {
 }
 BENCHMARK(BM_Tracking50MovingPeople)->Unit(::benchmark::kMillisecond);
 
+/**
+ * @brief Benchmark for tracking 50 moving people per category with one tracker per thread
+ *
+ * Mirrors the controller, which runs one MultipleObjectTracker per object category in
+ * its own thread. Each benchmark thread owns its fixture and tracker, so the reported
+ * items per second should scale close to linearly with the thread count.
+ */
+static void BM_Tracking50MovingPeoplePerCategoryThread(::benchmark::State& state) {
+    PeopleTrackingBenchmarkFixture fixture;
+    auto tracker = fixture.createPeopleTracker();
+
+    const size_t numPeople = 50;
+    const double frameTime = 0.033;
+    int frameCount = 0;
+    auto timestamp = fixture.getTimestamp();
+
+    for (auto _ : state) {
+        auto currentPeople = fixture.generateMovingPeopleScenario(numPeople, frameCount * frameTime);
+        tracker->track(std::move(currentPeople), timestamp, 0.7);
+
+        frameCount++;
+        timestamp = fixture.getTimestamp(frameCount);
+        if (frameCount >= 100) {
+            frameCount = 0;
+            tracker = fixture.createPeopleTracker();
+        }
+    }
+
+    state.SetItemsProcessed(state.iterations() * numPeople);
+    state.SetLabel("One tracker per category thread");
+}
+BENCHMARK(BM_Tracking50MovingPeoplePerCategoryThread)
+    ->ThreadRange(1, 8)
+    ->UseRealTime()
+    ->Unit(::benchmark::kMillisecond);
+
+/**
+ * @brief Benchmark for the track-to-measurement association alone
+ *
+ * Arguments are the number of objects and the DistanceType. People are spread over an
+ * area that grows with their number so that the density matches the 50-people scene,
+ * and every measurement is its track moved by one frame of walking plus noise.
+ */
+static void BM_MatchMovingPeople(::benchmark::State& state) {
+    PeopleTrackingBenchmarkFixture fixture;
+    const size_t numPeople = static_cast<size_t>(state.range(0));
+    const auto distanceType = static_cast<DistanceType>(state.range(1));
+    const double frameTime = 0.033;
+    const double areaScale = std::sqrt(numPeople / 50.0);
+
+    std::mt19937 gen(7);
+    std::normal_distribution<double> noise(0.0, 0.05);
+
+    auto tracks = fixture.generateMovingPeopleScenario(numPeople);
+    std::vector<TrackedObject> measurements;
+    measurements.reserve(numPeople);
+    for (auto &track : tracks) {
+        track.x *= areaScale;
+        track.y *= areaScale;
+        track.predictedMeasurementMean.at<double>(0, 0) = track.x;
+        track.predictedMeasurementMean.at<double>(1, 0) = track.y;
+
+        TrackedObject measurement = track;
+        measurement.predictedMeasurementMean = track.predictedMeasurementMean.clone();
+        measurement.x += track.vx * frameTime + noise(gen);
+        measurement.y += track.vy * frameTime + noise(gen);
+        measurements.push_back(std::move(measurement));
+    }
+
+    std::vector<std::pair<size_t, size_t>> assignments;
+    std::vector<size_t> unassignedTracks;
+    std::vector<size_t> unassignedMeasurements;
+
+    for (auto _ : state) {
+        match(tracks, measurements, assignments, unassignedTracks, unassignedMeasurements, distanceType, 0.7);
+        ::benchmark::DoNotOptimize(assignments.data());
+    }
+
+    state.SetItemsProcessed(state.iterations() * numPeople);
+    state.counters["assigned"] = static_cast<double>(assignments.size());
+}
+BENCHMARK(BM_MatchMovingPeople)
+    ->ArgNames({"people", "distance_type"})
+    ->ArgsProduct({{50, 500, 2000},
+                   {static_cast<int64_t>(DistanceType::MultiClassEuclidean),
+                    static_cast<int64_t>(DistanceType::Euclidean),
+                    static_cast<int64_t>(DistanceType::Mahalanobis),
+                    static_cast<int64_t>(DistanceType::MCEMahalanobis)}})
+    ->Unit(::benchmark::kMicrosecond);
+
 } // namespace benchmark
 } // namespace tracking
 } // namespace rv
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Multi-threaded Python benchmark for robot_vision.tracking.MultipleObjectTracker.
+
+Runs one tracker per simulated object category in its own Python thread, the way
+controller.tracking does, and reports throughput and scaling against one thread.
+Near-linear scaling shows that the bindings release the GIL during tracking.
+"""
+
+import argparse
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from robot_vision import tracking
+
+FRAME_TIME = 0.033
+RESET_FRAMES = 100
+
+def create_people(rng, count, elapsed):
+  people = []
+  for _ in range(count):
+    speed = rng.uniform(0.5, 2.0)
+    direction = rng.uniform(0, 2 * math.pi)
+    person = tracking.TrackedObject()
+    person.x = rng.uniform(-25.0, 25.0) + speed * math.cos(direction) * elapsed
+    person.y = rng.uniform(-25.0, 25.0) + speed * math.sin(direction) * elapsed
+    person.z = 0.0
+    person.length = 0.4
+    person.width = 0.5
+    person.height = 1.7
+    person.yaw = direction
+    person.classification = np.array([0.9, 0.1])
+    people.append(person)
+  return people
+
+def create_tracker():
+  config = tracking.TrackManagerConfig()
+  config.motion_models = [tracking.MotionModel.CV, tracking.MotionModel.CA, tracking.MotionModel.CTRV]
+  return tracking.MultipleObjectTracker(config)
+
+def track_category(seed, people, frames, barrier, results, index):
+  rng = random.Random(seed)
+  # Pre-generate the inputs so that only the track() call is measured
+  inputs = [create_people(rng, people, (frame % RESET_FRAMES) * FRAME_TIME) for frame in range(frames)]
+  tracker = create_tracker()
+  timestamp = datetime.now()
+
+  barrier.wait()
+  start = time.perf_counter()
+  for frame, objects in enumerate(inputs):
+    if frame and frame % RESET_FRAMES == 0:
+      tracker = create_tracker()
+    tracker.track(objects, timestamp, distance_type=tracking.DistanceType.Euclidean,
+                  distance_threshold=1.0)
+    timestamp += timedelta(seconds=FRAME_TIME)
+  results[index] = time.perf_counter() - start
+  return
+
+def run(threads, people, frames):
+  barrier = threading.Barrier(threads)
+  results = [0.0] * threads
+  workers = [threading.Thread(target=track_category, args=(42 + i, people, frames, barrier, results, i))
+             for i in range(threads)]
+  for worker in workers:
+    worker.start()
+  for worker in workers:
+    worker.join()
+  return threads * frames / max(results)
+
+def build_argparser():
+  parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("--max_threads", type=int, default=8, help="Largest number of category threads")
+  parser.add_argument("--people", type=int, default=50, help="Objects per frame and category")
+  parser.add_argument("--frames", type=int, default=300, help="Frames tracked per category")
+  return parser
+
+def main():
+  args = build_argparser().parse_args()
+  baseline = None
+  print(f"{'threads':>8} {'frames/s':>12} {'speedup':>8} {'efficiency':>10}")
+  threads = 1
+  while threads <= args.max_threads:
+    rate = run(threads, args.people, args.frames)
+    baseline = baseline or rate
+    speedup = rate / baseline
+    print(f"{threads:>8} {rate:>12.1f} {speedup:>8.2f} {speedup / threads:>10.0%}")
+    threads *= 2
+  return
+
+if __name__ == '__main__':
+  exit(main() or 0)
@@ -282,7 +282,9 @@ py::class_<rv::tracking::Classification>(tracking, "Classification", "Classifica
      .def_property_readonly("config", &rv::tracking::TrackManager::getConfig, "Current track manager configuration");
 
   py::class_<rv::tracking::MultipleObjectTracker>(tracking, "MultipleObjectTracker",
-     "Multiple Object Tracking algorithm using the TrackManager in the background. It performs an association step using the Gated Hungarian matcher.")
+     "Multiple Object Tracking algorithm using the TrackManager in the background. It performs an association step using the Gated Hungarian matcher. "
+     "The GIL is released while tracking, so distinct instances may run concurrently from different Python threads. "
+     "A single instance must not be used from more than one thread at a time.")
     .def(py::init<>(), "Default constructor, use default config parameters.")
     .def(py::init<const rv::tracking::TrackManagerConfig &>(),
       "Use the given config parameters for the track manager.",
@@ -294,12 +296,14 @@ py::class_<rv::tracking::Classification>(tracking, "Classification", "Classifica
       py::arg("distance_threshold"))
     .def("track",
          py::overload_cast<std::vector<rv::tracking::TrackedObject>, const std::chrono::system_clock::time_point &, double>(&rv::tracking::MultipleObjectTracker::track),
+         py::call_guard<py::gil_scoped_release>(),
          "Trigger the track step for the next timestamp. Use the default distance type and threshold.",
          py::arg("objects"),
          py::arg("timestamp"),
          py::arg("probability_threshold") = 0.5)
     .def("track",
          py::overload_cast<std::vector<rv::tracking::TrackedObject>, const std::chrono::system_clock::time_point &, const rv::tracking::DistanceType &, double, double>(&rv::tracking::MultipleObjectTracker::track),
+         py::call_guard<py::gil_scoped_release>(),
          "Trigger the track step for the next timestamp. Run match() with the given distance type and threshold.",
          py::arg("objects"),
          py::arg("timestamp"),
@@ -308,12 +312,14 @@ py::class_<rv::tracking::Classification>(tracking, "Classification", "Classifica
          py::arg("probability_threshold") = 0.5)
     .def("track",
          py::overload_cast<std::vector<std::vector<rv::tracking::TrackedObject>>, const std::chrono::system_clock::time_point &, double>(&rv::tracking::MultipleObjectTracker::track),
+         py::call_guard<py::gil_scoped_release>(),
          "Trigger the track step for the next timestamp with objects per camera. Use the default distance type and threshold.",
          py::arg("objects_per_camera"),
          py::arg("timestamp"),
          py::arg("probability_threshold") = 0.5)
     .def("track",
          py::overload_cast<std::vector<std::vector<rv::tracking::TrackedObject>>, const std::chrono::system_clock::time_point &, const rv::tracking::DistanceType &, double, double>(&rv::tracking::MultipleObjectTracker::track),
+         py::call_guard<py::gil_scoped_release>(),
          "Trigger the track step for the next timestamp with objects per camera. Run match() with the given distance type and threshold.",
          py::arg("objects_per_camera"),
          py::arg("timestamp"),
@@ -321,12 +327,16 @@ py::class_<rv::tracking::Classification>(tracking, "Classification", "Classifica
          py::arg("distance_threshold"),
          py::arg("probability_threshold") = 0.5)
     .def("timestamp", &rv::tracking::MultipleObjectTracker::getTimestamp, "Read current timestamp.")
-    .def("get_tracks", &rv::tracking::MultipleObjectTracker::getTracks, "Returns a list of all active tracks")
+    .def("get_tracks", &rv::tracking::MultipleObjectTracker::getTracks,
+         py::call_guard<py::gil_scoped_release>(),
+         "Returns a list of all active tracks")
     .def("get_reliable_tracks",
          &rv::tracking::MultipleObjectTracker::getReliableTracks,
+         py::call_guard<py::gil_scoped_release>(),
          "Returns a list of all active reliable tracks.")
     .def("update_tracker_params",
          &rv::tracking::MultipleObjectTracker::updateTrackerParams,
+         py::call_guard<py::gil_scoped_release>(),
          "Updates tracker frame based parameters.");
 
   py::class_<rv::tracking::TrackTracker>(tracking,
@@ -337,6 +347,7 @@ py::class_<rv::tracking::Classification>(tracking, "Classification", "Classifica
       py::arg("track_manager_config"))
     .def("track",
          &rv::tracking::TrackTracker::track,
+         py::call_guard<py::gil_scoped_release>(),
          "Trigger the track step for the next timestamp. Note: The objects must have an id already assigned.",
          py::arg("tracked_objects"),
          py::arg("timestamp"))
@@ -350,7 +361,11 @@ py::class_<rv::tracking::Classification>(tracking, "Classification", "Classifica
           std::vector<std::pair<size_t, size_t>> assignments;
           std::vector<size_t> unassignedTracks;
           std::vector<size_t> unassignedObjects;
-          rv::tracking::match(measurements, tracks, assignments,  unassignedTracks, unassignedObjects, distanceType, threshold);
+          {
+               // Arguments are already C++ copies, matching does not touch Python objects
+               py::gil_scoped_release release;
+               rv::tracking::match(measurements, tracks, assignments,  unassignedTracks, unassignedObjects, distanceType, threshold);
+          }
 
           return std::tuple<std::vector<std::pair<size_t, size_t>>,std::vector<size_t>,  std::vector<size_t>> (assignments, unassignedTracks, unassignedObjects);
           },
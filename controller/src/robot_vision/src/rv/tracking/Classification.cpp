@@ -31,9 +31,8 @@ namespace classification {
       throw std::runtime_error("The vectors should be of the same size");
     }
 
-    Classification residual = (classificationA - classificationB);
-
-    return std::sqrt(0.5 * residual.transpose() * residual);
+    // squaredNorm() of the difference expression avoids allocating a residual vector
+    return std::sqrt(0.5 * (classificationA - classificationB).squaredNorm());
   }
 
 
@@ -1,7 +1,10 @@
 // SPDX-FileCopyrightText: 2019 - 2025 Intel Corporation
 // SPDX-License-Identifier: Apache-2.0
 
-#include <functional>
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
 #include <numeric>
 #include <opencv2/core.hpp>
 #include <omp.h>
@@ -18,38 +21,258 @@ namespace tracking {
 
 constexpr double kDefaultClassBoundValue = 1000.;
 
-double calculateMulticlassScaledDistance(const TrackedObject &measurement, const TrackedObject &track)
+namespace {
+
+constexpr int kMeasurementSize = 7;
+constexpr int kYawIndex = 6;
+
+// Below this many track-measurement pairs the dense cost matrix is cheaper than building the grid
+constexpr size_t kMinPairsForGating = 256;
+
+inline double planarDistance(const TrackedObject &measurement, const TrackedObject &track)
+{
+  const double dx = measurement.x - track.x;
+  const double dy = measurement.y - track.y;
+  return std::sqrt(dx * dx + dy * dy);
+}
+
+/**
+ * @brief Mahalanobis distance on the measurement vector without temporary cv::Mat objects
+ *
+ * Equivalent to 0.5 * sqrt(innovation^T * S^-1 * innovation) with the yaw innovation ignored.
+ */
+inline double mahalanobisDistance(const TrackedObject &measurement, const TrackedObject &track)
 {
-  auto conflict = rv::tracking::classification::distance(measurement.classification, track.classification);
+  CV_DbgAssert(track.predictedMeasurementMean.isContinuous() && track.predictedMeasurementCovInv.isContinuous());
+  const double *mean = track.predictedMeasurementMean.ptr<double>();
+  const double *covInv = track.predictedMeasurementCovInv.ptr<double>();
 
-  double distance = sqrt(pow(measurement.x - track.x, 2) + pow(measurement.y - track.y, 2));
+  double innovation[kMeasurementSize] = {
+    measurement.x - mean[0], measurement.y - mean[1], measurement.z - mean[2],
+    measurement.length - mean[3], measurement.width - mean[4], measurement.height - mean[5],
+    measurement.yaw - mean[6]};
+
+  // ignore yaw, 2D detectors cannot detect orientation
+  innovation[kYawIndex] = 0.;
+
+  double squaredDistance = 0.;
+  for (int row = 0; row < kMeasurementSize; ++row)
+  {
+    const double *covInvRow = covInv + row * kMeasurementSize;
+    double rowProduct = 0.;
+    for (int col = 0; col < kMeasurementSize; ++col)
+    {
+      rowProduct += covInvRow[col] * innovation[col];
+    }
+    squaredDistance += innovation[row] * rowProduct;
+  }
 
-  return distance * (1.0 + conflict);
+  return 0.5 * std::sqrt(squaredDistance);
 }
 
-double calculateEuclideanDistance(const TrackedObject &measurement, const TrackedObject &track)
+struct EuclideanDistance
+{
+  double operator()(const TrackedObject &measurement, const TrackedObject &track) const
+  {
+    return planarDistance(measurement, track);
+  }
+};
+
+struct MulticlassScaledDistance
+{
+  double operator()(const TrackedObject &measurement, const TrackedObject &track) const
+  {
+    auto conflict = rv::tracking::classification::distance(measurement.classification, track.classification);
+    return planarDistance(measurement, track) * (1.0 + conflict);
+  }
+};
+
+struct MahalanobisDistance
+{
+  double operator()(const TrackedObject &measurement, const TrackedObject &track) const
+  {
+    return mahalanobisDistance(measurement, track);
+  }
+};
+
+struct CompoundDistance
 {
-  return sqrt(pow(measurement.x - track.x, 2) + pow(measurement.y - track.y, 2));
+  double operator()(const TrackedObject &measurement, const TrackedObject &track) const
+  {
+    return 0.5 * MulticlassScaledDistance()(measurement, track) + 0.5 * mahalanobisDistance(measurement, track);
+  }
+};
+
+/**
+ * @brief Planar disc around which all measurements with a cost below threshold lie
+ *
+ * Euclidean costs are at least the planar distance d to the track. The MCE-Mahalanobis
+ * cost is at least half of that. For the Mahalanobis cost, with a non-singular measurement
+ * covariance S, innovation^T * S^-1 * innovation >= d^2 / lambda_max(S) >= d^2 / trace(S),
+ * where d is the planar distance to the predicted measurement, so the cost is at least
+ * 0.5 * d / sqrt(trace(S)). Pairs outside the disc are rejected by the matcher anyway and
+ * can be set to the bound value without evaluating them.
+ */
+struct Gate
+{
+  double x;
+  double y;
+  double radius;
+};
+
+Gate gate(const TrackedObject &track, const DistanceType &distanceType, double threshold)
+{
+  switch (distanceType)
+  {
+    case DistanceType::Mahalanobis:
+    {
+      const cv::Mat &cov = track.predictedMeasurementCov;
+      const double trace = cov.empty() ? 0. : cv::trace(cov)[0];
+      if (!(trace > 0.) || !std::isfinite(trace) || !(cv::determinant(cov) > 0.))
+      {
+        return {track.x, track.y, std::numeric_limits<double>::infinity()};
+      }
+      const double *mean = track.predictedMeasurementMean.ptr<double>();
+      return {mean[0], mean[1], 2. * threshold * std::sqrt(trace)};
+    }
+    case DistanceType::MCEMahalanobis:
+      return {track.x, track.y, 2. * threshold};
+    case DistanceType::MultiClassEuclidean:
+    case DistanceType::Euclidean:
+    default:
+      return {track.x, track.y, threshold};
+  }
 }
 
-double calculateMahalanobisDistance(const TrackedObject &measurement, const TrackedObject &track)
+/**
+ * @brief Uniform grid over measurement positions for radius queries
+ *
+ * Cells are stored as a sorted vector of (cell key, measurement index) pairs,
+ * so building the grid needs a single allocation.
+ */
+class MeasurementGrid
 {
-  cv::Mat innovation = measurement.measurementVector() - (track.predictedMeasurementMean);
+public:
+  MeasurementGrid(const std::vector<TrackedObject> &measurements, double cellSize)
+    : mCellSize(cellSize)
+  {
+    mCells.reserve(measurements.size());
+    for (size_t j = 0; j < measurements.size(); ++j)
+    {
+      mCells.emplace_back(key(cell(measurements[j].x), cell(measurements[j].y)), j);
+    }
+    std::sort(mCells.begin(), mCells.end());
+  }
 
-  // ignore yaw, 2D detectors cannot detect orientation
-  innovation.at<double>(6, 0) = 0.;
+  template <typename Visitor>
+  void forEachCandidate(double x, double y, double radius, Visitor &&visit) const
+  {
+    const int64_t span = static_cast<int64_t>(std::ceil(radius / mCellSize));
+    const int64_t cx = cell(x);
+    const int64_t cy = cell(y);
+    for (int64_t ix = cx - span; ix <= cx + span; ++ix)
+    {
+      for (int64_t iy = cy - span; iy <= cy + span; ++iy)
+      {
+        const auto first = std::lower_bound(mCells.begin(), mCells.end(), std::make_pair(key(ix, iy), size_t{0}));
+        for (auto it = first; it != mCells.end() && it->first == key(ix, iy); ++it)
+        {
+          visit(it->second);
+        }
+      }
+    }
+  }
+
+private:
+  int64_t cell(double value) const
+  {
+    return static_cast<int64_t>(std::floor(value / mCellSize));
+  }
+
+  static int64_t key(int64_t cx, int64_t cy)
+  {
+    // Colliding keys only add candidates, which are filtered by distance afterwards
+    return static_cast<int64_t>((static_cast<uint64_t>(cx) << 32) ^ (static_cast<uint64_t>(cy) & 0xffffffffu));
+  }
 
-  cv::Mat mahalanobisDistance = innovation.t() * (track.predictedMeasurementCovInv) * innovation;
+  double mCellSize;
+  std::vector<std::pair<int64_t, size_t>> mCells;
+};
 
-  return 0.5 * std::sqrt(mahalanobisDistance.at<double>(0, 0));
+template <typename Distance>
+void fillCostMatrix(const std::vector<TrackedObject> &tracks,
+                    const std::vector<TrackedObject> &measurements,
+                    const DistanceType &distanceType, double threshold, double boundValue,
+                    apollo::perception::common::SecureMat<double> &costMatrix)
+{
+  const Distance distance;
+
+  std::vector<Gate> gates(tracks.size());
+  double maxRadius = 0.;
+  bool gating = tracks.size() * measurements.size() >= kMinPairsForGating;
+  for (size_t i = 0; gating && i < tracks.size(); ++i)
+  {
+    gates[i] = gate(tracks[i], distanceType, threshold);
+    gating = std::isfinite(gates[i].radius);
+    maxRadius = std::max(maxRadius, gates[i].radius);
+  }
+
+  if (!gating || !(maxRadius > 0.))
+  {
+    // Parallelize the cost matrix computation
+    #pragma omp parallel for collapse(2)
+    for (size_t i = 0; i < tracks.size(); ++i)
+    {
+      for (size_t j = 0; j < measurements.size(); ++j)
+      {
+        costMatrix(i, j) = distance(measurements[j], tracks[i]);
+      }
+    }
+    return;
+  }
+
+  const MeasurementGrid grid(measurements, maxRadius);
+
+  #pragma omp parallel for
+  for (size_t i = 0; i < tracks.size(); ++i)
+  {
+    const Gate &trackGate = gates[i];
+    const double squaredRadius = trackGate.radius * trackGate.radius;
+    for (size_t j = 0; j < measurements.size(); ++j)
+    {
+      costMatrix(i, j) = boundValue;
+    }
+    grid.forEachCandidate(trackGate.x, trackGate.y, trackGate.radius, [&](size_t j) {
+      const double dx = measurements[j].x - trackGate.x;
+      const double dy = measurements[j].y - trackGate.y;
+      if (dx * dx + dy * dy <= squaredRadius)
+      {
+        costMatrix(i, j) = distance(measurements[j], tracks[i]);
+      }
+    });
+  }
 }
 
-double calculateCompundDistance(const TrackedObject &measurement, const TrackedObject &track)
+} // namespace
+
+double calculateMulticlassScaledDistance(const TrackedObject &measurement, const TrackedObject &track)
 {
-  double euclideanDist = calculateMulticlassScaledDistance(measurement, track);
-  double mahalanobisDist = calculateMahalanobisDistance(measurement, track);
+  return MulticlassScaledDistance()(measurement, track);
+}
 
-  return 0.5 * euclideanDist + 0.5 * mahalanobisDist;
+double calculateEuclideanDistance(const TrackedObject &measurement, const TrackedObject &track)
+{
+  return EuclideanDistance()(measurement, track);
+}
+
+double calculateMahalanobisDistance(const TrackedObject &measurement, const TrackedObject &track)
+{
+  return mahalanobisDistance(measurement, track);
+}
+
+double calculateCompundDistance(const TrackedObject &measurement, const TrackedObject &track)
+{
+  return CompoundDistance()(measurement, track);
 }
 
 void match(const std::vector<TrackedObject> &tracks,
@@ -77,45 +300,29 @@ void match(const std::vector<TrackedObject> &tracks,
   }
 
   apollo::perception::lidar::BipartiteGraphMatcherOptions matcherOptions;
-  std::function<double(const TrackedObject &, const TrackedObject &)> distanceFunction;
+  matcherOptions.cost_thresh = threshold;
+  matcherOptions.bound_value = kDefaultClassBoundValue;
+
+  apollo::perception::common::SecureMat<double> *costMatrix = matcher.cost_matrix();
+  costMatrix->Resize(tracks.size(), measurements.size());
+
   switch (distanceType)
   {
     case DistanceType::MCEMahalanobis:
-      distanceFunction = std::bind(&calculateCompundDistance, std::placeholders::_1, std::placeholders::_2);
-      matcherOptions.cost_thresh = threshold;
-      matcherOptions.bound_value = kDefaultClassBoundValue;
+      fillCostMatrix<CompoundDistance>(tracks, measurements, distanceType, threshold, matcherOptions.bound_value, *costMatrix);
       break;
     case DistanceType::Mahalanobis:
-      distanceFunction = std::bind(&calculateMahalanobisDistance, std::placeholders::_1, std::placeholders::_2);
-      matcherOptions.cost_thresh = threshold;
-      matcherOptions.bound_value = kDefaultClassBoundValue;
+      fillCostMatrix<MahalanobisDistance>(tracks, measurements, distanceType, threshold, matcherOptions.bound_value, *costMatrix);
       break;
     case DistanceType::MultiClassEuclidean:
-      distanceFunction = std::bind(&calculateMulticlassScaledDistance, std::placeholders::_1, std::placeholders::_2);
-      matcherOptions.cost_thresh = threshold;
-      matcherOptions.bound_value = kDefaultClassBoundValue;
+      fillCostMatrix<MulticlassScaledDistance>(tracks, measurements, distanceType, threshold, matcherOptions.bound_value, *costMatrix);
       break;
     case DistanceType::Euclidean:
     default:
-      distanceFunction = std::bind(&calculateEuclideanDistance, std::placeholders::_1, std::placeholders::_2);
-      matcherOptions.cost_thresh = threshold;
-      matcherOptions.bound_value = kDefaultClassBoundValue;
+      fillCostMatrix<EuclideanDistance>(tracks, measurements, distanceType, threshold, matcherOptions.bound_value, *costMatrix);
       break;
   }
 
-  apollo::perception::common::SecureMat<double> *costMatrix = matcher.cost_matrix();
-  costMatrix->Resize(tracks.size(), measurements.size());
-
-  // Parallelize the cost matrix computation
-  #pragma omp parallel for collapse(2)
-  for (size_t i = 0; i < tracks.size(); ++i)
-  {
-    for (size_t j = 0; j < measurements.size(); ++j)
-    {
-      (*costMatrix)(i, j) = distanceFunction(measurements[j], tracks[i]);
-    }
-  }
-
   matcher.Match(matcherOptions, &assignments, &unassignedTracks, &unassignedMeasurements);
 }
 
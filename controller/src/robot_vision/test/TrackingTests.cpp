@@ -2,10 +2,15 @@
 // SPDX-License-Identifier: Apache-2.0
 
 #include <gtest/gtest.h>
+#include <algorithm>
 #include <chrono>
+#include <cmath>
 #include <iostream>
+#include <random>
+#include <rv/apollo/multi_hm_bipartite_graph_matcher.hpp>
 #include <rv/tracking/MultipleObjectTracker.hpp>
 #include <rv/tracking/Classification.hpp>
+#include <rv/tracking/ObjectMatching.hpp>
 #include <rv/tracking/TrackedObject.hpp>
 
 TEST(MultipleObjectTrackerTest, SingleDetectionTracking)
@@ -700,3 +705,138 @@ TEST(MultipleObjectTrackerTest, SingleJumpingDetectionTracking)
     }
   }
 }
+
+// Reference cost of the dense matcher, evaluated with cv::Mat for every pair
+double referenceDistance(const rv::tracking::TrackedObject &measurement, const rv::tracking::TrackedObject &track,
+                         const rv::tracking::DistanceType &distanceType)
+{
+  const double euclidean = std::sqrt(std::pow(measurement.x - track.x, 2) + std::pow(measurement.y - track.y, 2));
+  const double multiClass = euclidean * (1.0 + rv::tracking::classification::distance(measurement.classification, track.classification));
+
+  cv::Mat innovation = measurement.measurementVector() - track.predictedMeasurementMean;
+  innovation.at<double>(6, 0) = 0.;
+  cv::Mat squaredMahalanobis = innovation.t() * track.predictedMeasurementCovInv * innovation;
+  const double mahalanobis = 0.5 * std::sqrt(squaredMahalanobis.at<double>(0, 0));
+
+  switch (distanceType)
+  {
+    case rv::tracking::DistanceType::MCEMahalanobis:
+      return 0.5 * multiClass + 0.5 * mahalanobis;
+    case rv::tracking::DistanceType::Mahalanobis:
+      return mahalanobis;
+    case rv::tracking::DistanceType::MultiClassEuclidean:
+      return multiClass;
+    case rv::tracking::DistanceType::Euclidean:
+    default:
+      return euclidean;
+  }
+}
+
+void denseMatch(const std::vector<rv::tracking::TrackedObject> &tracks,
+                const std::vector<rv::tracking::TrackedObject> &measurements,
+                std::vector<std::pair<size_t, size_t>> &assignments,
+                std::vector<size_t> &unassignedTracks,
+                std::vector<size_t> &unassignedMeasurements,
+                const rv::tracking::DistanceType &distanceType, double threshold)
+{
+  apollo::perception::lidar::MultiHmBipartiteGraphMatcher matcher;
+  apollo::perception::lidar::BipartiteGraphMatcherOptions matcherOptions;
+  matcherOptions.cost_thresh = threshold;
+  matcherOptions.bound_value = 1000.;
+
+  auto costMatrix = matcher.cost_matrix();
+  costMatrix->Resize(tracks.size(), measurements.size());
+  for (size_t i = 0; i < tracks.size(); ++i)
+  {
+    for (size_t j = 0; j < measurements.size(); ++j)
+    {
+      (*costMatrix)(i, j) = referenceDistance(measurements[j], tracks[i], distanceType);
+    }
+  }
+  matcher.Match(matcherOptions, &assignments, &unassignedTracks, &unassignedMeasurements);
+}
+
+TEST(ObjectMatchingTest, GatedMatchEqualsDenseMatch)
+{
+  // Tracks are packed closely enough for their gates to overlap, and the track-measurement
+  // pairs are well above the count at which match() switches from the dense cost matrix to gating
+  auto classificationData = rv::tracking::ClassificationData({"Car", "Bike", "Pedestrian"});
+  const std::vector<std::string> classes = classificationData.getClasses();
+  std::mt19937 generator(42);
+  std::uniform_real_distribution<double> position(-15.0, 15.0);
+  std::uniform_real_distribution<double> variance(0.5, 2.0);
+  std::normal_distribution<double> jitter(0.0, 0.6);
+  std::uniform_int_distribution<size_t> className(0, classes.size() - 1);
+
+  std::vector<rv::tracking::TrackedObject> tracks;
+  std::vector<rv::tracking::TrackedObject> measurements;
+  for (size_t k = 0; k < 40; k++)
+  {
+    auto track = createObjectAtLocation(position(generator), position(generator), classificationData, classes[className(generator)]);
+    track.height = 1.5;
+
+    // Predicted measurement slightly off the track position with a non-singular covariance
+    track.predictedMeasurementMean = track.measurementVector();
+    track.predictedMeasurementMean.at<double>(0, 0) += 0.2;
+    track.predictedMeasurementMean.at<double>(1, 0) -= 0.1;
+    track.predictedMeasurementCov = cv::Mat::eye(rv::tracking::TrackedObject::MeasurementSize,
+                                                 rv::tracking::TrackedObject::MeasurementSize, CV_64F) * 0.1;
+    track.predictedMeasurementCov.at<double>(0, 0) = variance(generator);
+    track.predictedMeasurementCov.at<double>(1, 1) = variance(generator);
+    track.predictedMeasurementCov.at<double>(0, 1) = track.predictedMeasurementCov.at<double>(1, 0) = 0.2;
+    track.predictedMeasurementCovInv = track.predictedMeasurementCov.inv();
+    tracks.push_back(track);
+
+    if (k % 5 != 0)
+    {
+      auto measurement = createObjectAtLocation(track.x + jitter(generator), track.y + jitter(generator),
+                                                classificationData, classes[className(generator)]);
+      measurement.height = 1.5;
+      measurements.push_back(measurement);
+    }
+  }
+  for (size_t k = 0; k < 4; k++)
+  {
+    // Isolated tracks without measurements stay unassigned
+    auto track = createObjectAtLocation(200.0 + 10.0 * k, 0.0, classificationData, classes[className(generator)]);
+    track.height = 1.5;
+    track.predictedMeasurementMean = track.measurementVector();
+    track.predictedMeasurementCov = cv::Mat::eye(rv::tracking::TrackedObject::MeasurementSize,
+                                                 rv::tracking::TrackedObject::MeasurementSize, CV_64F);
+    track.predictedMeasurementCovInv = track.predictedMeasurementCov.inv();
+    tracks.push_back(track);
+  }
+  for (size_t k = 0; k < 8; k++)
+  {
+    auto clutter = createObjectAtLocation(position(generator), position(generator), classificationData, classes[className(generator)]);
+    clutter.height = 1.5;
+    measurements.push_back(clutter);
+  }
+  ASSERT_GE(tracks.size() * measurements.size(), 256u);
+
+  const double threshold = 2.0;
+  for (auto distanceType : {rv::tracking::DistanceType::MultiClassEuclidean, rv::tracking::DistanceType::Euclidean,
+                            rv::tracking::DistanceType::Mahalanobis, rv::tracking::DistanceType::MCEMahalanobis})
+  {
+    SCOPED_TRACE(static_cast<int>(distanceType));
+
+    std::vector<std::pair<size_t, size_t>> assignments, denseAssignments;
+    std::vector<size_t> unassignedTracks, denseUnassignedTracks;
+    std::vector<size_t> unassignedMeasurements, denseUnassignedMeasurements;
+    rv::tracking::match(tracks, measurements, assignments, unassignedTracks, unassignedMeasurements, distanceType, threshold);
+    denseMatch(tracks, measurements, denseAssignments, denseUnassignedTracks, denseUnassignedMeasurements, distanceType, threshold);
+
+    std::sort(assignments.begin(), assignments.end());
+    std::sort(denseAssignments.begin(), denseAssignments.end());
+    std::sort(unassignedTracks.begin(), unassignedTracks.end());
+    std::sort(denseUnassignedTracks.begin(), denseUnassignedTracks.end());
+    std::sort(unassignedMeasurements.begin(), unassignedMeasurements.end());
+    std::sort(denseUnassignedMeasurements.begin(), denseUnassignedMeasurements.end());
+
+    EXPECT_FALSE(denseAssignments.empty());
+    EXPECT_FALSE(denseUnassignedTracks.empty());
+    EXPECT_EQ(assignments, denseAssignments);
+    EXPECT_EQ(unassignedTracks, denseUnassignedTracks);
+    EXPECT_EQ(unassignedMeasurements, denseUnassignedMeasurements);
+  }
+}
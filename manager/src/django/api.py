@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: (C) 2023 - 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
 import json
 import os
 import socket
@@ -9,8 +10,11 @@ import uuid
 import asyncio
 
 from django.contrib.auth.models import User
-from django.db import IntegrityError, OperationalError, connection
+from django.core.cache import cache
+from django.db import IntegrityError, OperationalError, connection, transaction
 from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework.views import APIView
 from rest_framework import authentication, permissions
 from rest_framework.response import Response
@@ -19,7 +23,8 @@ from rest_framework import status
 from rest_framework import generics
 from rest_framework.authtoken.views import ObtainAuthToken
 
-from manager.models import Scene, Cam, SingletonSensor, Region, Tripwire, Asset3D, ChildScene, CalibrationMarker, DatabaseStatus, PubSubACL
+from manager.models import Scene, Cam, SingletonSensor, Region, Tripwire, Asset3D, ChildScene, CalibrationMarker, DatabaseStatus, PubSubACL, \
+  RepresentationVersion
 from manager.serializers import *
 from manager.scene_import import ImportScene
 from scene_common.timestamp import get_epoch_time, get_iso_time
@@ -56,14 +61,56 @@ def get_class_and_serializer(thing_type):
     return CalibrationMarker, CalibrationMarkerSerializer, 'marker_id'
   return None, None, None
 
-
-class ListThings(generics.ListCreateAPIView):
+REPRESENTATION_CACHE_TIMEOUT = 300
+
+class ConditionalGetMixin:
+  """Answers GET requests with an ETag and Last-Modified taken from the
+  RepresentationVersion, replies 304 Not Modified when the client already has
+  the current representation and caches serialized representations per version.
+  Users are not covered: they change through paths that do not invalidate the version."""
+
+  def conditionalGet(self, request, thing_class, serialize):
+    if thing_class is User:
+      return Response(serialize())
+
+    current = RepresentationVersion.get_instance()
+    # File URLs and pagination links are absolute, built from the request host
+    representation = f"{current.version}:{request.accepted_renderer.format}:" \
+      f"{request.build_absolute_uri('/')}:{request.get_full_path()}"
+    etag = quote_etag(hashlib.sha256(representation.encode()).hexdigest())
+    last_modified = int(current.modified.timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+      cache_key = f"representation:{etag}"
+      data = cache.get(cache_key)
+      if data is None:
+        data = serialize()
+        cache.set(cache_key, data, REPRESENTATION_CACHE_TIMEOUT)
+      response = Response(data)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
+
+class ListThings(ConditionalGetMixin, generics.ListCreateAPIView):
   authentication_classes = [authentication.TokenAuthentication]
   permission_classes = [permissions.IsAuthenticated]
 
-  def get_queryset(self):
+  def list(self, request, *args, **kwargs):
     thing_class, _, _ = get_class_and_serializer(self.args[0])
+    serialize = lambda: super(ListThings, self).list(request, *args, **kwargs).data
+    return self.conditionalGet(request, thing_class, serialize)
+
+  def perform_create(self, serializer):
+    super().perform_create(serializer)
+    transaction.on_commit(RepresentationVersion.invalidate)
+    return
+
+  def get_queryset(self):
+    thing_class, thing_serializer, _ = get_class_and_serializer(self.args[0])
     queryset = thing_class.objects.all()
+    if hasattr(thing_serializer, 'prefetch_queryset'):
+      queryset = thing_serializer.prefetch_queryset(queryset)
     query_params = self.request.query_params
     if query_params:
       keys = query_params.keys()
@@ -105,7 +152,7 @@ class SceneImportAPIView(APIView):
     errors = asyncio.run(coroutine)
     return Response(errors, status=status.HTTP_201_CREATED)
 
-class ManageThing(APIView):
+class ManageThing(ConditionalGetMixin, APIView):
   authentication_classes = [authentication.TokenAuthentication]
   permission_classes = [IsAdminOrReadOnly]
 
@@ -139,12 +186,11 @@ class ManageThing(APIView):
       raise ValidationError(thing_serializer.errors)
     elif not self.isValidQueryParameter(uid, thing_type):
       return Response(status=status.HTTP_404_NOT_FOUND)
+    serialize = lambda: thing_serializer(thing_class.objects.get(**{uid_field: uid})).data
     try:
-      thing = thing_class.objects.get(**{uid_field: uid})
+      return self.conditionalGet(request, thing_class, serialize)
     except thing_class.DoesNotExist:
       return Response(status=status.HTTP_404_NOT_FOUND)
-    serializer = thing_serializer(thing)
-    return Response(serializer.data)
 
   def post(self, request, thing_type, uid=None):
     thing_class, thing_serializer, uid_field = get_class_and_serializer(thing_type)
@@ -166,6 +212,7 @@ class ManageThing(APIView):
       serializer.save()
     except IntegrityError as e:
       raise ValidationError(str(e))
+    transaction.on_commit(RepresentationVersion.invalidate)
     return Response(serializer.data,
                     status=status.HTTP_201_CREATED if not thing else status.HTTP_200_OK)
 
@@ -187,6 +234,7 @@ class ManageThing(APIView):
     if not thing:
       return Response(status=status.HTTP_404_NOT_FOUND)
     thing[0].delete() # thing is always a list of single element
+    transaction.on_commit(RepresentationVersion.invalidate)
     data = {uid_field: uid}
     log.info("DELETED", thing_type, data)
     return Response(data, status=status.HTTP_200_OK)
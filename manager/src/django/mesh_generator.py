@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: (C) 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from io import BytesIO
+from io import BufferedReader, BytesIO
 import json
 import time
 import base64
@@ -147,7 +147,7 @@ class MappingServiceClient:
       mesh_type: Output type ('mesh' or 'pointcloud')
 
     Returns:
-      dict: Response from mapping service
+      dict: Response from mapping service, with the GLB file in 'glb_bytes'
     """
 
     # Prepare request data - ensure images are ordered by camera_order to maintain
@@ -162,10 +162,11 @@ class MappingServiceClient:
       else:
         log.warning(f"Camera {camera_id} in camera_order but not in images dict")
 
-    # Form data parameters
+    # Form data parameters; the GLB is requested as a binary part instead of base64 in JSON
     data = {
       'output_format': 'glb',
-      'mesh_type': mesh_type
+      'mesh_type': mesh_type,
+      'response_format': 'multipart'
     }
 
     log.info(f"Sending {len(images)} images to mapping service for reconstruction")
@@ -176,18 +177,26 @@ class MappingServiceClient:
         data=data,
         files=files,
         timeout=self.timeout_per_camera * len(images),
-        verify=self.rootcert
+        verify=self.rootcert,
+        stream=True
       )
 
-      if response.status_code == 200:
-        result = response.json()
-        log.info(f"Mapping service completed successfully in {result.get('processing_time', 0):.2f}s")
-        return result
-      else:
-        error_data = response.json() if response.content else {}
-        error_msg = error_data.get('error', f'HTTP {response.status_code}')
-        log.error(f"Mapping service error: {error_msg}")
-        raise Exception(f"Mapping service error: {error_msg}")
+      with response:
+        if response.status_code == 200:
+          if response.headers.get('Content-Type', '').startswith('multipart/'):
+            result = self._readMultipartResult(response)
+          else:
+            # Mapping service without multipart support, GLB is base64 encoded in the JSON
+            result = response.json()
+            if result.get('glb_data'):
+              result['glb_bytes'] = base64.b64decode(result.pop('glb_data'))
+          log.info(f"Mapping service completed successfully in {result.get('processing_time', 0):.2f}s")
+          return result
+        else:
+          error_data = response.json() if response.content else {}
+          error_msg = error_data.get('error', f'HTTP {response.status_code}')
+          log.error(f"Mapping service error: {error_msg}")
+          raise Exception(f"Mapping service error: {error_msg}")
 
     except requests.exceptions.Timeout:
       raise Exception("Mapping service request timed out")
@@ -197,6 +206,56 @@ class MappingServiceClient:
       log.error(f"Mapping service request failed: {e}")
       raise
 
+  def _readMultipartResult(self, response):
+    """
+    Read a multipart/mixed reconstruction response while it is streamed.
+
+    Every part carries a Content-Length header, so part bodies are read with a
+    single read each instead of scanning the body for the boundary.
+
+    Args:
+      response: Streamed requests response with multipart/mixed content
+
+    Returns:
+      dict: JSON metadata of the reconstruction, with the GLB file in 'glb_bytes'
+    """
+    boundary = response.headers['Content-Type'].split('boundary=', 1)[1].strip('"').encode()
+    response.raw.decode_content = True
+    stream = BufferedReader(response.raw)
+
+    parts = {}
+    while True:
+      line = stream.readline()
+      if not line:
+        raise Exception("Truncated multipart response from mapping service")
+      line = line.strip()
+      if not line:
+        continue
+      if line == b"--" + boundary + b"--":
+        break
+      if line != b"--" + boundary:
+        raise Exception("Malformed multipart response from mapping service")
+
+      headers = {}
+      header = stream.readline().strip()
+      while header:
+        name, _, value = header.decode('ascii').partition(':')
+        headers[name.strip().lower()] = value.strip()
+        header = stream.readline().strip()
+
+      length = int(headers['content-length'])
+      body = stream.read(length)
+      if len(body) != length:
+        raise Exception("Truncated multipart response from mapping service")
+      # Coarser levels of detail (lod1, lod2, ...) precede the full resolution GLB in lod0
+      if 'name="lod' in headers.get('content-disposition', '') and 'name="lod0"' not in headers['content-disposition']:
+        continue
+      parts[headers.get('content-type')] = body
+
+    result = json.loads(parts['application/json'])
+    result['glb_bytes'] = parts.get('model/gltf-binary')
+    return result
+
   def checkHealth(self):
     """
     Check if the mapping service is available and healthy.
@@ -295,9 +354,9 @@ class MeshGenerator:
         self._updateSceneCamerasWithMappingResult(mapping_result, cameras)
 
       # Save the generated mesh to the scene
-      if mapping_result.get('success') and mapping_result.get('glb_data'):
+      if mapping_result.get('success') and mapping_result.get('glb_bytes'):
         # Save mesh and get the transformation applied during alignment
-        mesh_transform = self._saveMeshToScene(scene, mapping_result['glb_data'])
+        mesh_transform = self._saveMeshToScene(scene, mapping_result['glb_bytes'])
 
         # Apply the same transformation to cameras to maintain relative pose
         if mesh_transform is not None:
@@ -420,20 +479,18 @@ class MeshGenerator:
       log.error(f"Error updating camera {camera.sensor_id}: {e}")
       raise
 
-  def _saveMeshToScene(self, scene, glb_data_base64):
+  def _saveMeshToScene(self, scene, glb_bytes):
     """
     Save the generated GLB mesh to the scene's map field.
 
     Args:
       scene: Scene object to update
-      glb_data_base64: Base64 encoded GLB file data
+      glb_bytes: GLB file data
 
     Returns:
       dict: Transformation applied to mesh (rotation matrix, translation, center_offset)
     """
     try:
-      # Decode base64 GLB data
-      glb_bytes = base64.b64decode(glb_data_base64)
       mesh = trimesh.load(BytesIO(glb_bytes), file_type='glb')
       merged_mesh = mergeMesh(mesh)
 
@@ -3,15 +3,12 @@
 
 import json
 import os
-import socket
 import traceback
 import uuid
 import zipfile
 from functools import partial
-import requests
 
 import numpy as np
-import paho.mqtt.client as mqtt
 from PIL import Image
 
 from django.contrib.postgres.fields import ArrayField
@@ -21,6 +18,7 @@ from django.db import models, transaction
 from django.conf import settings
 from django.contrib.sessions.models import Session
 from django.contrib.auth.models import User
+from django.utils import timezone
 from django.utils.text import get_valid_filename
 from django.core.files import File
 
@@ -28,56 +26,23 @@ from scene_common.camera import Camera as ScenescapeCamera, CameraPose as Scenes
 from scene_common.geometry import Region as ScenescapeRegion, Tripwire as ScenescapeTripwire
 from scene_common.glb_top_view import generateOrthoView, getMeshSize
 from scene_common.mesh_util import extractMeshFromGLB, extractMeshFromPointCloud
-from scene_common.mqtt import PubSub
 from scene_common.options import *
 from scene_common.scene_model import SceneModel as ScenescapeScene
 from scene_common.scenescape import SceneLoader
 from scene_common.timestamp import get_epoch_time
 from manager.validators import validate_map_file, validate_glb, validate_map_corners_lla
 from manager.fields import ListField
+from manager.update_notifier import UpdateNotifier
 
 from scene_common import log
 
+update_notifier = UpdateNotifier()
+
 # FIXME - when entire app has transitioned to using APIs
 # move this definition to views.py
 def sendUpdateCommand(scene_id=None, camera_data=None):
-  broker = os.environ.get("BROKER")
-  auth = os.environ.get("BROKERAUTH")
-  rootcert = os.environ.get("BROKERROOTCERT")
-  autocalibration = os.environ.get("AUTOCALIBRATION")
-  if rootcert is None:
-    rootcert = "/run/secrets/certs/scenescape-ca.pem"
-  cert = os.environ.get("BROKERCERT")
-  if broker is not None:
-    client = PubSub(auth, cert, rootcert, broker)
-    try:
-      client.connect()
-    except socket.gaierror as e:
-      log.error("Unable to connect", e)
-    else:
-      if scene_id:
-        client.publish(PubSub.formatTopic(PubSub.CMD_SCENE_UPDATE, scene_id = scene_id), "update")
-        url = f"https://{autocalibration}/v1/scenes/{scene_id}/registration"
-        headers = {
-          "Content-Type": "application/json"
-        }
-        try:
-          response = requests.patch(url, headers=headers, verify=rootcert, timeout=10)
-          log.info("Status code: %s", response.status_code)
-          try:
-            log.info("Response: %s", response.json())
-          except ValueError:
-            log.info("Non-JSON response: %s", response.text)
-        except requests.exceptions.RequestException as e:
-          log.warning("Failed to send update command to autocalibration service: %s", e)
-
-      if camera_data:
-        client.publish(PubSub.formatTopic(PubSub.CMD_KUBECLIENT), json.dumps(camera_data), qos=2)
-      msg = client.publish(PubSub.formatTopic(PubSub.CMD_DATABASE), "update", qos=1)
-      if not msg.is_published() and msg.rc == mqtt.MQTT_ERR_SUCCESS:
-        client.loopStart()
-        msg.wait_for_publish()
-        client.loopStop()
+  RepresentationVersion.invalidate()
+  update_notifier.notify(scene_id=scene_id, camera_data=camera_data)
   return
 
 def sanitizeZipPath(instance, filename):
@@ -480,7 +445,7 @@ class Scene(models.Model):
       if sensor.type != "generic":
         continue
 
-      sensor = SingletonSensor.objects.get(pk=sensor.id)
+      sensor = sensor.singletonsensor
       self.createSceneScapeRegion(mScene.sensors, sensor)
 
     newSensors = list(mScene.sensors.keys())
@@ -1013,6 +978,24 @@ class DatabaseStatus(models.Model):
     self.pk = 1
     super(DatabaseStatus, self).save(*args, **kwargs)
 
+class RepresentationVersion(models.Model):
+  # Replaced whenever a resource served by the REST API changes; ETags and cached
+  # representations are only valid for the version they were computed from
+  version = models.UUIDField(default=uuid.uuid4)
+  modified = models.DateTimeField(default=timezone.now)
+
+  @classmethod
+  def get_instance(cls):
+    obj, _ = cls.objects.get_or_create(pk=1)
+    return obj
+
+  @classmethod
+  def invalidate(cls):
+    updated = cls.objects.filter(pk=1).update(version=uuid.uuid4(), modified=timezone.now())
+    if not updated:
+      cls.get_instance()
+    return
+
 class RegionOccupancyThreshold(models.Model):
   region = models.OneToOneField(Region, on_delete=models.CASCADE, related_name='roi_occupancy_threshold')
   sectors = models.JSONField(default=list)
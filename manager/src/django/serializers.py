@@ -63,8 +63,9 @@ class CenterSerializerField(serializers.DictField):
 
 class PointsSerializerField(serializers.DictField):
   def to_representation(self, obj):
+    # Sorted here rather than with order_by() so prefetched points are used
     points = []
-    for point in obj.all().order_by('sequence'):
+    for point in sorted(obj.all(), key=lambda point: (point.sequence is None, point.sequence)):
       points.append((point.x, point.y))
     return points
 
@@ -553,6 +554,32 @@ class SceneSerializer(NonNullSerializer):
   map_processed = serializers.DateTimeField(format=f"{DATETIME_FORMAT}Z")
   trs_matrix = serializers.SerializerMethodField('get_trs_matrix')
 
+  # Relations serialized for a scene, prefetched when listing scenes
+  PREFETCH_LOOKUPS = (
+    'parent__parent',
+    'sensor_set__cam',
+    'sensor_set__singletonsensor__points',
+    'sensor_set__singletonsensor__singleton_scalar_threshold',
+    'regions__points',
+    'regions__roi_occupancy_threshold',
+    'tripwires__points',
+    'children__child',
+  )
+  # Levels of child scenes whose relations are prefetched with their parent
+  PREFETCH_CHILD_DEPTH = 2
+
+  @classmethod
+  def prefetch_queryset(cls, queryset):
+    """Prefetch the relations of the scenes and of their child scenes, so
+    serializing a list of scenes takes the same number of queries whatever
+    the number of scenes."""
+    lookups = []
+    prefix = ''
+    for _ in range(cls.PREFETCH_CHILD_DEPTH + 1):
+      lookups.extend(prefix + lookup for lookup in cls.PREFETCH_LOOKUPS)
+      prefix += 'children__child__'
+    return queryset.prefetch_related(*lookups)
+
   def validate(self, attrs):
     allowed = set(self.fields.keys()) | {
         "mesh_translation",
@@ -602,8 +629,7 @@ class SceneSerializer(NonNullSerializer):
     return CamSerializer(queryset, many=True).data
 
   def get_sensors(self, obj):
-    queryset = [SingletonSensor.objects.get(pk=x.id) for x in obj.sensor_set.all()
-                if x.type == "generic"]
+    queryset = [x.singletonsensor for x in obj.sensor_set.all() if x.type == "generic"]
     return SingletonSerializer(queryset, many=True).data
 
   def get_rotation(self, obj):
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import socket
+import threading
+import time
+
+import requests
+
+from scene_common.mqtt import PubSub
+from scene_common import log
+
+UPDATE_DEBOUNCE_TIME = float(os.environ.get("UPDATE_DEBOUNCE_TIME", 0.5))
+AUTOCALIBRATION_TIMEOUT = 10
+
+class UpdateNotifier:
+  """Notifies the other services of database updates from a background thread,
+  using one broker connection and one HTTP session per process.
+
+  Notifications are collected for UPDATE_DEBOUNCE_TIME seconds after the first
+  one and then delivered together: every updated scene gets a single scene
+  update command and autocalibration registration PATCH, camera commands are
+  published in order, and one database update command is published for the
+  whole batch."""
+
+  def __init__(self, debounce_time=UPDATE_DEBOUNCE_TIME):
+    self.debounce_time = debounce_time
+    self.scene_ids = []
+    self.camera_data = []
+    self.pending = False
+    self.cond = threading.Condition()
+    self.thread = None
+    self.client = None
+    self.session = requests.Session()
+    return
+
+  def notify(self, scene_id=None, camera_data=None):
+    if os.environ.get("BROKER") is None:
+      return
+
+    with self.cond:
+      if scene_id and scene_id not in self.scene_ids:
+        self.scene_ids.append(scene_id)
+      if camera_data:
+        self.camera_data.append(camera_data)
+      self.pending = True
+      if self.thread is None:
+        self.thread = threading.Thread(target=self.run, daemon=True, name="update-notifier")
+        self.thread.start()
+      self.cond.notify()
+    return
+
+  def run(self):
+    while True:
+      with self.cond:
+        while not self.pending:
+          self.cond.wait()
+      # Let the notifications of the same edit or import pile up
+      time.sleep(self.debounce_time)
+
+      with self.cond:
+        scene_ids, camera_data = self.scene_ids, self.camera_data
+        self.scene_ids, self.camera_data = [], []
+        self.pending = False
+      try:
+        self.deliver(scene_ids, camera_data)
+      except Exception as e:
+        log.error("Failed to send update notifications", e)
+
+  def deliver(self, scene_ids, camera_data):
+    client = self.connect()
+    if client is None:
+      return
+
+    for scene_id in scene_ids:
+      client.publish(PubSub.formatTopic(PubSub.CMD_SCENE_UPDATE, scene_id=scene_id), "update")
+    for data in camera_data:
+      client.publish(PubSub.formatTopic(PubSub.CMD_KUBECLIENT), json.dumps(data), qos=2)
+    client.publish(PubSub.formatTopic(PubSub.CMD_DATABASE), "update", qos=1)
+
+    for scene_id in scene_ids:
+      self.notifyAutocalibration(scene_id)
+    return
+
+  def connect(self):
+    """Returns the broker client, connecting it on first use. The client's
+    network loop keeps it connected afterwards."""
+    if self.client is not None:
+      return self.client
+
+    broker = os.environ.get("BROKER")
+    auth = os.environ.get("BROKERAUTH")
+    rootcert = os.environ.get("BROKERROOTCERT")
+    if rootcert is None:
+      rootcert = "/run/secrets/certs/scenescape-ca.pem"
+    cert = os.environ.get("BROKERCERT")
+
+    client = PubSub(auth, cert, rootcert, broker)
+    try:
+      client.connect()
+    except socket.gaierror as e:
+      log.error("Unable to connect", e)
+      return None
+    client.loopStart()
+    self.client = client
+    return client
+
+  def notifyAutocalibration(self, scene_id):
+    autocalibration = os.environ.get("AUTOCALIBRATION")
+    rootcert = os.environ.get("BROKERROOTCERT")
+    if rootcert is None:
+      rootcert = "/run/secrets/certs/scenescape-ca.pem"
+    url = f"https://{autocalibration}/v1/scenes/{scene_id}/registration"
+    headers = {
+      "Content-Type": "application/json"
+    }
+    try:
+      response = self.session.patch(url, headers=headers, verify=rootcert,
+                                    timeout=AUTOCALIBRATION_TIMEOUT)
+      log.info("Status code: %s", response.status_code)
+      try:
+        log.info("Response: %s", response.json())
+      except ValueError:
+        log.info("Non-JSON response: %s", response.text)
+    except requests.exceptions.RequestException as e:
+      log.warning("Failed to send update command to autocalibration service: %s", e)
+    return
@@ -10,21 +10,27 @@ Flask service with build-time model selection (no runtime model parameter needed
 
 import argparse
 import base64
+import json
 import os
 import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from typing import Dict, Any
+import uuid
+from typing import Dict, Any, List, Optional, Tuple
+import trimesh
 from werkzeug.utils import secure_filename
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
 from scene_common import log
 
-from mesh_utils import getMeshInfo
+from mesh_utils import createLevelsOfDetail, exportQuantizedGlb, getMeshInfo
+from reconstruction_jobs import QUEUED, SUCCEEDED, QueueFullError, ReconstructionJob, ReconstructionJobQueue
+from result_cache import ReconstructionCache, computeCacheKey
 
 # Helper functions for request validation
 def validateReconstructionRequest(data):
@@ -41,6 +47,17 @@ def validateReconstructionRequest(data):
   if mesh_type not in ["mesh", "pointcloud"]:
     raise ValueError("mesh_type must be 'mesh' or 'pointcloud'")
 
+  response_format = data.get("response_format", "json")
+  if response_format not in ["json", "multipart"]:
+    raise ValueError("response_format must be 'json' or 'multipart'")
+
+  lod_levels = data.get("lod_levels", 1)
+  if not isinstance(lod_levels, int) or not 1 <= lod_levels <= MAX_LOD_LEVELS:
+    raise ValueError(f"lod_levels must be an integer between 1 and {MAX_LOD_LEVELS}")
+
+  if not isinstance(data.get("quantize", False), bool):
+    raise ValueError("quantize must be a boolean")
+
   images = data.get("images")
   video = data.get("video")
 
@@ -60,8 +77,15 @@ def validateReconstructionRequest(data):
         raise ValueError(f"Image {i} must be an object")
       if "data" not in img:
         raise ValueError(f"Image {i} missing required field: data")
-      if not isinstance(img["data"], str) or not img["data"].strip():
-        raise ValueError(f"Image {i} data must be a non-empty string")
+      data = img["data"]
+      if isinstance(data, str):
+        if not data.strip():
+          raise ValueError(f"Image {i} data must be a non-empty string")
+      elif isinstance(data, (bytes, bytearray, memoryview)):
+        if len(data) == 0:
+          raise ValueError(f"Image {i} data must be non-empty bytes")
+      else:
+        raise ValueError(f"Image {i} data must be a non-empty string or bytes")
 
       if "filename" in img and not isinstance(img["filename"], str):
         raise ValueError(f"Image {i} filename must be a string")
@@ -72,6 +96,11 @@ def validateReconstructionRequest(data):
 device = "cpu"
 loaded_model = None
 model_name = None
+# Serializes inference and meshing of /reconstruction requests and queued jobs on the model
+model_lock = threading.Lock()
+# Seconds a /reconstruction request waits for the model before it is answered with 503.
+# Must stay well below GUNICORN_TIMEOUT, which would kill the worker with all its jobs.
+MODEL_LOCK_TIMEOUT = float(os.getenv("MODEL_LOCK_TIMEOUT", "10"))
 
 # Flask app
 app = Flask(__name__)
@@ -80,45 +109,68 @@ CORS(app)  # Enable CORS for all routes
 # Configure Flask app
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max request size
 
+# Size of the chunks a GLB file is streamed in for multipart responses
+GLB_CHUNK_SIZE = 1024 * 1024
+# Maximum number of levels of detail a request can ask for, including full resolution
+MAX_LOD_LEVELS = 4
+
+# Number of video frames a job reconstructs from unless the request sets max_frames
+JOB_MAX_FRAMES = int(os.getenv("JOB_MAX_FRAMES", "32"))
+# Candidate video frames extracted per selected frame for the sharpness based selection
+JOB_FRAME_CANDIDATES = 3
+
+# Results of identical requests are served from disk; RESULT_CACHE_SIZE_MB=0 disables the cache
+result_cache = ReconstructionCache(
+  os.getenv("RESULT_CACHE_DIR", "/tmp/reconstruction_cache"),
+  int(os.getenv("RESULT_CACHE_SIZE_MB", "2048")) * 1024 * 1024,
+)
+
 def initializeModel():
   """Initialize the model - this will be overridden by model-specific services"""
   raise NotImplementedError("This should be overridden by model-specific services")
 
-def runModelInference(input_data: Dict[str, Any]) -> Dict[str, Any]:
+def parseFlag(value: Any) -> Any:
+  """Interpret a form string as boolean; other values are returned unchanged"""
+  if isinstance(value, str):
+    return value.lower() in ("1", "true", "yes", "y", "on")
+  return value
+
+def useKeyframes(input_data: Dict[str, Any]) -> bool:
+  """Read the use_keyframes flag of a request, which may be a form string"""
+  return parseFlag(input_data.get("use_keyframes"))
+
+def collectFrames(input_data: Dict[str, Any], max_video_frames: Optional[int] = None) -> List[Dict[str, Any]]:
   """
-  Run inference using the loaded model.
+  Gather the frames of a request from uploaded images and video.
 
   Args:
     input_data: Dictionary containing images and/or video path
+    max_video_frames: Number of video frames to select by sharpness. None limits
+      the video frames to what the model processes within the Gunicorn timeout.
 
   Returns:
-    Dictionary containing predictions, camera poses, and intrinsics
+    Frames for runInference
   """
   global loaded_model
 
-  if loaded_model is None:
-    raise RuntimeError("Model not loaded")
-
   images = input_data.get("images")
   video = input_data.get("video")
 
-  try:
-    # Accumulate all frames from both sources
-    all_frames = []
-
-    # Add frames from images if provided
-    if images:
-      all_frames.extend(images)
-      log.info(f"Added {len(images)} frames from uploaded images")
-
-    # Extract and add frames from video if provided
-    if video:
-      use_keyframes = input_data.get("use_keyframes")
-      if isinstance(use_keyframes, str):
-        use_keyframes = use_keyframes.lower() in ("1", "true", "yes", "y", "on")
-
-      # Extract frames from video using the model's internal method
-      video_frames = loaded_model._framesFromVideoAsBase64Dicts(
+  # Accumulate all frames from both sources
+  all_frames = []
+
+  # Add frames from images if provided
+  if images:
+    all_frames.extend(images)
+    log.info(f"Added {len(images)} frames from uploaded images")
+
+  # Extract and add frames from video if provided
+  if video:
+    use_keyframes = useKeyframes(input_data)
+
+    if max_video_frames is None:
+      # Extract frames from video as RGB arrays streamed from ffmpeg
+      video_frames = loaded_model.framesFromVideo(
         video_path=video,
         max_frames=loaded_model._maxFramesForTimeBudget(
           time_budget_seconds=int(os.getenv("GUNICORN_TIMEOUT", "300")),
@@ -126,11 +178,39 @@ def runModelInference(input_data: Dict[str, Any]) -> Dict[str, Any]:
         ),
         use_keyframes=use_keyframes,
       )
-      all_frames.extend(video_frames)
-      log.info(f"Added {len(video_frames)} frames from video")
+    else:
+      # Extract more candidates than needed and keep the sharpest frames
+      candidates = loaded_model.framesFromVideo(
+        video_path=video,
+        max_frames=max_video_frames * JOB_FRAME_CANDIDATES,
+        use_keyframes=use_keyframes,
+      )
+      video_frames = loaded_model.selectFrames(candidates, max_video_frames)
+    all_frames.extend(video_frames)
+    log.info(f"Added {len(video_frames)} frames from video")
+
+  if not all_frames:
+    raise RuntimeError("No frames available for inference")
+
+  return all_frames
+
+def runModelInference(input_data: Dict[str, Any]) -> Dict[str, Any]:
+  """
+  Run inference using the loaded model.
+
+  Args:
+    input_data: Dictionary containing images and/or video path
 
-    if not all_frames:
-      raise RuntimeError("No frames available for inference")
+  Returns:
+    Dictionary containing predictions, camera poses, and intrinsics
+  """
+  global loaded_model
+
+  if loaded_model is None:
+    raise RuntimeError("Model not loaded")
+
+  try:
+    all_frames = collectFrames(input_data)
 
     log.info(f"Running inference on {len(all_frames)} total frames")
     return loaded_model.runInference(all_frames)
@@ -139,144 +219,485 @@ def runModelInference(input_data: Dict[str, Any]) -> Dict[str, Any]:
     log.error(f"Model inference failed: {e}")
     raise RuntimeError(f"Model inference failed: {e}")
 
-def createGlbFile(result: Dict[str, Any], mesh_type: str = "mesh") -> str:
-  """Create GLB file from model results and return file path"""
+def writeGlb(scene_3d: 'trimesh.Scene', quantize: bool = False) -> str:
+  """Export a scene to a temporary GLB file and return its path"""
+  temp_glb_fd, temp_glb_path = tempfile.mkstemp(suffix=".glb")
+  try:
+    if quantize:
+      with os.fdopen(temp_glb_fd, "wb") as f:
+        f.write(exportQuantizedGlb(scene_3d))
+    else:
+      os.close(temp_glb_fd)
+      scene_3d.export(temp_glb_path)
+    return temp_glb_path
+  except Exception:
+    if os.path.exists(temp_glb_path):
+      os.unlink(temp_glb_path)
+    raise
+
+def createGlbFiles(result: Dict[str, Any], mesh_type: str = "mesh", lod_levels: int = 1,
+                   quantize: bool = False) -> Tuple[List[str], List[Dict[str, Any]]]:
+  """
+  Create GLB files from model results.
+
+  Args:
+    result: Output of runInference
+    mesh_type: "mesh" or "pointcloud"
+    lod_levels: Number of levels of detail; level 0 is the full resolution
+      output, every further level has about 4x fewer vertices
+    quantize: Store vertex attributes as normalized integers (KHR_mesh_quantization)
+
+  Returns:
+    (GLB file paths, LOD descriptions) ordered from full resolution to coarsest
+  """
   global loaded_model
 
-  temp_glb_fd, temp_glb_path = tempfile.mkstemp(suffix=".glb")
+  glb_paths = []
+  lods = []
 
   try:
     # Use the model's createOutput method
     scene_3d = loaded_model.createOutput(result, output_format=mesh_type)
-    scene_3d.export(temp_glb_path)
-
-    mesh_info = getMeshInfo(scene_3d)
-    log.info(f"GLB created: {mesh_info}")
-
-    return temp_glb_path
+    levels = createLevelsOfDetail(scene_3d, lod_levels) if lod_levels > 1 else [scene_3d]
+
+    for level, lod_scene in enumerate(levels):
+      glb_paths.append(writeGlb(lod_scene, quantize))
+      mesh_info = getMeshInfo(lod_scene)
+      log.info(f"GLB created (LOD {level}): {mesh_info}")
+      lods.append({
+        "level": level,
+        "vertices": mesh_info.get("total_vertices"),
+        "faces": mesh_info.get("total_faces"),
+        "size_bytes": os.path.getsize(glb_paths[-1]),
+        "quantized": quantize,
+      })
+
+    return glb_paths, lods
 
   except Exception as e:
-    if os.path.exists(temp_glb_path):
-      os.unlink(temp_glb_path)
+    for path in glb_paths:
+      if os.path.exists(path):
+        os.unlink(path)
     raise RuntimeError(f"Failed to create GLB file: {e}")
 
-  finally:
-    os.close(temp_glb_fd)
+def streamMultipartResponse(metadata: Dict[str, Any], glb_paths: List[str], delete_file: bool = True) -> Response:
+  """
+  Stream JSON metadata and the GLB files as a multipart/mixed response body.
 
-@app.route("/reconstruction", methods=["POST"])
-def reconstruct3D():
+  The GLB files are read from disk in chunks while they are sent and never
+  held in memory or base64 encoded. Every part carries a Content-Length header
+  so clients can read the parts without scanning for the boundary. GLB parts
+  are named lod<level> and sent from the coarsest level to full resolution,
+  so a client can show a small level of detail before the rest has arrived.
+
+  Args:
+    metadata: JSON serializable response fields (poses, intrinsics, ...)
+    glb_paths: Paths of the GLB files from full resolution to coarsest
+    delete_file: Delete the GLB files once the response has been sent or the
+      client went away
+
+  Returns:
+    Streaming Flask response
   """
-  Perform 3D reconstruction from multipart images OR video
+  boundary = uuid.uuid4().hex
+  metadata_bytes = json.dumps(metadata).encode("utf-8")
+
+  head = (
+    f"--{boundary}\r\n"
+    f"Content-Type: application/json\r\n"
+    f"Content-Length: {len(metadata_bytes)}\r\n\r\n"
+  ).encode("ascii") + metadata_bytes
+  parts = []
+  for level in reversed(range(len(glb_paths))):
+    glb_size = os.path.getsize(glb_paths[level])
+    part_head = (
+      f"\r\n--{boundary}\r\n"
+      f"Content-Type: model/gltf-binary\r\n"
+      f"Content-Disposition: inline; name=\"lod{level}\"\r\n"
+      f"Content-Length: {glb_size}\r\n\r\n"
+    ).encode("ascii")
+    parts.append((part_head, glb_paths[level], glb_size))
+  tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+
+  def generate():
+    try:
+      yield head
+      for part_head, glb_path, _ in parts:
+        yield part_head
+        with open(glb_path, "rb") as f:
+          while True:
+            chunk = f.read(GLB_CHUNK_SIZE)
+            if not chunk:
+              break
+            yield chunk
+      yield tail
+    finally:
+      if delete_file:
+        for glb_path in glb_paths:
+          if os.path.exists(glb_path):
+            os.unlink(glb_path)
+
+  response = Response(generate(), content_type=f"multipart/mixed; boundary={boundary}")
+  content_length = len(head) + len(tail) + sum(len(part_head) + glb_size for part_head, _, glb_size in parts)
+  response.headers["Content-Length"] = str(content_length)
+  return response
+
+def parseReconstructionRequest() -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[Response, int]]]:
+  """
+  Read the multipart form of a reconstruction request.
+
+  Uploaded images are kept as raw bytes and a video is saved to UPLOADS_DIR.
+
+  Returns:
+    (payload, None) for a valid request, or (None, error response)
   """
   global loaded_model, model_name
 
-  start_time = time.time()
-  glb_path = None
+  output_format = request.form.get("output_format", "glb")
+  mesh_type = request.form.get("mesh_type", "mesh")
+  response_format = request.form.get("response_format", "json")
+  use_keyframes = request.form.get("use_keyframes", True)
+  quantize = parseFlag(request.form.get("quantize", False))
+  try:
+    lod_levels = int(request.form.get("lod_levels", 1))
+  except ValueError:
+    return None, (jsonify({"error": f"lod_levels must be an integer between 1 and {MAX_LOD_LEVELS}"}), 400)
+
+  image_files = request.files.getlist("images")
+  video_file = request.files.get("video")
+
+  if (not image_files) and (video_file is None):
+    return None, (jsonify({"error": "Provide images and/or video"}), 400)
+
+  # Validate model availability
+  if loaded_model is None:
+    log.error(f"Model {model_name} not available")
+    return None, (jsonify({"error": f"Model {model_name} not available"}), 503)
+
+  images = None
   video_path = None
 
+  if image_files:
+    images = []
+    for f in image_files:
+      if not f or not f.filename:
+        continue
+      raw = f.read()
+      if not raw:
+        continue
+      # Encoded bytes are passed on as uploaded and decoded once by the model
+      images.append({
+        "filename": secure_filename(f.filename),
+        "data": raw,
+      })
+
+    if not images:
+      return None, (jsonify({"error": "No valid images uploaded"}), 400)
+
+    log.info(f"Received reconstruction request: model={model_name}, images={len(images)}, format={output_format}")
+
+  if video_file:
+    # Video path: save to a temp file and pass the path (recommended for video)
+    uploads_dir = os.getenv("UPLOADS_DIR", "/tmp/uploads")
+    os.makedirs(uploads_dir, exist_ok=True)
+
+    filename = secure_filename(video_file.filename or "video.mp4")
+    # Unique name, several queued jobs may upload videos with the same name
+    video_path = os.path.join(uploads_dir, f"{uuid.uuid4().hex}_{filename}")
+    video_file.save(video_path)
+    log.info(f"Received reconstruction request: model={model_name}, video={filename}, format={output_format}")
+
+  payload = {
+    "output_format": output_format,
+    "mesh_type": mesh_type,
+    "response_format": response_format,
+    "lod_levels": lod_levels,
+    "quantize": quantize,
+    "images": images,
+    "use_keyframes": use_keyframes,
+    "video": video_path,
+  }
+
   try:
-    output_format = request.form.get("output_format", "glb")
-    mesh_type = request.form.get("mesh_type", "mesh")
-    use_keyframes = request.form.get("use_keyframes", True)
-
-    image_files = request.files.getlist("images")
-    video_file = request.files.get("video")
-
-    if (not image_files) and (video_file is None):
-      return jsonify({"error": "Provide images and/or video"}), 400
-
-    # Validate model availability
-    if loaded_model is None:
-      log.error(f"Model {model_name} not available")
-      return jsonify({"error": f"Model {model_name} not available"}), 503
-
-    # Run inference
-    images = None
-
-    if image_files:
-      images = []
-      for f in image_files:
-        if not f or not f.filename:
-          continue
-        raw = f.read()
-        if not raw:
-          continue
-        images.append({
-          "filename": secure_filename(f.filename),
-          "data": base64.b64encode(raw).decode("utf-8"),
-        })
-
-      if not images:
-        return jsonify({"error": "No valid images uploaded"}), 400
-
-      log.info(f"Received reconstruction request: model={model_name}, images={len(images)}, format={output_format}")
-
-    if video_file:
-      # Video path: save to a temp file and pass the path (recommended for video)
-      uploads_dir = os.getenv("UPLOADS_DIR", "/tmp/uploads")
-      os.makedirs(uploads_dir, exist_ok=True)
-
-      filename = secure_filename(video_file.filename or "video.mp4")
-      video_path = os.path.join(uploads_dir, filename)
-      video_file.save(video_path)
-      log.info(f"Received reconstruction request: model={model_name}, video={filename}, format={output_format}")
-
-    inference_payload = {
-      "output_format": output_format,
-      "mesh_type": mesh_type,
-      "images": images,
-      "use_keyframes": use_keyframes,
-      "video": video_path,
-    }
+    validateReconstructionRequest(payload)
+  except ValueError as e:
+    log.error(f"Request validation failed: {e}")
+    removeUploadedVideo(payload)
+    return None, (jsonify({"error": "Request validation failed"}), 400)
+
+  return payload, None
+
+def removeUploadedVideo(payload: Dict[str, Any]) -> None:
+  """Delete the video a request saved to UPLOADS_DIR"""
+  video_path = payload.get("video")
+  if video_path and os.path.exists(video_path):
+    os.unlink(video_path)
+
+def buildResponseMetadata(result: Dict[str, Any], payload: Dict[str, Any], processing_time: float) -> Dict[str, Any]:
+  """Response fields of a finished reconstruction, without the GLB data"""
+  # Build message based on what was provided
+  parts = []
+  images = payload.get("images")
+  if isinstance(images, list) and images:
+    parts.append(f"{len(images)} images")
+  if payload.get("video"):
+    parts.append("video")
+  input_description = " and ".join(parts)
+
+  return {
+    "success": True,
+    "model": model_name,  # Inform client which model was used
+    "camera_poses": result["camera_poses"],  # Camera-to-world transformations (rotation as quaternion [w,x,y,z], translation as [x,y,z])
+    "intrinsics": result["intrinsics"],  # Scaled for original image dimensions
+    "processing_time": processing_time,
+    "message": f"Successfully processed {input_description} with {model_name}"
+  }
 
-    try:
-      validateReconstructionRequest(inference_payload)
-    except ValueError as e:
-      log.error(f"Request validation failed: {e}")
-      return jsonify({"error": "Request validation failed"}), 400
+def resultCacheKey(payload: Dict[str, Any], max_video_frames: Optional[int] = None) -> Optional[str]:
+  """
+  Cache key of a reconstruction request.
 
-    log.info(f"Starting {model_name} inference...")
-    result = runModelInference(inference_payload)
+  Args:
+    payload: Request from parseReconstructionRequest
+    max_video_frames: Video frame target as passed to collectFrames
 
-    # Generate GLB file if requested
-    glb_data = None
-    if output_format == "glb":
-      log.info("Generating GLB file...")
-      glb_path = createGlbFile(result, mesh_type)
+  Returns:
+    Key for result_cache, or None if the cache is disabled
+  """
+  if not result_cache.enabled:
+    return None
+
+  parameters = {
+    "output_format": payload["output_format"],
+    "mesh_type": payload["mesh_type"],
+    "lod_levels": payload.get("lod_levels", 1),
+    "quantize": payload.get("quantize", False),
+    "output": loaded_model.getOutputParameters(),
+  }
+  if payload.get("video"):
+    parameters["use_keyframes"] = bool(useKeyframes(payload))
+    parameters["video_frames"] = max_video_frames or f"time_budget:{os.getenv('GUNICORN_TIMEOUT', '300')}"
+  return computeCacheKey(model_name, parameters, payload.get("images"), payload.get("video"))
+
+def readGlbAsBase64(glb_path: str) -> str:
+  """Read a GLB file and encode it as base64 for JSON responses"""
+  with open(glb_path, "rb") as f:
+    return base64.b64encode(f.read()).decode('utf-8')
+
+def buildJsonResponse(metadata: Dict[str, Any], glb_paths: List[str]) -> Dict[str, Any]:
+  """JSON response with the full resolution GLB in glb_data and coarser levels of detail in lods"""
+  response_data = {**metadata, "glb_data": readGlbAsBase64(glb_paths[0]) if glb_paths else None}
+  if "lods" in metadata:
+    response_data["lods"] = [
+      {**lod, "glb_data": readGlbAsBase64(glb_paths[lod["level"]])} if lod["level"] > 0 else lod
+      for lod in metadata["lods"]
+    ]
+  return response_data
+
+def removeFiles(paths: List[str]) -> None:
+  for path in paths:
+    if path and os.path.exists(path):
+      os.unlink(path)
 
-      # Read GLB file and encode as base64
-      with open(glb_path, "rb") as f:
-        glb_bytes = f.read()
-        glb_data = base64.b64encode(glb_bytes).decode('utf-8')
+@app.route("/reconstruction", methods=["POST"])
+def reconstruct3D():
+  """
+  Perform 3D reconstruction from multipart images OR video
+  """
+  global loaded_model, model_name
 
-      log.info(f"GLB file generated successfully ({len(glb_bytes)} bytes)")
+  start_time = time.time()
+  payload = None
+  glb_paths = []
+
+  try:
+    payload, error_response = parseReconstructionRequest()
+    if error_response:
+      return error_response
+
+    cache_key = resultCacheKey(payload)
+    cached = result_cache.get(cache_key) if cache_key else None
+
+    if cached:
+      glb_paths = cached.glb_paths
+      response_data = {**cached.metadata, "cached": True}
+    else:
+      if not model_lock.acquire(timeout=MODEL_LOCK_TIMEOUT):
+        log.warning(f"Model busy for {MODEL_LOCK_TIMEOUT:.0f} seconds, rejecting request")
+        response = jsonify({"error": "Model is busy with another reconstruction, retry later or submit a job"})
+        response.headers["Retry-After"] = "30"
+        return response, 503
+
+      lods = []
+      try:
+        log.info(f"Starting {model_name} inference...")
+        result = runModelInference(payload)
+
+        # Generate GLB files if requested
+        if payload["output_format"] == "glb":
+          log.info("Generating GLB file...")
+          glb_paths, lods = createGlbFiles(result, payload["mesh_type"], payload["lod_levels"], payload["quantize"])
+          log.info(f"GLB file generated successfully ({os.path.getsize(glb_paths[0])} bytes)")
+      finally:
+        model_lock.release()
+
+      response_data = buildResponseMetadata(result, payload, time.time() - start_time)
+      if len(lods) > 1:
+        response_data["lods"] = lods
+      if cache_key:
+        result_cache.put(cache_key, response_data, glb_paths)
 
     processing_time = time.time() - start_time
+    response_data["processing_time"] = processing_time
     log.info(f"Request completed successfully in {processing_time:.2f} seconds")
 
-    # Build message based on what was provided
-    parts = []
-    if isinstance(images, list) and images:
-      parts.append(f"{len(images)} images")
-    if video_path:
-      parts.append("video")
-    input_description = " and ".join(parts)
-
-    response_data = {
-      "success": True,
-      "model": model_name,  # Inform client which model was used
-      "glb_data": glb_data,
-      "camera_poses": result["camera_poses"],  # Camera-to-world transformations (rotation as quaternion [w,x,y,z], translation as [x,y,z])
-      "intrinsics": result["intrinsics"],  # Scaled for original image dimensions
-      "processing_time": processing_time,
-      "message": f"Successfully processed {input_description} with {model_name}"
-    }
-    return jsonify(response_data), 200
+    if glb_paths and payload["response_format"] == "multipart":
+      # The GLBs are sent as binary parts after the metadata; the response deletes the files
+      response = streamMultipartResponse(response_data, glb_paths)
+      glb_paths = []
+      return response
+
+    return jsonify(buildJsonResponse(response_data, glb_paths)), 200
 
   finally:
     # Clean up temporary files
-    if glb_path and os.path.exists(glb_path):
-      os.unlink(glb_path)
+    removeFiles(glb_paths)
+    if payload:
+      removeUploadedVideo(payload)
+
+def processReconstructionJob(job: ReconstructionJob) -> None:
+  """
+  Run one queued reconstruction on the model of this worker process.
+
+  Video frames are selected by sharpness up to the job's frame target instead
+  of a request timeout budget. The job is checked for cancellation between
+  the stages.
+
+  Args:
+    job: Job with the payload from parseReconstructionRequest
+  """
+  global loaded_model
+
+  payload = job.payload
+  start_time = time.time()
+
+  if loaded_model is None:
+    raise RuntimeError("Model not loaded")
+
+  max_video_frames = payload.get("max_frames") or JOB_MAX_FRAMES
+  cache_key = resultCacheKey(payload, max_video_frames)
+  cached = result_cache.get(cache_key) if cache_key else None
+  if cached:
+    job.glb_paths = cached.glb_paths
+    job.result = {**cached.metadata, "cached": True, "processing_time": time.time() - start_time}
+    return
+
+  job.update("extracting_frames", 0.05)
+  frames = collectFrames(payload, max_video_frames=max_video_frames)
+
+  lods = []
+  job.update("waiting_for_model", 0.15)
+  with model_lock:
+    job.update("inference", 0.2)
+    log.info(f"Job {job.job_id}: running inference on {len(frames)} total frames")
+    result = loaded_model.runInference(frames)
+    del frames
+
+    if payload["output_format"] == "glb":
+      job.update("creating_output", 0.8)
+      job.glb_paths, lods = createGlbFiles(result, payload["mesh_type"], payload["lod_levels"], payload["quantize"])
+
+  job.result = buildResponseMetadata(result, payload, time.time() - start_time)
+  if len(lods) > 1:
+    job.result["lods"] = lods
+  if cache_key:
+    result_cache.put(cache_key, job.result, job.glb_paths)
+
+# The queue owns the uploaded video of a job and deletes it once the job
+# finished, was cancelled while waiting or dropped at shutdown
+job_queue = ReconstructionJobQueue(
+  processReconstructionJob,
+  max_queued=int(os.getenv("JOB_QUEUE_SIZE", "4")),
+  result_ttl=float(os.getenv("JOB_RESULT_TTL", "3600")),
+  release_payload=removeUploadedVideo,
+)
+
+def jobStatus(job: ReconstructionJob) -> Dict[str, Any]:
+  """Job status with the queue position of waiting jobs"""
+  status = job.toDict()
+  if job.state == QUEUED:
+    status["position"] = job_queue.position(job)
+  return status
+
+@app.route("/jobs", methods=["POST"])
+def submitJob():
+  """
+  Queue a reconstruction; accepts the same form fields as /reconstruction
+  plus an optional max_frames target for video frame selection
+  """
+  max_frames = request.form.get("max_frames")
+  if max_frames is not None:
+    try:
+      max_frames = int(max_frames)
+    except ValueError:
+      max_frames = 0
+    if max_frames < 1:
+      return jsonify({"error": "max_frames must be a positive integer"}), 400
+
+  payload, error_response = parseReconstructionRequest()
+  if error_response:
+    return error_response
+  payload["max_frames"] = max_frames
+
+  try:
+    job = job_queue.submit(payload)
+  except QueueFullError as e:
+    removeUploadedVideo(payload)
+    response = jsonify({"error": str(e)})
+    response.headers["Retry-After"] = "30"
+    return response, 429
+
+  response = jsonify(jobStatus(job))
+  response.headers["Location"] = f"/jobs/{job.job_id}"
+  return response, 202
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def getJob(job_id):
+  """Status and progress of a job"""
+  job = job_queue.get(job_id)
+  if job is None:
+    return jsonify({"error": "Job not found"}), 404
+  return jsonify(jobStatus(job)), 200
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+def cancelJob(job_id):
+  """Cancel a queued or running job"""
+  job = job_queue.cancel(job_id)
+  if job is None:
+    return jsonify({"error": "Job not found"}), 404
+  return jsonify(jobStatus(job)), 200
+
+@app.route("/jobs/<job_id>/result", methods=["GET"])
+def getJobResult(job_id):
+  """
+  Result of a finished job in the format of /reconstruction; the
+  response_format query parameter selects json or multipart
+  """
+  job = job_queue.get(job_id)
+  if job is None:
+    return jsonify({"error": "Job not found"}), 404
+  if job.state != SUCCEEDED:
+    return jsonify({**jobStatus(job), "error": job.error or f"Job is {job.state}"}), 409
+
+  response_format = request.args.get("response_format", "json")
+  if response_format not in ("json", "multipart"):
+    return jsonify({"error": "response_format must be 'json' or 'multipart'"}), 400
+
+  if job.glb_paths and response_format == "multipart":
+    # The job keeps the files until its result expires
+    return streamMultipartResponse(job.result, job.glb_paths, delete_file=False)
+
+  return jsonify(buildJsonResponse(job.result, job.glb_paths)), 200
 
 @app.route("/health", methods=["GET"])
 def healthCheck():
@@ -389,8 +810,7 @@ def runProductionServer(cert_file=None, key_file=None):
     "--worker-class", "sync",
     "--timeout", os.getenv("GUNICORN_TIMEOUT", "300"),
     "--keep-alive", "5",
-    "--max-requests", "1000",
-    "--max-requests-jitter", "100",
+    # No --max-requests: recycling the worker would drop queued and running jobs
     "--access-logfile", "-",
     "--error-logfile", "-",
     "--log-level", "info",
@@ -10,13 +10,8 @@ Implementation of the ReconstructionModel interface for MapAnything.
 This model is instantiated directly by the mapanything-service container.
 """
 
-import base64
-import math
-import os
-import subprocess
 import sys
-import tempfile
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Tuple
 
 import numpy as np
 from PIL import Image
@@ -46,6 +41,9 @@ class MapAnythingModel(ReconstructionModel):
   This model is used by the mapanything-service container.
   """
 
+  # Prefix of the <PREFIX>_CPU_SEC_PER_FRAME and <PREFIX>_CUDA_SEC_PER_FRAME settings
+  SEC_PER_FRAME_ENV_PREFIX = "MAPANYTHING"
+
   def __init__(self, device: str = "cpu"):
     super().__init__(
       model_name="mapanything",
@@ -72,7 +70,7 @@ class MapAnythingModel(ReconstructionModel):
     Run MapAnything inference on a LIST of frames.
 
     Args:
-      frames: [{"data": "<base64>"}, ...]  (base64-encoded images)
+      frames: [{"data": <image>}, ...] with base64 strings, encoded image bytes or RGB arrays
 
     Returns:
       Dictionary containing predictions, camera poses, and intrinsics
@@ -86,7 +84,7 @@ class MapAnythingModel(ReconstructionModel):
       pil_images: List[Image.Image] = []
       original_sizes: List[Tuple[int, int]] = []
       for img_data in frames:
-        img_array = self.decodeBase64Image(img_data["data"])
+        img_array = self.decodeImage(img_data["data"])
         # Apply CLAHE for improved contrast
         img_array = self._applyCLAHE(img_array)
         pil_image = Image.fromarray(img_array)
@@ -112,119 +110,6 @@ class MapAnythingModel(ReconstructionModel):
       log.error(f"MapAnything inference (frames) failed: {e}")
       raise RuntimeError(f"MapAnything inference (frames) failed: {e}")
 
-  def _maxFramesForTimeBudget(
-    self,
-    time_budget_seconds: float,
-    overhead: float,
-  ) -> int:
-
-    cpu_sec_per_frame = float(os.getenv("MAPANYTHING_CPU_SEC_PER_FRAME", "10"))
-    cuda_sec_per_frame = float(os.getenv("MAPANYTHING_CUDA_SEC_PER_FRAME", "0.8"))
-    sec_per_frame = cpu_sec_per_frame
-    if self.device.startswith("cuda") and cuda_sec_per_frame:
-      sec_per_frame = cuda_sec_per_frame
-
-    usable = max(0.0, time_budget_seconds - overhead)
-    if usable <= 0:
-      return 0
-
-    # conservative: floor
-    max_frames = int(math.floor(usable / max(1e-6, sec_per_frame)))
-    return max_frames
-
-  # Put in ReconstructionModel base class
-  def _framesFromVideoAsBase64Dicts(
-    self,
-    video_path: str,
-    max_frames: int,
-    use_keyframes: bool = True,
-    sample_every_n: int = 10,
-    jpeg_quality: int = 85,
-    max_side: Optional[int] = 960,
-  ) -> List[Dict[str, Any]]:
-    """
-    Extract frames using ffmpeg and return:
-      [{"data": "<base64-encoded-jpeg>"}, ...]
-
-    Modes:
-      - use_keyframes=True: extract TRUE keyframes (I-frames)
-      - use_keyframes=False: sample every N frames using select filter
-    """
-    if max_frames < 1:
-      return []
-
-    if not os.path.isfile(video_path):
-      raise ValueError(f"Video file not found: {video_path}")
-
-    if sample_every_n < 1:
-      sample_every_n = 1
-
-    # Map jpeg_quality (1..100) -> ffmpeg mjpeg qscale (2..31), where 2 is best quality
-    qscale = int(round(31 - (np.clip(jpeg_quality, 1, 100) / 100.0) * 29))
-    qscale = int(np.clip(qscale, 2, 31))
-
-    vf_parts: List[str] = []
-
-    # If not keyframes, use select filter to sample frames
-    if not use_keyframes:
-      # keep frames where n % sample_every_n == 0
-      vf_parts.append(f"select='not(mod(n\\,{sample_every_n}))'")
-    else:
-      log.info("Using key frames")
-
-    # Optional downscale: keep aspect ratio, cap longest side
-    if max_side is not None and max_side > 0:
-      vf_parts.append(
-        f"scale='if(gte(iw,ih),min(iw,{max_side}),-2)':'if(lt(iw,ih),min(ih,{max_side}),-2)'"
-      )
-
-    vf = ",".join(vf_parts) if vf_parts else None
-
-    frames: List[Dict[str, Any]] = []
-
-    with tempfile.TemporaryDirectory(prefix="frames_") as tmpdir:
-      out_pattern = os.path.join(tmpdir, "frame_%06d.jpg")
-
-      cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-loglevel", "error",
-      ]
-
-      # Keyframes mode: only decode keyframes
-      if use_keyframes:
-        cmd += ["-skip_frame", "nokey"]
-
-      cmd += ["-i", video_path]
-
-      if vf:
-        cmd += ["-vf", vf]
-
-      cmd += [
-        "-vsync", "vfr",
-        "-frames:v", str(max_frames),
-        "-q:v", str(qscale),
-        out_pattern,
-      ]
-
-      try:
-        subprocess.run(cmd, check=True)
-      except FileNotFoundError:
-        raise RuntimeError("ffmpeg not found. Install ffmpeg in the container/host.")
-      except subprocess.CalledProcessError as e:
-        mode = "keyframes" if use_keyframes else f"sample_every_n={sample_every_n}"
-        raise RuntimeError(f"ffmpeg failed extracting frames ({mode}): {e}")
-
-      # Read extracted frames back into base64
-      for i in range(1, max_frames + 1):
-        fpath = os.path.join(tmpdir, f"frame_{i:06d}.jpg")
-        if not os.path.exists(fpath):
-          break
-        with open(fpath, "rb") as f:
-          frames.append({"data": base64.b64encode(f.read()).decode("utf-8")})
-
-    return frames
-
   def getSupportedOutputs(self) -> List[str]:
     """Get supported output formats."""
     return ["mesh", "pointcloud"]
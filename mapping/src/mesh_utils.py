@@ -5,10 +5,13 @@
 
 """
 Mesh and Point Cloud Utilities
-Utilities for converting between meshes and point clouds for 3D reconstruction models.
+Utilities for converting between meshes and point clouds for 3D reconstruction models,
+building levels of detail and writing quantized GLB files.
 """
 
-from typing import Dict, Any
+import json
+import struct
+from typing import Dict, Any, List, Optional, Tuple
 
 import numpy as np
 import trimesh
@@ -116,3 +119,245 @@ def getMeshInfo(scene: 'trimesh.Scene') -> Dict[str, Any]:
       info["has_colors"] = True
 
   return info
+
+# Vertex count reduction between consecutive levels of detail
+LOD_REDUCTION = 4
+# Geometries with fewer vertices are kept unchanged in coarser levels of detail
+LOD_MIN_VERTICES = 64
+
+def _geometryColors(geometry) -> Optional[np.ndarray]:
+  """Per-vertex RGBA colors (uint8) of a mesh or point cloud, None without colors"""
+  visual = getattr(geometry, "visual", None)
+  if visual is None or visual.kind is None:
+    return None
+  if visual.kind == "texture":
+    visual = visual.to_color()
+  colors = np.asarray(visual.vertex_colors)
+  if len(colors) != len(geometry.vertices):
+    return None
+  return colors.astype(np.uint8)
+
+def _clusterLabels(vertices: np.ndarray, cell_size: float) -> Tuple[np.ndarray, int]:
+  """Assign every vertex to the cell of a regular grid; returns labels and the cluster count"""
+  cells = np.floor((vertices - vertices.min(axis=0)) / cell_size).astype(np.int64)
+  dims = cells.max(axis=0) + 1
+  keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+  _, labels = np.unique(keys, return_inverse=True)
+  return labels.reshape(-1), int(labels.max()) + 1
+
+def _clusterCellSize(vertices: np.ndarray, target_count: int) -> float:
+  """Largest grid cell size found that clusters the vertices into at most target_count clusters"""
+  extent = float(np.max(vertices.max(axis=0) - vertices.min(axis=0)))
+  if extent <= 0:
+    return 1.0
+
+  def clusterCount(log_cell_size):
+    return _clusterLabels(vertices, float(np.exp(log_cell_size)))[1]
+
+  # Initial guess for vertices on a surface, then bracket and bisect in log space;
+  # the cluster count falls monotonically with growing cells
+  guess = np.log(extent * np.sqrt(target_count / len(vertices)))
+  low, high = guess - np.log(4), guess + np.log(4)
+  while clusterCount(high) > target_count:
+    low, high = high, high + np.log(4)
+  while low > np.log(extent) - 20 and clusterCount(low) <= target_count:
+    low, high = low - np.log(4), low
+  for _ in range(8):
+    middle = (low + high) / 2
+    if clusterCount(middle) > target_count:
+      low = middle
+    else:
+      high = middle
+  return float(np.exp(high))
+
+def decimateGeometry(geometry, target_vertices: int):
+  """
+  Reduce a mesh or point cloud to about target_vertices vertices by vertex clustering.
+
+  Vertices in the same cell of a regular grid are merged into their mean
+  position and color. For meshes, faces collapsed by the merge and duplicate
+  faces are removed. Point clouds are voxel downsampled the same way.
+
+  Args:
+    geometry: trimesh.Trimesh or trimesh.PointCloud
+    target_vertices: Approximate vertex count of the result
+
+  Returns:
+    Decimated geometry of the same type, or the input if it is already small enough
+  """
+  vertices = np.asarray(geometry.vertices, dtype=np.float64)
+  if len(vertices) <= max(target_vertices, LOD_MIN_VERTICES):
+    return geometry
+
+  labels, count = _clusterLabels(vertices, _clusterCellSize(vertices, target_vertices))
+  weights = np.bincount(labels, minlength=count).astype(np.float64)
+  merged = np.stack([np.bincount(labels, vertices[:, axis], count) for axis in range(3)], axis=1)
+  merged /= weights[:, None]
+
+  colors = _geometryColors(geometry)
+  merged_colors = None
+  if colors is not None:
+    merged_colors = np.stack(
+      [np.bincount(labels, colors[:, channel].astype(np.float64), count) for channel in range(colors.shape[1])],
+      axis=1
+    ) / weights[:, None]
+    merged_colors = np.round(merged_colors).astype(np.uint8)
+
+  if isinstance(geometry, trimesh.PointCloud):
+    return trimesh.PointCloud(vertices=merged, colors=merged_colors)
+
+  faces = labels[np.asarray(geometry.faces)]
+  keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+  faces = faces[keep]
+  # Drop duplicate faces regardless of winding start, keep the first orientation
+  _, unique_index = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+  faces = faces[np.sort(unique_index)]
+
+  return trimesh.Trimesh(vertices=merged, faces=faces, vertex_colors=merged_colors, process=False)
+
+def createLevelsOfDetail(scene: 'trimesh.Scene', levels: int) -> List['trimesh.Scene']:
+  """
+  Build levels of detail of a scene.
+
+  Level 0 is the scene itself; every further level has about LOD_REDUCTION
+  times fewer vertices per geometry than the previous one and is decimated
+  from it. Scene graph transforms are applied to the geometry of the coarser
+  levels.
+
+  Args:
+    scene: Full resolution scene
+    levels: Number of levels including the full resolution one
+
+  Returns:
+    List of scenes from full resolution to coarsest
+  """
+  lods = [scene]
+  geometries = [geometry for geometry in scene.dump() if len(getattr(geometry, "vertices", [])) > 0]
+  for level in range(1, levels):
+    geometries = [decimateGeometry(geometry, len(geometry.vertices) // LOD_REDUCTION) for geometry in geometries]
+    lods.append(trimesh.Scene(geometries))
+    log.info(f"LOD {level}: {getMeshInfo(lods[-1])['total_vertices']} vertices")
+  return lods
+
+# glTF constants
+_GLTF_UNSIGNED_BYTE = 5121
+_GLTF_UNSIGNED_SHORT = 5123
+_GLTF_UNSIGNED_INT = 5125
+_GLTF_ARRAY_BUFFER = 34962
+_GLTF_ELEMENT_ARRAY_BUFFER = 34963
+_GLTF_POINTS = 0
+_GLTF_TRIANGLES = 4
+
+class _GlbBuilder:
+  """Collects buffer views and accessors of a single-buffer glTF"""
+
+  def __init__(self):
+    self.chunks = []
+    self.offset = 0
+    self.buffer_views = []
+    self.accessors = []
+
+  def addAccessor(self, data: np.ndarray, component_type: int, accessor_type: str, count: int,
+                  target: int, normalized: bool = False, byte_stride: Optional[int] = None,
+                  bounds: bool = False) -> int:
+    raw = np.ascontiguousarray(data).tobytes()
+    view = {"buffer": 0, "byteOffset": self.offset, "byteLength": len(raw), "target": target}
+    if byte_stride:
+      view["byteStride"] = byte_stride
+    self.buffer_views.append(view)
+    padding = (-len(raw)) % 4
+    self.chunks.append(raw + b"\0" * padding)
+    self.offset += len(raw) + padding
+
+    accessor = {
+      "bufferView": len(self.buffer_views) - 1,
+      "componentType": component_type,
+      "count": count,
+      "type": accessor_type,
+    }
+    if normalized:
+      accessor["normalized"] = True
+    if bounds:
+      accessor["min"] = data[:, :3].min(axis=0).tolist()
+      accessor["max"] = data[:, :3].max(axis=0).tolist()
+    self.accessors.append(accessor)
+    return len(self.accessors) - 1
+
+def exportQuantizedGlb(scene: 'trimesh.Scene') -> bytes:
+  """
+  Export a scene as GLB with quantized vertex attributes (KHR_mesh_quantization).
+
+  Positions are stored as 16-bit integers relative to the geometry bounds and
+  dequantized by the node transform, colors as normalized 8-bit RGBA. Like
+  trimesh's own GLB export no normals are written. Textures are baked into
+  vertex colors.
+
+  Args:
+    scene: Scene with meshes and/or point clouds
+
+  Returns:
+    GLB file content
+  """
+  builder = _GlbBuilder()
+  meshes, nodes = [], []
+
+  for geometry in scene.dump():
+    vertices = np.asarray(getattr(geometry, "vertices", []), dtype=np.float64)
+    if len(vertices) == 0:
+      continue
+
+    # Positions: unsigned 16 bit per axis, padded to 8 bytes per vertex for alignment
+    origin = vertices.min(axis=0)
+    scale = (vertices.max(axis=0) - origin) / 65535.0
+    scale[scale == 0] = 1.0
+    positions = np.zeros((len(vertices), 4), dtype=np.uint16)
+    positions[:, :3] = np.round((vertices - origin) / scale)
+    attributes = {
+      "POSITION": builder.addAccessor(positions, _GLTF_UNSIGNED_SHORT, "VEC3", len(vertices),
+                                      _GLTF_ARRAY_BUFFER, byte_stride=8, bounds=True)
+    }
+
+
+    colors = _geometryColors(geometry)
+    if colors is not None:
+      rgba = np.full((len(vertices), 4), 255, dtype=np.uint8)
+      rgba[:, :colors.shape[1]] = colors[:, :4]
+      attributes["COLOR_0"] = builder.addAccessor(rgba, _GLTF_UNSIGNED_BYTE, "VEC4", len(vertices),
+                                                  _GLTF_ARRAY_BUFFER, normalized=True)
+
+    primitive = {"attributes": attributes, "mode": _GLTF_POINTS}
+    if isinstance(geometry, trimesh.Trimesh) and len(geometry.faces) > 0:
+      faces = np.asarray(geometry.faces).reshape(-1)
+      if len(vertices) < 65536:
+        primitive["indices"] = builder.addAccessor(faces.astype(np.uint16), _GLTF_UNSIGNED_SHORT, "SCALAR",
+                                                   len(faces), _GLTF_ELEMENT_ARRAY_BUFFER)
+      else:
+        primitive["indices"] = builder.addAccessor(faces.astype(np.uint32), _GLTF_UNSIGNED_INT, "SCALAR",
+                                                   len(faces), _GLTF_ELEMENT_ARRAY_BUFFER)
+      primitive["mode"] = _GLTF_TRIANGLES
+
+    meshes.append({"primitives": [primitive]})
+    nodes.append({"mesh": len(meshes) - 1, "translation": origin.tolist(), "scale": scale.tolist()})
+
+  binary = b"".join(builder.chunks)
+  gltf = {
+    "asset": {"version": "2.0", "generator": "SceneScape mapping"},
+    "extensionsUsed": ["KHR_mesh_quantization"],
+    "extensionsRequired": ["KHR_mesh_quantization"],
+    "scene": 0,
+    "scenes": [{"nodes": list(range(len(nodes)))}],
+    "nodes": nodes,
+    "meshes": meshes,
+    "accessors": builder.accessors,
+    "bufferViews": builder.buffer_views,
+    "buffers": [{"byteLength": len(binary)}],
+  }
+
+  json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+  json_chunk += b" " * ((-len(json_chunk)) % 4)
+  total_length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+  return b"".join([
+    struct.pack("<4sII", b"glTF", 2, total_length),
+    struct.pack("<I4s", len(json_chunk), b"JSON"), json_chunk,
+    struct.pack("<I4s", len(binary), b"BIN\0"), binary,
+  ])
@@ -11,14 +11,20 @@ Note: Model selection is done at build-time. Each service container
 is built with a specific model (MapAnything or VGGT).
 """
 
+import math
+import os
+import subprocess
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import BinaryIO, Dict, Any, List, Optional, Union
 
 import cv2
 import numpy as np
 
 from scene_common import log
 
+# Image data accepted by runInference: base64 string, encoded image bytes or RGB array (H, W, 3)
+ImageData = Union[str, bytes, bytearray, memoryview, np.ndarray]
+
 class ReconstructionModel(ABC):
   """
   Abstract base class for 3D reconstruction models.
@@ -30,6 +36,12 @@ class ReconstructionModel(ABC):
   (mapanything-service, vggt-service) at initialization time.
   """
 
+  # Default inference time per frame, overridden by the <PREFIX>_CPU_SEC_PER_FRAME
+  # and <PREFIX>_CUDA_SEC_PER_FRAME environment variables
+  SEC_PER_FRAME_ENV_PREFIX = "RECONSTRUCTION"
+  CPU_SEC_PER_FRAME = 10.0
+  CUDA_SEC_PER_FRAME = 0.8
+
   def __init__(self, model_name: str, description: str, device: str = "cpu"):
     """
     Initialize the reconstruction model.
@@ -64,7 +76,8 @@ class ReconstructionModel(ABC):
 
     Args:
       images: List of image dictionaries containing:
-        - data: Base64 encoded image data
+        - data: Base64 encoded image, encoded image bytes or decoded RGB array (H, W, 3),
+          see decodeImage
         - (optional) metadata like filename, timestamp, etc.
 
     Returns:
@@ -160,6 +173,43 @@ class ReconstructionModel(ABC):
       "supported_outputs": self.getSupportedOutputs()
     }
 
+  def getOutputParameters(self) -> Dict[str, Any]:
+    """
+    Get the model parameters that shape the output of createOutput.
+
+    Results are cached by these parameters together with the input frames,
+    so models must list every setting that changes the generated scene.
+
+    Returns:
+      Dictionary of output parameters (e.g. voxel size)
+    """
+    return {}
+
+  def _maxFramesForTimeBudget(self, time_budget_seconds: float, overhead: float) -> int:
+    """
+    Number of frames the model processes within a time budget.
+
+    Args:
+      time_budget_seconds: Total time available, e.g. the Gunicorn timeout
+      overhead: Seconds reserved for decoding, meshing and the response
+
+    Returns:
+      Maximum number of frames, 0 if the overhead exceeds the budget
+    """
+    prefix = self.SEC_PER_FRAME_ENV_PREFIX
+    cpu_sec_per_frame = float(os.getenv(f"{prefix}_CPU_SEC_PER_FRAME", self.CPU_SEC_PER_FRAME))
+    cuda_sec_per_frame = float(os.getenv(f"{prefix}_CUDA_SEC_PER_FRAME", self.CUDA_SEC_PER_FRAME))
+    sec_per_frame = cpu_sec_per_frame
+    if self.device.startswith("cuda") and cuda_sec_per_frame:
+      sec_per_frame = cuda_sec_per_frame
+
+    usable = max(0.0, time_budget_seconds - overhead)
+    if usable <= 0:
+      return 0
+
+    # conservative: floor
+    return int(math.floor(usable / max(1e-6, sec_per_frame)))
+
   def validateImages(self, images: List[Dict[str, Any]]) -> None:
     """
     Validate input image data structure.
@@ -178,15 +228,44 @@ class ReconstructionModel(ABC):
         raise ValueError(f"Image {i} must be a dictionary")
       if 'data' not in img:
         raise ValueError(f"Image {i} missing required field: data")
-      if not isinstance(img['data'], str):
-        raise ValueError(f"Image {i} data must be a base64 string")
+      data = img['data']
+      if isinstance(data, np.ndarray):
+        if data.ndim != 3 or data.shape[2] != 3:
+          raise ValueError(f"Image {i} array must have shape (H, W, 3)")
+      elif not isinstance(data, (str, bytes, bytearray, memoryview)):
+        raise ValueError(f"Image {i} data must be a base64 string, image bytes or an RGB array")
+
+  def decodeImage(self, image_data: ImageData) -> np.ndarray:
+    """
+    Decode image data of any supported kind to numpy array.
 
-  def decodeBase64Image(self, image_data: str) -> np.ndarray:
+    Decoded arrays are passed through without a copy, encoded bytes are decoded
+    directly, and only strings go through base64 decoding.
+
+    Args:
+      image_data: Base64 encoded image string, encoded image bytes (JPEG, PNG, ...)
+        or RGB array (H, W, 3)
+
+    Returns:
+      Image as numpy array (H, W, 3) in RGB format
+
+    Raises:
+      ValueError: If image decoding fails
     """
-    Decode base64 image data to numpy array.
+    if isinstance(image_data, np.ndarray):
+      if image_data.dtype != np.uint8:
+        image_data = np.clip(image_data, 0, 255).astype(np.uint8)
+      return image_data
+    if isinstance(image_data, str):
+      return self.decodeBase64Image(image_data)
+    return self.decodeImageBytes(image_data)
+
+  def decodeImageBytes(self, img_bytes: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """
+    Decode encoded image bytes to numpy array.
 
     Args:
-      image_data: Base64 encoded image string
+      img_bytes: Encoded image (JPEG, PNG, ...)
 
     Returns:
       Image as numpy array (H, W, 3) in RGB format
@@ -194,18 +273,10 @@ class ReconstructionModel(ABC):
     Raises:
       ValueError: If image decoding fails
     """
-    import base64
     import io
     from PIL import Image
 
     try:
-      # Remove data URL prefix if present
-      if image_data.startswith('data:image'):
-        image_data = image_data.split(',')[1]
-
-      # Decode base64
-      img_bytes = base64.b64decode(image_data)
-
       # Convert to PIL Image
       pil_image = Image.open(io.BytesIO(img_bytes))
 
@@ -221,6 +292,218 @@ class ReconstructionModel(ABC):
     except Exception as e:
       raise ValueError(f"Failed to decode image data: {e}")
 
+  def decodeBase64Image(self, image_data: str) -> np.ndarray:
+    """
+    Decode base64 image data to numpy array.
+
+    Args:
+      image_data: Base64 encoded image string
+
+    Returns:
+      Image as numpy array (H, W, 3) in RGB format
+
+    Raises:
+      ValueError: If image decoding fails
+    """
+    import base64
+
+    try:
+      # Remove data URL prefix if present
+      if image_data.startswith('data:image'):
+        image_data = image_data.split(',')[1]
+
+      # Decode base64
+      img_bytes = base64.b64decode(image_data)
+
+    except Exception as e:
+      raise ValueError(f"Failed to decode image data: {e}")
+
+    return self.decodeImageBytes(img_bytes)
+
+  @staticmethod
+  def framesFromVideo(
+    video_path: str,
+    max_frames: int,
+    use_keyframes: bool = True,
+    sample_every_n: int = 10,
+    max_side: Optional[int] = 960,
+  ) -> List[Dict[str, Any]]:
+    """
+    Extract frames with ffmpeg, streamed as raw RGB through its stdout pipe.
+
+    Frames are never written to disk or re-encoded; each one is read into its
+    own array straight from the pipe.
+
+    Modes:
+      - use_keyframes=True: extract TRUE keyframes (I-frames)
+      - use_keyframes=False: sample every N frames using select filter
+
+    Args:
+      video_path: Path to the video file
+      max_frames: Maximum number of frames to extract
+      use_keyframes: Extract keyframes only instead of sampling every N frames
+      sample_every_n: Sampling step when not using keyframes
+      max_side: Cap for the longest image side, None to keep the video resolution
+
+    Returns:
+      [{"data": <RGB array (H, W, 3)>}, ...]
+
+    Raises:
+      ValueError: If the video file does not exist
+      RuntimeError: If ffmpeg is missing or fails
+    """
+    if max_frames < 1:
+      return []
+
+    if not os.path.isfile(video_path):
+      raise ValueError(f"Video file not found: {video_path}")
+
+    if sample_every_n < 1:
+      sample_every_n = 1
+
+    vf_parts: List[str] = []
+
+    # If not keyframes, use select filter to sample frames
+    if not use_keyframes:
+      # keep frames where n % sample_every_n == 0
+      vf_parts.append(f"select='not(mod(n\\,{sample_every_n}))'")
+    else:
+      log.info("Using key frames")
+
+    # Optional downscale: keep aspect ratio, cap longest side
+    if max_side is not None and max_side > 0:
+      vf_parts.append(
+        f"scale='if(gte(iw,ih),min(iw,{max_side}),-2)':'if(lt(iw,ih),min(ih,{max_side}),-2)'"
+      )
+
+    cmd = [
+      "ffmpeg",
+      "-hide_banner",
+      "-loglevel", "error",
+    ]
+
+    # Keyframes mode: only decode keyframes
+    if use_keyframes:
+      cmd += ["-skip_frame", "nokey"]
+
+    cmd += ["-i", video_path]
+
+    if vf_parts:
+      cmd += ["-vf", ",".join(vf_parts)]
+
+    # PPM frames carry their own size, so no probing is needed for rotated or scaled videos
+    cmd += [
+      "-vsync", "vfr",
+      "-frames:v", str(max_frames),
+      "-f", "image2pipe",
+      "-c:v", "ppm",
+      "pipe:1",
+    ]
+
+    try:
+      process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+      raise RuntimeError("ffmpeg not found. Install ffmpeg in the container/host.")
+
+    frames: List[Dict[str, Any]] = []
+    try:
+      while len(frames) < max_frames:
+        frame = ReconstructionModel._readPpmFrame(process.stdout)
+        if frame is None:
+          break
+        frames.append({"data": frame})
+      _, stderr = process.communicate()
+    finally:
+      if process.poll() is None:
+        process.kill()
+        process.wait()
+
+    if process.returncode != 0:
+      mode = "keyframes" if use_keyframes else f"sample_every_n={sample_every_n}"
+      raise RuntimeError(f"ffmpeg failed extracting frames ({mode}): {stderr.decode(errors='replace').strip()}")
+
+    return frames
+
+  @staticmethod
+  def _readPpmFrame(stream: BinaryIO) -> Optional[np.ndarray]:
+    """
+    Read one binary PPM (P6) image from a stream.
+
+    Args:
+      stream: Binary stream positioned at the start of a PPM image
+
+    Returns:
+      RGB array (H, W, 3), or None at the end of the stream
+    """
+    magic = stream.readline()
+    if not magic:
+      return None
+    if magic.strip() != b"P6":
+      raise RuntimeError(f"Unexpected frame header from ffmpeg: {magic[:16]!r}")
+    width, height = (int(value) for value in stream.readline().split())
+    if int(stream.readline()) != 255:
+      raise RuntimeError("Only 8-bit frames are supported")
+
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    buffer = memoryview(frame).cast("B")
+    filled = 0
+    while filled < len(buffer):
+      count = stream.readinto(buffer[filled:])
+      if not count:
+        return None
+      filled += count
+    return frame
+
+  @staticmethod
+  def frameSharpness(img_array: np.ndarray) -> float:
+    """
+    Sharpness score of an image as the variance of its Laplacian.
+
+    Blurred frames (motion blur, out of focus) score low.
+
+    Args:
+      img_array: RGB array (H, W, 3)
+
+    Returns:
+      Sharpness score, higher is sharper
+    """
+    gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+    # Half resolution is enough to rank frames and keeps scoring cheap for many candidates
+    gray = cv2.resize(gray, (max(1, gray.shape[1] // 2), max(1, gray.shape[0] // 2)),
+                      interpolation=cv2.INTER_AREA)
+    return float(cv2.Laplacian(gray, cv2.CV_32F).var())
+
+  def selectFrames(self, frames: List[Dict[str, Any]], max_frames: int) -> List[Dict[str, Any]]:
+    """
+    Select up to max_frames frames for reconstruction by image quality.
+
+    The frames are split into max_frames consecutive segments and the sharpest
+    frame of every segment is kept, so the selection still covers the whole
+    sequence while blurred frames are skipped.
+
+    Args:
+      frames: [{"data": <image>}, ...] in capture order
+      max_frames: Number of frames to select
+
+    Returns:
+      Selected frames in capture order, with decoded RGB arrays as data
+    """
+    if max_frames < 1:
+      return []
+    if len(frames) <= max_frames:
+      return frames
+
+    decoded = [{**frame, "data": self.decodeImage(frame["data"])} for frame in frames]
+    scores = [self.frameSharpness(frame["data"]) for frame in decoded]
+    bounds = np.linspace(0, len(decoded), max_frames + 1).astype(int)
+    selected = [
+      decoded[start + int(np.argmax(scores[start:end]))]
+      for start, end in zip(bounds[:-1], bounds[1:])
+      if end > start
+    ]
+    log.info(f"Selected {len(selected)} of {len(frames)} frames by sharpness")
+    return selected
+
   def _applyCLAHE(self, img_array: np.ndarray, clip_limit: float = 2.0, tile_grid_size: tuple = (8, 8)) -> np.ndarray:
     """
     Apply Contrast Limited Adaptive Histogram Equalization (CLAHE) to improve image contrast.
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Asynchronous reconstruction jobs
+Bounded job queue that runs reconstructions outside of the HTTP request.
+
+A single runner thread per process executes the jobs one after another on the
+model instance of that process, so a worker process never loads a second model
+and a reconstruction is no longer limited by the HTTP request timeout. Clients
+submit a job, poll its state and progress, fetch the result or cancel it.
+"""
+
+import collections
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from scene_common import log
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class QueueFullError(RuntimeError):
+  """Raised when a job is submitted while the queue is at capacity"""
+
+
+class JobCancelledError(RuntimeError):
+  """Raised inside a running job at the next checkpoint after it was cancelled"""
+
+
+class ReconstructionJob:
+  """
+  State of one reconstruction job.
+
+  The runner updates stage and progress while the job executes; a cancelled
+  running job stops at its next checkpoint.
+  """
+
+  def __init__(self, payload: Dict[str, Any]):
+    self.job_id = uuid.uuid4().hex
+    self.payload = payload
+    self.state = QUEUED
+    self.stage = QUEUED
+    self.progress = 0.0
+    self.error = None
+    self.result = None
+    self.glb_paths = []
+    self.created_at = time.time()
+    self.started_at = None
+    self.finished_at = None
+    self._cancel_event = threading.Event()
+
+  @property
+  def cancel_requested(self) -> bool:
+    return self._cancel_event.is_set()
+
+  def update(self, stage: str, progress: float) -> None:
+    """
+    Record the current processing stage and raise if the job was cancelled.
+
+    Args:
+      stage: Short name of the stage the job enters
+      progress: Overall progress in the range [0, 1]
+
+    Raises:
+      JobCancelledError: If cancellation was requested
+    """
+    self.checkCancelled()
+    self.stage = stage
+    self.progress = max(self.progress, min(1.0, progress))
+
+  def checkCancelled(self) -> None:
+    """
+    Raises:
+      JobCancelledError: If cancellation was requested
+    """
+    if self._cancel_event.is_set():
+      raise JobCancelledError(f"Job {self.job_id} was cancelled")
+
+  def toDict(self) -> Dict[str, Any]:
+    """Job status as returned by the API"""
+    status = {
+      "job_id": self.job_id,
+      "status": self.state,
+      "stage": self.stage,
+      "progress": round(self.progress, 3),
+      "created_at": self.created_at,
+      "started_at": self.started_at,
+      "finished_at": self.finished_at,
+    }
+    if self.error:
+      status["error"] = self.error
+    if self.state == RUNNING and self.cancel_requested:
+      status["cancel_requested"] = True
+    return status
+
+
+class ReconstructionJobQueue:
+  """
+  Bounded FIFO of reconstruction jobs executed by a single runner thread.
+
+  The runner thread is started lazily by the first submitted job, so a queue
+  created at import time works in forked Gunicorn workers. Finished jobs are
+  kept for result_ttl seconds, after which they are dropped together with
+  their GLB files.
+  """
+
+  def __init__(
+    self,
+    process_job: Callable[[ReconstructionJob], None],
+    max_queued: int = 4,
+    result_ttl: float = 3600.0,
+    release_payload: Optional[Callable[[Dict[str, Any]], None]] = None,
+  ):
+    """
+    Args:
+      process_job: Callable running one job; it stores result and glb_paths on the
+        job and calls job.update() between stages so cancellation can take effect
+      max_queued: Maximum number of jobs waiting to run
+      result_ttl: Seconds a finished job and its result are kept
+      release_payload: Callable freeing what a payload holds (e.g. uploaded files);
+        called once for every job when it finishes, also if it never ran
+    """
+    self.process_job = process_job
+    self.release_payload = release_payload
+    self.max_queued = max_queued
+    self.result_ttl = result_ttl
+    self.jobs: Dict[str, ReconstructionJob] = {}
+    self._pending = collections.deque()
+    self._cond = threading.Condition()
+    self._runner = None
+    self._stopped = False
+
+  def submit(self, payload: Dict[str, Any]) -> ReconstructionJob:
+    """
+    Add a job to the queue.
+
+    Args:
+      payload: Reconstruction request handed to process_job
+
+    Returns:
+      The queued job
+
+    Raises:
+      QueueFullError: If max_queued jobs are already waiting
+    """
+    with self._cond:
+      self._expireFinished()
+      if len(self._pending) >= self.max_queued:
+        raise QueueFullError(f"Job queue is full ({self.max_queued} jobs waiting)")
+
+      job = ReconstructionJob(payload)
+      self.jobs[job.job_id] = job
+      self._pending.append(job)
+      self._ensureRunner()
+      self._cond.notify()
+
+    log.info(f"Queued reconstruction job {job.job_id} ({len(self._pending)} waiting)")
+    return job
+
+  def get(self, job_id: str) -> Optional[ReconstructionJob]:
+    with self._cond:
+      self._expireFinished()
+      return self.jobs.get(job_id)
+
+  def position(self, job: ReconstructionJob) -> int:
+    """Number of jobs ahead of a queued job, 0 if it is not waiting"""
+    with self._cond:
+      try:
+        return self._pending.index(job)
+      except ValueError:
+        return 0
+
+  def cancel(self, job_id: str) -> Optional[ReconstructionJob]:
+    """
+    Cancel a job. A queued job is cancelled immediately, a running job stops at
+    its next checkpoint and finished jobs are left unchanged.
+
+    Args:
+      job_id: Id of the job to cancel
+
+    Returns:
+      The job, or None if it is unknown
+    """
+    with self._cond:
+      job = self.jobs.get(job_id)
+      if job is None:
+        return None
+      if job.state == QUEUED:
+        self._pending.remove(job)
+        self._finish(job, CANCELLED)
+      elif job.state == RUNNING:
+        job._cancel_event.set()
+    return job
+
+  def shutdown(self, timeout: Optional[float] = None) -> None:
+    """Cancel all waiting jobs and stop the runner after the current job"""
+    with self._cond:
+      self._stopped = True
+      while self._pending:
+        self._finish(self._pending.popleft(), CANCELLED)
+      for job in self.jobs.values():
+        if job.state == RUNNING:
+          job._cancel_event.set()
+      self._cond.notify_all()
+      runner = self._runner
+    if runner is not None:
+      runner.join(timeout)
+
+  def _ensureRunner(self) -> None:
+    if self._runner is None or not self._runner.is_alive():
+      self._runner = threading.Thread(target=self._run, name="ReconstructionJobRunner", daemon=True)
+      self._runner.start()
+
+  def _finish(self, job: ReconstructionJob, state: str, error: Optional[str] = None) -> None:
+    job.state = state
+    job.stage = state
+    job.error = error
+    job.finished_at = time.time()
+    if state == SUCCEEDED:
+      job.progress = 1.0
+    if job.payload is not None and self.release_payload is not None:
+      try:
+        self.release_payload(job.payload)
+      except Exception as e:
+        log.error(f"Failed to release the payload of job {job.job_id}: {e}")
+    job.payload = None
+    self._cond.notify_all()
+
+  def _expireFinished(self) -> None:
+    now = time.time()
+    expired = [job for job in self.jobs.values()
+               if job.state in FINISHED_STATES and now - job.finished_at > self.result_ttl]
+    for job in expired:
+      del self.jobs[job.job_id]
+      self._removeResult(job)
+
+  @staticmethod
+  def _removeResult(job: ReconstructionJob) -> None:
+    for glb_path in job.glb_paths:
+      if os.path.exists(glb_path):
+        os.unlink(glb_path)
+    job.glb_paths = []
+    job.result = None
+
+  def _run(self) -> None:
+    while True:
+      with self._cond:
+        while not self._pending and not self._stopped:
+          self._cond.wait()
+        if self._stopped:
+          return
+        job = self._pending.popleft()
+        job.state = RUNNING
+        job.stage = RUNNING
+        job.started_at = time.time()
+
+      log.info(f"Running reconstruction job {job.job_id}")
+      state, error = SUCCEEDED, None
+      try:
+        self.process_job(job)
+        job.checkCancelled()
+      except JobCancelledError:
+        state = CANCELLED
+      except Exception as e:
+        log.error(f"Reconstruction job {job.job_id} failed: {e}")
+        state, error = FAILED, str(e)
+
+      with self._cond:
+        if state != SUCCEEDED:
+          self._removeResult(job)
+        self._finish(job, state, error)
+      log.info(f"Reconstruction job {job.job_id} {state} in {job.finished_at - job.started_at:.2f} seconds")
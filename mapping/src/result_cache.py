@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Content-addressed reconstruction result cache
+On-disk cache of reconstruction results keyed by a hash of the input frames,
+the model and the output parameters.
+
+Retrying or regenerating a scene mesh sends the same camera snapshots again;
+with the cache such a request returns the stored GLB, camera poses and
+intrinsics instead of running inference and meshing again. The cache is
+bounded in size and evicts the least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from scene_common import log
+
+# Bump when the stored result format or the reconstruction pipeline changes
+CACHE_FORMAT_VERSION = 1
+
+METADATA_FILE = "result.json"
+GLB_FILE = "result.glb"
+# Coarser levels of detail are stored next to the full resolution GLB
+LOD_GLB_FILE = "result_lod{level}.glb"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def computeCacheKey(
+  model_name: str,
+  parameters: Dict[str, Any],
+  images: Optional[Iterable[Dict[str, Any]]] = None,
+  video_path: Optional[str] = None,
+) -> str:
+  """
+  Hash the inputs that determine a reconstruction result.
+
+  Args:
+    model_name: Name of the reconstruction model
+    parameters: Output and frame selection parameters (mesh_type, voxel size, ...)
+    images: Uploaded frames as [{"data": <base64 string or image bytes>}, ...] in order
+    video_path: Path of an uploaded video
+
+  Returns:
+    Hex digest identifying the result
+  """
+  digest = hashlib.sha256()
+  header = {"version": CACHE_FORMAT_VERSION, "model": model_name, "parameters": parameters}
+  digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+
+  for image in images or []:
+    data = image["data"]
+    if isinstance(data, str):
+      data = data.encode("utf-8")
+    # Length prefix keeps frame boundaries part of the key
+    digest.update(b"image:%d:" % len(data))
+    digest.update(data)
+
+  if video_path:
+    digest.update(b"video:%d:" % os.path.getsize(video_path))
+    with open(video_path, "rb") as f:
+      while True:
+        chunk = f.read(HASH_CHUNK_SIZE)
+        if not chunk:
+          break
+        digest.update(chunk)
+
+  return digest.hexdigest()
+
+
+class CachedResult:
+  """Result read from the cache; glb_paths are private copies owned by the caller"""
+
+  def __init__(self, metadata: Dict[str, Any], glb_paths: List[str]):
+    self.metadata = metadata
+    self.glb_paths = glb_paths
+
+  @property
+  def glb_path(self) -> Optional[str]:
+    """Full resolution GLB"""
+    return self.glb_paths[0] if self.glb_paths else None
+
+
+class ReconstructionCache:
+  """
+  Size-bounded LRU cache of reconstruction results in a directory.
+
+  Every entry is a directory named by its cache key that holds the JSON
+  metadata and the GLB file. Entries are written to a temporary directory and
+  renamed into place, so readers never see partial entries. The modification
+  time of an entry directory is its last use.
+  """
+
+  def __init__(self, cache_dir: str, max_bytes: int):
+    """
+    Args:
+      cache_dir: Directory holding the cache entries
+      max_bytes: Maximum total size of the cached files, 0 disables the cache
+    """
+    self.cache_dir = cache_dir
+    self.max_bytes = max_bytes
+    self._lock = threading.Lock()
+
+  @property
+  def enabled(self) -> bool:
+    return self.max_bytes > 0
+
+  def get(self, key: str) -> Optional[CachedResult]:
+    """
+    Look up a result and mark it as recently used.
+
+    Args:
+      key: Cache key from computeCacheKey
+
+    Returns:
+      Cached result with private copies of the GLB files, or None on a miss
+    """
+    if not self.enabled:
+      return None
+
+    entry_dir = os.path.join(self.cache_dir, key)
+    glb_paths = []
+    try:
+      with open(os.path.join(entry_dir, METADATA_FILE), "r") as f:
+        metadata = json.load(f)
+      for level, name in enumerate(self._glbFileNames(len(metadata.get("lods", [])))):
+        cached_glb = os.path.join(entry_dir, name)
+        if not os.path.exists(cached_glb):
+          if level > 0:
+            raise ValueError(f"missing {name}")
+          break
+        glb_paths.append(self._exportFile(cached_glb))
+      os.utime(entry_dir)
+    except FileNotFoundError:
+      self._removeFiles(glb_paths)
+      return None
+    except (OSError, ValueError) as e:
+      log.warning(f"Dropping unreadable cache entry {key}: {e}")
+      self._removeFiles(glb_paths)
+      shutil.rmtree(entry_dir, ignore_errors=True)
+      return None
+
+    log.info(f"Reconstruction cache hit {key[:12]}")
+    return CachedResult(metadata, glb_paths)
+
+  def put(self, key: str, metadata: Dict[str, Any], glb_paths: Optional[List[str]] = None) -> None:
+    """
+    Store a result; existing entries with the same key are kept.
+
+    Args:
+      key: Cache key from computeCacheKey
+      metadata: JSON serializable result fields (camera poses, intrinsics, ...)
+      glb_paths: GLB files of the result from full resolution to coarsest level
+        of detail, copied into the cache
+    """
+    if not self.enabled:
+      return
+
+    try:
+      os.makedirs(self.cache_dir, exist_ok=True)
+      entry_dir = os.path.join(self.cache_dir, key)
+      if os.path.exists(entry_dir):
+        os.utime(entry_dir)
+        return
+
+      staging_dir = tempfile.mkdtemp(prefix=".staging_", dir=self.cache_dir)
+      try:
+        with open(os.path.join(staging_dir, METADATA_FILE), "w") as f:
+          json.dump(metadata, f)
+        glb_paths = glb_paths or []
+        for name, glb_path in zip(self._glbFileNames(len(glb_paths)), glb_paths):
+          self._linkOrCopy(glb_path, os.path.join(staging_dir, name))
+        os.rename(staging_dir, entry_dir)
+      except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        if not os.path.exists(entry_dir):
+          raise
+
+    except OSError as e:
+      log.warning(f"Failed to cache reconstruction result {key}: {e}")
+      return
+
+    self.evict()
+
+  def evict(self) -> None:
+    """Remove least recently used entries until the cache fits into max_bytes"""
+    with self._lock:
+      entries = []
+      total = 0
+      try:
+        names = os.listdir(self.cache_dir)
+      except FileNotFoundError:
+        return
+
+      for name in names:
+        if name.startswith("."):
+          continue
+        entry_dir = os.path.join(self.cache_dir, name)
+        try:
+          size = sum(entry.stat().st_size for entry in os.scandir(entry_dir))
+          entries.append((os.stat(entry_dir).st_mtime, size, entry_dir))
+        except OSError:
+          continue
+        total += size
+
+      entries.sort()
+      for _, size, entry_dir in entries:
+        if total <= self.max_bytes:
+          break
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total -= size
+        log.info(f"Evicted reconstruction cache entry {os.path.basename(entry_dir)[:12]} ({size} bytes)")
+
+  @staticmethod
+  def _glbFileNames(count: int) -> List[str]:
+    """File names of the full resolution GLB and count - 1 levels of detail"""
+    return [GLB_FILE] + [LOD_GLB_FILE.format(level=level) for level in range(1, count)]
+
+  @staticmethod
+  def _removeFiles(paths: List[str]) -> None:
+    for path in paths:
+      if os.path.exists(path):
+        os.unlink(path)
+
+  def _exportFile(self, path: str) -> str:
+    """Give the caller its own link or copy, so eviction cannot remove a file in use"""
+    fd, export_path = tempfile.mkstemp(suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    os.unlink(export_path)
+    self._linkOrCopy(path, export_path)
+    return export_path
+
+  @staticmethod
+  def _linkOrCopy(source: str, destination: str) -> None:
+    try:
+      os.link(source, destination)
+    except OSError:
+      shutil.copyfile(source, destination)
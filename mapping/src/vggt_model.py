@@ -40,6 +40,12 @@ class VGGTModel(ReconstructionModel):
   This model is used by the vggt-service container.
   """
 
+  # Point cloud downsampling and floor flattening of createOutput
+  VOXEL_SIZE = 0.01
+  FLOOR_MARGIN = 0.02
+  # Prefix of the <PREFIX>_CPU_SEC_PER_FRAME and <PREFIX>_CUDA_SEC_PER_FRAME settings
+  SEC_PER_FRAME_ENV_PREFIX = "VGGT"
+
   def __init__(self, device: str = "cpu"):
     super().__init__(
       model_name="vggt",
@@ -84,7 +90,8 @@ class VGGTModel(ReconstructionModel):
     camera poses (camera-to-world) for API consistency.
 
     Args:
-      images: List of image dictionaries with 'data' field containing base64 images
+      images: List of image dictionaries with 'data' field containing base64 strings,
+        encoded image bytes or RGB arrays
 
     Returns:
       Dictionary containing predictions, camera poses, and intrinsics
@@ -100,7 +107,7 @@ class VGGTModel(ReconstructionModel):
       original_sizes = []
 
       for img_data in images:
-        img_array = self.decodeBase64Image(img_data["data"])
+        img_array = self.decodeImage(img_data["data"])
         # Apply CLAHE for improved contrast
         img_array = self._applyCLAHE(img_array)
         pil_image = Image.fromarray(img_array)
@@ -204,7 +211,11 @@ class VGGTModel(ReconstructionModel):
 
     return scaled_intrinsics
 
-  def createOutput(self, result: Dict[str, Any], output_format: str = None, voxel_size: float = 0.01, floor_margin: float = 0.02) -> 'trimesh.Scene':
+  def getOutputParameters(self) -> Dict[str, Any]:
+    """Get the parameters that shape the VGGT output."""
+    return {"voxel_size": self.VOXEL_SIZE, "floor_margin": self.FLOOR_MARGIN}
+
+  def createOutput(self, result: Dict[str, Any], output_format: str = None, voxel_size: float = VOXEL_SIZE, floor_margin: float = FLOOR_MARGIN) -> 'trimesh.Scene':
     """
     Create 3D output scene from VGGT results.
 
@@ -155,6 +155,18 @@ def flask_test_client(mock_model):
         yield client
 
 
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path):
+  """Replace the service result cache with a disabled cache in a per-test directory"""
+  from unittest.mock import patch
+  import api_service_base
+  from result_cache import ReconstructionCache
+
+  cache = ReconstructionCache(str(tmp_path / "reconstruction_cache"), 0)
+  with patch.object(api_service_base, "result_cache", cache):
+    yield cache
+
+
 @pytest.fixture(scope="session")
 def temp_test_dir(tmp_path_factory):
   """Fixture providing temporary directory for test files"""
@@ -9,9 +9,11 @@ Tests the Flask API endpoints and request validation.
 """
 
 import pytest
+import numpy as np
 import json
 import base64
 import io
+import os
 import sys
 from pathlib import Path
 from PIL import Image
@@ -20,6 +22,8 @@ from unittest.mock import Mock, patch, MagicMock
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+from model_interface import ReconstructionModel
+
 
 class TestAPIService:
   """Test cases for API service endpoints"""
@@ -161,6 +165,127 @@ class TestAPIService:
         data = json.loads(response.data)
         assert 'glb_data' in data
 
+  def test_reconstruction_with_multipart_glb_response(self, client):
+    """Test GLB is streamed as a binary part after the JSON metadata"""
+    import trimesh
+
+    glb_bytes = b"glTF" + bytes(range(256)) * 8
+    created_paths = []
+
+    def exportGlb(path):
+      created_paths.append(path)
+      with open(path, "wb") as f:
+        f.write(glb_bytes)
+
+    mock_scene = Mock(spec=trimesh.Scene)
+    mock_scene.export = Mock(side_effect=exportGlb)
+
+    with patch('api_service_base.loaded_model') as mock_model:
+      mock_model.is_loaded = True
+      mock_model.runInference = Mock(return_value={
+        "predictions": {},
+        "camera_poses": [
+          {"rotation": [1.0, 0.0, 0.0, 0.0], "translation": [0.0, 0.0, 0.0]}
+        ],
+        "intrinsics": [[[1000, 0, 500], [0, 1000, 500], [0, 0, 1]]]
+      })
+      mock_model.createOutput = Mock(return_value=mock_scene)
+
+      with patch('api_service_base.getMeshInfo', return_value={}):
+        img_bytes = base64.b64decode(self.create_test_image_base64())
+        data = {
+          'output_format': 'glb',
+          'response_format': 'multipart',
+          'images': [(io.BytesIO(img_bytes), 'test.jpg')]
+        }
+        response = client.post('/reconstruction', data=data, content_type='multipart/form-data')
+        body = response.get_data()
+
+    assert response.status_code == 200
+    assert response.mimetype == 'multipart/mixed'
+    assert int(response.headers['Content-Length']) == len(body)
+
+    boundary = response.mimetype_params['boundary'].encode()
+    parts = body.split(b"--" + boundary)
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+
+    metadata_headers, metadata = parts[1].strip(b"\r\n").split(b"\r\n\r\n", 1)
+    assert b"Content-Type: application/json" in metadata_headers
+    metadata = json.loads(metadata)
+    assert metadata['success'] is True
+    assert 'glb_data' not in metadata
+    assert len(metadata['camera_poses']) == 1
+
+    glb_headers, glb_part = parts[2][2:-2].split(b"\r\n\r\n", 1)
+    assert b"Content-Type: model/gltf-binary" in glb_headers
+    assert f"Content-Length: {len(glb_bytes)}".encode() in glb_headers
+    assert glb_part == glb_bytes
+
+    # The temporary GLB file is removed once the response has been sent
+    assert created_paths and not os.path.exists(created_paths[0])
+
+  def test_reconstruction_with_levels_of_detail(self, client):
+    """Test coarser levels of detail are returned and streamed before the full mesh"""
+    import trimesh
+
+    scene = trimesh.Scene([trimesh.creation.icosphere(subdivisions=4)])
+    img_bytes = base64.b64decode(self.create_test_image_base64())
+
+    with patch('api_service_base.loaded_model') as mock_model:
+      mock_model.runInference = Mock(return_value={
+        "predictions": {},
+        "camera_poses": [{"rotation": [1.0, 0.0, 0.0, 0.0], "translation": [0.0, 0.0, 0.0]}],
+        "intrinsics": [[[1000, 0, 500], [0, 1000, 500], [0, 0, 1]]]
+      })
+      mock_model.createOutput = Mock(return_value=scene)
+      mock_model.getOutputParameters = Mock(return_value={})
+
+      data = {'lod_levels': '3', 'quantize': 'true', 'images': [(io.BytesIO(img_bytes), 'test.jpg')]}
+      response = client.post('/reconstruction', data=data, content_type='multipart/form-data')
+      assert response.status_code == 200
+      result = json.loads(response.data)
+
+      data = {'lod_levels': '3', 'response_format': 'multipart', 'images': [(io.BytesIO(img_bytes), 'test.jpg')]}
+      response = client.post('/reconstruction', data=data, content_type='multipart/form-data')
+      body = response.get_data()
+
+    lods = result['lods']
+    assert [lod['level'] for lod in lods] == [0, 1, 2]
+    assert lods[0]['vertices'] > lods[1]['vertices'] > lods[2]['vertices']
+    assert all(lod['quantized'] for lod in lods)
+    assert 'glb_data' not in lods[0]
+    for lod in lods[1:]:
+      assert len(base64.b64decode(lod['glb_data'])) == lod['size_bytes']
+    assert len(base64.b64decode(result['glb_data'])) == lods[0]['size_bytes']
+
+    boundary = response.mimetype_params['boundary'].encode()
+    glb_parts = body.split(b"--" + boundary)[2:-1]
+    names = [part.split(b'name="', 1)[1].split(b'"', 1)[0] for part in glb_parts]
+    assert names == [b"lod2", b"lod1", b"lod0"]
+    assert int(response.headers['Content-Length']) == len(body)
+
+  def test_reconstruction_invalid_lod_levels(self, client):
+    """Test reconstruction rejects out of range levels of detail"""
+    img_bytes = base64.b64decode(self.create_test_image_base64())
+    for lod_levels in ('0', '5', 'many'):
+      data = {'lod_levels': lod_levels, 'images': [(io.BytesIO(img_bytes), 'test.jpg')]}
+      with patch('api_service_base.loaded_model'):
+        response = client.post('/reconstruction', data=data, content_type='multipart/form-data')
+      assert response.status_code == 400
+
+  def test_reconstruction_invalid_response_format(self, client):
+    """Test reconstruction rejects unknown response formats"""
+    img_bytes = base64.b64decode(self.create_test_image_base64())
+    data = {
+      'response_format': 'xml',
+      'images': [(io.BytesIO(img_bytes), 'test.jpg')]
+    }
+
+    with patch('api_service_base.loaded_model'):
+      response = client.post('/reconstruction', data=data, content_type='multipart/form-data')
+
+    assert response.status_code == 400
+
   def test_reconstruction_missing_images(self, client):
     """Test reconstruction with missing images field"""
     request_data = {
@@ -322,6 +447,73 @@ class TestAPIService:
     assert 'error' in data
 
 
+class VideoStubModel(ReconstructionModel):
+  """Model relying on the base class for video handling, like VGGTModel"""
+
+  SEC_PER_FRAME_ENV_PREFIX = "VGGT"
+
+  def __init__(self):
+    super().__init__("vggt", "Stub model for video requests", "cpu")
+
+  def loadModel(self):
+    self.is_loaded = True
+
+  def runInference(self, images):
+    self.validateImages(images)
+    return {
+      "predictions": {},
+      "camera_poses": [{"rotation": [1.0, 0.0, 0.0, 0.0], "translation": [0.0, 0.0, 0.0]} for _ in images],
+      "intrinsics": [[[500, 0, 320], [0, 500, 240], [0, 0, 1]] for _ in images]
+    }
+
+  def getSupportedOutputs(self):
+    return ["pointcloud"]
+
+  def getNativeOutput(self):
+    return "pointcloud"
+
+  def scaleIntrinsicsToOriginalSize(self, intrinsics, model_size, original_sizes, preprocessing_mode="crop"):
+    return intrinsics
+
+  def createOutput(self, result, output_format=None):
+    return MagicMock()
+
+
+class TestVideoReconstruction:
+  """Test cases for video requests to /reconstruction"""
+
+  def test_video_frames_limited_by_time_budget(self, tmp_path, monkeypatch):
+    """Test a model without its own frame budget handles a video request"""
+    from api_service_base import app
+
+    monkeypatch.setenv("UPLOADS_DIR", str(tmp_path))
+    monkeypatch.setenv("GUNICORN_TIMEOUT", "130")
+    monkeypatch.setenv("VGGT_CPU_SEC_PER_FRAME", "20")
+    model = VideoStubModel()
+    model.loadModel()
+    frames = [{"data": np.zeros((48, 64, 3), dtype=np.uint8)} for _ in range(3)]
+
+    with patch('api_service_base.loaded_model', model), \
+         patch('api_service_base.model_name', 'vggt'), \
+         patch.object(VideoStubModel, 'framesFromVideo', return_value=frames) as frames_from_video:
+      app.config['TESTING'] = True
+      with app.test_client() as client:
+        response = client.post(
+          '/reconstruction',
+          data={'output_format': 'json', 'video': (io.BytesIO(b"video"), 'walkthrough.mp4')},
+          content_type='multipart/form-data'
+        )
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['success'] is True
+    assert len(data['camera_poses']) == 3
+    # (130 s timeout - 30 s overhead) / 20 s per frame
+    assert frames_from_video.call_args.kwargs['max_frames'] == 5
+    # The uploaded video is deleted with the request
+    assert list(tmp_path.iterdir()) == []
+
+
 class TestRequestValidation:
   """Test cases for request validation functions"""
 
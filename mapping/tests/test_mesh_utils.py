@@ -9,6 +9,9 @@ Tests the mesh and point cloud utility functions.
 """
 
 import pytest
+import io
+import json
+import struct
 import numpy as np
 import trimesh
 import sys
@@ -17,7 +20,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from mesh_utils import createPointcloudFromMesh, getMeshInfo
+from mesh_utils import (createLevelsOfDetail, createPointcloudFromMesh, decimateGeometry,
+                        exportQuantizedGlb, getMeshInfo)
 
 
 class TestMeshUtils:
@@ -225,6 +229,84 @@ class TestMeshUtils:
     assert info["has_colors"] is False
     assert info["is_watertight"] is False
 
+  @staticmethod
+  def coloredSphere():
+    mesh = trimesh.creation.icosphere(subdivisions=4)
+    mesh.visual.vertex_colors = np.tile([200, 100, 50, 255], (len(mesh.vertices), 1)).astype(np.uint8)
+    return mesh
+
+  def test_decimate_mesh(self):
+    """Test vertex clustering reduces a mesh close to the target and keeps colors"""
+    mesh = self.coloredSphere()
+    target = len(mesh.vertices) // 4
+
+    decimated = decimateGeometry(mesh, target)
+
+    assert isinstance(decimated, trimesh.Trimesh)
+    assert 0.5 * target <= len(decimated.vertices) <= target
+    assert len(decimated.faces) > 0
+    assert decimated.faces.max() < len(decimated.vertices)
+    # No collapsed faces remain
+    assert np.all(decimated.area_faces > 0)
+    assert np.all(decimated.visual.vertex_colors == [200, 100, 50, 255])
+    assert np.allclose(decimated.bounds, mesh.bounds, atol=0.1)
+
+  def test_decimate_pointcloud(self):
+    """Test point clouds are voxel downsampled to about the target size"""
+    points = trimesh.PointCloud(np.random.rand(20000, 3))
+
+    decimated = decimateGeometry(points, 1000)
+
+    assert isinstance(decimated, trimesh.PointCloud)
+    assert 500 <= len(decimated.vertices) <= 1000
+
+  def test_decimate_small_geometry_unchanged(self):
+    """Test geometry below the target is returned as is"""
+    mesh = trimesh.creation.box()
+    assert decimateGeometry(mesh, 1000) is mesh
+
+  def test_create_levels_of_detail(self):
+    """Test every level of detail is about 4x smaller than the previous one"""
+    scene = trimesh.Scene([self.coloredSphere()])
+
+    lods = createLevelsOfDetail(scene, 3)
+
+    assert len(lods) == 3
+    assert lods[0] is scene
+    counts = [getMeshInfo(lod)["total_vertices"] for lod in lods]
+    assert counts[0] > counts[1] > counts[2]
+    assert counts[1] <= counts[0] // 4 and counts[2] <= counts[0] // 16
+
+  def test_quantized_glb_roundtrip(self):
+    """Test a quantized GLB loads with positions within the quantization step"""
+    mesh = self.coloredSphere()
+    mesh.apply_translation([10.0, -5.0, 2.0])
+
+    glb = exportQuantizedGlb(trimesh.Scene([mesh]))
+
+    magic, version, length = struct.unpack("<4sII", glb[:12])
+    assert (magic, version, length) == (b"glTF", 2, len(glb))
+    json_length = struct.unpack("<I", glb[12:16])[0]
+    gltf = json.loads(glb[20:20 + json_length])
+    assert gltf["extensionsRequired"] == ["KHR_mesh_quantization"]
+
+    loaded = trimesh.load(io.BytesIO(glb), file_type="glb", force="scene").dump()[0]
+    assert len(loaded.vertices) == len(mesh.vertices)
+    assert np.abs(loaded.vertices - mesh.vertices).max() < 1e-4
+    assert np.array_equal(loaded.faces, mesh.faces)
+    assert np.all(loaded.visual.vertex_colors == [200, 100, 50, 255])
+    assert len(glb) < len(trimesh.Scene([mesh]).export(file_type="glb"))
+
+  def test_quantized_glb_pointcloud(self):
+    """Test point clouds are written as quantized points"""
+    points = trimesh.PointCloud(np.random.rand(1000, 3), colors=np.full((1000, 4), 255, dtype=np.uint8))
+
+    glb = exportQuantizedGlb(trimesh.Scene([points]))
+
+    loaded = trimesh.load(io.BytesIO(glb), file_type="glb", force="scene").dump()[0]
+    assert isinstance(loaded, trimesh.PointCloud)
+    assert np.abs(loaded.vertices - points.vertices).max() < 1e-4
+
   def test_get_mesh_info_watertight_mesh(self):
     """Test getMeshInfo detects watertight meshes"""
     # Create a watertight mesh (simple cube)
@@ -12,6 +12,8 @@ import pytest
 import numpy as np
 import base64
 import io
+import shutil
+import subprocess
 import sys
 from pathlib import Path
 from PIL import Image
@@ -193,6 +195,98 @@ class TestReconstructionModel:
     with pytest.raises(ValueError, match="Failed to decode"):
       model.decodeBase64Image("invalid_base64_data")
 
+  def test_validate_images_accepts_bytes_and_arrays(self):
+    """Test validateImages accepts raw image bytes and decoded RGB arrays"""
+    model = MockReconstructionModel()
+
+    model.validateImages([
+      {"data": b"\x89PNG"},
+      {"data": np.zeros((4, 4, 3), dtype=np.uint8)}
+    ])
+
+    with pytest.raises(ValueError, match="must have shape"):
+      model.validateImages([{"data": np.zeros((4, 4), dtype=np.uint8)}])
+
+  def test_decode_image_bytes_and_arrays(self):
+    """Test decodeImage decodes raw bytes and passes arrays through"""
+    model = MockReconstructionModel()
+
+    test_image = Image.new('RGB', (40, 30), color=(0, 0, 255))
+    buffered = io.BytesIO()
+    test_image.save(buffered, format="PNG")
+
+    img_array = model.decodeImage(buffered.getvalue())
+    assert img_array.shape == (30, 40, 3)
+    assert img_array[0, 0].tolist() == [0, 0, 255]
+
+    frame = np.full((8, 6, 3), 7, dtype=np.uint8)
+    assert model.decodeImage(frame) is frame
+
+  def test_read_ppm_frame(self):
+    """Test PPM frames are read one by one from a stream"""
+    pixels = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+    stream = io.BytesIO(
+      b"P6\n3 2\n255\n" + pixels.tobytes() + b"P6\n3 2\n255\n" + pixels[::-1].tobytes()
+    )
+
+    first = ReconstructionModel._readPpmFrame(stream)
+    second = ReconstructionModel._readPpmFrame(stream)
+
+    np.testing.assert_array_equal(first, pixels)
+    np.testing.assert_array_equal(second, pixels[::-1])
+    assert ReconstructionModel._readPpmFrame(stream) is None
+
+  @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+  def test_frames_from_video(self, tmp_path):
+    """Test video frames are streamed from ffmpeg as RGB arrays"""
+    video_path = str(tmp_path / "video.mp4")
+    subprocess.run(
+      ["ffmpeg", "-loglevel", "error", "-f", "lavfi", "-i",
+       "testsrc=size=320x240:rate=10:duration=2", "-pix_fmt", "yuv420p", video_path],
+      check=True
+    )
+
+    frames = ReconstructionModel.framesFromVideo(
+      video_path, max_frames=3, use_keyframes=False, sample_every_n=5, max_side=160
+    )
+
+    assert len(frames) == 3
+    for frame in frames:
+      assert frame["data"].shape == (120, 160, 3)
+      assert frame["data"].dtype == np.uint8
+
+  def test_max_frames_for_time_budget(self, monkeypatch):
+    """Test the frame limit of a time budget follows the per frame settings of the device"""
+    for name in ("RECONSTRUCTION_CPU_SEC_PER_FRAME", "RECONSTRUCTION_CUDA_SEC_PER_FRAME"):
+      monkeypatch.delenv(name, raising=False)
+    model = MockReconstructionModel()
+
+    assert model._maxFramesForTimeBudget(time_budget_seconds=300, overhead=30) == 27
+    assert model._maxFramesForTimeBudget(time_budget_seconds=20, overhead=30) == 0
+
+    monkeypatch.setenv("RECONSTRUCTION_CPU_SEC_PER_FRAME", "2.5")
+    assert model._maxFramesForTimeBudget(time_budget_seconds=300, overhead=30) == 108
+
+    monkeypatch.setenv("RECONSTRUCTION_CUDA_SEC_PER_FRAME", "0.5")
+    cuda_model = MockReconstructionModel(device="cuda")
+    assert cuda_model._maxFramesForTimeBudget(time_budget_seconds=300, overhead=30) == 540
+
+  def test_select_frames_keeps_sharpest_per_segment(self):
+    """Test selectFrames keeps the sharpest frame of every segment in order"""
+    model = MockReconstructionModel()
+
+    rng = np.random.default_rng(0)
+    sharp = [rng.integers(0, 255, (32, 32, 3), dtype=np.uint8) for _ in range(3)]
+    blurred = [np.full((32, 32, 3), 128, dtype=np.uint8) for _ in range(3)]
+    # Segments of two frames: (blurred, sharp), (sharp, blurred), (blurred, sharp)
+    frames = [{"data": blurred[0]}, {"data": sharp[0]}, {"data": sharp[1]},
+              {"data": blurred[1]}, {"data": blurred[2]}, {"data": sharp[2]}]
+
+    selected = model.selectFrames(frames, 3)
+
+    assert [frame["data"] is img for frame, img in zip(selected, sharp)] == [True] * 3
+    assert model.selectFrames(frames[:2], 3) == frames[:2]
+
   def test_rotation_matrix_to_quaternion_identity(self):
     """Test rotation matrix to quaternion conversion for identity matrix"""
     model = MockReconstructionModel()
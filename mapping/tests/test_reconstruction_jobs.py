@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for Reconstruction Jobs
+Tests the bounded job queue and the /jobs API with a stub reconstruction model.
+"""
+
+import pytest
+import base64
+import io
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from PIL import Image
+from unittest.mock import patch
+
+import trimesh
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from model_interface import ReconstructionModel
+from reconstruction_jobs import (CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED,
+                                 JobCancelledError, QueueFullError, ReconstructionJobQueue)
+
+TIMEOUT = 5.0
+
+
+class StubReconstructionModel(ReconstructionModel):
+  """Reconstruction model returning one pose per frame; inference can be held back"""
+
+  def __init__(self):
+    super().__init__("stub_model", "Stub model for testing", "cpu")
+    self.release = threading.Event()
+    self.release.set()
+    self.inference_started = threading.Event()
+    self.frame_counts = []
+    self.lock = threading.Lock()
+    self.active = 0
+    self.max_active = 0
+
+  def loadModel(self):
+    self.is_loaded = True
+
+  def runInference(self, images):
+    self.validateImages(images)
+    with self.lock:
+      self.frame_counts.append(len(images))
+      self.active += 1
+      self.max_active = max(self.max_active, self.active)
+    self.inference_started.set()
+    self.release.wait(TIMEOUT)
+    with self.lock:
+      self.active -= 1
+    return {
+      "predictions": {},
+      "camera_poses": [{"rotation": [0.0, 0.0, 0.0, 1.0], "translation": [0.0, 0.0, 0.0]} for _ in images],
+      "intrinsics": [[[500.0, 0.0, 320.0], [0.0, 500.0, 240.0], [0.0, 0.0, 1.0]] for _ in images]
+    }
+
+  def getSupportedOutputs(self):
+    return ["mesh"]
+
+  def getNativeOutput(self):
+    return "mesh"
+
+  def scaleIntrinsicsToOriginalSize(self, intrinsics, model_size, original_sizes, preprocessing_mode="crop"):
+    return intrinsics
+
+  def createOutput(self, result, output_format=None):
+    return trimesh.Scene(trimesh.creation.box())
+
+
+def waitForState(get_state, states):
+  deadline = time.time() + TIMEOUT
+  while time.time() < deadline:
+    state = get_state()
+    if state in states:
+      return state
+    time.sleep(0.01)
+  return get_state()
+
+
+class TestReconstructionJobQueue:
+  """Test cases for the job queue"""
+
+  @pytest.fixture
+  def release(self):
+    release = threading.Event()
+    yield release
+    release.set()
+
+  @pytest.fixture
+  def queue(self, release):
+    started = []
+
+    def processJob(job):
+      started.append(job.job_id)
+      job.update("working", 0.5)
+      release.wait(TIMEOUT)
+      job.update("done", 0.9)
+      job.result = {"value": job.payload["value"]}
+
+    queue = ReconstructionJobQueue(processJob, max_queued=2, result_ttl=60.0)
+    queue.started = started
+    yield queue
+    release.set()
+    queue.shutdown(TIMEOUT)
+
+  def test_jobs_run_in_order(self, queue, release):
+    """Test jobs run one at a time in submission order"""
+    first = queue.submit({"value": 1})
+    second = queue.submit({"value": 2})
+
+    assert waitForState(lambda: first.state, (RUNNING,)) == RUNNING
+    assert second.state == QUEUED
+    assert queue.position(second) == 0
+    assert first.stage == "working" and first.progress == 0.5
+
+    release.set()
+    assert waitForState(lambda: second.state, (SUCCEEDED,)) == SUCCEEDED
+    assert first.state == SUCCEEDED and first.progress == 1.0
+    assert second.result == {"value": 2}
+    assert queue.started == [first.job_id, second.job_id]
+
+  def test_queue_is_bounded(self, queue):
+    """Test submitting beyond max_queued waiting jobs is rejected"""
+    running = queue.submit({"value": 0})
+    assert waitForState(lambda: running.state, (RUNNING,)) == RUNNING
+
+    queue.submit({"value": 1})
+    queue.submit({"value": 2})
+    with pytest.raises(QueueFullError):
+      queue.submit({"value": 3})
+
+  def test_cancel_queued_job(self, queue, release):
+    """Test a queued job is cancelled without running"""
+    running = queue.submit({"value": 0})
+    queued = queue.submit({"value": 1})
+    assert waitForState(lambda: running.state, (RUNNING,)) == RUNNING
+
+    assert queue.cancel(queued.job_id) is queued
+    assert queued.state == CANCELLED
+
+    release.set()
+    assert waitForState(lambda: running.state, (SUCCEEDED,)) == SUCCEEDED
+    assert queue.started == [running.job_id]
+
+  def test_cancel_running_job(self, queue, release):
+    """Test a running job stops at its next checkpoint"""
+    job = queue.submit({"value": 0})
+    assert waitForState(lambda: job.state, (RUNNING,)) == RUNNING
+
+    queue.cancel(job.job_id)
+    assert job.toDict()["cancel_requested"] is True
+    release.set()
+
+    assert waitForState(lambda: job.state, (CANCELLED,)) == CANCELLED
+    assert job.result is None
+    with pytest.raises(JobCancelledError):
+      job.checkCancelled()
+
+  def test_payload_released_once_per_job(self, release):
+    """Test the payload of finished, cancelled and dropped jobs is released"""
+    released = []
+
+    def processJob(job):
+      release.wait(TIMEOUT)
+
+    queue = ReconstructionJobQueue(processJob, max_queued=3, release_payload=released.append)
+    running = queue.submit({"value": 0})
+    assert waitForState(lambda: running.state, (RUNNING,)) == RUNNING
+    cancelled = queue.submit({"value": 1})
+    queue.submit({"value": 2})
+
+    queue.cancel(cancelled.job_id)
+    assert released == [{"value": 1}]
+    assert cancelled.payload is None
+
+    release.set()
+    assert waitForState(lambda: running.state, (SUCCEEDED,)) == SUCCEEDED
+    queue.shutdown(TIMEOUT)
+    assert sorted(payload["value"] for payload in released) == [0, 1, 2]
+
+  def test_failed_job_records_error(self):
+    """Test an exception in the job marks it failed with the error message"""
+    def processJob(job):
+      raise RuntimeError("model exploded")
+
+    queue = ReconstructionJobQueue(processJob)
+    job = queue.submit({})
+    assert waitForState(lambda: job.state, (FAILED,)) == FAILED
+    assert job.toDict()["error"] == "model exploded"
+    queue.shutdown(TIMEOUT)
+
+  def test_finished_jobs_expire(self, tmp_path):
+    """Test finished jobs and their GLB files are removed after the result TTL"""
+    glb_path = tmp_path / "result.glb"
+
+    def processJob(job):
+      glb_path.write_bytes(b"glTF")
+      job.glb_paths = [str(glb_path)]
+
+    queue = ReconstructionJobQueue(processJob, result_ttl=0.0)
+    job = queue.submit({})
+    assert waitForState(lambda: job.state, (SUCCEEDED,)) == SUCCEEDED
+
+    time.sleep(0.01)
+    assert queue.get(job.job_id) is None
+    assert not glb_path.exists()
+    queue.shutdown(TIMEOUT)
+
+
+class TestJobAPI:
+  """Test cases for the /jobs endpoints"""
+
+  @pytest.fixture
+  def model(self):
+    model = StubReconstructionModel()
+    model.loadModel()
+    yield model
+    model.release.set()
+
+  @pytest.fixture
+  def uploads_dir(self, tmp_path, monkeypatch):
+    monkeypatch.setenv("UPLOADS_DIR", str(tmp_path))
+    return tmp_path
+
+  @pytest.fixture
+  def client(self, model, uploads_dir):
+    import api_service_base
+    from api_service_base import app
+
+    queue = ReconstructionJobQueue(api_service_base.processReconstructionJob, max_queued=1,
+                                   release_payload=api_service_base.removeUploadedVideo)
+    with patch('api_service_base.loaded_model', model), \
+         patch('api_service_base.model_name', 'stub_model'), \
+         patch('api_service_base.getMeshInfo', return_value={}), \
+         patch('api_service_base.job_queue', queue):
+      app.config['TESTING'] = True
+      with app.test_client() as client:
+        yield client
+      model.release.set()
+      queue.shutdown(TIMEOUT)
+
+  @staticmethod
+  def imageUpload(name="test.jpg"):
+    img = Image.new('RGB', (64, 48), color=(0, 128, 255))
+    buffered = io.BytesIO()
+    img.save(buffered, format="JPEG")
+    return (io.BytesIO(buffered.getvalue()), name)
+
+  def submit(self, client, **fields):
+    data = {'images': [self.imageUpload("a.jpg"), self.imageUpload("b.jpg")], **fields}
+    return client.post('/jobs', data=data, content_type='multipart/form-data')
+
+  @staticmethod
+  def jobState(client, job_id):
+    return json.loads(client.get(f'/jobs/{job_id}').data)['status']
+
+  def test_job_lifecycle(self, client, model):
+    """Test submit, poll and fetch the result of a job"""
+    response = self.submit(client)
+    assert response.status_code == 202
+    job = json.loads(response.data)
+    assert response.headers['Location'] == f"/jobs/{job['job_id']}"
+    assert job['status'] in (QUEUED, RUNNING)
+
+    assert waitForState(lambda: self.jobState(client, job['job_id']), (SUCCEEDED,)) == SUCCEEDED
+    status = json.loads(client.get(f"/jobs/{job['job_id']}").data)
+    assert status['progress'] == 1.0
+    assert model.frame_counts == [2]
+
+    response = client.get(f"/jobs/{job['job_id']}/result")
+    assert response.status_code == 200
+    result = json.loads(response.data)
+    assert result['success'] is True
+    assert len(result['camera_poses']) == 2
+    assert base64.b64decode(result['glb_data'])[:4] == b"glTF"
+
+    # The result can be fetched again, also as multipart
+    response = client.get(f"/jobs/{job['job_id']}/result?response_format=multipart")
+    assert response.status_code == 200
+    assert response.mimetype == 'multipart/mixed'
+    assert b"model/gltf-binary" in response.get_data()
+
+  def test_result_of_unfinished_job(self, client, model):
+    """Test fetching the result of a running job returns 409"""
+    model.release.clear()
+    job = json.loads(self.submit(client).data)
+    assert model.inference_started.wait(TIMEOUT)
+
+    response = client.get(f"/jobs/{job['job_id']}/result")
+    assert response.status_code == 409
+    assert json.loads(response.data)['status'] == RUNNING
+
+  def test_cancel_job(self, client, model):
+    """Test cancelling a running and a queued job"""
+    model.release.clear()
+    running = json.loads(self.submit(client).data)
+    assert model.inference_started.wait(TIMEOUT)
+    queued = json.loads(self.submit(client).data)
+    assert queued['status'] == QUEUED
+
+    response = client.delete(f"/jobs/{queued['job_id']}")
+    assert response.status_code == 200
+    assert json.loads(response.data)['status'] == CANCELLED
+
+    client.delete(f"/jobs/{running['job_id']}")
+    model.release.set()
+    assert waitForState(lambda: self.jobState(client, running['job_id']), (CANCELLED,)) == CANCELLED
+    assert model.frame_counts == [2]
+
+  def test_cancel_queued_video_job(self, client, model, uploads_dir):
+    """Test the uploaded video of a job cancelled before it ran is deleted"""
+    model.release.clear()
+    self.submit(client)
+    assert model.inference_started.wait(TIMEOUT)
+
+    response = client.post('/jobs', data={'video': (io.BytesIO(b"video"), 'walkthrough.mp4')},
+                           content_type='multipart/form-data')
+    queued = json.loads(response.data)
+    assert queued['status'] == QUEUED
+    assert len(list(uploads_dir.iterdir())) == 1
+
+    client.delete(f"/jobs/{queued['job_id']}")
+    assert list(uploads_dir.iterdir()) == []
+
+  def test_queue_full(self, client, model):
+    """Test submitting to a full queue returns 429"""
+    model.release.clear()
+    self.submit(client)
+    assert model.inference_started.wait(TIMEOUT)
+    assert self.submit(client).status_code == 202
+
+    response = self.submit(client)
+    assert response.status_code == 429
+    assert 'Retry-After' in response.headers
+
+  def test_job_waits_for_synchronous_request(self, client, model):
+    """Test a job does not use the model while a /reconstruction request runs on it"""
+    from api_service_base import app
+
+    model.release.clear()
+    responses = []
+    def reconstruct():
+      data = {'images': [self.imageUpload("a.jpg"), self.imageUpload("b.jpg"), self.imageUpload("c.jpg")]}
+      with app.test_client() as request_client:
+        responses.append(request_client.post('/reconstruction', data=data,
+                                             content_type='multipart/form-data'))
+    request_thread = threading.Thread(target=reconstruct)
+    request_thread.start()
+    assert model.inference_started.wait(TIMEOUT)
+
+    job = json.loads(self.submit(client).data)
+    waitForState(lambda: json.loads(client.get(f"/jobs/{job['job_id']}").data)['stage'],
+                 ("waiting_for_model",))
+    assert json.loads(client.get(f"/jobs/{job['job_id']}").data)['stage'] == "waiting_for_model"
+    assert model.frame_counts == [3]
+
+    model.release.set()
+    request_thread.join(TIMEOUT)
+    assert responses[0].status_code == 200
+    assert waitForState(lambda: self.jobState(client, job['job_id']), (SUCCEEDED,)) == SUCCEEDED
+    assert model.frame_counts == [3, 2]
+    assert model.max_active == 1
+
+  def test_busy_model_rejects_synchronous_request(self, client, model, uploads_dir):
+    """Test /reconstruction answers 503 instead of waiting for the model past the timeout"""
+    model.release.clear()
+    self.submit(client)
+    assert model.inference_started.wait(TIMEOUT)
+
+    with patch('api_service_base.MODEL_LOCK_TIMEOUT', 0.05):
+      response = client.post('/reconstruction',
+                             data={'video': (io.BytesIO(b"video"), 'walkthrough.mp4')},
+                             content_type='multipart/form-data')
+    assert response.status_code == 503
+    assert 'Retry-After' in response.headers
+    assert list(uploads_dir.iterdir()) == []
+    assert model.frame_counts == [2]
+
+  def test_invalid_requests(self, client):
+    """Test unknown jobs and invalid submissions"""
+    assert client.get('/jobs/unknown').status_code == 404
+    assert client.get('/jobs/unknown/result').status_code == 404
+    assert client.delete('/jobs/unknown').status_code == 404
+    assert self.submit(client, max_frames='0').status_code == 400
+    assert self.submit(client, output_format='obj').status_code == 400
+
+
+if __name__ == "__main__":
+  pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit Tests for the Reconstruction Result Cache
+Tests cache keys, LRU eviction and cached /reconstruction responses.
+"""
+
+import pytest
+import base64
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from PIL import Image
+from unittest.mock import Mock, patch
+
+import trimesh
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from result_cache import ReconstructionCache, computeCacheKey
+
+
+class TestCacheKey:
+  """Test cases for computeCacheKey"""
+
+  IMAGES = [{"data": b"frame-1", "filename": "a.jpg"}, {"data": b"frame-2", "filename": "b.jpg"}]
+  PARAMETERS = {"mesh_type": "mesh", "output": {"voxel_size": 0.01}}
+
+  def test_same_inputs_same_key(self):
+    """Test keys only depend on frame content, model and parameters"""
+    renamed = [{"data": b"frame-1", "filename": "x.jpg"}, {"data": b"frame-2"}]
+    assert computeCacheKey("vggt", self.PARAMETERS, self.IMAGES) == \
+      computeCacheKey("vggt", dict(self.PARAMETERS), renamed)
+
+  @pytest.mark.parametrize("model_name, parameters, images", [
+    ("mapanything", PARAMETERS, IMAGES),
+    ("vggt", {"mesh_type": "pointcloud", "output": {"voxel_size": 0.01}}, IMAGES),
+    ("vggt", {"mesh_type": "mesh", "output": {"voxel_size": 0.02}}, IMAGES),
+    ("vggt", PARAMETERS, IMAGES[::-1]),
+    ("vggt", PARAMETERS, [{"data": b"frame-1frame-2"}]),
+  ])
+  def test_different_inputs_different_key(self, model_name, parameters, images):
+    """Test model, parameters, frame order and frame boundaries change the key"""
+    assert computeCacheKey(model_name, parameters, images) != \
+      computeCacheKey("vggt", self.PARAMETERS, self.IMAGES)
+
+  def test_video_content_is_hashed(self, tmp_path):
+    """Test the key follows the video content, not its path"""
+    first, second = tmp_path / "a.mp4", tmp_path / "b.mp4"
+    first.write_bytes(b"video-data")
+    second.write_bytes(b"video-data")
+    key = computeCacheKey("vggt", self.PARAMETERS, video_path=str(first))
+    assert key == computeCacheKey("vggt", self.PARAMETERS, video_path=str(second))
+
+    second.write_bytes(b"other-video")
+    assert key != computeCacheKey("vggt", self.PARAMETERS, video_path=str(second))
+
+
+class TestReconstructionCache:
+  """Test cases for the on-disk LRU cache"""
+
+  @staticmethod
+  def writeGlb(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(b"g" * size)
+    return str(path)
+
+  def test_put_and_get(self, tmp_path):
+    """Test a stored result is returned with a private GLB copy"""
+    cache = ReconstructionCache(str(tmp_path / "cache"), 1024 * 1024)
+    glb_path = self.writeGlb(tmp_path, "result.glb", 100)
+
+    cache.put("key", {"camera_poses": [1, 2]}, [glb_path])
+    os.unlink(glb_path)
+
+    cached = cache.get("key")
+    assert cached.metadata == {"camera_poses": [1, 2]}
+    assert Path(cached.glb_path).read_bytes() == b"g" * 100
+
+    # Removing the returned copy keeps the cached entry intact
+    os.unlink(cached.glb_path)
+    second = cache.get("key")
+    assert Path(second.glb_path).read_bytes() == b"g" * 100
+    os.unlink(second.glb_path)
+
+    assert cache.get("missing") is None
+
+  def test_levels_of_detail(self, tmp_path):
+    """Test the GLB files of all levels of detail are stored and returned in order"""
+    cache = ReconstructionCache(str(tmp_path / "cache"), 1024 * 1024)
+    glb_paths = [self.writeGlb(tmp_path, f"lod{level}.glb", 100 - level) for level in range(3)]
+    cache.put("key", {"lods": [{"level": level} for level in range(3)]}, glb_paths)
+
+    cached = cache.get("key")
+    assert [Path(path).stat().st_size for path in cached.glb_paths] == [100, 99, 98]
+    assert cached.glb_path == cached.glb_paths[0]
+
+    # An entry with a missing level of detail is dropped
+    os.unlink(tmp_path / "cache" / "key" / "result_lod2.glb")
+    assert cache.get("key") is None
+    assert not (tmp_path / "cache" / "key").exists()
+
+  def test_least_recently_used_entries_are_evicted(self, tmp_path):
+    """Test eviction keeps the cache within its size, dropping the oldest use first"""
+    cache = ReconstructionCache(str(tmp_path / "cache"), 2500)
+    for key in ("a", "b"):
+      cache.put(key, {}, [self.writeGlb(tmp_path, f"{key}.glb", 1000)])
+      time.sleep(0.02)
+
+    # Using a makes b the least recently used entry
+    os.unlink(cache.get("a").glb_path)
+    time.sleep(0.02)
+    cache.put("c", {}, [self.writeGlb(tmp_path, "c.glb", 1000)])
+
+    assert sorted(os.listdir(tmp_path / "cache")) == ["a", "c"]
+
+  def test_disabled_cache(self, tmp_path):
+    """Test a cache without size stores nothing"""
+    cache = ReconstructionCache(str(tmp_path / "cache"), 0)
+    cache.put("key", {}, [self.writeGlb(tmp_path, "result.glb", 10)])
+    assert cache.get("key") is None
+    assert not (tmp_path / "cache").exists()
+
+
+class TestCachedReconstruction:
+  """Test cases for cached /reconstruction requests"""
+
+  @pytest.fixture
+  def model(self):
+    model = Mock()
+    model.is_loaded = True
+    model.getOutputParameters = Mock(return_value={"voxel_size": 0.01})
+    model.runInference = Mock(return_value={
+      "predictions": {},
+      "camera_poses": [{"rotation": [0.0, 0.0, 0.0, 1.0], "translation": [1.0, 2.0, 3.0]}],
+      "intrinsics": [[[500, 0, 320], [0, 500, 240], [0, 0, 1]]]
+    })
+    model.createOutput = Mock(side_effect=lambda result, output_format=None: trimesh.Scene(trimesh.creation.box()))
+    return model
+
+  @pytest.fixture
+  def client(self, model, tmp_path):
+    from api_service_base import app
+
+    cache = ReconstructionCache(str(tmp_path / "cache"), 64 * 1024 * 1024)
+    with patch('api_service_base.loaded_model', model), \
+         patch('api_service_base.model_name', 'test_model'), \
+         patch('api_service_base.getMeshInfo', return_value={}), \
+         patch('api_service_base.result_cache', cache):
+      app.config['TESTING'] = True
+      with app.test_client() as client:
+        yield client
+
+  @staticmethod
+  def post(client, color=(255, 0, 0), **fields):
+    img = Image.new('RGB', (32, 32), color=color)
+    buffered = io.BytesIO()
+    img.save(buffered, format="PNG")
+    data = {'images': [(io.BytesIO(buffered.getvalue()), 'test.png')], **fields}
+    return client.post('/reconstruction', data=data, content_type='multipart/form-data')
+
+  def test_identical_request_is_served_from_cache(self, client, model):
+    """Test a repeated request returns the cached result without inference"""
+    first = json.loads(self.post(client).data)
+    second = json.loads(self.post(client).data)
+
+    assert model.runInference.call_count == 1
+    assert model.createOutput.call_count == 1
+    assert 'cached' not in first and second['cached'] is True
+    assert second['camera_poses'] == first['camera_poses']
+    assert second['intrinsics'] == first['intrinsics']
+    assert base64.b64decode(second['glb_data']) == base64.b64decode(first['glb_data'])
+
+    # The cached GLB is also served as multipart
+    response = self.post(client, response_format='multipart')
+    assert response.mimetype == 'multipart/mixed'
+    assert base64.b64decode(first['glb_data']) in response.get_data()
+    assert model.runInference.call_count == 1
+
+  def test_different_request_misses_cache(self, client, model):
+    """Test other frames or output parameters run inference again"""
+    self.post(client)
+    self.post(client, color=(0, 255, 0))
+    self.post(client, mesh_type='pointcloud')
+    assert model.runInference.call_count == 3
+
+
+if __name__ == "__main__":
+  pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark for levels of detail and quantized GLB output of the mapping service
+Builds the levels of detail of a sample reconstruction and reports vertex
+count, GLB file size and GLB load time per level, with float and quantized
+vertex attributes. The sample is synthetic: a dense colored mesh like the
+Poisson output of VGGT, and a point cloud from MapAnything style predictions.
+"""
+
+import argparse
+import gc
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from mesh_utils import createLevelsOfDetail, createPointcloudFromMesh, exportQuantizedGlb, getMeshInfo
+
+def sampleMesh(subdivisions: int) -> trimesh.Scene:
+  """Dense colored surface with small scale noise"""
+  rng = np.random.default_rng(0)
+  mesh = trimesh.creation.icosphere(subdivisions=subdivisions, radius=2.0)
+  mesh.vertices += rng.normal(0.0, 0.005, mesh.vertices.shape)
+  colors = np.clip((mesh.vertices / 4.0 + 0.5) * 255, 0, 255).astype(np.uint8)
+  mesh.visual.vertex_colors = np.column_stack([colors, np.full(len(colors), 255, dtype=np.uint8)])
+  return trimesh.Scene([mesh])
+
+def samplePointcloud(frames: int, height: int, width: int) -> trimesh.Scene:
+  """Point cloud of a room-sized depth map sequence"""
+  rng = np.random.default_rng(0)
+  v, u = np.mgrid[0:height, 0:width]
+  points = []
+  for frame in range(frames):
+    depth = 3.0 + 0.5 * np.sin(u / 40.0 + frame) + rng.normal(0.0, 0.01, u.shape)
+    points.append(np.stack([(u - width / 2) / 500.0 * depth + frame * 0.2, (v - height / 2) / 500.0 * depth, depth], axis=-1))
+  predictions = {
+    "world_points": np.stack(points).astype(np.float32),
+    "images": rng.integers(0, 255, (frames, height, width, 3), dtype=np.uint8),
+  }
+  return createPointcloudFromMesh(predictions)
+
+def loadTime(glb: bytes, repeat: int) -> float:
+  """Best time to parse a GLB into a trimesh scene"""
+  best = float("inf")
+  for _ in range(repeat):
+    # Collect the previously loaded scene outside of the measurement
+    gc.collect()
+    start = time.perf_counter()
+    scene = trimesh.load(io.BytesIO(glb), file_type="glb", force="scene")
+    best = min(best, time.perf_counter() - start)
+    del scene
+  return best
+
+def report(name: str, scene: trimesh.Scene, levels: int, repeat: int) -> None:
+  start = time.perf_counter()
+  lods = createLevelsOfDetail(scene, levels)
+  build_time = time.perf_counter() - start
+  print(f"{name} ({levels} levels built in {build_time:.2f} s)")
+  print(f"  {'level':>5} {'vertices':>9} {'faces':>9} {'float MB':>9} {'load ms':>8} {'quant MB':>9} {'load ms':>8}")
+
+  for level, lod in enumerate(lods):
+    info = getMeshInfo(lod)
+    float_glb = lod.export(file_type="glb")
+    quantized_glb = exportQuantizedGlb(lod)
+    print(f"  {level:>5} {info['total_vertices']:>9} {info['total_faces']:>9} "
+          f"{len(float_glb) / 2**20:>9.2f} {loadTime(float_glb, repeat) * 1000:>8.1f} "
+          f"{len(quantized_glb) / 2**20:>9.2f} {loadTime(quantized_glb, repeat) * 1000:>8.1f}")
+
+def main():
+  parser = argparse.ArgumentParser(description="Benchmark levels of detail and quantized GLB output")
+  parser.add_argument("--levels", type=int, default=4, help="Levels of detail including full resolution")
+  parser.add_argument("--subdivisions", type=int, default=7, help="Icosphere subdivisions of the sample mesh")
+  parser.add_argument("--frames", type=int, default=8, help="Frames of the sample point cloud")
+  parser.add_argument("--repeat", type=int, default=3, help="Loads per file, best time is reported")
+  args = parser.parse_args()
+
+  report("mesh", sampleMesh(args.subdivisions), args.levels, args.repeat)
+  report("pointcloud", samplePointcloud(args.frames, 384, 512), args.levels, args.repeat)
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark for video frame extraction in the mapping service
+Compares the former JPEG-on-disk + base64 frame path with the raw RGB pipe of
+ReconstructionModel.framesFromVideo, measuring wall time and peak memory of
+producing decoded frames ready for inference. Each path runs in a fresh
+process so peak RSS values do not influence each other. Requires ffmpeg.
+"""
+
+import argparse
+import base64
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+def createTestVideo(path: str, frames: int, width: int, height: int) -> None:
+  """Encode a synthetic test pattern video"""
+  subprocess.run(
+    ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+     "-f", "lavfi", "-i", f"testsrc2=size={width}x{height}:rate=30",
+     "-frames:v", str(frames), "-pix_fmt", "yuv420p", path],
+    check=True
+  )
+
+def legacyFrames(video_path: str, max_frames: int, max_side: int) -> tuple:
+  """Former path: ffmpeg writes JPEGs to disk, read back, base64 encoded, decoded again"""
+  import io
+  import numpy as np
+  from PIL import Image
+
+  scale = f"scale='if(gte(iw,ih),min(iw,{max_side}),-2)':'if(lt(iw,ih),min(ih,{max_side}),-2)'"
+  encoded = []
+  with tempfile.TemporaryDirectory(prefix="frames_") as tmpdir:
+    subprocess.run(
+      ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", video_path, "-vf", scale,
+       "-vsync", "vfr", "-frames:v", str(max_frames), "-q:v", "6",
+       os.path.join(tmpdir, "frame_%06d.jpg")],
+      check=True
+    )
+    for i in range(1, max_frames + 1):
+      fpath = os.path.join(tmpdir, f"frame_{i:06d}.jpg")
+      if not os.path.exists(fpath):
+        break
+      with open(fpath, "rb") as f:
+        encoded.append({"data": base64.b64encode(f.read()).decode("utf-8")})
+
+  # What decodeBase64Image did with every frame in runInference
+  frames = [np.array(Image.open(io.BytesIO(base64.b64decode(frame["data"]))).convert("RGB"))
+            for frame in encoded]
+  return frames, sum(len(frame["data"]) for frame in encoded)
+
+def pipeFrames(video_path: str, max_frames: int, max_side: int) -> tuple:
+  """Current path: raw RGB frames streamed from ffmpeg's stdout"""
+  from model_interface import ReconstructionModel
+
+  frames = ReconstructionModel.framesFromVideo(
+    video_path, max_frames, use_keyframes=False, sample_every_n=1, max_side=max_side
+  )
+  return [frame["data"] for frame in frames], 0
+
+def runMode(mode: str, video_path: str, max_frames: int, max_side: int) -> dict:
+  """Run one extraction path in this process and report its cost"""
+  baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  start = time.perf_counter()
+  frames, intermediate = legacyFrames(video_path, max_frames, max_side) if mode == "legacy" \
+    else pipeFrames(video_path, max_frames, max_side)
+  elapsed = time.perf_counter() - start
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+  return {
+    "mode": mode,
+    "frames": len(frames),
+    "shape": list(frames[0].shape) if frames else None,
+    "seconds": elapsed,
+    "frame_bytes_mb": sum(frame.nbytes for frame in frames) / 2**20,
+    "intermediate_mb": intermediate / 2**20,
+    "peak_rss_growth_mb": (peak - baseline) / 1024,
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description="Benchmark video frame extraction paths")
+  parser.add_argument("--frames", type=int, default=200, help="Number of frames in the test video")
+  parser.add_argument("--width", type=int, default=1280)
+  parser.add_argument("--height", type=int, default=720)
+  parser.add_argument("--max-side", type=int, default=960, help="Longest side of extracted frames")
+  parser.add_argument("--repeat", type=int, default=3, help="Runs per path, best time is reported")
+  parser.add_argument("--run-mode", choices=["legacy", "pipe"], help=argparse.SUPPRESS)
+  parser.add_argument("--video", help=argparse.SUPPRESS)
+  args = parser.parse_args()
+
+  if args.run_mode:
+    print(json.dumps(runMode(args.run_mode, args.video, args.frames, args.max_side)))
+    return
+
+  with tempfile.TemporaryDirectory(prefix="video_bench_") as tmpdir:
+    video_path = os.path.join(tmpdir, "test.mp4")
+    createTestVideo(video_path, args.frames, args.width, args.height)
+
+    results = {}
+    for mode in ("legacy", "pipe"):
+      runs = []
+      for _ in range(args.repeat):
+        output = subprocess.run(
+          [sys.executable, __file__, "--run-mode", mode, "--video", video_path,
+           "--frames", str(args.frames), "--max-side", str(args.max_side)],
+          check=True, capture_output=True, text=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+      results[mode] = min(runs, key=lambda run: run["seconds"])
+
+  print(f"{args.frames} frames {args.width}x{args.height}, max side {args.max_side}")
+  for mode, result in results.items():
+    print(f"  {mode:6s}: {result['frames']} frames {result['shape']}, {result['seconds']:.2f} s, "
+          f"peak RSS +{result['peak_rss_growth_mb']:.0f} MB (decoded frames {result['frame_bytes_mb']:.0f} MB, "
+          f"base64 copies held alongside {result['intermediate_mb']:.1f} MB)")
+  legacy, pipe = results["legacy"], results["pipe"]
+  print(f"  speedup {legacy['seconds'] / pipe['seconds']:.2f}x, "
+        f"peak memory {legacy['peak_rss_growth_mb'] - pipe['peak_rss_growth_mb']:.0f} MB lower")
+
+if __name__ == "__main__":
+  main()
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: (C) 2023 - 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 import os
 import json
 import re
@@ -23,6 +24,8 @@ class RESTClient:
     if not self.url.endswith("/"):
       self.url = self.url + "/"
     self.session = requests.session()
+    # ETag and decoded reply of the last successful GET of each URL and parameters
+    self.cachedReplies = {}
     if auth:
       self._parseAuth(auth)
     return
@@ -142,6 +145,9 @@ class RESTClient:
 
   def _get(self, endpoint, parameters):
     """Private method to get an object, used by public object specific calls.
+    Replies carrying an ETag are kept, and the next GET of the same endpoint
+    and parameters is conditional: if the server answers 304 Not Modified
+    a copy of the kept reply is returned.
 
     @param      endpoint        object specific endpoint on REST server
     @param      parameters      dictionary of key/value pairs appended to GET request,
@@ -151,9 +157,22 @@ class RESTClient:
     """
     full_path = urljoin(self.url, endpoint)
     headers = {'Authorization': f"Token {self.token}"}
+    cache_key = (full_path, json.dumps(parameters, sort_keys=True, default=str))
+    cached = self.cachedReplies.get(cache_key)
+    if cached:
+      headers['If-None-Match'] = cached[0]
     reply = self.session.get(full_path, params=parameters, headers=headers,
                              verify=self.rootcert)
-    return self.decodeReply(reply, HTTPStatus.OK)
+    if cached and reply.status_code == HTTPStatus.NOT_MODIFIED:
+      return copy.deepcopy(cached[1])
+
+    result = self.decodeReply(reply, HTTPStatus.OK)
+    etag = reply.headers.get('ETag')
+    if reply.status_code == HTTPStatus.OK and etag and not result.errors:
+      self.cachedReplies[cache_key] = (etag, copy.deepcopy(result))
+    else:
+      self.cachedReplies.pop(cache_key, None)
+    return result
 
   def _update(self, endpoint, data, files=None):
     """Private method to update an object, used by public object specific calls.
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import shutil
+from types import SimpleNamespace
+
+import numpy as np
+
+from apriltag_map_registry import ApriltagMapRegistry, computeMapKey
+from atag_camera_calibration import CameraCalibrationApriltag
+from atag_camera_calibration_controller import ApriltagCameraCalibrationController
+from conftest import scene_map
+
+SWEEP_SETTINGS = {"tag_size": 0.147, "tile_size": 480}
+TAGS = {"1": {"center": [1.0, 2.0, 0.0], "corners": [[0.9, 1.9, 0.0], [1.1, 1.9, 0.0],
+                                                     [1.1, 2.1, 0.0], [0.9, 2.1, 0.0]]}}
+
+class CalibrationDataInterface:
+  """! In-memory stand-in for the calibration marker REST interface. """
+
+  def __init__(self):
+    self.markers = {}
+    self.map_processed = {}
+
+  def calibrationMarkersWithSceneID(self, scene_id):
+    return {'results': [marker for marker in self.markers.values() if marker['scene'] == scene_id]}
+
+  def updateOrCreateCalibrationMarker(self, scene_id, post_data):
+    self.markers[post_data['marker_id']] = post_data
+
+  def deleteCalibrationMarkersForScene(self, scene_id):
+    self.markers = {key: marker for key, marker in self.markers.items() if marker['scene'] != scene_id}
+
+  def updateMapProcessed(self, scene_id, timestamp):
+    self.map_processed[scene_id] = timestamp
+
+def test_registryRoundTrip(tmp_path):
+  map_file = tmp_path / "map.png"
+  map_file.write_bytes(b"map contents")
+  registry = ApriltagMapRegistry(str(tmp_path / "registry"))
+  key = computeMapKey(str(map_file), 268.0, SWEEP_SETTINGS)
+
+  assert registry.get(key) is None
+  registry.put(key, TAGS, SWEEP_SETTINGS, str(map_file))
+  entry = registry.get(key)
+  assert entry['tags'] == TAGS
+  assert entry['sweep'] == SWEEP_SETTINGS
+  assert entry['map_file'] == "map.png"
+  return
+
+def test_mapKeyChanges(tmp_path):
+  map_file = tmp_path / "map.png"
+  map_file.write_bytes(b"map contents")
+  key = computeMapKey(str(map_file), 268.0, SWEEP_SETTINGS)
+
+  assert computeMapKey(str(map_file), 268.0, dict(SWEEP_SETTINGS)) == key
+  assert computeMapKey(str(map_file), 100.0, SWEEP_SETTINGS) != key
+  assert computeMapKey(str(map_file), 268.0, {**SWEEP_SETTINGS, "tag_size": 0.2}) != key
+
+  copied_file = tmp_path / "renamed.png"
+  shutil.copyfile(map_file, copied_file)
+  assert computeMapKey(str(copied_file), 268.0, SWEEP_SETTINGS) == key
+  map_file.write_bytes(b"new map contents")
+  assert computeMapKey(str(map_file), 268.0, SWEEP_SETTINGS) != key
+  return
+
+def test_unreadableEntryDropped(tmp_path):
+  registry = ApriltagMapRegistry(str(tmp_path))
+  with open(registry.entryPath("broken"), "w") as f:
+    f.write("{not json")
+
+  assert registry.get("broken") is None
+  assert not (tmp_path / "broken.json").exists()
+  return
+
+def test_registeredMapSkipsSweep(tmp_path, monkeypatch):
+  data_interface = CalibrationDataInterface()
+  registry = ApriltagMapRegistry(str(tmp_path))
+  scene = SimpleNamespace(id="scene-1", name="Test", map=scene_map, scale=268.0,
+                          apriltag_size=0.147, map_processed=None)
+
+  controller = ApriltagCameraCalibrationController(data_interface, map_registry=registry)
+  response = controller.processSceneForCalibration(scene, map_update=True)
+  assert response['status'] == "success"
+  swept = controller.cam_calib_objs[scene.id].result_data_3d
+  corners = controller.cam_calib_objs[scene.id].result_corners_3d
+  assert len(swept) >= 4 and corners.keys() == swept.keys()
+  for tag_id, center in swept.items():
+    assert np.allclose(np.mean(corners[tag_id], axis=0), center, atol=0.01)
+
+  # A restarted service registers the unchanged map without sweeping it
+  def sweep(*args, **kwargs):
+    raise AssertionError("unchanged map swept again")
+  monkeypatch.setattr(CameraCalibrationApriltag, "identifyApriltagsInScene", sweep)
+  data_interface.deleteCalibrationMarkersForScene(scene.id)
+  controller = ApriltagCameraCalibrationController(data_interface, map_registry=registry)
+  response = controller.processSceneForCalibration(scene, map_update=True)
+  assert response['status'] == "success"
+  assert controller.cam_calib_objs[scene.id].result_data_3d == swept
+  assert len(data_interface.markers) == len(swept)
+  return
@@ -2,10 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import math
+import threading
+import time
+from unittest import mock
 
 import cv2
 import numpy as np
 
+import atag_camera_calibration
+from atag_camera_calibration import CameraCalibrationApriltag, DEFAULT_ROTATION_MATRIX, TILE_SIZE
 from conftest import scene_map
 
 def verify_findApriltagsInFrame(autocalibration, src_image, intrinsics, \
@@ -68,6 +73,108 @@ def verify_getCameraFrustum(autocalibration, frustum, relative_tolerance):
       assert math.isclose(i, j, rel_tol=relative_tolerance)
   return
 
+def verify_sweepTiles(autocalibration):
+  """! Test for functions that lay out the virtual camera tiles over the map.
+  @param    autocalibration       controller test class object.
+
+  @return None
+  """
+  autocalibration.prepareTileSweep(TILE_SIZE, TILE_SIZE)
+  tiles = autocalibration.sweepTiles(DEFAULT_ROTATION_MATRIX)
+  min_bound = autocalibration.triangle_mesh.get_min_bound().numpy()
+  max_bound = autocalibration.triangle_mesh.get_max_bound().numpy()
+  assert tiles[0][:2] == (min_bound[0], min_bound[1])
+  for bbx, bby, _ in tiles:
+    assert min_bound[0] <= bbx < max_bound[0] and min_bound[1] <= bby < max_bound[1]
+    assert autocalibration.tileSeesMesh(autocalibration.tileCameraPose(bbx, bby, DEFAULT_ROTATION_MATRIX))
+
+  outside = autocalibration.tileCameraPose(max_bound[0] + 10, max_bound[1] + 10, DEFAULT_ROTATION_MATRIX)
+  assert not autocalibration.tileSeesMesh(outside)
+  return
+
+def verify_castImagePoints(autocalibration):
+  """! Test for casting image points onto the map in one batch.
+  @param    autocalibration       controller test class object.
+
+  @return None
+  """
+  autocalibration.prepareTileSweep(TILE_SIZE, TILE_SIZE)
+  bbx, bby, _ = autocalibration.sweepTiles(DEFAULT_ROTATION_MATRIX)[0]
+  camera_pose = autocalibration.tileCameraPose(bbx, bby, DEFAULT_ROTATION_MATRIX)
+  intrinsics = autocalibration.tile_intrinsics.intrinsics
+  # The image center of the first tile sees the map corner, far outside of the image does not
+  points_2d = {"center": [TILE_SIZE / 2, TILE_SIZE / 2], "outside": [-100 * TILE_SIZE, -100 * TILE_SIZE]}
+  points_3d, hits = autocalibration.castImagePoints(list(points_2d.values()), intrinsics,
+                                                    camera_pose.pose_mat, autocalibration.raycasting_scene)
+  assert points_3d.shape == (2, 3)
+  assert hits.tolist() == [True, False]
+  assert np.allclose(points_3d[0][:2], [bbx, bby], atol=1e-3)
+
+  mapped = autocalibration.getCorresponding3DPoints(points_2d, intrinsics, camera_pose.pose_mat,
+                                                    autocalibration.raycasting_scene)
+  assert list(mapped.keys()) == ["center"]
+  assert np.allclose(mapped["center"], points_3d[0])
+  return
+
+def verify_raycastTileRenderer(result_data):
+  """! Test for the map sweep with the CPU raycast tile renderer.
+  @param    result_data           expected 3d coordinates of the apriltags.
+
+  @return None
+  """
+  autocalibration = CameraCalibrationApriltag(scene_map, 268.0, "Test", tile_renderer="raycast")
+  autocalibration.identifyApriltagsInScene(TILE_SIZE, TILE_SIZE, DEFAULT_ROTATION_MATRIX, workers=1)
+  assert autocalibration.result_data_3d.keys() == result_data.keys()
+  for tag_id, point in autocalibration.result_data_3d.items():
+    assert np.allclose(point, result_data[tag_id], atol=1e-3)
+  return
+
+class FakeOffscreenRenderer:
+  """! Blank offscreen renderer that records how many renderers exist at once. """
+  lock = threading.Lock()
+  alive = 0
+  max_alive = 0
+
+  def __init__(self, res_x, res_y):
+    self.shape = (res_y, res_x, 3)
+    self.scene = mock.MagicMock()
+    with FakeOffscreenRenderer.lock:
+      FakeOffscreenRenderer.alive += 1
+      FakeOffscreenRenderer.max_alive = max(FakeOffscreenRenderer.max_alive, FakeOffscreenRenderer.alive)
+    return
+
+  def __del__(self):
+    with FakeOffscreenRenderer.lock:
+      FakeOffscreenRenderer.alive -= 1
+    return
+
+  def setup_camera(self, intrinsic_matrix, extrinsic_matrix, res_x, res_y):
+    return
+
+  def render_to_image(self):
+    time.sleep(0.005)
+    return np.full(self.shape, 255, dtype=np.uint8)
+
+def test_offscreenSweepsSerialized(monkeypatch):
+  """! Verifies concurrent in-process map sweeps of two scenes never hold
+  offscreen renderers at the same time. """
+  monkeypatch.setattr(atag_camera_calibration.rendering, "OffscreenRenderer", FakeOffscreenRenderer)
+  calibrations = [CameraCalibrationApriltag(scene_map, 268.0, name, tile_renderer="offscreen")
+                  for name in ("Lobby", "Garage")]
+  sweeps = [threading.Thread(target=calibration.identifyApriltagsInScene,
+                             args=(TILE_SIZE, TILE_SIZE, DEFAULT_ROTATION_MATRIX),
+                             kwargs={'workers': 1})
+            for calibration in calibrations]
+  for sweep in sweeps:
+    sweep.start()
+  for sweep in sweeps:
+    sweep.join()
+
+  assert all(calibration.result_data_3d == {} for calibration in calibrations)
+  assert FakeOffscreenRenderer.max_alive == 1
+  assert FakeOffscreenRenderer.alive == 0
+  return
+
 def test_cameraCalibrationApriltag(autocalibration, apriltags2d, result_data, \
                                    pose, intrinsics, actual_centers_2d, frustum, relative_tolerance):
   verify_findApriltagsInFrame(autocalibration, scene_map, intrinsics, \
@@ -75,5 +182,8 @@ def test_cameraCalibrationApriltag(autocalibration, apriltags2d, result_data, \
   verify_getCameraPoseInScene(autocalibration, apriltags2d, result_data, \
                              pose, intrinsics, relative_tolerance)
   verify_getCameraFrustum(autocalibration, frustum, relative_tolerance)
+  verify_sweepTiles(autocalibration)
+  verify_castImagePoints(autocalibration)
+  verify_raycastTileRenderer(result_data)
 
   return
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+import pytest
+
+from calibration_job_queue import QUEUED, RUNNING, CalibrationJobQueue, QueueFullError
+
+TIMEOUT = 5
+
+class BlockingJobs:
+  """! Job target recording its calls and blocking until released. """
+
+  def __init__(self):
+    self.started = {}
+    self.release = {}
+    self.calls = []
+    self.lock = threading.Lock()
+
+  def __call__(self, name, *args):
+    with self.lock:
+      self.calls.append((name,) + args)
+      self.started.setdefault(name, threading.Event()).set()
+      release = self.release.setdefault(name, threading.Event())
+    assert release.wait(TIMEOUT)
+    return
+
+  def waitStarted(self, name):
+    with self.lock:
+      started = self.started.setdefault(name, threading.Event())
+    return started.wait(TIMEOUT)
+
+  def finish(self, name):
+    with self.lock:
+      self.release.setdefault(name, threading.Event()).set()
+    return
+
+def waitIdle(queue):
+  for _ in range(TIMEOUT * 100):
+    with queue.cond:
+      if not queue.pending and not queue.running:
+        return True
+    time.sleep(0.01)
+  return False
+
+def test_scenesRunConcurrently():
+  jobs = BlockingJobs()
+  queue = CalibrationJobQueue(workers=2, max_queued=4)
+  queue.submit("camera:a", "scene-1", jobs, ("a",))
+  queue.submit("camera:b", "scene-2", jobs, ("b",))
+
+  assert jobs.waitStarted("a") and jobs.waitStarted("b")
+  assert queue.state("camera:a") == RUNNING and queue.state("camera:b") == RUNNING
+  jobs.finish("a")
+  jobs.finish("b")
+  assert waitIdle(queue)
+  assert queue.state("camera:a") is None
+  return
+
+def test_sceneJobsSerialized():
+  jobs = BlockingJobs()
+  queue = CalibrationJobQueue(workers=2, max_queued=4)
+  queue.submit("scene:1", "scene-1", jobs, ("register",))
+  assert jobs.waitStarted("register")
+  queue.submit("camera:a", "scene-1", jobs, ("a",))
+  queue.submit("camera:b", "scene-2", jobs, ("b",))
+
+  # The idle worker skips the camera of the scene being registered
+  assert jobs.waitStarted("b")
+  assert queue.state("camera:a") == QUEUED
+  assert queue.position("camera:a") == 1
+  jobs.finish("register")
+  assert jobs.waitStarted("a")
+  jobs.finish("a")
+  jobs.finish("b")
+  assert waitIdle(queue)
+  return
+
+def test_duplicateRequestsMerged():
+  jobs = BlockingJobs()
+  queue = CalibrationJobQueue(workers=1, max_queued=4)
+  running = queue.submit("camera:a", "scene-1", jobs, ("a", "frame-1"))
+  assert jobs.waitStarted("a")
+
+  # A running calibration handles new requests for the camera
+  assert queue.submit("camera:a", "scene-1", jobs, ("a", "frame-2")) is running
+  queued = queue.submit("camera:b", "scene-2", jobs, ("b", "frame-1"))
+  assert queue.submit("camera:b", "scene-2", jobs, ("b", "frame-2")) is queued
+  assert queue.position("camera:b") == 1
+
+  # A rerun queues a follow-up behind the running job of the key
+  follow_up = queue.submit("camera:a", "scene-1", jobs, ("a", "frame-3"), rerun=True)
+  assert follow_up is not running
+  assert queue.position("camera:a") == 2
+
+  jobs.finish("a")
+  jobs.finish("b")
+  assert waitIdle(queue)
+  assert jobs.calls == [("a", "frame-1"), ("b", "frame-2"), ("a", "frame-3")]
+  return
+
+def test_queueFull():
+  jobs = BlockingJobs()
+  queue = CalibrationJobQueue(workers=1, max_queued=1)
+  queue.submit("camera:a", "scene-1", jobs, ("a",))
+  assert jobs.waitStarted("a")
+  queue.submit("camera:b", "scene-1", jobs, ("b",))
+
+  with pytest.raises(QueueFullError):
+    queue.submit("camera:c", "scene-2", jobs, ("c",))
+  # Merging into a waiting job needs no room in the queue
+  queue.submit("camera:b", "scene-1", jobs, ("b",))
+  # Unbounded submissions, such as scene validation on start, are always queued
+  queue.submit("scene:2", "scene-2", jobs, ("scene-2",), bounded=False)
+  assert queue.position("scene:2") == 2
+
+  jobs.finish("a")
+  jobs.finish("b")
+  jobs.finish("scene-2")
+  assert waitIdle(queue)
+  return
+
+def test_failedJobKeepsWorker():
+  queue = CalibrationJobQueue(workers=1, max_queued=2)
+  done = threading.Event()
+
+  def fail():
+    raise ValueError("calibration failed")
+
+  queue.submit("camera:a", "scene-1", fail)
+  queue.submit("camera:b", "scene-1", done.set)
+  assert done.wait(TIMEOUT)
+  assert waitIdle(queue)
+  return
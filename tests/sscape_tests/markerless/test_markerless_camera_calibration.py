@@ -5,11 +5,13 @@
 
 from types import NoneType
 
+import h5py
 import open3d as o3d
 import numpy as np
 import pytest
 
-from markerless_camera_calibration import CameraCalibrationMonocularPoseEstimate, getPoseMatrix
+import markerless_camera_calibration
+from markerless_camera_calibration import CameraCalibrationMonocularPoseEstimate, getPoseMatrix, list_h5_names
 from scene_common.mesh_util import extractMeshFromGLB, extractMeshFromImage
 from scene_common.transform import convertToTransformMatrix
 
@@ -68,6 +70,54 @@ def test_getMarkerlessConfig(createCamCalibObject, createSceneObject, hlocConfig
   assert len(cfg['hloc']) == 6
   assert cfg['hloc'] == hlocConfig
 
+def test_retrieveDatabaseImages(createCamCalibObject):
+  """! Tests retrieval of the dataset images closest to a query descriptor. """
+  cam_obj = createCamCalibObject
+  cam_obj.db_image_names = ["rgb/0.jpg", "rgb/1.jpg", "rgb/2.jpg", "rgb/3.jpg"]
+  cam_obj.db_global_descriptors = np.array([[1.0, 0.0], [0.6, 0.8], [-1.0, 0.0], [0.8, 0.6]],
+                                           dtype=np.float32)
+  query = np.array([1.0, 0.0], dtype=np.float32)
+
+  cam_obj.hloc_config.num_loc = 2
+  assert cam_obj.retrieveDatabaseImages(query) == ["rgb/0.jpg", "rgb/3.jpg"]
+  # Images with negative similarity are never retrieved
+  cam_obj.hloc_config.num_loc = 50
+  assert cam_obj.retrieveDatabaseImages(query) == ["rgb/0.jpg", "rgb/3.jpg", "rgb/1.jpg"]
+
+def test_extractChangedFeatures(createCamCalibObject, tmp_path, monkeypatch):
+  """! Tests that only added and changed dataset images are extracted again. """
+  extracted = []
+  def extract(conf, image_dir, export_dir, image_list=None, feature_path=None):
+    names = set(list_h5_names(feature_path)) if feature_path.exists() else set()
+    new_names = sorted(name for name in image_list if name not in names)
+    with h5py.File(str(feature_path), 'a') as fd:
+      for name in new_names:
+        fd.create_dataset(f"{name}/global_descriptor", data=np.zeros(4))
+    extracted.append(new_names)
+    return feature_path
+  monkeypatch.setattr(markerless_camera_calibration.extract_features, "main", extract)
+
+  cam_obj = createCamCalibObject
+  config = {"output": "global-feats-test"}
+  (tmp_path / "rgb").mkdir()
+  for index in range(4):
+    (tmp_path / "rgb" / f"{index}.jpg").write_bytes(b"image %d" % index)
+  def hashes():
+    return {f"rgb/{path.name}": markerless_camera_calibration.hashFile(path)
+            for path in (tmp_path / "rgb").glob("*.jpg")}
+
+  feature_path = cam_obj.extractChangedFeatures(config, tmp_path, tmp_path, hashes())
+  assert extracted[-1] == ["rgb/0.jpg", "rgb/1.jpg", "rgb/2.jpg", "rgb/3.jpg"]
+  cam_obj.extractChangedFeatures(config, tmp_path, tmp_path, hashes())
+  assert extracted[-1] == []
+
+  (tmp_path / "rgb" / "1.jpg").write_bytes(b"changed image")
+  (tmp_path / "rgb" / "2.jpg").unlink()
+  (tmp_path / "rgb" / "4.jpg").write_bytes(b"added image")
+  cam_obj.extractChangedFeatures(config, tmp_path, tmp_path, hashes())
+  assert extracted[-1] == ["rgb/1.jpg", "rgb/4.jpg"]
+  assert sorted(list_h5_names(feature_path)) == ["rgb/0.jpg", "rgb/1.jpg", "rgb/3.jpg", "rgb/4.jpg"]
+
 def test_extractMeshFromGLBBad(getBadGlbFile, getImageFile):
   """! Tests loading bad glb file. """
   with pytest.raises(ValueError) as valueerror:
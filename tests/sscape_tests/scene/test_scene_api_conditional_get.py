@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.pagination import PageNumberPagination
+
+from manager.models import Region, Scene
+
+class SceneApiConditionalGetTestCase(TestCase):
+  def setUp(self):
+    cache.clear()
+    self.user = User.objects.create_superuser('test_user', 'test_user@intel.com', 'testpassword')
+    self.token = Token.objects.create(user=self.user)
+    with self.captureOnCommitCallbacks(execute=True):
+      self.scene = Scene.objects.create(name="test_scene")
+
+  def get(self, path, **headers):
+    return self.client.get(path, HTTP_AUTHORIZATION=f"Token {self.token.key}", **headers)
+
+  def test_scene_list_not_modified(self):
+    response = self.get('/api/v1/scenes')
+    self.assertEqual(response.status_code, 200)
+    etag = response['ETag']
+
+    response = self.get('/api/v1/scenes', HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, 304)
+    self.assertEqual(response['ETag'], etag)
+    self.assertEqual(response.content, b"")
+
+    with self.captureOnCommitCallbacks(execute=True):
+      Scene.objects.create(name="other_scene")
+    response = self.get('/api/v1/scenes', HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, 200)
+    self.assertNotEqual(response['ETag'], etag)
+    self.assertEqual(response.json()['count'], 2)
+    return
+
+  def test_scene_detail_not_modified(self):
+    path = f'/api/v1/scene/{self.scene.pk}'
+    response = self.get(path)
+    self.assertEqual(response.status_code, 200)
+    etag = response['ETag']
+    self.assertNotEqual(etag, self.get('/api/v1/scenes')['ETag'])
+
+    response = self.get(path, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, 304)
+
+    # Changes to related objects are part of the scene representation
+    with self.captureOnCommitCallbacks(execute=True):
+      region = Region.objects.create(name="test_region", scene=self.scene)
+      region.notifydbupdate()
+    response = self.get(path, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(response.json()['regions'][0]['name'], "test_region")
+    return
+
+  def test_scene_list_per_host(self):
+    with self.captureOnCommitCallbacks(execute=True):
+      Scene.objects.create(name="other_scene")
+    # Pagination links are built from the host of the request
+    with mock.patch.object(PageNumberPagination, 'page_size', 1):
+      response = self.get('/api/v1/scenes', HTTP_HOST="localhost")
+      other_response = self.get('/api/v1/scenes', HTTP_HOST="web.scenescape.intel.com")
+    self.assertNotEqual(other_response['ETag'], response['ETag'])
+    self.assertTrue(response.json()['next'].startswith("http://localhost/"))
+    self.assertTrue(other_response.json()['next'].startswith("http://web.scenescape.intel.com/"))
+
+    response = self.get('/api/v1/scenes', HTTP_HOST="web.scenescape.intel.com",
+                        HTTP_IF_NONE_MATCH=response['ETag'])
+    self.assertEqual(response.status_code, 200)
+    return
+
+  def test_scene_cached_representation(self):
+    with CaptureQueriesContext(connection) as first:
+      first_response = self.get('/api/v1/scenes')
+    with CaptureQueriesContext(connection) as second:
+      second_response = self.get('/api/v1/scenes')
+    self.assertEqual(second_response.json(), first_response.json())
+    self.assertLess(len(second), len(first))
+
+    with self.captureOnCommitCallbacks(execute=True):
+      response = self.client.post(f'/api/v1/scene/{self.scene.pk}', {'name': "renamed_scene"},
+                                  content_type='application/json',
+                                  HTTP_AUTHORIZATION=f"Token {self.token.key}")
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(self.get('/api/v1/scenes').json()['results'][0]['name'], "renamed_scene")
+    return
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+
+from scene_common.options import EULER
+
+from manager.models import Cam, ChildScene, Region, RegionPoint, Scene, SingletonAreaPoint, \
+  SingletonScalarThreshold, SingletonSensor, Tripwire, TripwirePoint
+
+class SceneApiListTestCase(TestCase):
+  def setUp(self):
+    self.user = User.objects.create_superuser('test_user', 'test_user@intel.com', 'testpassword')
+    self.token = Token.objects.create(user=self.user)
+    self.scene_count = 0
+
+  def addScenes(self, count):
+    with self.captureOnCommitCallbacks(execute=True):
+      for _ in range(count):
+        self.addScene()
+    return
+
+  def addScene(self):
+    index = self.scene_count
+    self.scene_count += 1
+    scene = Scene.objects.create(name=f"scene_{index}")
+    for cam_index in range(2):
+      Cam.objects.create(sensor_id=f"cam_{index}_{cam_index}", name=f"cam_{index}_{cam_index}",
+                         scene=scene, type="camera", transform_type=EULER,
+                         transforms=[1.0, 2.0, 3.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                         intrinsics_fx=570.0, intrinsics_fy=570.0, intrinsics_cx=320.0,
+                         intrinsics_cy=240.0, width=640, height=480)
+    sensor = SingletonSensor.objects.create(sensor_id=f"sensor_{index}", name=f"sensor_{index}",
+                                            scene=scene, type="generic", area="poly")
+    SingletonScalarThreshold.objects.create(singleton=sensor, range_max=10,
+                                            sectors=[{"color": "green", "color_min": "0"}])
+    region = Region.objects.create(name=f"region_{index}", scene=scene)
+    tripwire = Tripwire.objects.create(name=f"tripwire_{index}", scene=scene)
+    for sequence, (x, y) in enumerate([(0, 0), (1, 0), (1, 1)], start=1):
+      SingletonAreaPoint.objects.create(singleton=sensor, sequence=sequence, x=x, y=y)
+      RegionPoint.objects.create(region=region, sequence=sequence, x=x, y=y)
+      TripwirePoint.objects.create(tripwire=tripwire, sequence=sequence, x=x, y=y)
+    child = Scene.objects.create(name=f"child_{index}")
+    ChildScene.objects.create(parent=scene, child=child)
+    ChildScene.objects.create(parent=scene, child_name=f"remote_{index}", child_type="remote")
+    return
+
+  def listScenes(self):
+    # Measure serialization rather than the cached representation
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+      response = self.client.get('/api/v1/scenes', HTTP_AUTHORIZATION=f"Token {self.token.key}")
+    self.assertEqual(response.status_code, 200)
+    return response.json(), len(queries)
+
+  def test_scene_list_query_count(self):
+    self.addScenes(2)
+    self.listScenes()
+    _, query_count = self.listScenes()
+
+    self.addScenes(4)
+    self.listScenes()
+    data, more_scenes_query_count = self.listScenes()
+    self.assertEqual(data['count'], 12)
+    self.assertEqual(more_scenes_query_count, query_count)
+    return
+
+  def test_scene_list_content(self):
+    self.addScenes(1)
+    data, _ = self.listScenes()
+    scenes = {scene['name']: scene for scene in data['results']}
+
+    scene = scenes['scene_0']
+    self.assertEqual(sorted(cam['uid'] for cam in scene['cameras']), ["cam_0_0", "cam_0_1"])
+    self.assertEqual(scene['cameras'][0]['resolution'], [640, 480])
+    self.assertEqual(scene['cameras'][0]['translation'], [1.0, 2.0, 3.0])
+    self.assertEqual(scene['sensors'][0]['uid'], "sensor_0")
+    self.assertEqual(scene['sensors'][0]['points'], [[0, 0], [1, 0], [1, 1]])
+    self.assertEqual(scene['sensors'][0]['color_ranges']['range_max'], 10)
+    self.assertEqual(scene['regions'][0]['points'], [[0, 0], [1, 0], [1, 1]])
+    self.assertEqual(scene['tripwires'][0]['points'], [[0, 0], [1, 0], [1, 1]])
+    children = {child['name']: child for child in scene['children']}
+    self.assertEqual(children['child_0']['link']['name'], "child_0")
+    self.assertEqual(children['remote_0'], {'name': "remote_0"})
+    self.assertEqual(scenes['child_0']['parent'], str(scene['uid']))
+    return
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from manager.update_notifier import UpdateNotifier
+from scene_common.mqtt import PubSub
+
+TIMEOUT = 5
+
+class UpdateNotifierTestCase(SimpleTestCase):
+  def setUp(self):
+    patcher = mock.patch.dict('os.environ', {'BROKER': "broker.scenescape.intel.com",
+                                             'AUTOCALIBRATION': "autocalibration:8443"})
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+    patcher = mock.patch('manager.update_notifier.PubSub')
+    self.pubsub_class = patcher.start()
+    self.addCleanup(patcher.stop)
+    self.pubsub_class.formatTopic = PubSub.formatTopic
+    for topic in ('CMD_SCENE_UPDATE', 'CMD_KUBECLIENT', 'CMD_DATABASE'):
+      setattr(self.pubsub_class, topic, getattr(PubSub, topic))
+    self.client = self.pubsub_class.return_value
+
+    self.database_topic = PubSub.formatTopic(PubSub.CMD_DATABASE)
+    self.notifier = UpdateNotifier(debounce_time=0.1)
+    self.notifier.session = mock.Mock()
+
+    self.delivered = threading.Event()
+    deliver = self.notifier.deliver
+    def deliverBatch(*args):
+      deliver(*args)
+      self.delivered.set()
+    self.notifier.deliver = deliverBatch
+
+  def publishedTopics(self):
+    return [call.args[0] for call in self.client.publish.call_args_list]
+
+  def test_notifications_debounced(self):
+    camera_data = [{'sensor_id': "camera1", 'action': "save"},
+                   {'sensor_id': "camera1", 'action': "delete"}]
+    for scene_id in ["scene1", "scene2", "scene1", "scene1"]:
+      self.notifier.notify(scene_id=scene_id)
+    for data in camera_data:
+      self.notifier.notify(camera_data=data)
+    self.notifier.notify()
+    self.assertTrue(self.delivered.wait(TIMEOUT))
+
+    self.pubsub_class.assert_called_once()
+    self.client.connect.assert_called_once()
+    self.assertEqual(self.publishedTopics(), [
+      PubSub.formatTopic(PubSub.CMD_SCENE_UPDATE, scene_id="scene1"),
+      PubSub.formatTopic(PubSub.CMD_SCENE_UPDATE, scene_id="scene2"),
+      PubSub.formatTopic(PubSub.CMD_KUBECLIENT),
+      PubSub.formatTopic(PubSub.CMD_KUBECLIENT),
+      self.database_topic,
+    ])
+    camera_payloads = [call.args[1] for call in self.client.publish.call_args_list[2:4]]
+    self.assertEqual([json.loads(payload) for payload in camera_payloads], camera_data)
+    patched_urls = [call.args[0] for call in self.notifier.session.patch.call_args_list]
+    self.assertEqual(patched_urls, ["https://autocalibration:8443/v1/scenes/scene1/registration",
+                                    "https://autocalibration:8443/v1/scenes/scene2/registration"])
+    return
+
+  def test_connection_reused(self):
+    self.notifier.notify(scene_id="scene1")
+    self.assertTrue(self.delivered.wait(TIMEOUT))
+    self.delivered.clear()
+    self.notifier.notify(scene_id="scene1")
+    self.assertTrue(self.delivered.wait(TIMEOUT))
+
+    self.pubsub_class.assert_called_once()
+    self.client.connect.assert_called_once()
+    self.assertEqual(self.publishedTopics().count(self.database_topic), 2)
+    return
+
+  def test_no_broker(self):
+    with mock.patch.dict('os.environ'):
+      del os.environ['BROKER']
+      self.notifier.notify(scene_id="scene1")
+    self.assertIsNone(self.notifier.thread)
+    self.pubsub_class.assert_not_called()
+    return
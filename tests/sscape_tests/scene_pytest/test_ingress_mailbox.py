@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from controller.ingress_mailbox import IngressMailbox
+
+TIMEOUT = 5
+
+class RecordingHandler:
+  """Records dispatched messages and checks the shared lock is held"""
+
+  def __init__(self, lock, expected):
+    self.lock = lock
+    self.expected = expected
+    self.received = []
+    self.lock_held = []
+    self.done = threading.Event()
+
+  def __call__(self, client, userdata, message):
+    # RLock has no public owner check; a non-blocking acquire from another
+    # thread tells whether the dispatcher is holding it
+    probe = threading.Thread(target=self._probe)
+    probe.start()
+    probe.join()
+    self.received.append((client, userdata, message.topic, message.payload))
+    if len(self.received) == self.expected:
+      self.done.set()
+
+  def _probe(self):
+    acquired = self.lock.acquire(blocking=False)
+    if acquired:
+      self.lock.release()
+    self.lock_held.append(not acquired)
+
+def message(topic, payload):
+  return SimpleNamespace(topic=topic, payload=payload)
+
+@pytest.fixture
+def shed_metric():
+  with mock.patch('controller.ingress_mailbox.metrics') as metrics:
+    yield metrics.inc_shed
+
+def run_mailbox(mailbox, handler):
+  mailbox.start()
+  assert handler.done.wait(TIMEOUT)
+  mailbox.shutdown()
+  mailbox.join(TIMEOUT)
+  return
+
+def test_keep_latest_per_topic(shed_metric):
+  """! Verifies only the newest undispatched message per topic is handed to the handler
+  and that every superseded message is counted. """
+  lock = threading.RLock()
+  handler = RecordingHandler(lock, expected=2)
+  mailbox = IngressMailbox(handler, lock)
+
+  for payload in (b"1", b"2", b"3"):
+    mailbox.put("client", "userdata", message("scenescape/data/camera/cam1", payload))
+  mailbox.put("client", "userdata", message("scenescape/data/camera/cam2", b"a"))
+  assert mailbox.pending() == 2
+  assert mailbox.shedCount("scenescape/data/camera/cam1") == 2
+  assert mailbox.shedCount("scenescape/data/camera/cam2") == 0
+  assert mailbox.shedCount() == 2
+  assert shed_metric.call_count == 2
+  shed_metric.assert_called_with({"topic": "scenescape/data/camera/cam1",
+                                  "reason": "superseded"})
+
+  run_mailbox(mailbox, handler)
+  assert handler.received == [
+    ("client", "userdata", "scenescape/data/camera/cam1", b"3"),
+    ("client", "userdata", "scenescape/data/camera/cam2", b"a"),
+  ]
+  assert mailbox.pending() == 0
+  assert mailbox.shedCount() == 2
+  return
+
+def test_other_topics_not_dropped(shed_metric):
+  """! Verifies a busy topic neither drops nor starves messages on other topics. """
+  lock = threading.RLock()
+  busy_topic = "scenescape/data/camera/busy"
+  topics = [f"scenescape/data/camera/cam{idx}" for idx in range(4)]
+  handler = RecordingHandler(lock, expected=len(topics) + 1)
+  mailbox = IngressMailbox(handler, lock)
+
+  for idx, topic in enumerate(topics):
+    mailbox.put(None, None, message(busy_topic, idx))
+    mailbox.put(None, None, message(topic, topic))
+
+  run_mailbox(mailbox, handler)
+  # The busy topic keeps its first arrival position and only its last message
+  assert [received[2:] for received in handler.received] == \
+    [(busy_topic, len(topics) - 1)] + [(topic, topic) for topic in topics]
+  assert mailbox.shedCount(busy_topic) == len(topics) - 1
+  assert mailbox.shedCount() == len(topics) - 1
+  return
+
+def test_dispatch_under_shared_lock(shed_metric):
+  """! Verifies the handler runs with the shared lock held and waits for it. """
+  lock = threading.RLock()
+  handler = RecordingHandler(lock, expected=1)
+  mailbox = IngressMailbox(handler, lock)
+  mailbox.put(None, None, message("scenescape/data/camera/cam1", b"1"))
+
+  with lock:
+    mailbox.start()
+    assert not handler.done.wait(0.2)
+    assert handler.received == []
+  assert handler.done.wait(TIMEOUT)
+  assert handler.lock_held == [True]
+
+  mailbox.shutdown()
+  mailbox.join(TIMEOUT)
+  assert not mailbox.is_alive()
+  return
+
+def test_handler_error_does_not_stop_dispatch(shed_metric):
+  """! Verifies an exception in the handler is logged and later messages still dispatch. """
+  received = []
+  done = threading.Event()
+  def handler(client, userdata, msg):
+    received.append(msg.payload)
+    if msg.payload == b"bad":
+      raise ValueError("bad message")
+    done.set()
+
+  mailbox = IngressMailbox(handler)
+  mailbox.put(None, None, message("scenescape/data/camera/cam1", b"bad"))
+  mailbox.put(None, None, message("scenescape/data/camera/cam2", b"good"))
+  mailbox.start()
+  assert done.wait(TIMEOUT)
+  mailbox.shutdown()
+  mailbox.join(TIMEOUT)
+  assert received == [b"bad", b"good"]
+  return
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: (C) 2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from queue import Empty, Queue
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from controller.ilabs_tracking import IntelLabsTracking
+from controller.time_chunking import (ADAPTIVE_LATENCY_HEADROOM, ADAPTIVE_SMOOTHING,
+                                      DISPATCH_REASON_ALL_CAMERAS, TimeChunkProcessor)
+from controller.tracking import BATCHED_MODE
+
+CATEGORY = "person"
+TIMEOUT = 5
+
+class FakeTracker:
+  """Stands in for a category tracker thread"""
+
+  def __init__(self, tracking_latency=0.0):
+    self.tracking_latency = tracking_latency
+    self.requested_frame_rate = None
+    self.queue = Queue()
+
+def fake_manager(**trackers):
+  return SimpleNamespace(trackers=trackers)
+
+def chunk(arrivals):
+  """Builds one category of popped buffer data with the given camera arrival times"""
+  return {CATEGORY: {f"camera{idx}": ([], 0.0, [], arrival)
+                     for idx, arrival in enumerate(arrivals)}}
+
+@pytest.fixture(autouse=True)
+def chunk_metrics():
+  with mock.patch('controller.time_chunking.metrics') as metrics:
+    yield metrics
+
+def test_update_interval_follows_latency():
+  """! Verifies the interval moves towards the tracking latency plus headroom
+  with the configured smoothing and is propagated as requested frame rate. """
+  tracker = FakeTracker(tracking_latency=0.1)
+  processor = TimeChunkProcessor(fake_manager(person=tracker), rate_fps=15, adaptive=True)
+  start = processor.interval
+
+  processor._updateInterval(chunk([1.0]))
+  target = 0.1 * ADAPTIVE_LATENCY_HEADROOM
+  expected = start + ADAPTIVE_SMOOTHING * (target - start)
+  assert processor.interval == pytest.approx(expected)
+  assert tracker.requested_frame_rate == int(round(1.0 / expected))
+
+  for _ in range(100):
+    processor._updateInterval(chunk([1.0]))
+  assert processor.interval == pytest.approx(target)
+  assert tracker.requested_frame_rate == 8
+  return
+
+def test_update_interval_follows_arrival_spread():
+  """! Verifies a camera arrival spread above the tracking latency drives the interval. """
+  tracker = FakeTracker(tracking_latency=0.01)
+  processor = TimeChunkProcessor(fake_manager(person=tracker), rate_fps=15, adaptive=True)
+  start = processor.interval
+
+  processor._updateInterval(chunk([1.0, 1.5, 1.2]))
+  assert processor.arrival_spread == pytest.approx(ADAPTIVE_SMOOTHING * 0.5)
+  expected = start + ADAPTIVE_SMOOTHING * (processor.arrival_spread - start)
+  assert processor.interval == pytest.approx(expected)
+
+  for _ in range(100):
+    processor._updateInterval(chunk([1.0, 1.5]))
+  assert processor.arrival_spread == pytest.approx(0.5)
+  assert processor.interval == pytest.approx(0.5)
+  return
+
+@pytest.mark.parametrize("latency, bound", [(10.0, 1.0 / 4), (0.0, 1.0 / 30)])
+def test_update_interval_bounds(latency, bound):
+  """! Verifies the interval never leaves the configured rate bounds. """
+  tracker = FakeTracker(tracking_latency=latency)
+  processor = TimeChunkProcessor(fake_manager(person=tracker), rate_fps=15, adaptive=True,
+                                 min_rate_fps=4, max_rate_fps=30)
+  for _ in range(100):
+    processor._updateInterval(chunk([1.0]))
+    assert 1.0 / 30 <= processor.interval <= 1.0 / 4
+  assert processor.interval == pytest.approx(bound)
+  assert tracker.requested_frame_rate == int(round(1.0 / bound))
+  return
+
+def test_update_interval_slowest_category():
+  """! Verifies the slowest dispatched category sets the latency target and
+  every tracker gets the new frame rate. """
+  fast, slow, idle = FakeTracker(0.01), FakeTracker(0.2), FakeTracker(5.0)
+  processor = TimeChunkProcessor(fake_manager(person=fast, vehicle=slow, apriltag=idle),
+                                 rate_fps=15, adaptive=True)
+  start = processor.interval
+  data = {"person": chunk([1.0])[CATEGORY], "vehicle": chunk([1.0])[CATEGORY]}
+
+  processor._updateInterval(data)
+  target = 0.2 * ADAPTIVE_LATENCY_HEADROOM
+  assert processor.interval == pytest.approx(start + ADAPTIVE_SMOOTHING * (target - start))
+  rates = {tracker.requested_frame_rate for tracker in (fast, slow, idle)}
+  assert rates == {int(round(1.0 / processor.interval))}
+  return
+
+def test_early_dispatch_all_cameras(chunk_metrics):
+  """! Verifies a category is dispatched before the timer once all of its active cameras
+  have reported, and not while one is missing. """
+  tracker = FakeTracker()
+  processor = TimeChunkProcessor(fake_manager(person=tracker), rate_fps=1, early_dispatch=True)
+  processor.add_message("camera1", CATEGORY, ["a1"], 1.0, [])
+  processor.add_message("camera2", CATEGORY, ["b1"], 1.1, [])
+  processor.start()
+  try:
+    objects, when, already_tracked, mode = tracker.queue.get(timeout=0.5)
+    assert objects == [["a1"], ["b1"]]
+    assert when == 1.1
+    assert mode == BATCHED_MODE
+
+    # camera2 has reported before and is still active, so early dispatch waits for it
+    processor.add_message("camera1", CATEGORY, ["a2"], 2.0, [])
+    with pytest.raises(Empty):
+      tracker.queue.get(timeout=0.2)
+    processor.add_message("camera2", CATEGORY, ["b2"], 1.9, [])
+    objects, when, _, _ = tracker.queue.get(timeout=0.5)
+    assert objects == [["b2"], ["a2"]]
+    assert when == 2.0
+  finally:
+    processor.shutdown()
+    processor.join(TIMEOUT)
+
+  reasons = {call.args[0]["reason"] for call in chunk_metrics.inc_chunk_dispatch.call_args_list}
+  assert reasons == {DISPATCH_REASON_ALL_CAMERAS}
+  return
+
+def test_early_dispatch_min_interval():
+  """! Verifies a complete category waits for the minimal interval since its last dispatch. """
+  processor = TimeChunkProcessor(fake_manager(person=FakeTracker()), early_dispatch=True,
+                                 max_rate_fps=2)
+  processor.add_message("camera1", CATEGORY, ["a1"], 1.0, [])
+  assert processor._wakeup.is_set()
+
+  processor._last_dispatch[CATEGORY] = time.monotonic()
+  assert processor._readyCategories() == []
+  processor._last_dispatch[CATEGORY] = time.monotonic() - processor.min_interval
+  assert processor._readyCategories() == [CATEGORY]
+  assert processor._readyCategories() == []
+  return
+
+def test_early_dispatch_ignores_inactive_cameras():
+  """! Verifies cameras silent for longer than the activity timeout are not waited for. """
+  processor = TimeChunkProcessor(fake_manager(person=FakeTracker()), early_dispatch=True)
+  processor.add_message("camera1", CATEGORY, ["a1"], 1.0, [])
+  processor.add_message("camera2", CATEGORY, ["b1"], 1.0, [])
+  processor.buffer.pop()
+  processor._complete.clear()
+
+  with mock.patch('controller.time_chunking.ACTIVE_CAMERA_TIMEOUT_S', 0.0):
+    time.sleep(0.01)
+    assert processor._allCamerasReported("camera1", CATEGORY) is False
+    processor.buffer.add("camera1", CATEGORY, ["a2"], 2.0, [])
+    time.sleep(0.01)
+    assert processor._allCamerasReported("camera1", CATEGORY) is True
+  return
+
+@mock.patch('controller.ilabs_tracking.rv')
+def test_requested_frame_rate_applied(rv):
+  """! Verifies the adapted rate reaches the frame-based tracker parameters
+  on the next batched tracking call. """
+  rv.tracking.MultipleObjectTracker.return_value.get_reliable_tracks.return_value = []
+  tracker = IntelLabsTracking(0.3333, 0.2666, 0.5333, 15)
+  tracker.tracker.update_tracker_params.reset_mock()
+  tracker.tracking_latency = 0.2
+  processor = TimeChunkProcessor(fake_manager(person=tracker), rate_fps=15, adaptive=True)
+
+  processor._updateInterval(chunk([1.0]))
+  rate = tracker.requested_frame_rate
+  assert rate == int(round(1.0 / processor.interval))
+  assert rate != 15
+  tracker.tracker.update_tracker_params.assert_not_called()
+
+  tracker.trackCategoryBatched([[]], 1.0, [])
+  tracker.tracker.update_tracker_params.assert_called_once_with(rate)
+  assert tracker.ref_camera_frame_rate == rate
+
+  tracker.trackCategoryBatched([[]], 2.0, [])
+  tracker.tracker.update_tracker_params.assert_called_once_with(rate)
+  return